@@ -0,0 +1,262 @@
+"""
+Offline benchmark suite over one term's fixtures (bench_fixtures.py). The
+committed set, 2023FA-reconstructed, is rebuilt from that term's outputs
+rather than recorded from the live sites, so timings on it are a
+reconstructed baseline, not a recorded one.
+
+    python3 bench.py [--repeats N] [--only coursews,catalog.extract,...]
+    python3 bench.py --save-baseline      # keep this run as bench_baseline.json
+    python3 bench.py --threshold 0.15     # fail on anything 15% slower than the baseline
+    python3 bench.py --fixtures synthetic-50000   # a synth_catalog.py set instead
+
+The stage scripts (coursews, sublist, rollup, combiner) each run in a scratch
+directory with fetch.py answering from the fixtures instead of the network,
+and are timed through the report instrument.py writes for them. Then the
+hot functions are timed on their own: timeslots.parse (cold cache),
+catalog.extract, jsonstream.iter_items, rollup.sync and conflicts.build.
+Everything is best of N. Results go to bench_results.json and are compared
+with bench_baseline.json when there is one; the exit status is 1 if anything
+regressed past the threshold. Runs on another fixture set write
+bench_results-<set>.json and compare with bench_baseline-<set>.json.
+"""
+
+import argparse
+import json
+import os
+import platform
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+import bench_fixtures
+import catalog
+import conflicts
+import fetch
+import jsonstream
+import rollup
+import timeslots
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS = 'bench_results.json'
+BASELINE = 'bench_baseline.json'
+THRESHOLD = 0.15
+# Differences smaller than this are noise whatever the ratio.
+NOISE = 0.005
+
+stages = [
+    ('coursews', ['coursews.py', '--no-cache']),
+    ('sublist', ['sublist_ws.py', '--no-cache']),
+    ('rollup', ['rollup.py']),
+    ('combiner', ['combiner_ws.py', '--split']),
+]
+
+
+def replay(coursews, pages):
+    """Answer fetch.py's requests from the fixtures."""
+    def response(url):
+        r = requests.Response()
+        r.url = url
+        if 'coursews' in urlparse(url).netloc:
+            r.status_code, r._content = 200, coursews
+        else:
+            num = parse_qs(urlparse(url).query).get('search', [''])[0]
+            r.status_code, r._content = (200, pages[num]) if num in pages else (404, b'')
+        return r
+
+    def fetch_one(session, url, *args, **kwargs):
+        return response(url)
+
+    def stream(session, url, *args, chunk_size=fetch.CHUNK, **kwargs):
+        body = response(url).content
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+    fetch.fetch = fetch_one
+    fetch.stream = stream
+
+
+def child(stage, fixtures=None):
+    """Run one stage script here, inside the scratch directory."""
+    coursews, pages, _ = bench_fixtures.load(fixtures)
+    replay(coursews, pages)
+    argv = dict(stages)[stage]
+    sys.argv = argv
+    runpy.run_path(os.path.join(HERE, argv[0]), run_name='__main__')
+
+
+def run_stage(stage, scratch, fixtures):
+    subprocess.run([sys.executable, os.path.abspath(__file__), '--child', stage]
+                   + ([fixtures] if fixtures else []), cwd=scratch,
+                   check=True, stdout=subprocess.DEVNULL)
+    with open(os.path.join(scratch, 'reports', stage + '.json')) as f:
+        report = json.load(f)
+    return {'wall_s': report['wall_s'], 'cpu_s': report['cpu_s'],
+            'peak_rss_kb': report['peak_rss_kb'],
+            'phases': {name: p['wall_s'] for name, p in report['phases'].items()}}
+
+
+def setup(scratch, pages, evaluations):
+    shutil.copy(os.path.join(HERE, 'course_six_renumbering.json'), scratch)
+    with open(os.path.join(scratch, 'evaluations'), 'w') as f:
+        json.dump(evaluations, f)
+
+
+def bench_stages(repeats, only, fixtures):
+    _, pages, evaluations = bench_fixtures.load(fixtures)
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        setup(scratch, pages, evaluations)
+        for stage, _ in stages:
+            if stage == 'sublist':
+                # Only the sampled subjects have catalog pages.
+                with open(os.path.join(scratch, 'all_classes'), 'w') as f:
+                    json.dump(sorted(pages), f)
+            runs = []
+            for _ in range(repeats if not only or stage in only else 1):
+                # Each repeat starts cold; incremental state would skip the work.
+                # rollup.json is only state to rollup; the combiner reads it.
+                leftovers = ['manifest.json', 'sublist.journal']
+                if stage == 'rollup':
+                    leftovers.append('rollup.json')
+                for leftover in leftovers:
+                    path = os.path.join(scratch, leftover)
+                    if os.path.exists(path):
+                        os.remove(path)
+                runs.append(run_stage(stage, scratch, fixtures))
+            if not only or stage in only:
+                results[stage] = min(runs, key=lambda r: r['wall_s'])
+        with open(os.path.join(scratch, 'ws')) as f:
+            ws = json.load(f)
+        with open(os.path.join(scratch, 'full.json')) as f:
+            classes = json.load(f)['classes']
+    return results, ws, classes
+
+
+def best(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - begin)
+    return min(times)
+
+
+def bench_functions(repeats, only, ws, classes, fixtures):
+    coursews, pages, evaluations = bench_fixtures.load(fixtures)
+    strings = sorted({s for c in ws.values() for raw in c['l_raw'] + c['r_raw'] + c['b_raw']
+                      for s in raw.strip().split(',')})
+
+    def parse_times():
+        timeslots.parse.cache_clear()
+        for s in strings:
+            timeslots.parse(s)
+
+    def extract_pages():
+        for content in pages.values():
+            catalog.extract(content, {})
+
+    def read_coursews():
+        text = jsonstream.repair(jsonstream.decode([coursews]),
+                                 [('"Making"', '&quot;Making&quot;')])
+        for _ in jsonstream.iter_items(text):
+            pass
+
+    functions = [
+        ('timeslots.parse', parse_times, len(strings)),
+        ('catalog.extract', extract_pages, len(pages)),
+        ('jsonstream.iter_items', read_coursews, len(ws)),
+        ('rollup.sync', lambda: rollup.sync({'history': {}, 'table': {}},
+                                            evaluations), len(evaluations)),
+        ('conflicts.build', lambda: conflicts.build(classes), len(classes)),
+    ]
+    results = {}
+    for name, fn, items in functions:
+        if only and name not in only:
+            continue
+        seconds = best(fn, repeats)
+        results[name] = {'seconds': round(seconds, 6), 'items': items,
+                         'us_per_item': round(seconds / items * 1e6, 3)}
+    return results
+
+
+def timings(results):
+    """Flatten a results file into {metric: seconds}."""
+    out = {}
+    for stage, r in results.get('stages', {}).items():
+        out[stage] = r['wall_s']
+        for phase, seconds in r['phases'].items():
+            out['{}/{}'.format(stage, phase)] = seconds
+    for name, r in results.get('functions', {}).items():
+        out[name] = r['seconds']
+    return out
+
+
+def compare(results, baseline, threshold):
+    new, old = timings(results), timings(baseline)
+    regressions = 0
+    print('{:32} {:>10} {:>10} {:>8}'.format('', 'baseline', 'now', 'change'))
+    for metric in sorted(new):
+        if metric not in old:
+            print('{:32} {:>10} {:>10.4f}'.format(metric, '-', new[metric]))
+            continue
+        change = new[metric] / old[metric] - 1 if old[metric] else 0
+        regressed = change > threshold and new[metric] - old[metric] > NOISE
+        regressions += regressed
+        print('{:32} {:>10.4f} {:>10.4f} {:>+7.1%}{}'.format(
+            metric, old[metric], new[metric], change, '  REGRESSION' if regressed else ''))
+    return regressions
+
+
+def main():
+    if len(sys.argv) in (3, 4) and sys.argv[1] == '--child':
+        return child(*sys.argv[2:])
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--only', default='', help='comma-separated stages and functions')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--fixtures', default=None,
+                        help="fixture set to run on; defaults to coursews.py's term, "
+                             "recorded or else reconstructed")
+    args = parser.parse_args()
+    only = set(filter(None, args.only.split(',')))
+    # Baselines only compare like with like.
+    suffix = '-' + args.fixtures if args.fixtures else ''
+    results_name = RESULTS.replace('.json', suffix + '.json')
+    baseline_name = BASELINE.replace('.json', suffix + '.json')
+
+    stage_results, ws, classes = bench_stages(args.repeats, only, args.fixtures)
+    results = {'python': platform.python_version(),
+               'machine': platform.machine(),
+               'repeats': args.repeats,
+               'fixtures': bench_fixtures.meta(args.fixtures),
+               'stages': stage_results,
+               'functions': bench_functions(args.repeats, only, ws, classes, args.fixtures)}
+    with open(os.path.join(HERE, results_name), 'w') as f:
+        json.dump(results, f, indent=1)
+
+    baseline_path = os.path.join(HERE, baseline_name)
+    if args.save_baseline:
+        shutil.copy(os.path.join(HERE, results_name), baseline_path)
+        print('Saved', baseline_name)
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(regressions, 'regressions past {:.0%}'.format(args.threshold))
+            sys.exit(1)
+        return
+
+    for metric, seconds in sorted(timings(results).items()):
+        print('{:32} {:10.4f}'.format(metric, seconds))
+
+
+if __name__ == '__main__':
+    main()
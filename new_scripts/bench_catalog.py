@@ -0,0 +1,159 @@
+"""
+Benchmark catalog.extract against the BeautifulSoup parser it replaced.
+
+    python3 bench_catalog.py [page directory] [repeats]
+
+Pages default to the recorded corpus in fixtures/catalog/ (made with
+bench_fixtures.py catalog). Without one they fall back to the reconstructed
+pages of the bench fixtures, which bench_fixtures.py writes and already
+checks against catalog.extract, so agreement on them says little; a
+warning says so. http_cache/ after a live sublist_ws.py run also works.
+Every page is run through both parsers; any difference in the resulting
+record (including the partial record left by a page that fails) is reported
+and makes the script exit non-zero.
+"""
+
+import os
+import statistics
+import sys
+import time
+import warnings
+
+from bs4 import BeautifulSoup
+
+import bench_fixtures
+import catalog
+
+warnings.filterwarnings('ignore', category=DeprecationWarning)
+
+
+def soup_parse_page(num, content, classes):
+    # sublist_ws.parse_page as it was before catalog.py.
+    soup = BeautifulSoup(content, "lxml")
+
+    start = soup.h3
+
+    classes[num] = {'no_next': False,
+                    'repeat': False,
+                    'half': False,
+                    'url': ''}
+
+    name_split = start.getText().split("\n")
+    if len(name_split) > 2 and name_split[1] != "(New)":
+        classes[num]['old_num'] = name_split[1][1:-1]
+
+    level = start.findNext('img').findNext('img')
+
+    if 'nonext' in str(level):
+        classes[num]['no_next'] = True
+        level = level.findNext('img')
+
+    if 'Undergrad' in str(level):
+        classes[num]['level'] = 'U'
+    elif 'Graduate' in str(level):
+        classes[num]['level'] = 'G'
+
+    gterms = ['Fall', 'IAP', 'Spring', 'Summer']
+    terms = [level.findNext()]
+    while True:
+        next_term = terms[-1].findNext()
+        if not any(x in str(next_term) for x in gterms):
+            break
+        terms.append(next_term)
+
+    others = [terms[-1]]
+    while True:
+        next_other = others[-1].findNext()
+        if str(next_other) == '<br/>':
+            break
+        others.append(next_other)
+
+    for other in others:
+        if 'repeat.gif' in str(other):
+            classes[num]['repeat'] = True
+
+    half = soup.getText().split(' half of term')
+    if len(half) > 1:
+        term = half[0].split(' ')[-1].strip()
+        if term == "first":
+            classes[num]['half'] = 1
+        if term == "second":
+            classes[num]['half'] = 2
+
+    url = soup.getText().split('URL: ')
+    if len(url) > 1:
+        classes[num]['url'] = url[1].split('\n')[0].strip('?')
+
+    classes[num]['final'] = '+final' in soup.getText()
+
+
+def lxml_parse_page(num, content, classes):
+    classes[num] = {}
+    catalog.extract(content, classes[num])
+
+
+def run(parse, content, repeats):
+    times = []
+    for _ in range(repeats):
+        classes = {}
+        begin = time.perf_counter()
+        try:
+            parse('page', content, classes)
+            failed = False
+        except (AttributeError, TypeError):
+            failed = True
+        times.append(time.perf_counter() - begin)
+    return (classes.get('page'), failed), min(times)
+
+
+def load_pages(path):
+    pages = {}
+    for name in sorted(os.listdir(path)):
+        if name.endswith('.body') or name.endswith('.html'):
+            with open(os.path.join(path, name), 'rb') as f:
+                pages[name] = f.read()
+    return pages
+
+
+def main():
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+        pages = load_pages(path)
+    elif os.path.isdir(bench_fixtures.CATALOG):
+        path = bench_fixtures.CATALOG
+        pages = load_pages(path)
+    else:
+        path = bench_fixtures.FIXTURES
+        pages = bench_fixtures.load()[1]
+        print('WARNING: no recorded pages in {} (bench_fixtures.py catalog makes them);'
+              ' comparing on reconstructed pages only'.format(bench_fixtures.CATALOG))
+    if not pages:
+        print('no catalog pages in', path)
+        sys.exit(1)
+
+    soup_times = []
+    lxml_times = []
+    mismatches = 0
+    for name, content in pages.items():
+        expected, soup_time = run(soup_parse_page, content, repeats)
+        actual, lxml_time = run(lxml_parse_page, content, repeats)
+        soup_times.append(soup_time)
+        lxml_times.append(lxml_time)
+        if expected != actual:
+            mismatches += 1
+            print('MISMATCH', name)
+            print('  soup:', expected)
+            print('  lxml:', actual)
+
+    ms = lambda xs: 1000 * statistics.mean(xs)
+    print(f'{len(pages)} pages, best of {repeats}')
+    print(f'  BeautifulSoup: {ms(soup_times):.3f} ms/page (median {1000 * statistics.median(soup_times):.3f})')
+    print(f'  catalog.py:    {ms(lxml_times):.3f} ms/page (median {1000 * statistics.median(lxml_times):.3f})')
+    print(f'  speedup:       {sum(soup_times) / sum(lxml_times):.1f}x')
+    print(f'  mismatches:    {mismatches}')
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Size and parse-time comparison of compact.py against the full.js format.
+
+    python3 bench_compact.py [full.json] [repeats]
+
+Encodes the classes in full.json, checks that decoding gives back exactly the
+same classes, and reports raw/gzip sizes and the time to parse (and decode)
+each format in Python. If node is installed, the same is done in JavaScript
+with www/compact.js, which is also checked against the original.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import compact
+
+node_bench = r'''
+const fs = require('fs');
+eval(fs.readFileSync(process.argv[2], 'utf8'));
+const full = fs.readFileSync(process.argv[3], 'utf8');
+const packed = fs.readFileSync(process.argv[4], 'utf8');
+const repeats = Number(process.argv[5]);
+function best(f) {
+    let best = Infinity, out;
+    for (let i = 0; i < repeats; i++) {
+        const begin = process.hrtime.bigint();
+        out = f();
+        best = Math.min(best, Number(process.hrtime.bigint() - begin) / 1e6);
+    }
+    return [out, best];
+}
+const [a, full_ms] = best(() => JSON.parse(full));
+const [b, compact_ms] = best(() => decode_compact(JSON.parse(packed)));
+const same = Object.keys(a).length === Object.keys(b).length &&
+    Object.keys(a).every(c => c in b &&
+        Object.keys(a[c]).length === Object.keys(b[c]).length &&
+        Object.keys(a[c]).every(k => JSON.stringify(a[c][k]) === JSON.stringify(b[c][k])));
+console.log(JSON.stringify({full_ms, compact_ms, same}));
+'''
+
+
+def best(f, repeats):
+    best_time = None
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        out = f()
+        elapsed = time.perf_counter() - begin
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return out, best_time
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'full.json'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with open(path) as f:
+        classes = json.load(f)['classes']
+
+    full = json.dumps(classes, separators=(',', ':'))
+    packed = json.dumps(compact.encode(classes), separators=(',', ':'))
+
+    decoded, full_time = best(lambda: json.loads(full), repeats)
+    decoded, compact_time = best(lambda: compact.decode(json.loads(packed)), repeats)
+    ok = decoded == classes
+
+    kb = lambda s: len(s.encode('utf-8')) / 1024
+    gz = lambda s: len(gzip.compress(s.encode('utf-8'), 9)) / 1024
+    print(f'{len(classes)} classes from {path}, best of {repeats}')
+    print(f'  full:    {kb(full):8.1f} KB  gzip {gz(full):7.1f} KB  python parse {1000 * full_time:7.2f} ms')
+    print(f'  compact: {kb(packed):8.1f} KB  gzip {gz(packed):7.1f} KB  python parse+decode {1000 * compact_time:7.2f} ms')
+    print(f'  round trip: {"ok" if ok else "MISMATCH"}')
+
+    if shutil.which('node'):
+        decoder = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'www', 'compact.js')
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name, text in [('bench.js', node_bench), ('full.json', full), ('compact.json', packed)]:
+                paths.append(os.path.join(tmp, name))
+                with open(paths[-1], 'w') as f:
+                    f.write(text)
+            out = subprocess.run(['node', paths[0], decoder, paths[1], paths[2], str(repeats)],
+                                 capture_output=True, text=True, check=True).stdout
+        result = json.loads(out)
+        print(f'  node: full parse {result["full_ms"]:.2f} ms, '
+              f'compact parse+decode {result["compact_ms"]:.2f} ms, '
+              f'round trip {"ok" if result["same"] else "MISMATCH"}')
+        ok = ok and result['same']
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Check delta.py over a run of simulated builds.
+
+    python3 bench_delta.py [full.json] [builds] [seed]
+
+Starting from full.json, each build moves a few sections, changes a few
+ratings and adds or drops the odd class, then publishes through delta.py into
+a scratch directory. Afterwards every intermediate version is brought up to
+date by following the manifest's patch chain, and the result must equal the
+last build exactly; only versions older than the last delta.KEEP patches may
+lack a chain. Patch sizes are reported against the full dataset.
+"""
+
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+
+import delta
+
+
+def mutate(classes, rng):
+    classes = copy.deepcopy(classes)
+    numbers = [c for c in classes if classes[c].get('l')]
+    for c in rng.sample(numbers, min(5, len(numbers))):
+        slots, room = classes[c]['l'][0]
+        classes[c]['l'][0] = [[[start + 2, length] for start, length in slots], room]
+    for c in rng.sample(list(classes), 5):
+        classes[c]['ra'] = round(rng.uniform(1, 7), 1)
+    if rng.random() < 0.3:
+        del classes[rng.choice(list(classes))]
+    if rng.random() < 0.3:
+        new = copy.deepcopy(classes[rng.choice(list(classes))])
+        new['no'] = f'99.S{rng.randrange(1000):03d}'
+        classes[new['no']] = new
+    if rng.random() < 0.2:
+        c = rng.choice(list(classes))
+        classes[c].pop('on', None)
+        classes[c]['x'] = True
+    return classes
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'full.json'
+    builds = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    rng = random.Random(int(sys.argv[3]) if len(sys.argv) > 3 else 0)
+
+    with open(path) as f:
+        classes = json.load(f)['classes']
+    full_size = len(json.dumps(classes, separators=(',', ':')))
+
+    history = {}
+    with tempfile.TemporaryDirectory() as patch_dir:
+        for _ in range(builds):
+            latest, _ = delta.publish(classes, patch_dir)
+            history[latest] = classes
+            classes = mutate(classes, rng)
+        # Republishing the same data must not add a patch.
+        latest, patch = delta.publish(history[latest], patch_dir)
+        assert patch is None
+        final = history[latest]
+
+        with open(os.path.join(patch_dir, 'manifest.json')) as f:
+            index = json.load(f)
+
+        bad = 0
+        pruned = 0
+        sizes = []
+        for age, (v, old) in enumerate(reversed(list(history.items()))):
+            files = delta.chain(index, v)
+            if files is None:
+                if age <= delta.KEEP:
+                    print('no patch chain from', v)
+                    bad += 1
+                else:
+                    pruned += 1
+                continue
+            for name in files:
+                with open(os.path.join(patch_dir, name)) as f:
+                    old = delta.apply(old, json.load(f))
+            if old != final:
+                print('MISMATCH after patching', v)
+                bad += 1
+        for entry in index['patches'].values():
+            sizes.append(os.path.getsize(os.path.join(patch_dir, entry['file'])))
+
+    print(f'{builds} builds, full dataset {full_size / 1024:.1f} KB')
+    print(f'  patches: {len(sizes)}, mean {sum(sizes) / len(sizes) / 1024:.1f} KB, '
+          f'largest {max(sizes) / 1024:.1f} KB')
+    print(f'  versions patched up to date: {len(history) - bad - pruned} of {len(history)}'
+          f' ({pruned} past the last {delta.KEEP} patches)')
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+"""
+Inputs for bench.py: one term's coursews JSON, a sample of catalog pages and
+the evaluations, gzipped under fixtures/<set>/.
+
+    python3 bench_fixtures.py record [--sample N]    # from the live sites and ./evaluations
+    python3 bench_fixtures.py rebuild [--sample N]   # offline, from ws, sublist and full.json
+    python3 bench_fixtures.py catalog [--sample N]   # search.cgi pages as served, for bench_catalog.py
+
+`record` saves the responses as served. `rebuild` reconstructs them from the
+term outputs committed next to this script, for when the sites can't be
+reached: coursews items and sections from ws, catalog pages in the
+student.mit.edu markup from sublist (each checked to parse back to the same
+record), and one averaged evaluation per subject from full.json.
+`record` writes fixtures/<term>/ and `rebuild` fixtures/<term>-reconstructed/,
+and meta.json in each says how it was made. The committed set is
+2023FA-reconstructed: its catalog pages are written by catalog_page() below
+rather than served by the catalog, and its coursews feed lists every section
+after the classes instead of in the live feed's order, so it stands in for
+real responses without reproducing their shapes. A set name defaults to the
+term's recorded set when there is one, else its reconstruction. `catalog` saves
+a sample of real search.cgi pages, byte for byte, under fixtures/catalog/
+as the regression corpus for catalog.py. synth_catalog.py writes larger,
+synthetic sets in the same layout under other names.
+"""
+
+import argparse
+import datetime
+import gzip
+import html
+import json
+import os
+import random
+import re
+import sys
+
+import catalog
+import fetch
+import sublist_ws
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, 'fixtures')
+CATALOG = os.path.join(FIXTURES, 'catalog')
+RECONSTRUCTED = '-reconstructed'
+COURSEWS_URL = 'http://coursews.mit.edu/coursews/?term={}'
+# Catalog pages in a fixture set (None for every subject), and in fixtures/catalog/.
+SAMPLE = None
+CATALOG_SAMPLE = 50
+
+term_names = {'FA': 'Fall', 'JA': 'IAP', 'SP': 'Spring', 'SU': 'Summer'}
+section_types = [('l', 'LectureSession'), ('r', 'RecitationSession'), ('b', 'LabSession')]
+
+
+def coursews_term():
+    """The term coursews.py scrapes (update.py rewrites the same line)."""
+    with open(os.path.join(HERE, 'coursews.py')) as f:
+        return re.search(r"^term = '(\w+)'", f.read(), re.MULTILINE).group(1)
+
+
+def default_set():
+    """coursews.py's term: its recorded set if there is one, else its reconstruction."""
+    term = coursews_term()
+    if os.path.isdir(os.path.join(FIXTURES, term)):
+        return term
+    return term + RECONSTRUCTED
+
+
+def read_json(name):
+    with open(os.path.join(HERE, name)) as f:
+        return json.load(f)
+
+
+def write_gz(path, data):
+    # mtime=0 keeps the bytes identical when the content is.
+    with open(path, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+        f.write(data)
+
+
+def load(term=None):
+    """
+    (coursews JSON bytes, {number: page bytes}, evaluations) for a term's
+    fixtures, or for a fixture set by name.
+    """
+    path = os.path.join(FIXTURES, term or default_set())
+    with gzip.open(os.path.join(path, 'coursews.json.gz')) as f:
+        coursews = f.read()
+    with gzip.open(os.path.join(path, 'catalog.json.gz')) as f:
+        pages = {num: page.encode('utf-8') for num, page in json.load(f).items()}
+    with gzip.open(os.path.join(path, 'evaluations.json.gz')) as f:
+        evaluations = json.load(f)
+    return coursews, pages, evaluations
+
+
+def meta(term=None):
+    with open(os.path.join(FIXTURES, term or default_set(), 'meta.json')) as f:
+        return json.load(f)
+
+
+def save(term, coursews, pages, evaluations, source, name=None):
+    path = os.path.join(FIXTURES, name or term)
+    os.makedirs(path, exist_ok=True)
+    write_gz(os.path.join(path, 'coursews.json.gz'), coursews)
+    write_gz(os.path.join(path, 'catalog.json.gz'), json.dumps(
+        {num: page.decode('utf-8') for num, page in sorted(pages.items())},
+        sort_keys=True).encode('utf-8'))
+    write_gz(os.path.join(path, 'evaluations.json.gz'),
+             json.dumps(evaluations, sort_keys=True).encode('utf-8'))
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump({'term': term,
+                   'source': source,
+                   'made': datetime.date.today().isoformat(),
+                   'catalog_pages': len(pages),
+                   'evaluated_subjects': len(evaluations)}, f, indent=1)
+    print('{}: coursews {:.0f} KB, {} catalog pages, {} evaluated subjects'.format(
+        path, len(coursews) / 1024, len(pages), len(evaluations)))
+
+
+def sample(numbers, n):
+    numbers = sorted(numbers)
+    if n is None:
+        return numbers
+    return sorted(random.Random(0).sample(numbers, min(n, len(numbers))))
+
+
+def record(term, n):
+    session = fetch.make_session()
+    coursews = b''.join(fetch.stream(session, COURSEWS_URL.format(term), timeout=120))
+    numbers = [c['id'] for c in json.loads(coursews.decode('utf-8', 'replace')
+                                           .replace('"Making"', '&quot;Making&quot;'))['items']
+               if c['type'] == 'Class']
+
+    pages = {}
+    for num, r, err in fetch.fetch_all(sample(numbers, n), lambda c: sublist_ws.base_url + c,
+                                       session=session):
+        if err is None and r.status_code == 200:
+            pages[num] = r.content
+        else:
+            print('Failed to fetch:', num)
+
+    # evaluations as eval_to_json.py writes it, cut down to this term's subjects.
+    evaluations = read_json('evaluations')
+    evaluations = {k: v for k, v in evaluations.items() if k in numbers}
+    save(term, coursews, pages, evaluations, 'recorded')
+
+
+def record_catalog(n):
+    """Save n search.cgi pages from all_classes as <number>.html under fixtures/catalog/."""
+    os.makedirs(CATALOG, exist_ok=True)
+    saved = 0
+    for num, r, err in fetch.fetch_all(sample(read_json('all_classes'), n),
+                                       lambda c: sublist_ws.base_url + c):
+        if err is None and r.status_code == 200:
+            with open(os.path.join(CATALOG, num + '.html'), 'wb') as f:
+                f.write(r.content)
+            saved += 1
+        else:
+            print('Failed to fetch:', num)
+    print('{}: {} catalog pages'.format(CATALOG, saved))
+
+
+def coursews_items(ws):
+    items = []
+    sections = []
+    for num, c in ws.items():
+        hass = ','.join(code for code, field in [('HH', 'HASS-H'), ('HA', 'HASS-A'),
+                                                 ('HS', 'HASS-S'), ('HE', 'HASS-E')] if c[field])
+        gir = 'REST' if c['REST'] else 'LAB' if c['LAB'] else 'LAB2' if c['pLAB'] else ''
+        comm = 'CIH' if c['CI-H'] else 'CIHW' if c['CI-HW'] else 'CIM' if c['CI-M'] else ''
+        items.append({'type': 'Class', 'id': num, 'label': c['name'],
+                      'units': '{}-{}-{}'.format(c['units1'], c['units2'], c['units3']),
+                      'total-units': c['total_units'],
+                      'level': 'Undergraduate' if c['level'] == 'U' else 'Graduate',
+                      'semester': [term_names[t] for t in c['terms']],
+                      'description': c['desc'],
+                      'gir_attribute': gir, 'comm_req_attribute': comm, 'hass_attribute': hass,
+                      'prereqs': '' if c['prereq'] == 'None' else c['prereq'],
+                      'joint_subjects': [j + 'J' for j in c['same_as'].split(', ') if j],
+                      'meets_with_subjects': [j for j in c['meets_with'].split(', ') if j],
+                      'in-charge': c['in-charge'],
+                      'fall_instructors': [], 'spring_instructors': []})
+        for typ, kind in section_types:
+            for i, (raw, (_, room)) in enumerate(zip(c[typ + '_raw'], c[typ])):
+                label = '{}{:02d}'.format(typ.upper(), i + 1)
+                sections.append({'type': kind, 'section-of': num, 'id': num + label,
+                                 'label': label, 'timeAndPlace': '{} {}'.format(raw, room)})
+        if c['tba']:
+            sections.append({'type': 'LectureSession', 'section-of': num, 'id': num + 'TBA',
+                             'label': 'TBA', 'timeAndPlace': '*TO BE ARRANGED null'})
+    # The live feed interleaves sections with classes; keep them after, like its tail.
+    return json.dumps({'items': items + sections}).encode('utf-8')
+
+
+def catalog_page(num, c, record):
+    """A search.cgi result page for num that catalog.extract reads back as record."""
+    old = '\n({})\n'.format(record['old_num']) if 'old_num' in record else '\n'
+    nonext = ('<img alt="Not offered academic year" src="/icns/nonext.gif">'
+              if record['no_next'] else '')
+    level = ('<img alt="Undergrad" src="/icns/under.gif">' if record['level'] == 'U'
+             else '<img alt="Graduate" src="/icns/grad.gif">')
+    terms = ' , '.join('<img alt="{0}" src="/icns/{1}.gif">'.format(
+        term_names[t], term_names[t].lower()) for t in c['terms'] or ['FA'])
+    repeat = ('<img alt="Can be repeated for credit" src="/icns/repeat.gif">'
+              if record['repeat'] else '')
+    half = {1: '<br>Begins first half of term.',
+            2: '<br>Ends second half of term.'}.get(record['half'], '')
+    final = '<br>+final' if record['final'] else ''
+    url = ('<br>URL: <a href="{0}">{0}</a>'.format(html.escape(record['url']))
+           if record['url'] else '')
+    return '''<html><head><title>{num}</title></head><body>
+<table><tr><td>
+<a name="{num}"></a><h3>{num} {name}{old}</h3>
+<!--s--><img alt="______" src="/icns/hr.gif"><br>
+{nonext}{level}&nbsp;&nbsp;({terms})
+{repeat}<br>
+Prereq: {prereq}<br>
+Units: {u1}-{u2}-{u3}<br>
+{half}{final}<br>
+<img alt="______" src="/icns/hr.gif"><br>
+{desc}
+{url}
+<br><i>{incharge}</i>
+</td></tr></table>
+</body></html>'''.format(num=num, name=html.escape(c['name']), old=old, nonext=nonext,
+                         level=level, terms=terms, repeat=repeat,
+                         prereq=html.escape(c['prereq']), u1=c['units1'], u2=c['units2'],
+                         u3=c['units3'], half=half, final=final, desc=html.escape(c['desc']),
+                         url=url, incharge=html.escape(c['in-charge'])).encode('utf-8')
+
+
+def rebuild(term, n):
+    ws = read_json('ws')
+    sublist = read_json('sublist')
+    classes = read_json('full.json')['classes']
+
+    # Only subjects whose catalog record is complete; pages that broke midway
+    # left partial ones.
+    numbers = [c for c in ws if 'level' in sublist.get(c, {})]
+    pages = {}
+    for num in sample(numbers, n):
+        page = catalog_page(num, ws[num], sublist[num])
+        parsed = {}
+        catalog.extract(page, parsed)
+        if parsed != sublist[num]:
+            sys.exit('rebuilt page for {} parses to {}, not {}'.format(num, parsed, sublist[num]))
+        pages[num] = page
+
+    evaluations = {}
+    for num, c in classes.items():
+        if c.get('ra'):
+            course, number = num.split('.', 1)
+            evaluations[num] = [{'term': 'average', 'rating': c['ra'], 'ic_hours': c['h'],
+                                 'oc_hours': 0, 'eligible': c['si'], 'resp': 1,
+                                 'rate': 100, 'professors': [], 'course_number': course,
+                                 'class_number': number, 'class_name': c['n']}]
+
+    save(term, coursews_items(ws), pages, evaluations,
+         'reconstructed from ws, sublist and full.json; catalog pages synthesized, not recorded',
+         name=term + RECONSTRUCTED)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('mode', choices=['record', 'rebuild', 'catalog'])
+    parser.add_argument('--sample', type=int, default=None,
+                        help='catalog pages to keep; all of them, or {} for catalog, by default'
+                        .format(CATALOG_SAMPLE))
+    parser.add_argument('--term', default=None, help="defaults to coursews.py's term")
+    args = parser.parse_args()
+    term = args.term or coursews_term()
+    if args.mode == 'record':
+        record(term, args.sample or SAMPLE)
+    elif args.mode == 'catalog':
+        record_catalog(args.sample or CATALOG_SAMPLE)
+    else:
+        rebuild(term, args.sample or SAMPLE)
+
+
+if __name__ == '__main__':
+    main()
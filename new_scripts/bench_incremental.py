@@ -0,0 +1,157 @@
+"""
+Check that a pipeline rerun only redoes the subjects whose inputs changed.
+
+    python3 bench_incremental.py [--changes N] [--fixtures SET]
+
+Runs coursews, sublist, rollup and combiner in a scratch directory against
+the bench fixtures, with sublist_ws.py and combiner_ws.py given the same
+arguments pipeline.py gives them. It then reruns them three times:
+
+- with nothing changed, where no catalog page is reparsed and no subject
+  rebuilt;
+- with N catalog pages and N coursews classes changed, where exactly the
+  changed pages are reparsed and exactly the affected subjects rebuilt;
+- from scratch, whose full.json must match the incremental one.
+
+Counts come from the instrument.py reports the stages write. The exit
+status is 1 if any of the checks fails.
+"""
+
+import argparse
+import json
+import os
+import random
+import runpy
+import subprocess
+import sys
+import tempfile
+
+import bench
+import bench_fixtures
+import pipeline
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CHANGES = 10
+# Fixture overrides the child reads from the scratch directory.
+COURSEWS = 'replay_coursews.json'
+PAGES = 'replay_pages.json'
+
+
+def argv(stage):
+    """The script and arguments pipeline.py runs for a stage."""
+    return pipeline.by_name[stage].run.argv
+
+
+def child(args, fixtures=None):
+    """Run one stage script here, answering fetches from the (changed) fixtures."""
+    coursews, pages, _ = bench_fixtures.load(fixtures)
+    if os.path.exists(COURSEWS):
+        with open(COURSEWS, 'rb') as f:
+            coursews = f.read()
+    if os.path.exists(PAGES):
+        with open(PAGES) as f:
+            pages = {num: page.encode('utf-8') for num, page in json.load(f).items()}
+    bench.replay(coursews, pages)
+    sys.argv = args
+    runpy.run_path(os.path.join(HERE, args[0]), run_name='__main__')
+
+
+def run(scratch, args, fixtures):
+    subprocess.run([sys.executable, os.path.abspath(__file__), '--child', fixtures or '']
+                   + args, cwd=scratch, check=True, stdout=subprocess.DEVNULL)
+
+
+def counts(scratch, stage):
+    with open(os.path.join(scratch, 'reports', stage + '.json')) as f:
+        return json.load(f)['counters'].get('subjects', {})
+
+
+def change(coursews, pages, n):
+    """Toggle +final on n catalog pages and rename n classes; returns the changed numbers."""
+    rng = random.Random(0)
+    changed_pages = rng.sample(sorted(pages), n)
+    for num in changed_pages:
+        page = pages[num]
+        if b'+final' in page:
+            pages[num] = page.replace(b'+final', b'')
+        else:
+            pages[num] = page.replace(b'Units:', b'+final<br>Units:', 1)
+
+    feed = json.loads(coursews)
+    items = [c for c in feed['items'] if c['type'] == 'Class']
+    changed_classes = [c['id'] for c in rng.sample(items, n)]
+    for c in items:
+        if c['id'] in changed_classes:
+            c['label'] += ' (renamed)'
+    return json.dumps(feed).encode('utf-8'), changed_pages, changed_classes
+
+
+def check(name, ok, detail):
+    print('{:8} {}: {}'.format('ok' if ok else 'FAILED', name, detail))
+    return ok
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--child':
+        return child(sys.argv[3:], sys.argv[2] or None)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--changes', type=int, default=CHANGES,
+                        help='catalog pages and coursews classes to change')
+    parser.add_argument('--fixtures', default=None,
+                        help="fixture set to run on; defaults to coursews.py's term, "
+                             "recorded or else reconstructed")
+    args = parser.parse_args()
+
+    coursews, pages, evaluations = bench_fixtures.load(args.fixtures)
+    ok = True
+    with tempfile.TemporaryDirectory() as scratch:
+        bench.setup(scratch, pages, evaluations)
+
+        def scheduled():
+            """One scheduled update; (catalog pages parsed, subjects built)."""
+            run(scratch, ['coursews.py', '--no-cache'], args.fixtures)
+            # Only the fixture's subjects have catalog pages.
+            with open(os.path.join(scratch, 'all_classes'), 'w') as f:
+                json.dump(sorted(pages), f)
+            run(scratch, argv('sublist'), args.fixtures)
+            run(scratch, ['rollup.py'], args.fixtures)
+            run(scratch, argv('combiner'), args.fixtures)
+            return (counts(scratch, 'sublist').get('parsed', 0),
+                    counts(scratch, 'combiner').get('built', 0))
+
+        parsed, built = scheduled()
+        print('first run: {} pages parsed, {} subjects built'.format(parsed, built))
+
+        parsed, built = scheduled()
+        ok &= check('unchanged rerun', parsed == 0 and built == 0,
+                    '{} pages parsed, {} subjects built'.format(parsed, built))
+
+        new_coursews, changed_pages, changed_classes = change(coursews, pages, args.changes)
+        with open(os.path.join(scratch, COURSEWS), 'wb') as f:
+            f.write(new_coursews)
+        with open(os.path.join(scratch, PAGES), 'w') as f:
+            json.dump({num: page.decode('utf-8') for num, page in pages.items()}, f)
+        with open(os.path.join(scratch, 'ws')) as f:
+            in_ws = set(json.load(f))
+        expected = len((set(changed_pages) & in_ws) | set(changed_classes))
+
+        parsed, built = scheduled()
+        ok &= check('changed rerun', parsed == len(changed_pages) and built == expected,
+                    '{} pages parsed (expected {}), {} subjects built (expected {})'.format(
+                        parsed, len(changed_pages), built, expected))
+
+        with open(os.path.join(scratch, 'full.json')) as f:
+            incremental = json.load(f)['classes']
+        os.remove(os.path.join(scratch, 'manifest.json'))
+        parsed, built = scheduled()
+        with open(os.path.join(scratch, 'full.json')) as f:
+            full = json.load(f)['classes']
+        ok &= check('same output as a full rebuild', incremental == full,
+                    '{} subjects rebuilt from scratch'.format(built))
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Corpus check and microbenchmark for timeslots.py.
+
+    python3 bench_timeslots.py [repeats]
+
+Every time string in ws (l_raw/r_raw/b_raw) and CSB.xlsx is parsed by
+timeslots.tsp and by the tsp that used to be copied into coursews.py, and
+the results must agree. The one intended difference is evening times: the
+old code took the start of an EVE range from the daytime table, so
+'M EVE (8.30-10 PM)' came out 27 slots long; the reference here carries
+that fix.
+"""
+
+import itertools
+import json
+import sys
+import time
+
+import timeslots
+import xlsx
+from timeslots import days, times, eve_times
+
+
+def old_tsp_eve(t):
+    wdays = t.split()[0]
+    t = t[t.find("(")+1:t.find(")")].rstrip(' PM')
+
+    slots = []
+    startendtime = t.split('-')
+    try:
+        for d in wdays:
+            if len(startendtime) > 1:
+                length = eve_times[startendtime[1]] - eve_times[startendtime[0]]
+            else:
+                length = 2
+            slots.append((days[d] + eve_times[startendtime[0]], length))
+    except Exception:
+        pass
+
+    return slots
+
+
+def old_tsp(t):
+    if '*' in t:
+        return []
+
+    if 'EVE' in t:
+        return old_tsp_eve(t)
+
+    slots = []
+    try:
+        t = t.split()[0]
+        t = t.split("(")[0]
+
+        for t in t.split(','):
+
+            split = [''.join(x) for _, x in itertools.groupby(t, key=str.isalpha)]
+            startendtime = split[1].split('-')
+
+            for d in split[0]:
+                if len(startendtime) > 1:
+                    length = times[startendtime[1]] - times[startendtime[0]]
+                else:
+                    length = 2
+                slots.append((days[d] + times[startendtime[0]], length))
+    except Exception:
+        pass
+
+    return slots
+
+
+def corpus():
+    strings = []
+    with open('ws') as f:
+        for c in json.load(f).values():
+            for raw in c['l_raw'] + c['r_raw'] + c['b_raw']:
+                strings.extend(raw.strip().split(','))
+    rows = xlsx.rows('CSB.xlsx')
+    next(rows)
+    for row in rows:
+        c = [xlsx.clean(x).replace('"', '').strip() for x in row]
+        if len(c) > 3:
+            strings.extend(c[3].strip().split(','))
+    return strings
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    strings = corpus()
+    distinct = set(strings)
+
+    mismatches = 0
+    for s in sorted(distinct):
+        expected = old_tsp(s)
+        actual = list(timeslots.parse(s)[0])
+        if expected != actual:
+            mismatches += 1
+            print('MISMATCH', repr(s), expected, actual)
+
+    def best(fn):
+        results = []
+        for _ in range(repeats):
+            begin = time.perf_counter()
+            fn()
+            results.append(time.perf_counter() - begin)
+        return min(results)
+
+    old = best(lambda: [old_tsp(s) for s in strings])
+    timeslots.parse.cache_clear()
+    cold = best(lambda: (timeslots.parse.cache_clear(), [timeslots.parse(s) for s in strings]))
+    warm = best(lambda: [timeslots.parse(s) for s in strings])
+
+    us = lambda total: 1e6 * total / len(strings)
+    print(f'{len(strings)} strings, {len(distinct)} distinct, best of {repeats}')
+    print(f'  old tsp:          {us(old):.3f} us/string')
+    print(f'  timeslots (cold): {us(cold):.3f} us/string')
+    print(f'  timeslots (warm): {us(warm):.3f} us/string')
+    print(f'  mismatches:       {mismatches}')
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Single-pass extractor for student.mit.edu catalog pages.
+
+The page is parsed once with lxml. One walk collects the elements in document
+order (what BeautifulSoup's findNext steps through) and one XPath pulls the
+visible text (what soup.getText() returns), and every field sublist_ws.py
+needs is read from those two. The result matches the BeautifulSoup version
+field for field; bench_catalog.py checks that on the pages in fixtures/catalog/.
+"""
+
+from lxml import etree
+
+gterms = ['Fall', 'IAP', 'Spring', 'Summer']
+
+# Text nodes under an element, minus the ones BeautifulSoup's getText() leaves out.
+visible_text = etree.XPath('.//text()[not(parent::script) and not(parent::style)]')
+# The same over the whole document, including stray text after </html>.
+document_text = etree.XPath('//text()[not(parent::script) and not(parent::style)]')
+
+
+def html_str(el):
+    """str(tag) in BeautifulSoup terms: the element and its subtree, no tail."""
+    if el is None:
+        return 'None'
+    return etree.tostring(el, method='html', encoding='unicode', with_tail=False)
+
+
+def is_bare_br(el):
+    return el is not None and el.tag == 'br' and not el.attrib and len(el) == 0 and not el.text
+
+
+def extract(content, out):
+    """
+    Fill out with no_next, repeat, half, url, old_num, level and final.
+
+    Fields are set in the same order as the old parser set them, so a page
+    that breaks halfway leaves the same partial record behind. Raises
+    AttributeError for pages without the expected structure.
+    """
+    out.update({'no_next': False,
+                'repeat': False,
+                'half': False,
+                'url': ''})
+
+    root = etree.HTML(content)
+    if root is None:
+        raise AttributeError('empty page')
+
+    elements = list(root.iter(etree.Element))
+    position = {el: i for i, el in enumerate(elements)}
+
+    def find_next(el, tag=None):
+        for i in range(position[el] + 1, len(elements)):
+            if tag is None or elements[i].tag == tag:
+                return elements[i]
+        return None
+
+    start = next((el for el in elements if el.tag == 'h3'), None)
+    if start is None:
+        raise AttributeError("'NoneType' object has no attribute 'getText'")
+
+    name_split = ''.join(visible_text(start)).split("\n")
+    if len(name_split) > 2 and name_split[1] != "(New)":
+        out['old_num'] = name_split[1][1:-1]
+
+    level = find_next(start, 'img')
+    level = find_next(level, 'img') if level is not None else None
+    if level is None:
+        raise AttributeError("'NoneType' object has no attribute 'findNext'")
+
+    if 'nonext' in html_str(level):
+        out['no_next'] = True
+        level = find_next(level, 'img')
+        if level is None:
+            raise AttributeError("'NoneType' object has no attribute 'findNext'")
+
+    if 'Undergrad' in html_str(level):
+        out['level'] = 'U'
+    elif 'Graduate' in html_str(level):
+        out['level'] = 'G'
+
+    term = find_next(level)
+    while term is not None:
+        next_term = find_next(term)
+        if not any(x in html_str(next_term) for x in gterms):
+            break
+        term = next_term
+    if term is None:
+        raise AttributeError("'NoneType' object has no attribute 'findNext'")
+
+    others = [term]
+    while True:
+        next_other = find_next(others[-1])
+        if is_bare_br(next_other):
+            break
+        if next_other is None:
+            raise AttributeError("'NoneType' object has no attribute 'findNext'")
+        others.append(next_other)
+
+    if any('repeat.gif' in html_str(other) for other in others):
+        out['repeat'] = True
+
+    text = ''.join(document_text(root))
+
+    half = text.split(' half of term')
+    if len(half) > 1:
+        term = half[0].split(' ')[-1].strip()
+        if term == "first":
+            out['half'] = 1
+        if term == "second":
+            out['half'] = 2
+
+    url = text.split('URL: ')
+    if len(url) > 1:
+        out['url'] = url[1].split('\n')[0].strip('?')
+
+    out['final'] = '+final' in text
@@ -1,14 +1,15 @@
 import json
 import copy
 
+import rollup
+
 with open('csb') as f:
     times = json.load(f)
 
 with open('sublist') as f:
     descs = json.load(f)
 
-with open('evaluations') as f:
-    evals = json.load(f)
+evals = rollup.load_table()
 
 classes = {}
 
@@ -73,29 +74,7 @@ for c in times:
         classes[c]['d'] = "This class is in the registrar's schedule, but not the course catalog."
         classes[c]['n'] = 'Special Subject'
 
-    if c in evals:
-        total_rating = 0
-        total_hours = 0
-        total_size = 0
-        terms = 0
-        
-        for t in evals[c]:
-            if t['resp'] > 0:
-                total_rating += t['rating']
-                total_hours += t['oc_hours'] + t['ic_hours']
-                total_size += t['eligible']
-                terms += 1
-                
-        if terms == 0:
-            terms = 1
-            
-        classes[c]['ra'] = round(total_rating / terms, 1)
-        classes[c]['h'] = round(total_hours / terms, 1)
-        classes[c]['si'] = round(total_size / terms, 1)
-    else:
-        classes[c]['ra'] = 0
-        classes[c]['h'] = 0
-        classes[c]['si'] = 0
+    classes[c].update(rollup.lookup(evals, c))
 
 try:
     # Special case 14.01/14.02 rec-only sections.
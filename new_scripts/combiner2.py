@@ -2,6 +2,8 @@ import json
 import copy
 from functools import cmp_to_key
 
+import rollup
+
 def class_sort_internal(a, b):
     if len(a) < len(b):
         return -1
@@ -51,8 +53,7 @@ with open('csb') as f:
 with open('sublist') as f:
     descs = json.load(f)
 
-with open('evaluations') as f:
-    evals = json.load(f)
+evals = rollup.load_table()
 
 classes_base = []
 classes_extended = []
@@ -165,29 +166,10 @@ for c in times:
         cl_e['a'] = ''
         cl_e['p'] = ''
 
-    if c in evals:
-        total_rating = 0
-        total_hours = 0
-        total_size = 0
-        terms = 0
-        
-        for t in evals[c]:
-            if t['resp'] > 0:
-                total_rating += t['rating']
-                total_hours += t['oc_hours'] + t['ic_hours']
-                total_size += t['eligible']
-                terms += 1
-                
-        if terms == 0:
-            terms = 1
-            
-        cl['r'] = round(total_rating / terms, 1)
-        cl['h'] = round(total_hours / terms, 1)
-        cl_e['z'] = round(total_size / terms, 1)
-    else:
-        cl['r'] = 0
-        cl['h'] = 0
-        cl_e['z'] = 0
+    averages = rollup.lookup(evals, c)
+    cl['r'] = averages['ra']
+    cl['h'] = averages['h']
+    cl_e['z'] = averages['si']
 
     classes_base.append(cl)
     classes_extended.append(cl_e)
@@ -1,18 +1,35 @@
 import json
+import sys
 import copy
 import datetime
 
+import compact
+import delta
+import instrument
+import manifest
+import payload
+import rollup
+import timeslots
+
+incremental = '--incremental' in sys.argv
+split = '--split' in sys.argv
+compact_output = '--compact' in sys.argv
+
+instrument.start('combiner')
+
 with open('ws') as f:
     ws = json.load(f)
 
 with open('sublist') as f:
     sublist = json.load(f)
 
-with open('evaluations') as f:
-    evals = json.load(f)
+# Rating, hours and size averages per subject, from rollup.py.
+evals = rollup.load_table()
 
-    # Special case 6.871 evals.
-    # evals['6.871'] = evals['HST.956']
+instrument.lap('load')
+
+# Special case 6.871 evals.
+# evals['6.871'] = evals['HST.956']
 
 classes = {}
 
@@ -22,8 +39,8 @@ def all_virtual(sections):
             return False
     return True
 
-for c in ws:
-    classes[c] = {
+def build_class(c):
+    cl = {
         'no': c,
         'co': ws[c]['course'],
         'cl': ws[c]['class'],
@@ -37,76 +54,85 @@ for c in ws:
         'rr': ws[c]['r_raw'],
         'br': ws[c]['b_raw']}
 
-    classes[c]['hh'] = ws[c]['HASS-H']
-    classes[c]['ha'] = ws[c]['HASS-A']
-    classes[c]['hs'] = ws[c]['HASS-S']
-    classes[c]['he'] = ws[c]['HASS-E']
-    classes[c]['ci'] = ws[c]['CI-H']
-    classes[c]['cw'] = ws[c]['CI-HW']
-    classes[c]['re'] = ws[c]['REST']
-    classes[c]['la'] = ws[c]['LAB']
-    classes[c]['pl'] = ws[c]['pLAB']
-    classes[c]['u1'] = ws[c]['units1']
-    classes[c]['u2'] = ws[c]['units2']
-    classes[c]['u3'] = ws[c]['units3']
-    classes[c]['le'] = ws[c]['level']
-    classes[c]['sa'] = ws[c]['same_as']
-    classes[c]['mw'] = ws[c]['meets_with']
-    classes[c]['lm'] = ws[c]['limited']
-    classes[c]['t'] = ws[c]['terms']
-    classes[c]['pr'] = ws[c]['prereq']
-    classes[c]['d'] = ws[c]['desc']
-    classes[c]['n'] = ws[c]['name']
-
-    classes[c]['i'] = ws[c]['in-charge']
-    classes[c]['v'] = all_virtual(ws[c]['l'] + ws[c]['r'] + ws[c]['b'])
+    cl['hh'] = ws[c]['HASS-H']
+    cl['ha'] = ws[c]['HASS-A']
+    cl['hs'] = ws[c]['HASS-S']
+    cl['he'] = ws[c]['HASS-E']
+    cl['ci'] = ws[c]['CI-H']
+    cl['cw'] = ws[c]['CI-HW']
+    cl['re'] = ws[c]['REST']
+    cl['la'] = ws[c]['LAB']
+    cl['pl'] = ws[c]['pLAB']
+    cl['u1'] = ws[c]['units1']
+    cl['u2'] = ws[c]['units2']
+    cl['u3'] = ws[c]['units3']
+    cl['le'] = ws[c]['level']
+    cl['sa'] = ws[c]['same_as']
+    cl['mw'] = ws[c]['meets_with']
+    cl['lm'] = ws[c]['limited']
+    cl['t'] = ws[c]['terms']
+    cl['pr'] = ws[c]['prereq']
+    cl['d'] = ws[c]['desc']
+    cl['n'] = ws[c]['name']
+
+    cl['i'] = ws[c]['in-charge']
+    cl['v'] = all_virtual(ws[c]['l'] + ws[c]['r'] + ws[c]['b'])
 
 
     if c in sublist:
-        classes[c]['nx'] = sublist[c]['no_next']
-        classes[c]['hf'] = sublist[c]['half']
-        classes[c]['rp'] = sublist[c]['repeat']
-        classes[c]['u'] = sublist[c]['url']
+        cl['nx'] = sublist[c]['no_next']
+        cl['hf'] = sublist[c]['half']
+        cl['rp'] = sublist[c]['repeat']
+        cl['u'] = sublist[c]['url']
         try:
-            classes[c]['f'] = sublist[c]['final']
+            cl['f'] = sublist[c]['final']
         except:
             print('failed to get final for', c)
-            classes[c]['f'] = False
+            cl['f'] = False
         if 'old_num' in sublist[c]:
-            classes[c]['on'] = sublist[c]['old_num']
-            classes[c]['n'] = "[" + sublist[c]['old_num'] + "] " + classes[c]['n']
+            cl['on'] = sublist[c]['old_num']
+            cl['n'] = "[" + sublist[c]['old_num'] + "] " + cl['n']
     else:
-        classes[c]['nx'] = False
-        classes[c]['hf'] = False
-        classes[c]['rp'] = False
-        classes[c]['u'] = ''
-        classes[c]['f'] = False
-
-    old_c = classes[c].get('on', None)
-    if c in evals or (old_c and old_c in evals):
-        total_rating = 0
-        total_hours = 0
-        total_size = 0
-        terms = 0
-        
-        evals_ = evals[old_c] if old_c else evals[c]
-        for t in evals_:
-            if t['resp'] > 0:
-                total_rating += t['rating']
-                total_hours += t['oc_hours'] + t['ic_hours']
-                total_size += t['eligible']
-                terms += 1
-                
-        if terms == 0:
-            terms = 1
-            
-        classes[c]['ra'] = round(total_rating / terms, 1)
-        classes[c]['h'] = round(total_hours / terms, 1)
-        classes[c]['si'] = round(total_size / terms, 1)
+        cl['nx'] = False
+        cl['hf'] = False
+        cl['rp'] = False
+        cl['u'] = ''
+        cl['f'] = False
+
+    cl.update(rollup.lookup(evals, c, cl.get('on')))
+
+    return cl
+
+
+def input_digest(c):
+    old_c = sublist.get(c, {}).get('old_num')
+    return manifest.digest([ws[c], sublist.get(c), evals.get(c), evals.get(old_c)])
+
+
+# Reuse last run's entry for any class whose inputs (and this script and the
+# modules it uses) are unchanged.
+state = manifest.load()
+script_digest = manifest.source_digest(__file__)
+known = state.get('combiner', {})
+previous = {}
+if incremental and known.get('script') == script_digest:
+    previous = manifest.load_previous('full.json', {}).get('classes', {})
+known = known.get('classes', {})
+
+digests = {}
+for c in ws:
+    digests[c] = input_digest(c)
+    if c in previous and known.get(c) == digests[c]:
+        classes[c] = previous[c]
+        instrument.count('subjects', 'reused')
     else:
-        classes[c]['ra'] = 0
-        classes[c]['h'] = 0
-        classes[c]['si'] = 0
+        classes[c] = build_class(c)
+        instrument.count('subjects', 'built')
+
+# Forget the old digests until full.json is rewritten below, so a run that
+# dies in between cannot leave them vouching for entries they don't describe.
+if state.pop('combiner', None) is not None:
+    manifest.save(state)
 
 # Special case 2.008 schedule.
 # classes['2.008']['s'] = ['l', 'b']
@@ -151,10 +177,62 @@ except Exception as e:
 classes['22.05']['l'] = [[[[33,3],[93,3]],"24-121"]]
 classes['22.05']['r'] = [[[[124,2]],"24-121"]]
 
+# Occupancy bitmasks (five 30-bit day words) parallel to l/r/b, built last so
+# they include the special cases above.
+for c in classes:
+    for s in ['l', 'r', 'b']:
+        if s in classes[c]:
+            classes[c][s + 'o'] = [timeslots.occupancy(slots) for slots, _ in classes[c][s]]
+
+
+instrument.lap('build')
+
+
+def verify_occupancy(classes, neighbours=10):
+    """
+    Check every mask against its slot list, and check that ANDing masks gives
+    the same answer as comparing slots pairwise for each class's sections
+    against its own and the next few classes' sections. A slot without a
+    positive length has no bits in its mask, so it is reported on its own.
+    """
+    bad = 0
+    sections = []
+    for c in classes:
+        own = []
+        for s in ['l', 'r', 'b']:
+            for (slots, _), mask in zip(classes[c].get(s, []), classes[c].get(s + 'o', [])):
+                if any(length <= 0 for _, length in slots):
+                    print('occupancy mask cannot represent empty slot for', c, s, slots)
+                    bad += 1
+                if timeslots.occupied(mask) != timeslots.covered(slots):
+                    print('occupancy mask disagrees with slots for', c, s, slots)
+                    bad += 1
+                own.append((c, slots, mask))
+        sections.append(own)
+
+    for i, own in enumerate(sections):
+        others = [x for near in sections[i:i + neighbours + 1] for x in near]
+        for c1, slots1, mask1 in own:
+            for c2, slots2, mask2 in others:
+                pairwise = any(timeslots.conflict_check(a, b) for a in slots1 for b in slots2)
+                if pairwise != timeslots.overlaps(mask1, mask2):
+                    print('occupancy masks disagree on conflict between', c1, c2)
+                    bad += 1
+    return bad
+
+
+if verify_occupancy(classes):
+    sys.exit('occupancy bitmasks failed verification; not writing full.js')
+instrument.lap('verify')
+instrument.count('classes', n=len(classes))
+
 last_update = datetime.datetime.now().strftime('%Y-%m-%d %l:%M %p')
+# The id delta.py publishes patches from, so a loaded page knows where it stands.
+version = delta.version(classes)
 
 with open('full.js', 'w') as f:
     f.write('var last_update = "' + last_update + '";\n')
+    f.write('var version = "' + version + '";\n')
     f.write('var classes = ')
     json.dump(classes, f, separators=(',', ':'))
     f.write(';')
@@ -164,3 +242,14 @@ with open('full.json', 'w') as f:
     obj["lastUpdated"] = last_update
     obj["classes"] = classes
     json.dump(obj, f, separators=(',', ':'))
+
+state['combiner'] = {'script': script_digest, 'classes': digests}
+manifest.save(state)
+
+if split:
+    payload.write(classes, last_update, version)
+
+if compact_output:
+    compact.write(classes, last_update)
+
+instrument.lap('write')
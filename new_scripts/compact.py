@@ -0,0 +1,153 @@
+"""
+Compact column-wise encoding of the class data in full.js.
+
+Instead of one object per class repeating every key, each field becomes one
+array over all classes:
+
+  - fields that are always true/false are packed into one integer per class
+    (bit i is flags[i]);
+  - repetitive string fields (course, level, instructors, same-as, ...) hold
+    indices into a shared string table;
+  - sections are [room, start, length, start, length, ...] with the room
+    interned as well;
+  - occupancy masks are left out and rebuilt from the sections;
+  - everything else is stored as is, with null for classes missing the field.
+
+decode() (and decode_compact() in www/compact.js) rebuild the usual classes
+object with the original field names.
+
+    python3 compact.py [full.json]    # -> compact.js
+"""
+
+import json
+import sys
+
+import timeslots
+
+VERSION = 1
+
+section_fields = ['l', 'r', 'b']
+mask_fields = {s + 'o': s for s in section_fields}
+
+
+class Strings:
+    def __init__(self):
+        self.table = []
+        self.index = {}
+
+    def __call__(self, s):
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.table)
+            self.table.append(s)
+        return i
+
+
+def encode(classes):
+    numbers = list(classes)
+    fields = []
+    for cl in classes.values():
+        for k in cl:
+            if k not in fields:
+                fields.append(k)
+
+    def column(k):
+        return [classes[c].get(k) for c in numbers]
+
+    flags = [k for k in fields
+             if all(type(classes[c].get(k)) is bool for c in numbers)]
+    # Strings repeated often enough that an index beats the text.
+    interned = [k for k in fields
+                if k not in flags and k not in section_fields
+                and all(isinstance(v, str) for v in column(k))
+                and 2 * len(set(column(k))) <= len(numbers)]
+
+    strings = Strings()
+    bits = [sum(1 << i for i, k in enumerate(flags) if classes[c][k]) for c in numbers]
+    columns = {}
+    for k in fields:
+        if k in flags or k in mask_fields:
+            continue
+        if k in interned:
+            columns[k] = [strings(v) for v in column(k)]
+        elif k in section_fields:
+            columns[k] = [None if v is None else
+                          [[strings(room)] + [x for slot in slots for x in slot] for slots, room in v]
+                          for v in column(k)]
+        else:
+            columns[k] = column(k)
+
+    obj = {'v': VERSION,
+           'fields': fields,
+           'flags': flags,
+           'interned': interned,
+           'masks': [k for k in fields if k in mask_fields],
+           'strings': strings.table,
+           'bits': bits,
+           'columns': columns}
+    # Classes are keyed by their number; only spell the keys out if not.
+    if numbers != column('no'):
+        obj['keys'] = numbers
+    return obj
+
+
+def decode(obj):
+    if obj['v'] != VERSION:
+        raise ValueError(f"unknown compact encoding version {obj['v']}")
+    strings = obj['strings']
+    columns = obj['columns']
+    bits = obj['bits']
+
+    # How to rebuild each field, worked out once rather than per class.
+    kinds = []
+    for k in obj['fields']:
+        if k in obj['masks']:
+            kinds.append((k, 'mask', mask_fields[k]))
+        elif k in obj['flags']:
+            kinds.append((k, 'flag', obj['flags'].index(k)))
+        elif k in obj['interned']:
+            kinds.append((k, 'interned', columns[k]))
+        elif k in section_fields:
+            kinds.append((k, 'sections', columns[k]))
+        else:
+            kinds.append((k, 'raw', columns[k]))
+
+    classes = {}
+    for row, number in enumerate(obj.get('keys') or columns['no']):
+        cl = {}
+        for k, kind, arg in kinds:
+            if kind == 'mask':
+                if arg in cl:
+                    cl[k] = [list(timeslots.occupancy(slots)) for slots, _ in cl[arg]]
+            elif kind == 'flag':
+                cl[k] = bool(bits[row] >> arg & 1)
+            else:
+                v = arg[row]
+                if v is None:
+                    continue
+                if kind == 'interned':
+                    v = strings[v]
+                elif kind == 'sections':
+                    v = [[[[s[i], s[i + 1]] for i in range(1, len(s), 2)], strings[s[0]]] for s in v]
+                cl[k] = v
+        classes[number] = cl
+    return classes
+
+
+def write(classes, last_update, path='compact.js'):
+    with open(path, 'w') as f:
+        f.write('var last_update = "' + last_update + '";\n')
+        f.write('var classes_compact = ')
+        json.dump(encode(classes), f, separators=(',', ':'))
+        f.write(';')
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'full.json'
+    with open(path) as f:
+        obj = json.load(f)
+    write(obj['classes'], obj['lastUpdated'])
+
+
+if __name__ == '__main__':
+    main()
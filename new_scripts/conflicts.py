@@ -0,0 +1,179 @@
+"""
+Section-pair conflict index over the whole term.
+
+Sections that meet at exactly the same times share an occupancy pattern, and a
+term only has a few hundred distinct patterns. The index maps every section
+option in full.json (one entry of a class's l, r or b list) to its pattern id,
+and stores for each pattern a bitset of the patterns it overlaps. "Does this
+class fit my schedule" becomes: for each of its section types, is there an
+option whose overlap bitset misses every chosen pattern.
+
+fits() answers as conflict_helper in www/script.js does: a class needs a
+clear option for every section type it lists, so a class with no sections,
+or a type with no options, does not fit once anything is chosen. Masks agree
+with conflict_check because timeslots.parse only returns slots of positive
+length; main() checks both against a port of conflict_helper on every run.
+
+    python3 conflicts.py          # full.json -> conflicts.json, conflicts.js
+
+Bitsets are base64 of little-endian bytes (pattern p is bit p % 8 of byte
+p // 8). The same file loads into ConflictIndex for Python callers.
+"""
+
+import base64
+import json
+import sys
+
+import timeslots
+
+section_types = ['l', 'r', 'b']
+
+
+def build(classes):
+    patterns = {}
+    options = {}
+    for number, cl in classes.items():
+        # The section types the page checks, even ones without options.
+        options[number] = {}
+        for typ in cl['s']:
+            masks = cl.get(typ + 'o')
+            if masks is None:
+                masks = [timeslots.occupancy(slots) for slots, _ in cl.get(typ, [])]
+            options[number][typ] = [
+                patterns.setdefault(tuple(mask), len(patterns)) for mask in masks]
+
+    # Patterns meeting in each half-hour; two patterns overlap exactly when
+    # they share one.
+    buckets = [0] * (timeslots.timeslots * len(timeslots.days))
+    occupied = [timeslots.occupied(mask) for mask in patterns]
+    for p, slots in enumerate(occupied):
+        for slot in slots:
+            buckets[slot] |= 1 << p
+
+    width = (len(patterns) + 7) // 8
+    overlaps = []
+    for slots in occupied:
+        bits = 0
+        for slot in slots:
+            bits |= buckets[slot]
+        overlaps.append(base64.b64encode(bits.to_bytes(width, 'little')).decode('ascii'))
+
+    return {'patterns': len(patterns), 'options': options, 'overlaps': overlaps}
+
+
+class ConflictIndex:
+    def __init__(self, index):
+        self.options = index['options']
+        self.overlaps = [int.from_bytes(base64.b64decode(o), 'little') for o in index['overlaps']]
+
+    @classmethod
+    def load(cls, path='conflicts.json'):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def pattern(self, number, typ, i):
+        return self.options[number][typ][i]
+
+    def chosen_bits(self, chosen):
+        """Bitset of the patterns of chosen (number, type, index) options."""
+        bits = 0
+        for number, typ, i in chosen:
+            bits |= 1 << self.pattern(number, typ, i)
+        return bits
+
+    def conflicts(self, a, b):
+        """Whether two (number, type, index) options overlap."""
+        return bool(self.overlaps[self.pattern(*a)] >> self.pattern(*b) & 1)
+
+    def fits(self, number, chosen):
+        """Whether every section type of `number` has an option clear of the chosen options."""
+        if not isinstance(chosen, int):
+            chosen = self.chosen_bits(chosen)
+        if not chosen:
+            return True
+        types = self.options.get(number, {})
+        if not types:
+            return False
+        for patterns in types.values():
+            if all(self.overlaps[p] & chosen for p in patterns):
+                return False
+        return True
+
+    def fitting(self, chosen, numbers=None):
+        """All classes (or those in numbers) that fit around the chosen options."""
+        chosen = self.chosen_bits(chosen)
+        if numbers is None:
+            numbers = self.options
+        return [number for number in numbers if self.fits(number, chosen)]
+
+
+def page_fits(classes, number, chosen):
+    """conflict_helper from www/script.js over the chosen (number, type, index) options."""
+    if not chosen:
+        return True
+    old_slots = [slot for n, typ, i in chosen for slot in classes[n][typ][i][0]]
+    if not classes[number]['s']:
+        return False
+    for typ in classes[number]['s']:
+        if not any(not any(timeslots.conflict_check(slot, old) for old in old_slots
+                           for slot in option[0])
+                   for option in classes[number][typ]):
+            return False
+    return True
+
+
+def verify(classes, index, neighbours=10):
+    """
+    Check every pair of distinct slot lists against conflict_check, then
+    compare fits() with page_fits() for each class's first options chosen,
+    against that class and the next few. Returns the number of disagreements.
+    """
+    conflicts = ConflictIndex(index)
+    numbers = list(classes)
+    bad = 0
+
+    # Every pair of distinct meeting patterns, bit against slots.
+    slot_lists = {}
+    for number, types in index['options'].items():
+        for typ, patterns in types.items():
+            for (slots, _), p in zip(classes[number][typ], patterns):
+                slot_lists.setdefault(tuple(map(tuple, slots)), p)
+    pairs = list(slot_lists.items())
+    for a, p in pairs:
+        for b, q in pairs:
+            pairwise = any(timeslots.conflict_check(x, y) for x in a for y in b)
+            if pairwise != bool(conflicts.overlaps[p] >> q & 1):
+                print('conflict index disagrees with conflict_check on', a, b)
+                bad += 1
+
+    for i, number in enumerate(numbers):
+        chosen = [(number, typ, 0) for typ in classes[number]['s'] if classes[number][typ]]
+        for other in numbers[i:i + neighbours + 1]:
+            if conflicts.fits(other, chosen) != page_fits(classes, other, chosen):
+                print('conflict index disagrees with the page on', other, 'around', chosen)
+                bad += 1
+    return bad
+
+
+def main():
+    with open('full.json') as f:
+        classes = json.load(f)['classes']
+
+    index = build(classes)
+    if verify(classes, index):
+        sys.exit('conflict index failed verification; not writing conflicts.js')
+
+    with open('conflicts.json', 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+
+    with open('conflicts.js', 'w') as f:
+        f.write('var conflicts = ')
+        json.dump(index, f, separators=(',', ':'))
+        f.write(';')
+
+    sections = sum(len(o) for typs in index['options'].values() for o in typs.values())
+    print(sections, 'sections,', index['patterns'], 'distinct patterns')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,119 +1,20 @@
 import json
-import requests
-import itertools
+import sys
 
-term = '2023FA'
+import fetch
+import httpcache
+import instrument
+import jsonstream
+from timeslots import tsp
 
-# copied from csb.py
-
-timeslots = 30
-days = {'M': 0,
-        'T': timeslots,
-        'W': timeslots * 2,
-        'R': timeslots * 3,
-        'F': timeslots * 4}
-times = {'8': 0,
-         '8.30': 1,
-         '9': 2,
-         '9.30': 3,
-         '10': 4,
-         '10.30': 5,
-         '11': 6,
-         '11.30': 7,
-         '12': 8,
-         '12.30': 9,
-         '1': 10,
-         '1.30': 11,
-         '2': 12,
-         '2.30': 13,
-         '3': 14,
-         '3.30': 15,
-         '4': 16,
-         '4.30': 17,
-         '5': 18,
-         '5.30': 19,
-         '6': 20,
-         '6.30': 21,
-         '7': 22,
-         '7.30': 23}
-
-eve_times = {'12': 8,
-             '12.30': 9,
-             '1': 10,
-             '1.30': 11,
-             '2': 12,
-             '2.30': 13,
-             '3': 14,
-             '3.30': 15,
-             '4': 16,
-             '4.30': 17,
-             '5': 18,
-             '5.30': 19,
-             '6': 20,
-             '6.30': 21,
-             '7': 22,
-             '7.30': 23,
-             '8': 24,
-             '8.30': 25,
-             '9': 26,
-             '9.30': 27,
-             '10': 28,
-             '10.30': 29}
-
-def tsp_eve(t, number):
-    wdays = t.split()[0]
-    t = t[t.find("(")+1:t.find(")")].rstrip(' PM')
-    
-    slots = []
-    startendtime = t.split('-')
-    try:
-        for d in wdays:
-            if len(startendtime) > 1:
-                length = eve_times[startendtime[1]] - times[startendtime[0]]
-            else:
-                length = 2
-            slots.append((days[d] + eve_times[startendtime[0]], length))
-    except Exception as e:
-        print("tsp_eve", e, t, number)
-
-    return slots
-
-def tsp(t, number):
-    if '*' in t:
-        return []
-    
-    if 'EVE' in t:
-        return tsp_eve(t, number)
-    
-    slots = []
-    try:
-        t = t.split()[0]
-        # remove trailing parens e.g. MWF2(LIMITEDTO15)
-        t = t.split("(")[0]
-
-        for t in t.split(','):
-
-            split = [''.join(x) for _, x in itertools.groupby(t, key=str.isalpha)]
-            startendtime = split[1].split('-')
-
-            for d in split[0]:
-                if len(startendtime) > 1:
-                    length = times[startendtime[1]] - times[startendtime[0]]
-                else:
-                    length = 2
-                slots.append((days[d] + times[startendtime[0]], length))
-    except Exception as e:
-        print("tsp", e, t, number)
-
-    return slots
+term = '2023FA'
 
-url = f'http://coursews.mit.edu/coursews/?term={term}'
+# --base-url points the scrape at another host, e.g. replay_server.py.
+base_url = 'http://coursews.mit.edu'
+if '--base-url' in sys.argv:
+    base_url = sys.argv[sys.argv.index('--base-url') + 1].rstrip('/')
 
-raw_text = requests.get(url).text
-# hilariously, the json is invalid thanks to one class
-fixed_text = raw_text.replace('"Making"', '&quot;Making&quot;')
-raw_classes = json.loads(fixed_text)['items']
-classes = {}
+url = f'{base_url}/coursews/?term={term}'
 
 terms = {'Fall': 'FA', 'IAP': 'JA', 'Spring': 'SP', 'Summer': 'SU'}
 
@@ -149,59 +50,57 @@ with open("course_six_renumbering.json") as f:
     course_six_renumbering = json.loads(f.read())
     course_six_renumbering_inv = {v: k for k, v in course_six_renumbering.items()}
 
-for c in raw_classes:
-    if c['type'] == 'Class':
-        number = c['id']
-        name = c['label']
-
-        # if number in course_six_renumbering_inv:
-        #     name = "[" + course_six_renumbering_inv[number] + "] " + name
-
-        units1, units2, units3 = parse_units(c['units'])
-
-        classes[number] = {
-            'number': number,
-            'name':name,
-            'course': number.split('.')[0],
-            'class': number.split('.')[1],
-            'sections': [],
-            'l': [],
-            'r': [],
-            'b': [],
-            'l_raw': [],
-            'r_raw': [],
-            'b_raw': [],
-            'tba': False,
-            'all_slots': [],
-            'level': ('U' if c['level'] == 'Undergraduate' else 'G'),
-            'terms': term_map(c['semester']),
-            'desc': c['description'],
-            'units1': int(units1),    
-            'units2': int(units2),
-            'units3': int(units3),
-            'total_units': int(c['total-units']),
-            'REST': c['gir_attribute'] == 'REST',
-            'LAB': c['gir_attribute'] == 'LAB',
-            'pLAB': c['gir_attribute'] == 'LAB2',
-            'CI-H': c['comm_req_attribute'] == 'CIH',
-            'CI-HW': c['comm_req_attribute'] == 'CIHW',
-            'CI-M': c['comm_req_attribute'] == 'CIM',
-            'HASS-H': 'HH' in c['hass_attribute'],
-            'HASS-A': 'HA' in c['hass_attribute'],
-            'HASS-S': 'HS' in c['hass_attribute'],
-            'HASS-E': 'HE' in c['hass_attribute'],
-            'prereq': parse_prereqs(c['prereqs']),
-            'same_as': parse_joint(c['joint_subjects']),
-            'meets_with': parse_joint(c['meets_with_subjects']),
-            'sat': False,
-            'limited': 'limited' in c['description'].lower(),
-            # 'instructors': ', '.join(c[instructors]),
-            'in-charge': c['in-charge']}
-
-for c in raw_classes:
-    if c['type'] == 'Class':
-        continue
-    elif c['type'] == 'LectureSession':
+def add_class(c):
+    number = c['id']
+    name = c['label']
+
+    # if number in course_six_renumbering_inv:
+    #     name = "[" + course_six_renumbering_inv[number] + "] " + name
+
+    units1, units2, units3 = parse_units(c['units'])
+
+    classes[number] = {
+        'number': number,
+        'name':name,
+        'course': number.split('.')[0],
+        'class': number.split('.')[1],
+        'sections': [],
+        'l': [],
+        'r': [],
+        'b': [],
+        'l_raw': [],
+        'r_raw': [],
+        'b_raw': [],
+        'tba': False,
+        'all_slots': [],
+        'level': ('U' if c['level'] == 'Undergraduate' else 'G'),
+        'terms': term_map(c['semester']),
+        'desc': c['description'],
+        'units1': int(units1),    
+        'units2': int(units2),
+        'units3': int(units3),
+        'total_units': int(c['total-units']),
+        'REST': c['gir_attribute'] == 'REST',
+        'LAB': c['gir_attribute'] == 'LAB',
+        'pLAB': c['gir_attribute'] == 'LAB2',
+        'CI-H': c['comm_req_attribute'] == 'CIH',
+        'CI-HW': c['comm_req_attribute'] == 'CIHW',
+        'CI-M': c['comm_req_attribute'] == 'CIM',
+        'HASS-H': 'HH' in c['hass_attribute'],
+        'HASS-A': 'HA' in c['hass_attribute'],
+        'HASS-S': 'HS' in c['hass_attribute'],
+        'HASS-E': 'HE' in c['hass_attribute'],
+        'prereq': parse_prereqs(c['prereqs']),
+        'same_as': parse_joint(c['joint_subjects']),
+        'meets_with': parse_joint(c['meets_with_subjects']),
+        'sat': False,
+        'limited': 'limited' in c['description'].lower(),
+        # 'instructors': ', '.join(c[instructors]),
+        'in-charge': c['in-charge']}
+
+
+def add_section(c):
+    if c['type'] == 'LectureSession':
         typ = 'l'
         typraw = 'l_raw'
     elif c['type'] == 'RecitationSession':
@@ -212,13 +111,13 @@ for c in raw_classes:
         typraw = 'b_raw'
     else:
         print("unknown type", c)
-        continue
+        return
     
     number = c['section-of']
 
     if number not in classes:
         print('section for nonexistent class', number)
-        continue
+        return
 
     cl = classes[number]
 
@@ -245,12 +144,12 @@ for c in raw_classes:
     # Check for TBA.
     if t == '*TO BE ARRANGED' or t == 'null' or t.lower() == 'tbd' or t.lower() == 'tba' or t == '*TOBEARRANGED':
         cl['tba'] = True
-        continue
+        return
 
     # Check for Saturday :(
     if 'S' in t:
         cl['sat'] = True
-        continue
+        return
     
     # Parse timeslot.
     # Format: 30 timeslots a day.
@@ -260,13 +159,15 @@ for c in raw_classes:
 
     # If no slots, ignore.
     if slots == []:
-        continue
+        return
 
-    # If duplicate slot, throw out.
-    if slots in cl['all_slots']:
-        continue
-    else:
-        cl['all_slots'].append(slots)
+    # If duplicate slot (for this section type), throw out.
+    seen = seen_slots.setdefault((number, typ), set())
+    key = tuple(sorted(slots))
+    if key in seen:
+        return
+    seen.add(key)
+    cl['all_slots'].append(slots)
 
     slots = (slots, p)
 
@@ -276,8 +177,51 @@ for c in raw_classes:
     cl[typ].append(slots)
     cl[typraw].append(t)
 
+
+classes = {}
+
+# Sorted slot tuples already seen, per (class, section type).
+seen_slots = {}
+
+# Sections that show up before their class wait here until it does.
+pending = {}
+
+instrument.start('coursews')
+cache = None if '--no-cache' in sys.argv else httpcache.Cache()
+body = fetch.stream(fetch.make_session(1), url, timeout=120, cache=cache)
+# hilariously, the json is invalid thanks to one class
+text = jsonstream.repair(jsonstream.decode(body), [('"Making"', '&quot;Making&quot;')])
+
+# ws and all_classes are only written once the whole feed has been read; a
+# failed or cut-off download leaves the previous ones in place.
+try:
+    for c in jsonstream.iter_items(text):
+        if c['type'] == 'Class':
+            add_class(c)
+            for section in pending.pop(c['id'], []):
+                add_section(section)
+        elif c.get('section-of') in classes:
+            add_section(c)
+        else:
+            pending.setdefault(c.get('section-of'), []).append(c)
+except (fetch.FetchError, ValueError) as e:
+    sys.exit('coursews: {}; ws and all_classes left unchanged'.format(e))
+
+# Whatever is left never found its class.
+for sections in pending.values():
+    for section in sections:
+        add_section(section)
+
+instrument.lap('download and parse')
+instrument.count('classes', n=len(classes))
+
+if cache is not None:
+    cache.evict()
+
 with open('ws', 'w') as f:
     json.dump(classes, f)
 
 with open('all_classes', 'w') as f:
     json.dump(list(classes.keys()), f)
+
+instrument.lap('write')
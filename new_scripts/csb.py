@@ -1,114 +1,20 @@
 import string
-import itertools
 import json
+import sys
 
-timeslots = 30
-days = {'M': 0,
-        'T': timeslots,
-        'W': timeslots * 2,
-        'R': timeslots * 3,
-        'F': timeslots * 4}
-times = {'8': 0,
-         '8.30': 1,
-         '9': 2,
-         '9.30': 3,
-         '10': 4,
-         '10.30': 5,
-         '11': 6,
-         '11.30': 7,
-         '12': 8,
-         '12.30': 9,
-         '1': 10,
-         '1.30': 11,
-         '2': 12,
-         '2.30': 13,
-         '3': 14,
-         '3.30': 15,
-         '4': 16,
-         '4.30': 17,
-         '5': 18,
-         '5.30': 19,
-         '6': 20,
-         '6.30': 21,
-         '7': 22,
-         '7.30': 23}
-
-eve_times = {'1': 10,
-             '1.30': 11,
-             '2': 12,
-             '2.30': 13,
-             '3': 14,
-             '3.30': 15,
-             '4': 16,
-             '4.30': 17,
-             '5': 18,
-             '5.30': 19,
-             '6': 20,
-             '6.30': 21,
-             '7': 22,
-             '7.30': 23,
-             '8': 24,
-             '8.30': 25,
-             '9': 26,
-             '9.30': 27,
-             '10': 28,
-             '10.30': 29}
-
-def tsp_eve(t):
-    wdays = t.split()[0]
-    t = t[t.find("(")+1:t.find(")")].rstrip(' PM')
-    
-    slots = []
-    startendtime = t.split('-')
-    try:
-        for d in wdays:
-            if len(startendtime) > 1:
-                length = eve_times[startendtime[1]] - times[startendtime[0]]
-            else:
-                length = 2
-            slots.append((days[d] + eve_times[startendtime[0]], length))
-    except Exception:
-        print(t)
-
-    return slots
-
-def tsp(t):
-    if '*' in t:
-        return []
-    
-    if 'EVE' in t:
-        return tsp_eve(t)
-
-    t = t.split()[0]
-    slots = []
-    
-    try:
-        for t in t.split(','):
-
-            split = [''.join(x) for _, x in itertools.groupby(t, key=str.isalpha)]
-            startendtime = split[1].split('-')
-
-            for d in split[0]:
-                if len(startendtime) > 1:
-                    length = times[startendtime[1]] - times[startendtime[0]]
-                else:
-                    length = 2
-                slots.append((days[d] + times[startendtime[0]], length))
-    except Exception:
-        print(t)
-
-    return slots
+import xlsx
+from timeslots import tsp
 
-f = open('csb_raw')
+# Read straight from the registrar's spreadsheet, one row at a time.
+rows = xlsx.rows(sys.argv[1] if len(sys.argv) > 1 else 'CSB.xlsx')
 
 current_class = ''
 classes = {}
 
-f.readline()
+next(rows)
 
-for line in f:
-    c = line.replace('"', '').split('\t')
-    c = [x.strip() for x in c]
+for row in rows:
+    c = [xlsx.clean(x).replace('"', '').strip() for x in row]
 
     # Check that this line is actually a class.
     try:
@@ -160,7 +66,7 @@ for line in f:
     # Format: 30 timeslots a day.
     slots = []
     for s in c[3].strip().split(','):
-        slots.extend(tsp(s))
+        slots.extend(tsp(s, c[0]))
 
     # If no slots, ignore.
     if slots == []:
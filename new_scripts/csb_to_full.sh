@@ -1,6 +1,6 @@
 #! /bin/sh
-python xlsx2tsv.py CSB.xlsx 1 > csb_raw
-python csb.py
+python3 csb.py CSB.xlsx
+python3 rollup.py
 python sublist2.py
 python combiner.py
 cp full.json ../www/full.js
@@ -0,0 +1,158 @@
+"""
+Patches between successive builds of the class data.
+
+Each build is identified by a hash of its classes. delta.py keeps the last
+published classes in patches/current.json; when a new build differs, it
+writes patches/<old>-<new>.json holding only the added, removed and changed
+classes (and for changed ones, only the fields that changed), and records it
+in patches/manifest.json:
+
+    {"latest": "<version>",
+     "patches": {"<from>": {"to": "<version>", "file": "<from>-<to>.json"}, ...}}
+
+A client with version N follows patches[N] until it reaches latest, calling
+apply() on each; a version missing from the map means a full download.
+combiner_ws.py writes the version of a build into full.js and base.js as
+`var version = "..."`, so a loaded page knows its N.
+
+    python3 delta.py [full.json] [patch_dir]
+"""
+
+import json
+import os
+import sys
+
+import manifest
+
+PATCH_DIR = 'patches'
+KEEP = 30
+VERSION_LENGTH = 12
+
+
+def version(classes):
+    return manifest.digest(classes)[:VERSION_LENGTH]
+
+
+def diff(old, new):
+    patch = {'from': version(old), 'to': version(new), 'added': {}, 'removed': [], 'changed': {}}
+    for number, cl in new.items():
+        if number not in old:
+            patch['added'][number] = cl
+        elif old[number] != cl:
+            before = old[number]
+            change = {'set': {k: v for k, v in cl.items() if k not in before or before[k] != v},
+                      'unset': [k for k in before if k not in cl]}
+            patch['changed'][number] = change
+    patch['removed'] = [number for number in old if number not in new]
+    return patch
+
+
+def apply(classes, patch):
+    """New classes from classes (at version patch['from']) and a patch."""
+    removed = set(patch['removed'])
+    out = {}
+    for number, cl in classes.items():
+        if number in removed:
+            continue
+        change = patch['changed'].get(number)
+        if change is not None:
+            cl = {k: v for k, v in cl.items() if k not in change['unset']}
+            cl.update(change['set'])
+        out[number] = cl
+    out.update(patch['added'])
+    return out
+
+
+def load_json(path, default):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def write_json(path, obj):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(obj, f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def publish(classes, patch_dir=PATCH_DIR, keep=KEEP):
+    """
+    Record classes as the latest version, writing a patch from the previous
+    one. Returns (version, patch); patch is None for the first version or if
+    nothing changed.
+    """
+    os.makedirs(patch_dir, exist_ok=True)
+    current_path = os.path.join(patch_dir, 'current.json')
+    manifest_path = os.path.join(patch_dir, 'manifest.json')
+
+    previous = load_json(current_path, None)
+    index = load_json(manifest_path, {'latest': None, 'patches': {}})
+    latest = version(classes)
+    if index['latest'] == latest:
+        return latest, None
+
+    patch = None
+    if previous is not None:
+        patch = diff(previous, classes)
+        if apply(previous, patch) != classes:
+            sys.exit('patch does not reproduce the new build; not publishing it')
+        name = f"{patch['from']}-{patch['to']}.json"
+        write_json(os.path.join(patch_dir, name), patch)
+        # Re-inserted so the map stays ordered by when each patch was written,
+        # even for a version that comes back (A -> B -> A).
+        replaced = index['patches'].pop(patch['from'], None)
+        if replaced is not None and replaced['file'] != name:
+            remove(os.path.join(patch_dir, replaced['file']))
+        index['patches'][patch['from']] = {'to': latest, 'file': name}
+
+    # Only the most recent patches are kept; older clients refetch in full.
+    for old in list(index['patches'])[:-keep]:
+        remove(os.path.join(patch_dir, index['patches'].pop(old)['file']))
+
+    index['latest'] = latest
+    write_json(current_path, classes)
+    write_json(manifest_path, index)
+    return latest, patch
+
+
+def chain(index, start):
+    """Patch files that take version start to the latest, or None if there is no path."""
+    files = []
+    seen = set()
+    while start != index['latest']:
+        entry = index['patches'].get(start)
+        if entry is None or start in seen:
+            return None
+        seen.add(start)
+        files.append(entry['file'])
+        start = entry['to']
+    return files
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'full.json'
+    patch_dir = sys.argv[2] if len(sys.argv) > 2 else PATCH_DIR
+
+    with open(path) as f:
+        classes = json.load(f)['classes']
+
+    latest, patch = publish(classes, patch_dir)
+    if patch is None:
+        print('latest version', latest, '(no patch)')
+    else:
+        print(f"{patch['from']} -> {patch['to']}: {len(patch['added'])} added, "
+              f"{len(patch['removed'])} removed, {len(patch['changed'])} changed")
+
+
+if __name__ == '__main__':
+    main()
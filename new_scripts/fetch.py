@@ -0,0 +1,192 @@
+"""
+Shared HTTP fetching for the scrapers.
+
+One pooled requests session is shared by a thread pool, so a full-term scrape
+reuses connections instead of opening one per subject. Every request has a
+timeout and a bounded number of retries with exponential backoff; a subject
+that still fails is reported back to the caller instead of looping forever.
+Passing an httpcache.Cache makes every request conditional, and a RateLimit
+spaces requests out for servers that throttle. stream() hands a large body
+over in chunks as it downloads instead of all at once. Every request is
+recorded with instrument.py.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import instrument
+
+WORKERS = 16
+TIMEOUT = 5
+RETRIES = 4
+BACKOFF = 0.5
+CHUNK = 64 * 1024
+
+
+class FetchError(Exception):
+    def __init__(self, url, cause):
+        super().__init__(f'{url}: {cause}')
+        self.url = url
+        self.cause = cause
+
+
+class RateLimit:
+    """Keeps requests at most `rate` per second, shared across threads."""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate
+        self.lock = threading.Lock()
+        self.next = 0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            at = max(now, self.next)
+            self.next = at + self.interval
+        time.sleep(at - now)
+
+
+def make_session(workers=WORKERS):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get(session, url, **kwargs):
+    """session.get, timed and counted for the stage report."""
+    start = time.perf_counter()
+    try:
+        r = session.get(url, **kwargs)
+    except requests.exceptions.RequestException:
+        instrument.request(time.perf_counter() - start)
+        raise
+    nbytes = 0 if kwargs.get('stream') else len(r.content)
+    instrument.request(time.perf_counter() - start, nbytes, r.status_code)
+    return r
+
+
+def fetch(session, url, timeout=TIMEOUT, retries=RETRIES, backoff=BACKOFF, cache=None,
+          limit=None):
+    """GET url, retrying connection errors, timeouts and 5xx responses."""
+    headers = cache.conditional_headers(url) if cache is not None else {}
+    for attempt in range(retries + 1):
+        try:
+            if limit is not None:
+                limit.wait()
+            r = get(session, url, timeout=timeout, headers=headers)
+            if r.status_code == 304 and cache is not None:
+                cached = cache.response(url)
+                if cached is not None:
+                    return cached
+                # The entry vanished since we asked; ask again unconditionally.
+                r = get(session, url, timeout=timeout)
+            if r.status_code >= 500:
+                raise requests.exceptions.HTTPError(f'HTTP {r.status_code}', response=r)
+            if cache is not None:
+                cache.store(url, r)
+            return r
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.HTTPError) as e:
+            if attempt == retries:
+                instrument.error()
+                raise FetchError(url, e)
+            instrument.retry()
+            time.sleep(backoff * 2 ** attempt)
+
+
+def stream(session, url, timeout=TIMEOUT, retries=RETRIES, backoff=BACKOFF, cache=None,
+           chunk_size=CHUNK):
+    """
+    Yield the body of url in chunks without holding all of it in memory.
+
+    Retries only cover getting a response. A connection lost mid-body raises
+    FetchError, and so does any status but 200 (or a 304 answered from the
+    cache), so an error page is never mistaken for the body. With a cache, a
+    304 streams the stored body from disk and a 200 is written to the cache
+    as it passes through.
+    """
+    headers = cache.conditional_headers(url) if cache is not None else {}
+    for attempt in range(retries + 1):
+        try:
+            r = get(session, url, timeout=timeout, headers=headers, stream=True)
+            if r.status_code == 304 and cache is not None:
+                cached = cache.iter_body(url, chunk_size)
+                if cached is not None:
+                    r.close()
+                    yield from cached
+                    return
+                # The entry vanished since we asked; ask again unconditionally.
+                r = get(session, url, timeout=timeout, stream=True)
+            if r.status_code >= 500:
+                raise requests.exceptions.HTTPError(f'HTTP {r.status_code}', response=r)
+            break
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.HTTPError) as e:
+            if attempt == retries:
+                instrument.error()
+                raise FetchError(url, e)
+            instrument.retry()
+            time.sleep(backoff * 2 ** attempt)
+
+    if r.status_code != 200:
+        r.close()
+        instrument.error()
+        raise FetchError(url, f'HTTP {r.status_code}')
+
+    if cache is None:
+        yield from _body(url, r, chunk_size)
+        return
+
+    with cache.writer(url, r) as write:
+        for chunk in _body(url, r, chunk_size):
+            write(chunk)
+            yield chunk
+
+
+def _body(url, r, chunk_size):
+    """r's body in chunks, with a connection lost part way raised as FetchError."""
+    try:
+        for chunk in r.iter_content(chunk_size):
+            instrument.transferred(len(chunk))
+            yield chunk
+    except requests.exceptions.RequestException as e:
+        instrument.error()
+        raise FetchError(url, e)
+
+
+def fetch_all(keys, url_for, workers=WORKERS, timeout=TIMEOUT, retries=RETRIES,
+              backoff=BACKOFF, session=None, cache=None, limit=None):
+    """
+    Fetch url_for(key) for every key with up to `workers` requests in flight.
+
+    Yields (key, response, error) in the same order as keys, so callers that
+    build their output in input order stay deterministic. Exactly one of
+    response and error is None.
+    """
+    keys = list(keys)
+    if session is None:
+        session = make_session(workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(fetch, session, url_for(k), timeout, retries, backoff, cache, limit)
+                   for k in keys]
+        for k, future in zip(keys, futures):
+            try:
+                yield k, future.result(), None
+            except FetchError as e:
+                yield k, None, e
+
+
+def write_failures(path, failures):
+    """Write one `<key>\t<reason>` line per subject that could not be fetched."""
+    with open(path, 'w') as f:
+        for k, reason in failures:
+            f.write(f'{k}\t{reason}\n')
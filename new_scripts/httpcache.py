@@ -0,0 +1,175 @@
+"""
+Persistent on-disk HTTP response cache.
+
+Responses are stored under http_cache/ keyed by a hash of the URL, with the
+ETag and Last-Modified headers kept next to the body. fetch.py sends them back
+as If-None-Match / If-Modified-Since, and a 304 is answered from disk, so a
+rerun with no upstream changes only transfers headers.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CACHE_DIR = 'http_cache'
+MAX_BYTES = 200 * 1024 * 1024
+MAX_AGE = 30 * 24 * 60 * 60
+
+
+class Cache:
+    def __init__(self, path=CACHE_DIR, max_bytes=MAX_BYTES, max_age=MAX_AGE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(path, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.path, key)
+        return base + '.json', base + '.body'
+
+    def _meta(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or not os.path.exists(body_path):
+            return None
+        return meta
+
+    def conditional_headers(self, url):
+        meta = self._meta(url)
+        if meta is None:
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def response(self, url):
+        """Rebuild the cached 200 response for url, or None if it isn't cached."""
+        meta = self._meta(url)
+        if meta is None:
+            return None
+        meta_path, body_path = self._paths(url)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+
+        meta['used'] = time.time()
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+
+        r = requests.Response()
+        r.status_code = 200
+        r.url = url
+        r.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        r.encoding = meta.get('encoding')
+        r._content = body
+        r.from_cache = True
+        return r
+
+    def iter_body(self, url, chunk_size):
+        """The cached body of url as a chunk iterator, or None if it isn't cached."""
+        meta = self._meta(url)
+        if meta is None:
+            return None
+        meta_path, body_path = self._paths(url)
+        meta['used'] = time.time()
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        return self._chunks(body_path, chunk_size)
+
+    def _chunks(self, path, chunk_size):
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def _new_meta(self, url, r, size):
+        now = time.time()
+        return {'url': url,
+                'etag': r.headers.get('ETag'),
+                'last_modified': r.headers.get('Last-Modified'),
+                'encoding': r.encoding,
+                'headers': {k: r.headers[k] for k in ('Content-Type',) if k in r.headers},
+                'size': size,
+                'stored': now,
+                'used': now}
+
+    def store(self, url, r):
+        if r.status_code != 200:
+            return
+        meta_path, body_path = self._paths(url)
+        self._write(body_path, r.content)
+        self._write(meta_path, json.dumps(self._new_meta(url, r, len(r.content))).encode('utf-8'))
+
+    @contextlib.contextmanager
+    def writer(self, url, r):
+        """
+        Store a streamed 200 response chunk by chunk. Yields a write function;
+        the entry only replaces the old one if the block finishes cleanly.
+        """
+        meta_path, body_path = self._paths(url)
+        tmp = f'{body_path}.{os.getpid()}.tmp'
+        size = 0
+        try:
+            with open(tmp, 'wb') as f:
+                def write(chunk):
+                    nonlocal size
+                    f.write(chunk)
+                    size += len(chunk)
+                yield write
+        except BaseException:
+            os.remove(tmp)
+            raise
+        os.replace(tmp, body_path)
+        self._write(meta_path, json.dumps(self._new_meta(url, r, size)).encode('utf-8'))
+
+    def _write(self, path, data):
+        # Write to a temporary name first so a crash never leaves half a file.
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _remove(self, meta_path):
+        for p in (meta_path, meta_path[:-len('.json')] + '.body'):
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        """Drop entries older than max_age, then least recently used ones until under max_bytes."""
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.path, name)
+            try:
+                with open(meta_path) as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                self._remove(meta_path)
+                continue
+            if now - meta.get('stored', 0) > self.max_age:
+                self._remove(meta_path)
+                continue
+            entries.append((meta.get('used', 0), meta.get('size', 0), meta_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, meta_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(meta_path)
+            total -= size
@@ -0,0 +1,188 @@
+"""
+Timing, counters and optional profiling for the build scripts.
+
+A script calls start('<stage>') once; when it exits, reports/<stage>.json
+gets its wall and CPU time, peak RSS, any phase() or lap() timings, the requests
+fetch.py made (count, bytes, status codes, retries, latency histogram) and
+counters such as parse failures by category. pipeline.py gathers the stage
+reports of a run into reports/run-<time>.json.
+
+Profiling is opt-in through FIREHOSE_PROFILE (pipeline.py --profile sets it):
+
+    FIREHOSE_PROFILE=cprofile python3 sublist_ws.py      # reports/sublist.prof
+    FIREHOSE_PROFILE=tracemalloc python3 combiner_ws.py  # reports/combiner.tracemalloc.txt
+
+Without start() the counters still work but nothing is written.
+"""
+
+import atexit
+import datetime
+import json
+import os
+import resource
+import threading
+import time
+from contextlib import contextmanager
+
+REPORT_DIR = 'reports'
+# Upper bounds of the latency histogram buckets, in milliseconds.
+BUCKETS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+lock = threading.Lock()
+stage = None
+started = None
+phases = {}
+counters = {}
+latencies = []
+fetches = {'count': 0, 'bytes': 0, 'retries': 0, 'errors': 0, 'status': {}}
+profiler = None
+last_lap = None
+
+
+def profiling():
+    return [p for p in os.environ.get('FIREHOSE_PROFILE', '').split(',') if p]
+
+
+def start(name):
+    global stage, started, profiler, last_lap
+    stage = name
+    started = (datetime.datetime.now(), time.perf_counter(), time.process_time())
+    last_lap = started[1:]
+    modes = profiling()
+    if 'tracemalloc' in modes:
+        import tracemalloc
+        tracemalloc.start()
+    if 'cprofile' in modes:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    atexit.register(finish)
+
+
+def count(name, key=None, n=1):
+    """Add n to a counter, or to one category of it when key is given."""
+    with lock:
+        if key is None:
+            counters[name] = counters.get(name, 0) + n
+        else:
+            counts = counters.setdefault(name, {})
+            counts[key] = counts.get(key, 0) + n
+
+
+def request(seconds, nbytes=0, status=None):
+    """One HTTP request fetch.py made: time to response, body size and status."""
+    with lock:
+        fetches['count'] += 1
+        fetches['bytes'] += nbytes
+        key = str(status) if status is not None else 'error'
+        fetches['status'][key] = fetches['status'].get(key, 0) + 1
+        latencies.append(seconds)
+
+
+def transferred(nbytes):
+    with lock:
+        fetches['bytes'] += nbytes
+
+
+def retry():
+    with lock:
+        fetches['retries'] += 1
+
+
+def error():
+    with lock:
+        fetches['errors'] += 1
+
+
+@contextmanager
+def phase(name):
+    """Time a block of a stage; repeated phases add up."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        add_phase(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+
+def add_phase(name, wall, cpu):
+    with lock:
+        p = phases.setdefault(name, {'wall_s': 0, 'cpu_s': 0})
+        p['wall_s'] += wall
+        p['cpu_s'] += cpu
+
+
+def lap(name):
+    """
+    End a phase that began at the previous lap (or at start()), for scripts
+    that run at module level where a with-block won't fit.
+    """
+    global last_lap
+    now = time.perf_counter(), time.process_time()
+    if last_lap is not None:
+        add_phase(name, now[0] - last_lap[0], now[1] - last_lap[1])
+    last_lap = now
+
+
+def histogram(values):
+    counts = [0] * (len(BUCKETS) + 1)
+    for v in values:
+        ms = v * 1000
+        i = 0
+        while i < len(BUCKETS) and ms > BUCKETS[i]:
+            i += 1
+        counts[i] += 1
+    labels = ['<={}ms'.format(b) for b in BUCKETS] + ['>{}ms'.format(BUCKETS[-1])]
+    return dict(zip(labels, counts))
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(p * len(values)))] * 1000
+
+
+def report():
+    """The report so far as a dict."""
+    with lock:
+        out = {'stage': stage}
+        if started is not None:
+            out['started'] = started[0].isoformat(timespec='seconds')
+            out['wall_s'] = round(time.perf_counter() - started[1], 3)
+            out['cpu_s'] = round(time.process_time() - started[2], 3)
+        # ru_maxrss is in kilobytes on Linux.
+        out['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        out['phases'] = {name: {k: round(v, 3) for k, v in p.items()} for name, p in phases.items()}
+        out['requests'] = dict(fetches, status=dict(fetches['status']))
+        if latencies:
+            ordered = sorted(latencies)
+            out['requests']['latency_ms'] = {
+                'p50': round(percentile(ordered, 0.5), 1),
+                'p95': round(percentile(ordered, 0.95), 1),
+                'max': round(ordered[-1] * 1000, 1),
+                'histogram': histogram(ordered),
+            }
+        out['counters'] = json.loads(json.dumps(counters))
+    return out
+
+
+def finish():
+    if profiler is not None:
+        profiler.disable()
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    base = os.path.join(REPORT_DIR, stage)
+    out = report()
+
+    if profiler is not None:
+        profiler.dump_stats(base + '.prof')
+        out['profile'] = base + '.prof'
+    if 'tracemalloc' in profiling():
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            out['tracemalloc_peak_kb'] = peak // 1024
+            with open(base + '.tracemalloc.txt', 'w') as f:
+                for line in tracemalloc.take_snapshot().statistics('lineno')[:30]:
+                    f.write(str(line) + '\n')
+            out['tracemalloc'] = base + '.tracemalloc.txt'
+            tracemalloc.stop()
+
+    with open(base + '.json', 'w') as f:
+        json.dump(out, f, indent=1)
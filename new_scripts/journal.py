@@ -0,0 +1,71 @@
+"""
+Write-ahead journal for long scraping runs.
+
+Each result is appended to a JSONL file as soon as it is scraped, one
+[key, value] line per subject, and flushed to disk before moving on. If the
+run dies partway through (crash, rate limit, expired login), the next run
+opens the same journal, skips every key already in it and carries on. Once
+the run has written its final artifact from the journal, done() removes it.
+
+A line cut short by a crash is dropped (and truncated away) on reopening.
+"""
+
+import json
+import os
+
+
+class Journal:
+    def __init__(self, path, fresh=False, default=None):
+        self.path = path
+        self.default = default
+        self.entries = {}
+        if fresh and os.path.exists(path):
+            os.remove(path)
+        good = self._replay()
+        self.f = open(path, 'a')
+        if good is not None:
+            self.f.truncate(good)
+
+    def _replay(self):
+        """Load the existing journal; returns the offset to truncate a torn last line at."""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError('no newline')
+                    key, value = json.loads(line)
+                except ValueError:
+                    print('Dropping incomplete journal entry in', self.path)
+                    return offset
+                self.entries[key] = value
+                offset += len(line)
+        return None
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        return self.entries.get(key, default)
+
+    def items(self):
+        return self.entries.items()
+
+    def append(self, key, value):
+        self.f.write(json.dumps([key, value], separators=(',', ':'), default=self.default) + '\n')
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        self.entries[key] = value
+
+    def close(self):
+        self.f.close()
+
+    def done(self):
+        """The final artifact is written; the journal is no longer needed."""
+        self.close()
+        os.remove(self.path)
@@ -0,0 +1,126 @@
+"""
+Incremental reading of the coursews feed.
+
+The feed is one JSON object whose "items" array holds every class and
+section. iter_items() scans text chunks as they arrive and yields each element
+of that array as soon as it is complete, so only the item being read (plus one
+network chunk) is ever held in memory. A document that ends before the array
+and the object around it are closed raises ValueError, so a cut-off download
+is never taken for a short feed. repair() fixes known-bad tokens on the
+way through, including ones split across chunk boundaries.
+"""
+
+import codecs
+import json
+import re
+
+# Characters that change the scanner's state; everything else is skipped.
+structural = re.compile(r'["\\{}\[\]]')
+
+
+def decode(chunks, encoding='utf-8'):
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def repair(chunks, replacements):
+    """Apply str.replace for each (bad, good) pair across a stream of text."""
+    keep = max((len(bad) for bad, _ in replacements), default=1) - 1
+    carry = ''
+    for chunk in chunks:
+        text = carry + chunk
+        for bad, good in replacements:
+            text = text.replace(bad, good)
+        # Hold back a suffix that could be the start of a bad token.
+        split = max(len(text) - keep, 0)
+        carry = text[split:]
+        if split:
+            yield text[:split]
+    if carry:
+        yield carry
+
+
+def iter_items(chunks, key='items'):
+    """Yield each element of the top-level `key` array from a stream of JSON text."""
+    buf = ''
+    pos = 0
+    depth = 0
+    in_string = False
+    string_start = None
+    last_string = None
+    in_items = False
+    items_closed = False
+    item_start = None
+    # Whether a ':' went by since the last structural character; only
+    # tracked at depth 1, where it marks last_string as a key.
+    colon = False
+
+    for chunk in chunks:
+        buf += chunk
+        while True:
+            m = structural.search(buf, pos)
+            if m is None:
+                if depth == 1 and not in_string:
+                    colon = colon or ':' in buf[pos:]
+                pos = len(buf)
+                break
+            ch = m.group()
+            i = m.start()
+            after_colon = colon
+            colon = False
+
+            if in_string:
+                if ch == '\\':
+                    if i + 1 >= len(buf):
+                        # The escaped character is in the next chunk.
+                        pos = i
+                        break
+                    pos = i + 2
+                    continue
+                if ch == '"':
+                    in_string = False
+                    if string_start is not None:
+                        last_string = buf[string_start + 1:i]
+                        string_start = None
+                pos = i + 1
+                continue
+
+            if ch == '"':
+                in_string = True
+                if depth == 1:
+                    string_start = i
+            elif ch in '{[':
+                depth += 1
+                if depth == 2 and ch == '[':
+                    # A value equal to key is not the key, so the array must follow a ':'.
+                    in_items = last_string == key and (after_colon or ':' in buf[pos:i])
+                elif depth == 3 and in_items:
+                    item_start = i
+            elif ch in '}]':
+                depth -= 1
+                if depth == 2 and item_start is not None:
+                    yield json.loads(buf[item_start:i + 1])
+                    item_start = None
+                elif depth == 1:
+                    items_closed = items_closed or in_items
+                    in_items = False
+            pos = i + 1
+
+        # Drop everything before the earliest position still needed.
+        cut = min(p for p in (pos, item_start, string_start) if p is not None)
+        if cut:
+            buf = buf[cut:]
+            pos -= cut
+            if item_start is not None:
+                item_start -= cut
+            if string_start is not None:
+                string_start -= cut
+
+    if depth != 0 or in_string or not items_closed:
+        raise ValueError('JSON ended before the "{}" array was complete'.format(key))
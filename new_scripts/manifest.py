@@ -0,0 +1,72 @@
+"""
+Per-subject content hashes from the previous run, for incremental rebuilds.
+
+manifest.json holds one section per stage, mapping each subject to digests of
+the inputs that produced its output last time. A stage can then reuse the
+previous output for every subject whose digests still match.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+MANIFEST = 'manifest.json'
+
+module_import = re.compile(r'^(?:import|from) (\w+)', re.MULTILINE)
+
+
+def digest(obj):
+    """Stable hash of any JSON-serialisable value (or raw bytes)."""
+    if not isinstance(obj, bytes):
+        obj = json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(obj).hexdigest()
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def sources(path):
+    """A script and every module next to it that it imports, directly or not."""
+    found = []
+    pending = [path]
+    while pending:
+        script = pending.pop()
+        if script in found:
+            continue
+        found.append(script)
+        with open(script) as f:
+            for name in module_import.findall(f.read()):
+                module = os.path.join(os.path.dirname(script), name + '.py')
+                if os.path.exists(module):
+                    pending.append(module)
+    return sorted(found)
+
+
+def source_digest(path):
+    """Changes whenever the script or any module of ours it imports does."""
+    return digest([[os.path.basename(p), file_digest(p)] for p in sources(path)])
+
+
+def load(path=MANIFEST):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save(manifest, path=MANIFEST):
+    with open(path, 'w') as f:
+        json.dump(manifest, f, sort_keys=True)
+
+
+def load_previous(path, default=None):
+    """Previous output of a stage, or default if there is no usable one."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
@@ -0,0 +1,103 @@
+"""
+Split the class data into a base payload and per-course extended details.
+
+full.js carries every field of every class, but most of the bytes are
+descriptions and other text that only the class description panel and the
+manual section picker read. base.js keeps everything the table, filters and
+schedule search need; extended/<version>/<course>.json holds the rest for one
+course and is fetched by the page the first time a class from that course is
+opened. <version> is a hash of all the extended files, and base.js names it
+(var extended_version), so a page always fetches the files of its own build,
+whatever older ones a browser has cached.
+
+    python3 payload.py [full.json] [out_dir]    # split an existing build
+
+combiner_ws.py --split writes the same files at the end of a build.
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+
+import delta
+import manifest
+
+VERSION_LENGTH = 12
+
+extended_version_line = re.compile(r'^var extended_version = "([0-9a-f]+)";$', re.M)
+
+# Fields read only by class_desc() and the manual section picker in script.js.
+extended_fields = ['d', 'pr', 'i', 'u', 'sa', 'mw', 'lr', 'rr', 'br']
+
+
+def split(classes):
+    """Returns (base, extended) where extended maps course -> {number: fields}."""
+    base = {}
+    extended = {}
+    for number, cl in classes.items():
+        base[number] = {k: v for k, v in cl.items() if k not in extended_fields}
+        extended.setdefault(cl['co'], {})[number] = {k: cl[k] for k in extended_fields if k in cl}
+    return base, extended
+
+
+def write(classes, last_update, version, out_dir='.'):
+    base, extended = split(classes)
+    extended_version = manifest.digest(extended)[:VERSION_LENGTH]
+
+    with open(os.path.join(out_dir, 'base.js'), 'w') as f:
+        f.write('var last_update = "' + last_update + '";\n')
+        f.write('var version = "' + version + '";\n')
+        f.write('var extended_version = "' + extended_version + '";\n')
+        f.write('var classes = ')
+        # Sorted so identical data always serialises (and publishes) identically.
+        json.dump(base, f, sort_keys=True, separators=(',', ':'))
+        f.write(';')
+
+    root = os.path.join(out_dir, 'extended')
+    ext_dir = os.path.join(root, extended_version)
+    os.makedirs(ext_dir, exist_ok=True)
+    for course, fields in extended.items():
+        with open(os.path.join(ext_dir, course + '.json'), 'w') as f:
+            json.dump(fields, f, sort_keys=True, separators=(',', ':'))
+
+    # Earlier builds' files.
+    remove_others(root, {extended_version})
+
+
+def remove_others(root, keep):
+    """Remove everything in an extended/ directory but the named versions."""
+    for name in os.listdir(root):
+        if name in keep:
+            continue
+        path = os.path.join(root, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+
+def extended_version(path):
+    """The extended_version a base.js names, or None."""
+    with open(path) as f:
+        m = extended_version_line.search(f.read(1024))
+    return m.group(1) if m else None
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'full.json'
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else '.'
+
+    with open(path) as f:
+        obj = json.load(f)
+
+    write(obj['classes'], obj['lastUpdated'], delta.version(obj['classes']), out_dir)
+
+    full = os.path.getsize(path)
+    base = os.path.getsize(os.path.join(out_dir, 'base.js'))
+    print(f'base.js {base} bytes ({base / full:.0%} of {path})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+"""
+The schedule update as a pipeline of cached stages.
+
+Each stage declares the files it reads and writes; the scripts it runs and
+the modules they import count as inputs too. A stage is skipped when its
+inputs hash the same as on its last successful run and its outputs are
+still there; stages that don't depend on each other (the catalog scrape and
+the evaluation rollup, or conflicts.py and delta.py) run at the same time.
+Input hashes from the last run are kept in pipeline.json. Inside a stage that
+does run, sublist_ws.py and combiner_ws.py only redo the subjects whose
+inputs changed (see manifest.py); bench_incremental.py checks that.
+
+    python3 pipeline.py                 # the whole schedule update
+    python3 pipeline.py combiner        # one stage, plus whatever it needs
+    python3 pipeline.py --force         # rerun every stage regardless
+    python3 pipeline.py --list
+    python3 pipeline.py --profile=cprofile,tracemalloc
+
+Every run writes reports/run-<time>.json: each stage's outcome and wall
+time, plus the instrument.py report of each script that ran. --profile
+turns on instrument.py's profiling in the stage scripts.
+update_schedule.sh and update.py both run it.
+"""
+
+import datetime
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import instrument
+import manifest
+import payload
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WWW = os.path.join(HERE, '..', 'www')
+STATE = 'pipeline.json'
+# Run reports kept in reports/.
+KEEP_REPORTS = 30
+
+
+class StageError(Exception):
+    pass
+
+
+class Stage:
+    def __init__(self, name, run, inputs=(), outputs=(), always=False, optional=False):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        # Stages that read from the network have no inputs to compare.
+        self.always = always
+        # A stage whose failure doesn't stop the ones after it.
+        self.optional = optional
+
+
+def path_digest(path):
+    """Digest of a file, or of every file in a directory; None if it doesn't exist."""
+    path = os.path.join(HERE, path)
+    if os.path.isdir(path):
+        h = hashlib.sha1()
+        for name in sorted(os.listdir(path)):
+            h.update(name.encode('utf-8'))
+            h.update((path_digest(os.path.join(path, name)) or '').encode('ascii'))
+        return h.hexdigest()
+    if os.path.exists(path):
+        return manifest.file_digest(path)
+    return None
+
+
+def python(*argv):
+    """A stage step running one of the scripts here, output captured."""
+    def run(log):
+        r = subprocess.run([sys.executable] + list(argv), cwd=HERE,
+                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        log.append(r.stdout)
+        if r.returncode != 0:
+            raise StageError('{} exited with {}'.format(' '.join(argv), r.returncode))
+    run.argv = list(argv)
+    return run
+
+
+def command(*argv):
+    def run(log):
+        try:
+            r = subprocess.run(list(argv), cwd=HERE,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        except OSError as e:
+            raise StageError('{}: {}'.format(argv[0], e))
+        log.append(r.stdout)
+        if r.returncode != 0:
+            raise StageError('{} exited with {}'.format(argv[0], r.returncode))
+    return run
+
+
+def publish_www(log):
+    shutil.copy(os.path.join(HERE, 'full.js'), os.path.join(WWW, 'full.js'))
+    # The new extended/<version>/ goes up before the base.js that names it.
+    extended = os.path.join(WWW, 'extended')
+    os.makedirs(extended, exist_ok=True)
+    for source in glob.glob(os.path.join(HERE, 'extended', '*')):
+        target = os.path.join(extended, os.path.basename(source))
+        if not os.path.exists(target):
+            shutil.rmtree(target + '.tmp', ignore_errors=True)
+            shutil.copytree(source, target + '.tmp')
+            os.replace(target + '.tmp', target)
+    python('publish.py', WWW, 'base.js')(log)
+    # Keep the versions the base files still in www/ name: the new one, and
+    # the previous one publish.py keeps for pages loaded before the switch.
+    used = {payload.extended_version(path) for path in glob.glob(os.path.join(WWW, 'base.*.js'))}
+    payload.remove_others(extended, used)
+
+
+def publish_conflicts(log):
+    shutil.copy(os.path.join(HERE, 'conflicts.js'), os.path.join(WWW, 'conflicts.js'))
+
+
+def publish_patches(log):
+    patches = os.path.join(WWW, 'patches')
+    os.makedirs(patches, exist_ok=True)
+    for path in glob.glob(os.path.join(patches, '*.json')):
+        os.remove(path)
+    for path in glob.glob(os.path.join(HERE, 'patches', '*.json')):
+        name = os.path.basename(path)
+        if name == 'manifest.json' or '-' in name:
+            shutil.copy(path, patches)
+
+
+def code(*scripts):
+    """The scripts and the modules of ours they import, as stage inputs."""
+    return sorted({os.path.relpath(p, HERE) for s in scripts
+                   for p in manifest.sources(os.path.join(HERE, s))})
+
+
+def steps(*runs):
+    def run(log):
+        for r in runs:
+            r(log)
+    return run
+
+
+stages = [
+    Stage('coursews', python('coursews.py'),
+          outputs=['ws', 'all_classes'], always=True),
+    # The catalog changes independently of coursews (URLs, finals, half
+    # terms), so it is always scraped; httpcache keeps that to 304s, and
+    # --incremental only reparses the pages that changed.
+    Stage('sublist', python('sublist_ws.py', '--incremental'),
+          inputs=['ws', 'all_classes'], outputs=['sublist'], always=True),
+    Stage('rollup', python('rollup.py'),
+          inputs=['evaluations'] + code('rollup.py'), outputs=['rollup.json'], optional=True),
+    Stage('combiner', python('combiner_ws.py', '--split', '--incremental'),
+          inputs=['ws', 'sublist', 'rollup.json'] + code('combiner_ws.py'),
+          outputs=['full.js', 'full.json', 'base.js', 'extended']),
+    Stage('publish', publish_www,
+          inputs=['full.js', 'base.js', 'extended'] + code('publish.py'),
+          outputs=['../www/full.js']),
+    Stage('conflicts', steps(python('conflicts.py'), publish_conflicts),
+          inputs=['full.json'] + code('conflicts.py'),
+          outputs=['conflicts.js', '../www/conflicts.js']),
+    Stage('delta', steps(python('delta.py'), publish_patches),
+          inputs=['full.json'] + code('delta.py'), outputs=['patches/manifest.json']),
+    Stage('compile', command('sh', 'compile.sh'),
+          inputs=['../www/script.js', 'compile.sh'], outputs=['../www/script-compiled.js']),
+]
+
+by_name = {s.name: s for s in stages}
+
+# What update_schedule.sh has always done; compiling is left to update.py.
+SCHEDULE = ['publish', 'conflicts', 'delta']
+
+
+def dependencies(stage):
+    return [s.name for s in stages
+            if s is not stage and set(s.outputs) & set(stage.inputs)]
+
+
+def needed(targets):
+    """The targets and every stage they depend on, in declaration order."""
+    todo = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in todo:
+            todo.add(name)
+            pending.extend(dependencies(by_name[name]))
+    return [s for s in stages if s.name in todo]
+
+
+def write_report(started, wall, results):
+    report_dir = os.path.join(HERE, instrument.REPORT_DIR)
+    os.makedirs(report_dir, exist_ok=True)
+    for name, result in results.items():
+        # The stage script's own report, if it wrote one during this run.
+        path = os.path.join(report_dir, name + '.json')
+        if result['status'] != 'skipped' and os.path.exists(path) \
+                and os.path.getmtime(path) >= started.timestamp():
+            with open(path) as f:
+                result['report'] = json.load(f)
+    report = {'started': started.isoformat(timespec='seconds'),
+              'wall_s': round(wall, 3),
+              'stages': results}
+    path = os.path.join(report_dir, started.strftime('run-%Y%m%d-%H%M%S.json'))
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=1)
+    for old in sorted(glob.glob(os.path.join(report_dir, 'run-*.json')))[:-KEEP_REPORTS]:
+        os.remove(old)
+    return path
+
+
+def run(targets=SCHEDULE, force=False, workers=4, profile=None):
+    """Run the targets and their dependencies. Returns True if nothing required failed."""
+    for name in targets:
+        if name not in by_name:
+            raise ValueError('no stage named {}'.format(name))
+    if profile:
+        # Read by instrument.start() in the stage scripts.
+        os.environ['FIREHOSE_PROFILE'] = profile
+
+    started = datetime.datetime.now()
+    run_start = time.perf_counter()
+    results = {}
+
+    state_path = os.path.join(HERE, STATE)
+    state = manifest.load(state_path)
+    lock = threading.Lock()
+    todo = needed(targets)
+    finished = set()
+    failed = set()
+
+    def say(text):
+        with lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    def execute(stage):
+        digests = {p: path_digest(p) for p in stage.inputs}
+        outputs_exist = all(os.path.exists(os.path.join(HERE, p)) for p in stage.outputs)
+        if (not force and not stage.always and outputs_exist
+                and state.get(stage.name) == digests):
+            say('=== {}: inputs unchanged, skipped ===\n'.format(stage.name))
+            results[stage.name] = {'status': 'skipped'}
+            return
+        log = ['=== {} ===\n'.format(stage.name)]
+        stage_start = time.perf_counter()
+        results[stage.name] = {'status': 'failed'}
+        try:
+            stage.run(log)
+        finally:
+            results[stage.name]['wall_s'] = round(time.perf_counter() - stage_start, 3)
+            # One stage's output at a time, even when they ran side by side.
+            say(''.join(log))
+        results[stage.name]['status'] = 'ran'
+        with lock:
+            state[stage.name] = digests
+            manifest.save(state, state_path)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while todo or running:
+            for stage in list(todo):
+                deps = dependencies(stage)
+                if any(d in failed for d in deps):
+                    say('=== {}: not run, {} failed ===\n'.format(
+                        stage.name, ', '.join(d for d in deps if d in failed)))
+                    todo.remove(stage)
+                    failed.add(stage.name)
+                    results[stage.name] = {'status': 'not run'}
+                elif all(d in finished for d in deps):
+                    todo.remove(stage)
+                    running[pool.submit(execute, stage)] = stage
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    # Whatever went wrong, the stage fails and the report still gets written.
+                    error = str(e) if isinstance(e, StageError) else '{}: {}'.format(
+                        type(e).__name__, e)
+                    say('=== {} failed: {} ===\n'.format(stage.name, error))
+                    results.setdefault(stage.name, {})['status'] = 'failed'
+                    results[stage.name]['error'] = error
+                    if not stage.optional:
+                        failed.add(stage.name)
+                        continue
+                finished.add(stage.name)
+
+    path = write_report(started, time.perf_counter() - run_start, results)
+    say('Report written to {}\n'.format(os.path.relpath(path)))
+    return not failed
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if '--list' in sys.argv:
+        for stage in stages:
+            print('{:10} <- {}'.format(stage.name, ', '.join(dependencies(stage)) or '-'))
+        return
+    profile = None
+    for a in sys.argv[1:]:
+        if a == '--profile':
+            profile = 'cprofile'
+        elif a.startswith('--profile='):
+            profile = a.split('=', 1)[1]
+    try:
+        ok = run(args or SCHEDULE, force='--force' in sys.argv, profile=profile)
+    except ValueError as e:
+        sys.exit(str(e))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
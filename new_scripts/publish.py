@@ -0,0 +1,95 @@
+"""
+Publish a data script into www/ under a content-hashed name.
+
+    python3 publish.py [www_dir] [script ...]     # default: ../www base.js
+
+Each script is copied to <name>.<hash>.js next to a gzip (and, if the brotli
+module is installed, a brotli) copy at maximum compression, and the matching
+<script src> in index.html is pointed at it. The hash ignores the
+last_update line, which changes on every build, so rebuilding identical data
+republishes nothing and browsers keep their cached copy. The previously
+published version is kept for pages loaded before the switch; older ones are
+removed.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HASH_LENGTH = 12
+
+last_update_line = re.compile(rb'^var last_update = "[^"\n]*";\n', re.M)
+
+
+def content_hash(data):
+    return hashlib.sha256(last_update_line.sub(b'', data)).hexdigest()[:HASH_LENGTH]
+
+
+def compressed(data):
+    out = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        out['.br'] = brotli.compress(data, quality=11)
+    return out
+
+
+def write(path, data):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def publish(www_dir, script):
+    stem, ext = os.path.splitext(os.path.basename(script))
+    with open(script, 'rb') as f:
+        data = f.read()
+
+    name = f'{stem}.{content_hash(data)}{ext}'
+    path = os.path.join(www_dir, name)
+    if not os.path.exists(path):
+        for suffix, body in compressed(data).items():
+            write(path + suffix, body)
+        # The uncompressed file goes last: its presence marks a complete publish.
+        write(path, data)
+
+    index_path = os.path.join(www_dir, 'index.html')
+    with open(index_path) as f:
+        index = f.read()
+    reference = re.compile(r'(<script[^>]*\bsrc=")(' + re.escape(stem) + r'(?:\.[0-9a-f]+)?'
+                           + re.escape(ext) + r')(")')
+    previous = [m.group(2) for m in reference.finditer(index)]
+    if not previous:
+        sys.exit(f'no <script src="{stem}{ext}"> in {index_path}')
+    if previous != [name] * len(previous):
+        write(index_path, reference.sub(lambda m: m.group(1) + name + m.group(3), index).encode('utf-8'))
+
+    keep = {name} | set(previous)
+    hashed = re.compile(re.escape(stem) + r'\.[0-9a-f]{%d}' % HASH_LENGTH + re.escape(ext) + r'(\.gz|\.br)?$')
+    for other in os.listdir(www_dir):
+        m = hashed.match(other)
+        if m and other[:len(other) - len(m.group(1) or '')] not in keep:
+            os.remove(os.path.join(www_dir, other))
+
+    if brotli is None:
+        print('brotli not installed; wrote', name, 'and', name + '.gz only')
+    else:
+        print('published', name)
+    return name
+
+
+def main():
+    www_dir = sys.argv[1] if len(sys.argv) > 1 else '../www'
+    scripts = sys.argv[2:] or ['base.js']
+    for script in scripts:
+        publish(www_dir, script)
+
+
+if __name__ == '__main__':
+    main()
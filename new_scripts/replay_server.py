@@ -0,0 +1,245 @@
+"""
+Local stand-in for coursews.mit.edu and student.mit.edu.
+
+Replays stored responses so scraper changes can be load-tested on one
+machine: coursews/?term=, catalog/search.cgi?search= and the department
+pages (catalog/m18a.html ...) that sublist_ws.py --bulk reads. Responses
+come from the bench fixtures (bench_fixtures.py, or a synth_catalog.py set
+with --fixtures) and, with --http-cache, from anything a scraper has stored
+in http_cache/.
+
+    python3 replay_server.py --port 8700 --latency lognormal:80,0.6 --error-rate 0.05
+    python3 coursews.py --base-url http://localhost:8700
+    python3 sublist_ws.py --base-url http://localhost:8700 --workers 32
+
+Latency is drawn per request from fixed:MS, uniform:LO-HI, exp:MEAN or
+lognormal:MEDIAN,SIGMA (milliseconds). --error-rate answers that fraction
+with a 503, --drop-rate closes the connection without answering, and
+--bandwidth caps each response at that many KB/s. Bodies carry an ETag, so
+conditional requests get 304s. GET /stats returns the counts so far.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import bench_fixtures
+
+PORT = 8700
+CHUNK = 16 * 1024
+
+department_page = re.compile(r'/catalog/m(.+?)([a-z])\.html$')
+# The part of a search result page that describes the subject.
+subject_block = re.compile(rb'<a name="[^"]+"></a>.*?(?=</td>)', re.DOTALL | re.IGNORECASE)
+# Subjects per department page, as the registrar splits them.
+PER_PAGE = 30
+
+
+def latency_sampler(spec, rng):
+    """Seconds to wait, drawn from a spec like 'uniform:20-200' (milliseconds)."""
+    kind, _, params = spec.partition(':')
+    try:
+        if kind == 'fixed':
+            ms = float(params)
+            return lambda: ms / 1000
+        if kind == 'uniform':
+            lo, hi = (float(x) for x in params.split('-'))
+            return lambda: rng.uniform(lo, hi) / 1000
+        if kind == 'exp':
+            mean = float(params)
+            return lambda: rng.expovariate(1 / mean) / 1000 if mean else 0
+        if kind == 'lognormal':
+            median, sigma = (float(x) for x in params.split(','))
+            return lambda: rng.lognormvariate(0, sigma) * median / 1000
+    except ValueError:
+        pass
+    raise ValueError('bad latency spec: ' + spec)
+
+
+class Recordings:
+    def __init__(self, name, cache_dir=None):
+        coursews, pages, _ = bench_fixtures.load(name)
+        self.name = name
+        # The term coursews/?term= answers for; synthetic sets stand in for one.
+        self.term = bench_fixtures.meta(name)['term']
+        self.coursews = coursews
+        self.pages = pages
+        self.departments = {}
+        for num in sorted(pages):
+            self.departments.setdefault(num.split('.')[0], []).append(num)
+        self.cached = self.load_cache(cache_dir) if cache_dir else {}
+
+    def load_cache(self, cache_dir):
+        """{path?query: body path} for every 200 stored in an httpcache directory."""
+        cached = {}
+        for name in os.listdir(cache_dir):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(cache_dir, name)) as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            url = urlparse(meta.get('url', ''))
+            body = os.path.join(cache_dir, name[:-len('.json')] + '.body')
+            if os.path.exists(body):
+                cached[url.path + '?' + url.query] = body
+        return cached
+
+    def department(self, dept, letter):
+        numbers = self.departments.get(dept, [])
+        k = ord(letter) - ord('a')
+        chunk = numbers[k * PER_PAGE:(k + 1) * PER_PAGE]
+        if not chunk:
+            return None
+        blocks = []
+        for num in chunk:
+            m = subject_block.search(self.pages[num])
+            if m:
+                blocks.append(m.group())
+        return b'<html><body><table><tr><td>\n' + b'\n'.join(blocks) + b'\n</td></tr></table></body></html>'
+
+    def body(self, path, query):
+        """The stored body for a request, or None."""
+        if path + '?' + query in self.cached:
+            with open(self.cached[path + '?' + query], 'rb') as f:
+                return f.read()
+        q = parse_qs(query)
+        if path.rstrip('/') == '/coursews':
+            return self.coursews if q.get('term', [''])[0] == self.term else None
+        if path == '/catalog/search.cgi':
+            return self.pages.get(q.get('search', [''])[0])
+        m = department_page.match(path)
+        if m:
+            return self.department(m.group(1), m.group(2))
+        return None
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = {}
+
+    def add(self, key):
+        with self.lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+
+def make_handler(recordings, args, rng, latency, stats):
+    rng_lock = threading.Lock()
+
+    def draw(fn):
+        with rng_lock:
+            return fn()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *a):
+            if args.verbose:
+                super().log_message(*a)
+
+        def send(self, status, body=b'', headers=()):
+            self.send_response(status)
+            for k, v in headers:
+                self.send_header(k, v)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if not body:
+                return
+            if not args.bandwidth:
+                self.wfile.write(body)
+                return
+            for i in range(0, len(body), CHUNK):
+                piece = body[i:i + CHUNK]
+                self.wfile.write(piece)
+                self.wfile.flush()
+                time.sleep(len(piece) / (args.bandwidth * 1024))
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/stats':
+                self.send(200, json.dumps(stats.snapshot()).encode('utf-8'),
+                          [('Content-Type', 'application/json')])
+                return
+
+            time.sleep(draw(latency))
+            roll = draw(rng.random)
+            if roll < args.drop_rate:
+                stats.add('dropped')
+                # Hang up without a response, like a connection reset mid-request.
+                self.close_connection = True
+                self.connection.close()
+                return
+            if roll < args.drop_rate + args.error_rate:
+                stats.add('503')
+                self.send(503, b'Service Unavailable', [('Connection', 'close')])
+                self.close_connection = True
+                return
+
+            body = recordings.body(url.path, url.query)
+            if body is None:
+                stats.add('404')
+                self.send(404, b'Not Found')
+                return
+            etag = '"{}"'.format(hashlib.sha1(body).hexdigest()[:16])
+            if self.headers.get('If-None-Match') == etag:
+                stats.add('304')
+                self.send(304, headers=[('ETag', etag)])
+                return
+            stats.add('200')
+            content_type = 'application/json' if url.path.startswith('/coursews') else 'text/html'
+            self.send(200, body, [('ETag', etag), ('Content-Type', content_type)])
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay stored coursews and catalog responses.')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--fixtures', default=None,
+                        help="fixture set to serve; defaults to coursews.py's term, "
+                             "recorded or else reconstructed")
+    parser.add_argument('--http-cache', default=None,
+                        help='also replay every response stored in this http_cache directory')
+    parser.add_argument('--latency', default='fixed:0', help='e.g. uniform:20-200, lognormal:80,0.6')
+    parser.add_argument('--error-rate', type=float, default=0, help='fraction answered with 503')
+    parser.add_argument('--drop-rate', type=float, default=0, help='fraction of connections dropped')
+    parser.add_argument('--bandwidth', type=float, default=0, help='KB/s per response (0 = unlimited)')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    try:
+        latency = latency_sampler(args.latency, rng)
+    except ValueError as e:
+        parser.error(str(e))
+    recordings = Recordings(args.fixtures or bench_fixtures.default_set(), args.http_cache)
+    stats = Stats()
+
+    server = ThreadingHTTPServer(('127.0.0.1', args.port),
+                                 make_handler(recordings, args, rng, latency, stats))
+    server.daemon_threads = True
+    print('Replaying {} as {} ({} catalog pages, {} cached responses) on http://127.0.0.1:{}'.format(
+        recordings.name, recordings.term, len(recordings.pages), len(recordings.cached), args.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(stats.snapshot()))
+
+
+if __name__ == '__main__':
+    main()
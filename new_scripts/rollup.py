@@ -0,0 +1,119 @@
+"""
+Subject evaluation averages, rolled up once and kept in rollup.json.
+
+The combiners show each subject's average rating, hours and class size over
+every term that had responses. Rather than walk the whole evaluation history
+for every subject on every run, rollup.json keeps each subject's per-term
+contributions and the resulting averages, and only subjects touched by new
+evaluations are recomputed.
+
+    python3 rollup.py    # sync with evaluations (eval_to_json.py's dump of evaluations.db)
+
+Combiners call load_table() and lookup().
+"""
+
+import json
+import os
+import sys
+
+import instrument
+
+ROLLUP = 'rollup.json'
+EVALUATIONS = 'evaluations'
+
+empty = {'ra': 0, 'h': 0, 'si': 0}
+
+
+def contribution(record):
+    """(rating, hours, size) a term adds to the averages, or None if it had no responses."""
+    if record['resp'] > 0:
+        return [float(record['rating']),
+                float(record['oc_hours']) + float(record['ic_hours']),
+                record['eligible']]
+    return None
+
+
+def aggregate(history):
+    # Same arithmetic, in the same order, as the loop the combiners used to run.
+    total_rating = 0
+    total_hours = 0
+    total_size = 0
+    terms = 0
+    for _, c in history:
+        if c is not None:
+            total_rating += c[0]
+            total_hours += c[1]
+            total_size += c[2]
+            terms += 1
+
+    if terms == 0:
+        terms = 1
+
+    return {'ra': round(total_rating / terms, 1),
+            'h': round(total_hours / terms, 1),
+            'si': round(total_size / terms, 1)}
+
+
+def load(path=ROLLUP):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'history': {}, 'table': {}}
+
+
+def save(store, path=ROLLUP):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(store, f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def load_table(path=ROLLUP):
+    # Without a rollup every subject would be published with zero ratings.
+    if not os.path.exists(path):
+        sys.exit(f'{path} not found; run rollup.py first')
+    return load(path)['table']
+
+
+def lookup(table, number, old_number=None):
+    """Averages for a subject, taken from its old number's evaluations when it was renumbered."""
+    if old_number and old_number in table:
+        return table[old_number]
+    return table.get(number, empty)
+
+
+def sync(store, evals):
+    """Bring the store in line with a full evaluations history. Returns the number of subjects recomputed."""
+    changed = 0
+    for subject, records in evals.items():
+        history = [[t['term'], contribution(t)] for t in records]
+        if store['history'].get(subject) != history:
+            store['history'][subject] = history
+            store['table'][subject] = aggregate(history)
+            changed += 1
+    for subject in list(store['history']):
+        if subject not in evals:
+            del store['history'][subject]
+            del store['table'][subject]
+            changed += 1
+    return changed
+
+
+def main():
+    instrument.start('rollup')
+    store = load()
+    if os.path.exists(EVALUATIONS):
+        with open(EVALUATIONS) as f:
+            changed = sync(store, json.load(f))
+    elif os.path.exists(ROLLUP):
+        print('No', EVALUATIONS, 'file; keeping the last rollup')
+        changed = 0
+    else:
+        sys.exit(f'No {EVALUATIONS} file and no {ROLLUP} to keep')
+    save(store)
+    print(len(store['table']), 'subjects,', changed, 'updated')
+
+
+if __name__ == '__main__':
+    main()
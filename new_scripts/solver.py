@@ -0,0 +1,194 @@
+"""
+Offline schedule search over full.json, mirroring select_slots/select_helper
+in www/script.js.
+
+Given a list of classes and any locked sections, returns every choice of
+section options that reaches the minimum number of conflicts, in the same
+order the page lists them. Conflicts are counted as in the page (one per
+overlapping pair of slots); occupancy bitmasks from combiner_ws.py skip the
+pairwise count whenever two options cannot overlap, and a lower bound on the
+conflicts the remaining sections must add prunes branches early.
+
+    python3 solver.py 6.1210 18.03 8.03 --lock 18.03,r=2
+    python3 solver.py --batch queries.json
+
+A batch file is a list of {"classes": [...], "locked": {"18.03,r": 2}}
+objects; a locked value of "none" leaves that section out, as on the page.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import timeslots
+
+MAX_CONFLICTS = 1000
+
+
+def load(path='full.json'):
+    with open(path) as f:
+        return json.load(f)['classes']
+
+
+class Option:
+    __slots__ = ['slots', 'mask', 'clean']
+
+    def __init__(self, slots, mask=None):
+        self.slots = slots
+        self.mask = mask if mask is not None else timeslots.occupancy(slots)
+        # Zero or negative lengths make the page's pairwise test disagree with
+        # the masks, so those options always take the slow path.
+        self.clean = all(length > 0 for _, length in slots)
+
+
+def section_options(classes, section):
+    number, typ = section
+    masks = classes[number].get(typ + 'o') or [None] * len(classes[number][typ])
+    return [Option(slots, mask) for (slots, _), mask in zip(classes[number][typ], masks)]
+
+
+def conflicts(a, b):
+    """Overlapping slot pairs between two options, as select_helper counts them."""
+    if a.clean and b.clean and not timeslots.overlaps(a.mask, b.mask):
+        return 0
+    return sum(timeslots.conflict_check(x, y) for x in a.slots for y in b.slots)
+
+
+def select_slots(classes, cur_classes, locked=None, max_conflicts=MAX_CONFLICTS):
+    """
+    Returns (all_sections, options, min_conflicts) like select_slots in
+    script.js: all_sections lists the locked sections first, then the rest by
+    number of options, and each entry of options is a list of option indices
+    aligned with it.
+    """
+    locked = locked or {}
+
+    all_class_sections = []
+    for c in cur_classes:
+        for s in classes[c]['s']:
+            all_class_sections.append((classes[c]['no'], s))
+    all_class_sections.sort(key=lambda section: len(classes[section[0]][section[1]]))
+
+    all_sections = []
+    tmp_options = []
+    init = []
+    auto_sections = []
+    for section in all_class_sections:
+        key = f'{section[0]},{section[1]}'
+        if key in locked:
+            if locked[key] != 'none':
+                all_sections.append(section)
+                tmp_options.append(locked[key])
+                init.append(section_options(classes, section)[locked[key]])
+        else:
+            auto_sections.append(section)
+    all_sections.extend(auto_sections)
+
+    options = [section_options(classes, section) for section in auto_sections]
+
+    # Conflicts of every option with the locked sections, and between every
+    # pair of options of different sections.
+    base = [[sum(conflicts(o, l) for l in init) for o in opts] for opts in options]
+    pair = {}
+    for i in range(len(options)):
+        for j in range(i):
+            pair[i, j] = [[conflicts(a, b) for b in options[j]] for a in options[i]]
+
+    # Conflicts with the locked sections are unavoidable, so every section
+    # still to be placed adds at least its cheapest option's share.
+    bound = [0] * (len(options) + 1)
+    for i in range(len(options) - 1, -1, -1):
+        bound[i] = bound[i + 1] + (min(base[i]) if base[i] else 0)
+
+    def helper(depth, chosen_options, cur_conflicts, min_conflicts):
+        if depth == len(options):
+            return [list(chosen_options)], cur_conflicts
+
+        chosen = []
+        for s in range(len(options[depth])):
+            new_conflicts = base[depth][s]
+            for j, o in enumerate(chosen_options):
+                new_conflicts += pair[depth, j][s][o]
+
+            if cur_conflicts + new_conflicts + bound[depth + 1] > min_conflicts:
+                continue
+
+            chosen_options.append(s)
+            out, out_conflicts = helper(depth + 1, chosen_options,
+                                        cur_conflicts + new_conflicts, min_conflicts)
+            chosen_options.pop()
+
+            if out_conflicts < min_conflicts:
+                chosen = []
+                min_conflicts = out_conflicts
+
+            if out_conflicts == min_conflicts:
+                chosen.extend(out)
+
+        return chosen, min_conflicts
+
+    # Like the page, conflicts among the locked sections themselves don't count.
+    found, min_conflicts = helper(0, [], 0, max_conflicts)
+
+    return all_sections, [tmp_options + o for o in found], min_conflicts
+
+
+def parse_lock(text):
+    section, _, option = text.partition('=')
+    return section, option if option == 'none' else int(option)
+
+
+def check(classes, query):
+    """Why a query can't be run against classes, or None if it can."""
+    for c in query['classes']:
+        if c not in classes:
+            return f'no class {c} in the data'
+    for key, option in (query.get('locked') or {}).items():
+        number, _, typ = key.partition(',')
+        if number not in classes or typ not in classes[number]['s']:
+            return f'no section {key} to lock'
+        count = len(classes[number][typ])
+        if option != 'none' and not (isinstance(option, int) and 0 <= option < count):
+            return f'{key} has options 0 to {count - 1}, not {option}'
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find minimum-conflict schedules.')
+    parser.add_argument('classes', nargs='*')
+    parser.add_argument('--data', default='full.json')
+    parser.add_argument('--lock', action='append', default=[], type=parse_lock,
+                        metavar='NUMBER,TYPE=OPTION', help='e.g. 18.03,r=2 or 18.03,r=none')
+    parser.add_argument('--batch', help='JSON list of {"classes": [...], "locked": {...}}')
+    args = parser.parse_args()
+
+    classes = load(args.data)
+    if args.batch:
+        with open(args.batch) as f:
+            queries = json.load(f)
+    else:
+        queries = [{'classes': args.classes, 'locked': dict(args.lock)}]
+
+    for query in queries:
+        problem = check(classes, query)
+        if problem is not None:
+            sys.exit(f'solver.py: {problem}')
+
+    results = []
+    for query in queries:
+        begin = time.perf_counter()
+        sections, options, min_conflicts = select_slots(classes, query['classes'],
+                                                        query.get('locked'))
+        results.append({'classes': query['classes'],
+                        'sections': [f'{n},{s}' for n, s in sections],
+                        'conflicts': min_conflicts,
+                        'options': options,
+                        'seconds': round(time.perf_counter() - begin, 6)})
+
+    json.dump(results, sys.stdout, indent=1)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,85 +1,196 @@
+import argparse
 import json
-import requests
 import re
-from bs4 import BeautifulSoup
-
-base_url = "http://student.mit.edu/catalog/search.cgi?search="
-
-with open('all_classes') as f:
-    class_list = json.load(f)
-
-classes = {}
-
-for c in class_list:
-    try:
-        while True:
-            try:    
-                r = requests.get(base_url + c, timeout=5)
-                break
-            except requests.exceptions.ConnectionError:
-                pass
-        soup = BeautifulSoup(r.content, "lxml")
-
-        start = soup.h3
-        num = c
-
-        classes[num] = {'no_next': False,
-                        'repeat': False,
-                        'half': False,
-                        'url': ''}
-
-        name_split = start.getText().split("\n")
-        if len(name_split) > 2 and name_split[1] != "(New)":
-            classes[num]['old_num'] = name_split[1][1:-1]
-
-        level = start.findNext('img').findNext('img')
-
-        if 'nonext' in str(level):
-            classes[num]['no_next'] = True
-            level = level.findNext('img')
-        
-        if 'Undergrad' in str(level):
-            classes[num]['level'] = 'U'
-        elif 'Graduate' in str(level):
-            classes[num]['level'] = 'G'
-
-        gterms = ['Fall', 'IAP', 'Spring', 'Summer']
-        terms = [level.findNext()]
-        while True:
-            next_term = terms[-1].findNext()
-            if not any(x in str(next_term) for x in gterms):
-                break
-            terms.append(next_term)
-
-        others = [terms[-1]]
-        while True:
-            next_other = others[-1].findNext()
-            if str(next_other) == '<br/>':
-                break
-            others.append(next_other)
-            
-        for other in others:
-            if 'repeat.gif' in str(other):
-                classes[num]['repeat'] = True
-
-        half = soup.getText().split(' half of term')
-        if len(half) > 1:
-            term = half[0].split(' ')[-1].strip()
-            if term == "first":
-                classes[num]['half'] = 1
-            if term == "second":
-                classes[num]['half'] = 2
-            
-        url = soup.getText().split('URL: ')
-        if len(url) > 1:
-            classes[num]['url'] = url[1].split('\n')[0].strip('?')
-
-        classes[num]['final'] = '+final' in soup.getText()
-
-        print(num)
-    except (AttributeError, TypeError) as e:
-        print("Failed:", num)
-        print(e)
-
-with open("sublist", 'w') as f:
-    json.dump(classes, f)
+
+import catalog
+import fetch
+import httpcache
+import instrument
+import journal
+import manifest
+
+catalog_host = "http://student.mit.edu"
+search_path = "/catalog/search.cgi?search="
+department_path = "/catalog/m{}{}.html"
+base_url = catalog_host + search_path
+
+JOURNAL = 'sublist.journal'
+
+subject_anchor = re.compile(rb'<a name="([^"]+)"></a>', re.IGNORECASE)
+
+
+def parse_page(num, content, classes):
+    classes[num] = {}
+    catalog.extract(content, classes[num])
+
+
+def split_department_page(content):
+    """
+    Split a department listing page into {number: html} blocks, one per
+    subject, each shaped like a single search.cgi result so parse_page can
+    read it unchanged.
+    """
+    anchors = list(subject_anchor.finditer(content))
+    blocks = {}
+    for i, m in enumerate(anchors):
+        end = anchors[i + 1].start() if i + 1 < len(anchors) else len(content)
+        num = m.group(1).decode('ascii', 'replace')
+        blocks[num] = b'<html><body>' + content[m.start():end] + b'</body></html>'
+    return blocks
+
+
+def fetch_departments(class_list, args):
+    """
+    Download every department page (m18a.html, m18b.html, ...) once and
+    return the subject blocks they contain. Each round fetches the next
+    letter for all departments whose previous page existed.
+    """
+    blocks = {}
+    pending = sorted(set(c.split('.')[0] for c in class_list))
+    letter = 'a'
+    while pending and letter <= 'z':
+        found = []
+        pages = fetch.fetch_all(pending, lambda d: args.host + department_path.format(d, letter),
+                                workers=args.workers, timeout=args.timeout,
+                                retries=args.retries, backoff=args.backoff,
+                                cache=args.cache)
+        for dept, r, err in pages:
+            if err is not None or r.status_code != 200:
+                continue
+            page_blocks = split_department_page(r.content)
+            if not page_blocks:
+                continue
+            blocks.update(page_blocks)
+            found.append(dept)
+        pending = found
+        letter = chr(ord(letter) + 1)
+    return blocks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=fetch.WORKERS,
+                        help='catalog requests in flight at once (1 = serial)')
+    parser.add_argument('--timeout', type=float, default=fetch.TIMEOUT)
+    parser.add_argument('--retries', type=int, default=fetch.RETRIES)
+    parser.add_argument('--backoff', type=float, default=fetch.BACKOFF)
+    parser.add_argument('--failed', default='sublist_failed',
+                        help='report of subjects that could not be scraped')
+    parser.add_argument('--bulk', action='store_true',
+                        help='read whole department pages instead of one search per subject')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always download pages instead of revalidating http_cache/')
+    parser.add_argument('--incremental', action='store_true',
+                        help="reuse the last run's entry for subjects whose catalog page is unchanged")
+    parser.add_argument('--fresh', action='store_true',
+                        help='discard the journal of an interrupted run instead of resuming it')
+    parser.add_argument('--base-url', dest='host', default=catalog_host,
+                        help='catalog host to scrape, e.g. a replay_server.py address')
+    args = parser.parse_args()
+    args.host = args.host.rstrip('/')
+    args.cache = None if args.no_cache else httpcache.Cache()
+    instrument.start('sublist')
+
+    with open('all_classes') as f:
+        class_list = json.load(f)
+
+    with open('ws') as f:
+        ws_digests = {c: manifest.digest(v) for c, v in json.load(f).items()}
+
+    state = manifest.load()
+    known = state.get('sublist', {}) if args.incremental else {}
+    previous = manifest.load_previous('sublist', {}) if args.incremental else {}
+
+    def unchanged(num, key, value):
+        return num in previous and known.get(num, {}).get(key) == value
+
+    # Subjects an interrupted run already scraped, as long as coursews still agrees.
+    progress = journal.Journal(JOURNAL, fresh=args.fresh)
+
+    def resumed(num):
+        entry = progress.get(num)
+        return entry is not None and entry['digests']['ws'] == ws_digests.get(num)
+
+    if len(progress):
+        print('Resuming: {} subjects already in {}'.format(len(progress), JOURNAL))
+
+    classes = {}
+    failures = []
+    digests = {}
+
+    code_digest = manifest.source_digest(__file__)
+
+    def add(num, content):
+        page_digest = manifest.digest(content)
+        if unchanged(num, 'page', page_digest) and unchanged(num, 'code', code_digest):
+            classes[num] = previous[num]
+            instrument.count('subjects', 'page unchanged')
+        else:
+            try:
+                with instrument.phase('parse'):
+                    parse_page(num, content, classes)
+                print(num)
+                instrument.count('subjects', 'parsed')
+            except (AttributeError, TypeError) as e:
+                print("Failed:", num)
+                print(e)
+                instrument.count('parse_failures', 'catalog page')
+                failures.append((num, e))
+                return
+        digests[num] = {'ws': ws_digests.get(num), 'page': page_digest, 'code': code_digest}
+        progress.append(num, {'class': classes[num], 'digests': digests[num]})
+
+    todo = []
+    for num in class_list:
+        if resumed(num):
+            classes[num] = progress.get(num)['class']
+            digests[num] = progress.get(num)['digests']
+            instrument.count('subjects', 'resumed')
+        else:
+            todo.append(num)
+
+    # Every other page is fetched again (through http_cache/, usually a 304),
+    # so catalog-only changes are picked up; an unchanged page is not reparsed.
+    blocks = {}
+    if args.bulk:
+        with instrument.phase('departments'):
+            blocks = fetch_departments(todo, args)
+    for num in todo:
+        if num in blocks:
+            add(num, blocks[num])
+
+    # Anything the department pages didn't cover falls back to a search.
+    searches = fetch.fetch_all([c for c in todo if c not in blocks],
+                               lambda c: args.host + search_path + c,
+                               workers=args.workers, timeout=args.timeout,
+                               retries=args.retries, backoff=args.backoff,
+                               cache=args.cache)
+    for num, r, err in searches:
+        if err is None and r.status_code != 200:
+            # A 404 or error page is not a catalog entry; don't parse it as one.
+            err = 'HTTP {}'.format(r.status_code)
+        if err is not None:
+            print("Failed to fetch:", num)
+            instrument.count('fetch_failures')
+            failures.append((num, err))
+            continue
+        add(num, r.content)
+
+    # Keep all_classes order in the output whatever order subjects finished in.
+    classes = {c: classes[c] for c in class_list if c in classes}
+
+    with open("sublist", 'w') as f:
+        json.dump(classes, f)
+
+    state['sublist'] = digests
+    manifest.save(state)
+    progress.done()
+
+    fetch.write_failures(args.failed, failures)
+
+    if args.cache is not None:
+        args.cache.evict()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Synthetic catalogs for scale testing, far larger than one MIT term.
+
+    python3 synth_catalog.py 50000                  # fixtures/synthetic-50000/
+    python3 synth_catalog.py 200000 --seed 3 --name big
+    python3 bench.py --fixtures synthetic-50000
+    python3 replay_server.py --fixtures synthetic-50000
+
+Writes a fixture set in the same layout bench_fixtures.py does (coursews
+JSON, a catalog page per subject, evaluations), so bench.py and
+replay_server.py take it like the term's own set, and through the replay
+server so does every pipeline stage.
+
+Subjects are modelled on ws. The first copy of each department keeps the
+real numbers; further copies are departments 18_1, 18_2, ... with the same
+subject numbers. Each synthetic subject takes its units, level, flags, text
+and number of lectures, recitations and labs from the real subject it
+copies, but every section's time string and room is drawn afresh from
+what ws has for that section type, so the schedule isn't the real one
+repeated. Joint and meets-with subjects point within the same copy.
+"""
+
+import argparse
+import random
+import sys
+
+import bench_fixtures
+
+SECTION_TYPES = ['l', 'r', 'b']
+# combiner_ws.py patches these by number, so every set has to have them.
+SPECIAL_CASES = ['6.S977', '21M.707', '22.05']
+
+
+def section_pools(ws):
+    """{type: [(raw time string, [slots, room]), ...]} over every section in ws."""
+    pools = {typ: [] for typ in SECTION_TYPES}
+    for c in ws.values():
+        for typ in SECTION_TYPES:
+            pools[typ].extend(zip(c[typ + '_raw'], c[typ]))
+    return pools
+
+
+def synthetic_number(num, copy):
+    if copy == 0:
+        return num
+    course, rest = num.split('.', 1)
+    return '{}_{}.{}'.format(course, copy, rest)
+
+
+def plan(templates, n, rng):
+    """
+    n (template, copy) pairs, whole copies of the catalog first. A set
+    smaller than the catalog is a sample that includes the special cases.
+    """
+    if n < len(templates):
+        special = [num for num in SPECIAL_CASES if num in templates]
+        rest = [num for num in templates if num not in special]
+        return [(num, 0) for num in sorted(special + rng.sample(rest, n - len(special)))]
+    chosen = []
+    copy = 0
+    while len(chosen) < n:
+        batch = templates if n - len(chosen) >= len(templates) \
+            else sorted(rng.sample(templates, n - len(chosen)))
+        chosen.extend((num, copy) for num in batch)
+        copy += 1
+    return chosen
+
+
+def relink(subjects, copy, included):
+    numbers = (synthetic_number(j, copy) for j in subjects.split(', ') if j)
+    return ', '.join(j for j in numbers if j in included)
+
+
+def generate(ws, sublist, evaluations, n, seed):
+    rng = random.Random(seed)
+    pools = section_pools(ws)
+    # Only subjects whose catalog record is complete can be rendered as a page.
+    templates = sorted(c for c in ws if 'level' in sublist.get(c, {}))
+    chosen = plan(templates, n, rng)
+    included = {synthetic_number(num, copy) for num, copy in chosen}
+
+    classes = {}
+    pages = {}
+    synthetic_evaluations = {}
+    for num, copy in chosen:
+        new = synthetic_number(num, copy)
+        c = dict(ws[num])
+        c['number'] = new
+        c['course'], c['class'] = new.split('.', 1)
+        for typ in SECTION_TYPES:
+            drawn = [rng.choice(pools[typ]) for _ in ws[num][typ]] if pools[typ] else []
+            c[typ + '_raw'] = [raw for raw, _ in drawn]
+            c[typ] = [section for _, section in drawn]
+        c['same_as'] = relink(c['same_as'], copy, included)
+        c['meets_with'] = relink(c['meets_with'], copy, included)
+        classes[new] = c
+
+        record = {k: v for k, v in sublist[num].items() if k != 'old_num'}
+        pages[new] = bench_fixtures.catalog_page(new, c, record)
+
+        if num in evaluations:
+            course, number = new.split('.', 1)
+            synthetic_evaluations[new] = [dict(e, course_number=course, class_number=number)
+                                          for e in evaluations[num]]
+    return classes, pages, synthetic_evaluations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('subjects', type=int, help='how many subjects to generate')
+    parser.add_argument('--name', default=None, help='fixture set name (default synthetic-N)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--term', default=None,
+                        help="term the coursews feed is served as; defaults to coursews.py's")
+    args = parser.parse_args()
+    if args.subjects < len(SPECIAL_CASES):
+        sys.exit('need at least {} subjects, for the special cases in combiner_ws.py'.format(
+            len(SPECIAL_CASES)))
+
+    term = args.term or bench_fixtures.coursews_term()
+    ws = bench_fixtures.read_json('ws')
+    sublist = bench_fixtures.read_json('sublist')
+    # The term's own fixture evaluations are the ones keyed on ws numbers.
+    _, _, evaluations = bench_fixtures.load()
+
+    classes, pages, synthetic_evaluations = generate(ws, sublist, evaluations,
+                                                     args.subjects, args.seed)
+    name = args.name or 'synthetic-{}'.format(args.subjects)
+    bench_fixtures.save(term, bench_fixtures.coursews_items(classes), pages,
+                        synthetic_evaluations,
+                        'synthetic, {} subjects modelled on ws, seed {}'.format(
+                            len(classes), args.seed),
+                        name=name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+Timeslot parsing shared by coursews.py and csb.py.
+
+The week is a grid of 30 half-hour slots per day (8am to 11pm), Monday to
+Friday. A time string such as 'MWF2', 'TR9.30-11' or 'W EVE (7-9.30 PM)'
+becomes a tuple of (start_slot, length) pairs. A term only has a few hundred
+distinct strings, so results are cached on the raw string. occupancy() turns
+a section's slots into a bitmask over the same grid.
+"""
+
+import re
+from functools import lru_cache
+
+import instrument
+
+timeslots = 30
+days = {'M': 0,
+        'T': timeslots,
+        'W': timeslots * 2,
+        'R': timeslots * 3,
+        'F': timeslots * 4}
+times = {'8': 0,
+         '8.30': 1,
+         '9': 2,
+         '9.30': 3,
+         '10': 4,
+         '10.30': 5,
+         '11': 6,
+         '11.30': 7,
+         '12': 8,
+         '12.30': 9,
+         '1': 10,
+         '1.30': 11,
+         '2': 12,
+         '2.30': 13,
+         '3': 14,
+         '3.30': 15,
+         '4': 16,
+         '4.30': 17,
+         '5': 18,
+         '5.30': 19,
+         '6': 20,
+         '6.30': 21,
+         '7': 22,
+         '7.30': 23}
+
+eve_times = {'12': 8,
+             '12.30': 9,
+             '1': 10,
+             '1.30': 11,
+             '2': 12,
+             '2.30': 13,
+             '3': 14,
+             '3.30': 15,
+             '4': 16,
+             '4.30': 17,
+             '5': 18,
+             '5.30': 19,
+             '6': 20,
+             '6.30': 21,
+             '7': 22,
+             '7.30': 23,
+             '8': 24,
+             '8.30': 25,
+             '9': 26,
+             '9.30': 27,
+             '10': 28,
+             '10.30': 29}
+
+# Day letters followed by a start time and optional end time, e.g. 'MWF9.30-11'.
+day_time = re.compile(r'([A-Za-z]+)([^A-Za-z]+)')
+
+
+def parse_eve(t):
+    wdays = t.split()[0]
+    t = t[t.find("(")+1:t.find(")")].rstrip(' PM')
+
+    slots = []
+    startendtime = t.split('-')
+    try:
+        start = eve_times[startendtime[0]]
+        if len(startendtime) > 1:
+            length = eve_times[startendtime[1]] - start
+        else:
+            length = 2
+        if length <= 0:
+            return tuple(slots), ('tsp_eve', 'empty range', t)
+        for d in wdays:
+            slots.append((days[d] + start, length))
+    except KeyError as e:
+        return tuple(slots), ('tsp_eve', e, t)
+
+    return tuple(slots), None
+
+
+@lru_cache(maxsize=4096)
+def parse(t):
+    """
+    Parse one time string into ((start_slot, length), ...), error).
+
+    error is None on success. On a malformed string it describes the problem,
+    and the slots are whatever parsed before it (same as the old tsp). Every
+    slot returned has a positive length, so its occupancy mask agrees with
+    conflict_check.
+    """
+    if '*' in t:
+        return (), None
+
+    if 'EVE' in t:
+        return parse_eve(t)
+
+    slots = []
+    try:
+        t = t.split()[0]
+        # remove trailing parens e.g. MWF2(LIMITEDTO15)
+        t = t.split("(")[0]
+    except IndexError as e:
+        return (), ('tsp', e, t)
+
+    for chunk in t.split(','):
+        m = day_time.match(chunk)
+        if m is None:
+            return tuple(slots), ('tsp', 'bad time', chunk)
+
+        wdays, startend = m.groups()
+        startendtime = startend.split('-')
+        try:
+            start = times[startendtime[0]]
+            if len(startendtime) > 1:
+                length = times[startendtime[1]] - start
+                if length <= 0:
+                    # An evening range without EVE, e.g. 'R6-9': the end is PM.
+                    length = eve_times[startendtime[1]] - start
+            else:
+                length = 2
+            if length <= 0 or start + length > timeslots:
+                return tuple(slots), ('tsp', 'empty range', chunk)
+            for d in wdays:
+                slots.append((days[d] + start, length))
+        except KeyError as e:
+            return tuple(slots), ('tsp', e, chunk)
+
+    return tuple(slots), None
+
+
+def tsp(t, number=None):
+    """Slots for time string t, printing a warning (with the subject number) if it is malformed."""
+    slots, error = parse(t)
+    if error is not None:
+        instrument.count('parse_failures', error[0])
+        print(*error, number)
+    return slots
+
+
+def conflict_check(slot1, slot2):
+    """Whether two (start, length) slots overlap, as in www/script.js."""
+    return slot1[0] < slot2[0] + slot2[1] and slot2[0] < slot1[0] + slot1[1]
+
+
+def occupancy(slots):
+    """
+    Occupancy bitmask of a section: five 30-bit words, one per day, with bit
+    i of word d set when the section meets in slot d * 30 + i. Two sections
+    conflict exactly when some pair of words ANDs to non-zero.
+    """
+    bits = 0
+    for start, length in slots:
+        if length > 0:
+            bits |= ((1 << length) - 1) << start
+    day = (1 << timeslots) - 1
+    return tuple((bits >> (d * timeslots)) & day for d in range(len(days)))
+
+
+def overlaps(mask1, mask2):
+    return any(a & b for a, b in zip(mask1, mask2))
+
+
+def covered(slots):
+    """Set of slot indices a list of (start, length) slots covers."""
+    return {i for start, length in slots for i in range(start, start + length)}
+
+
+def occupied(mask):
+    """Set of slot indices set in an occupancy bitmask."""
+    return {d * timeslots + i
+            for d, word in enumerate(mask)
+            for i in range(timeslots) if word >> i & 1}
@@ -1,9 +1,4 @@
 #! /bin/sh
+# The stages, and which of them can be skipped, are declared in pipeline.py.
 cd "${0%/*}"
-echo "=== coursews.py ==="
-python3 coursews.py
-echo "=== sublist_ws.py ==="
-python3 sublist_ws.py
-echo "=== combiner_ws.py ==="
-python3 combiner_ws.py
-cp full.js ../www/full.js
+exec python3 pipeline.py "$@"
@@ -0,0 +1,148 @@
+"""
+Streaming reader for .xlsx spreadsheets such as the registrar's CSB.xlsx.
+
+rows() walks the sheet with iterparse and yields a tuple of cell strings per
+row as soon as the row has been read, dropping each row behind it, so memory
+stays flat however large the sheet grows. Shared strings are read lazily
+into a list, only as far as the highest index a cell has asked for. Rows are
+padded to the width of the sheet's declared dimension.
+
+    python3 xlsx.py CSB.xlsx [sheet number or name] > csb.tsv
+
+prints a sheet as tab-separated values, as the old xlsx2tsv.py did.
+"""
+
+import re
+import sys
+import zipfile
+
+from lxml import etree
+
+ns = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+column_letters = re.compile(r'[A-Z]+')
+
+
+def column(ref):
+    """'A1' -> 0, 'B7' -> 1, 'AA3' -> 26."""
+    index = 0
+    for letter in column_letters.match(ref).group():
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def clean(text):
+    """A cell's text on one line, for tab-separated output."""
+    return text.replace('\t', ' ').replace('\n', ' ').replace('\r', ' ')
+
+
+def release(el):
+    # Free the element and every sibling already read before it.
+    el.clear()
+    while el.getprevious() is not None:
+        del el.getparent()[0]
+
+
+def string_text(si):
+    t = si.find(ns + 't')
+    if t is not None:
+        return t.text or ''
+    # Rich text: the runs' text, leaving out phonetic hints.
+    return ''.join(t.text or '' for t in si.iterfind(ns + 'r/' + ns + 't'))
+
+
+class SharedStrings:
+    def __init__(self, z):
+        self.strings = []
+        self.pending = None
+        if 'xl/sharedStrings.xml' in z.namelist():
+            self.pending = etree.iterparse(z.open('xl/sharedStrings.xml'), tag=ns + 'si')
+
+    def __getitem__(self, i):
+        while i >= len(self.strings) and self.pending is not None:
+            try:
+                _, si = next(self.pending)
+            except StopIteration:
+                self.pending = None
+                break
+            self.strings.append(string_text(si))
+            release(si)
+        return self.strings[i]
+
+
+def sheet_names(z):
+    workbook = etree.fromstring(z.read('xl/workbook.xml'))
+    return [s.get('name') for s in workbook.iterfind(ns + 'sheets/' + ns + 'sheet')]
+
+
+def sheet_path(z, sheet):
+    """Worksheet part for a 1-based sheet number or a sheet name."""
+    if isinstance(sheet, str) and not sheet.isdigit():
+        names = sheet_names(z)
+        if names.count(sheet) != 1:
+            raise ValueError("Can't find a single sheet named '{}'".format(sheet))
+        sheet = names.index(sheet) + 1
+    path = 'xl/worksheets/sheet{}.xml'.format(sheet)
+    if path not in z.namelist():
+        raise ValueError('No sheet {}'.format(sheet))
+    return path
+
+
+def cell_text(c, strings):
+    kind = c.get('t')
+    if kind == 'inlineStr':
+        return string_text(c.find(ns + 'is'))
+    v = c.find(ns + 'v')
+    if v is None or v.text is None:
+        return ''
+    if kind == 's':
+        return strings[int(v.text)]
+    return v.text
+
+
+def rows(path, sheet=1):
+    """Yield every row of a sheet as a tuple of strings, '' for empty cells."""
+    with zipfile.ZipFile(path) as z:
+        strings = SharedStrings(z)
+        width = 0
+        events = etree.iterparse(z.open(sheet_path(z, sheet)),
+                                 tag=(ns + 'dimension', ns + 'row'))
+        for _, el in events:
+            if el.tag == ns + 'dimension':
+                width = column(el.get('ref').split(':')[-1]) + 1
+                continue
+            cells = []
+            for c in el.iterfind(ns + 'c'):
+                ref = c.get('r')
+                if ref is not None:
+                    cells.extend([''] * (column(ref) - len(cells)))
+                cells.append(cell_text(c, strings))
+            width = max(width, len(cells))
+            cells.extend([''] * (width - len(cells)))
+            release(el)
+            yield tuple(cells)
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__.strip())
+    path = sys.argv[1]
+    if len(sys.argv) > 2:
+        sheet = sys.argv[2]
+    else:
+        with zipfile.ZipFile(path) as z:
+            names = sheet_names(z)
+        if len(names) > 1:
+            sys.exit('There are multiple sheets -- need to specify a sheet number or name:\n' +
+                     '\n'.join('{:3}: {}'.format(i + 1, name) for i, name in enumerate(names)))
+        sheet = 1
+
+    try:
+        for row in rows(path, sheet):
+            print('\t'.join(clean(cell) for cell in row))
+    except ValueError as e:
+        sys.exit(str(e))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+#! /usr/bin/env python3
+
+"""
+Check eval_http.py end to end against a local stand-in for the evaluation site.
+
+    ./bench_eval_http.py                  # scrape the fixture term and check the store
+    ./bench_eval_http.py --serve 8780     # just run the stand-in, for trying things by hand
+
+The stand-in serves one term's search listing and a report page per subject,
+in the markup eval_http.py reads, built from the evaluations in the bench
+fixtures (new_scripts/bench_fixtures.py). Every tenth report covers two
+subjects, the way joint subjects share one report. Pages need the cookie in
+the cookies file the check writes; without it they are the login page. A
+fraction of report requests get a 503.
+
+The check runs eval_http.py against it and compares every record in the
+resulting evaluation store with what the pages say. It then runs the scraper
+again, which must answer every report from http_cache/ without asking the
+server, and once with no cookies, which must stop with the expired-cookies
+message. It exits non-zero if anything differs.
+"""
+
+import argparse
+import html
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'new_scripts'))
+import bench_fixtures
+
+from evalstore import EvalStore
+
+SEARCH_PATH = '/ose-rpt/subjectEvaluationSearch.htm'
+REPORT_PATH = '/ose-rpt/subjectEvaluationReport.htm'
+COOKIE = {'name': 'JSESSIONID', 'value': 'fixture', 'domain': '127.0.0.1', 'path': '/'}
+ERROR_RATE = 0.05
+JOINT_EVERY = 10
+
+roles = [('Lecturer', 'LEC'), ('Recitation Instructor', 'REC'), ('Lab Instructor', 'LAB')]
+
+
+def make_reports(evaluations, seed=0):
+    """
+    [(subjects, record)] for one term: per-report numbers derived from each
+    subject's averaged fixture record, plus made-up instructors.
+    """
+    rng = random.Random(seed)
+    numbers = sorted(evaluations)
+    reports = []
+    i = 0
+    while i < len(numbers):
+        subjects = numbers[i:i + 2] if len(reports) % JOINT_EVERY == JOINT_EVERY - 1 else numbers[i:i + 1]
+        i += len(subjects)
+        average = evaluations[subjects[0]][0]
+        eligible = max(1, int(round(average['eligible'])))
+        resp = rng.randint(1, eligible)
+        record = {'rating': round(min(average['rating'], 7.0), 1),
+                  'ic_hours': round(average['ic_hours'], 1),
+                  'oc_hours': round(rng.uniform(0, 8), 1),
+                  'eligible': eligible,
+                  'resp': resp,
+                  'rate': round(resp / eligible * 100, 1),
+                  'professors': []}
+        for k in range(rng.randint(1, 3)):
+            role, code = rng.choice(roles)
+            record['professors'].append({'name': 'Instructor {}-{}'.format(len(reports), k),
+                                         'role': role, 'code': code,
+                                         'rating': round(rng.uniform(1, 7), 1)})
+        names = [' '.join(evaluations[s][0]['class_name'].split()) or 'Untitled' for s in subjects]
+        reports.append((list(zip(subjects, names)), record))
+    return reports
+
+
+def listing_page(term, reports):
+    links = ''.join('<p><a href="subjectEvaluationReport.htm?surveyId={}&amp;termId={}">{}</a></p>'
+                    .format(i, term, html.escape(subjects[0][0]))
+                    for i, (subjects, _) in enumerate(reports))
+    return ('<html><head><title>Search Results</title></head><body><div id="rh-col">'
+            '<p>Search results</p><p><a href="help.htm">Help</a></p><p>{} reports</p>{}'
+            '</div></body></html>').format(len(reports), links)
+
+
+def report_page(subjects, record):
+    titles = '<br>\n'.join(html.escape('{} {}'.format(num, name)) for num, name in subjects)
+    professors = ''.join(
+        '<tr><td><a href="#"><strong>{}</strong></a>, {} ({})</td><td></td><td></td><td></td>'
+        '<td><span class="avg">{:.1f}</span></td></tr>'.format(
+            html.escape(p['name']), p['role'], p['code'], p['rating'])
+        for p in record['professors'])
+    return '''<html><head><title>Report for {num}</title></head><body><div id="contentsframe">
+<table class="header">
+<tr><td class="subjectTitle"><h1>{titles}</h1></td></tr>
+<tr><td class="summaryContainer"><table class="summary"><tr>
+<td>Eligible to respond: {eligible}</td>
+<td>Total number of respondents: {resp}</td>
+<td>Response rate: {rate:.1f}%</td>
+<td><p>Overall rating of subject: {rating:.1f}  out of 7.0</p></td>
+</tr></table></td></tr>
+</table>
+<table class="indivQuestions"></table>
+<table class="indivQuestions"></table>
+<table class="indivQuestions">
+<tr><td>Question</td></tr><tr><td>Question</td></tr><tr><td>Question</td></tr>
+<tr><td class="avg">{ic:.1f}</td></tr>
+<tr><td class="avg">{oc:.1f}</td></tr>
+</table>
+<table class="grid"><tr><th>Instructor</th></tr><tr><th>Role</th></tr>{professors}</table>
+<!-- end of report --></div></body></html>'''.format(
+        num=html.escape(subjects[0][0]), titles=titles, eligible=record['eligible'],
+        resp=record['resp'], rate=record['rate'], rating=record['rating'],
+        ic=record['ic_hours'], oc=record['oc_hours'], professors=professors)
+
+
+class Site:
+    def __init__(self, term, reports, error_rate=ERROR_RATE, seed=0):
+        self.term = term
+        self.reports = reports
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {'listing': 0, 'report': 0, '503': 0, 'login': 0, 'in_flight': 0,
+                       'max_in_flight': 0}
+
+    def count(self, key, n=1):
+        with self.lock:
+            self.counts[key] += n
+            if key == 'in_flight':
+                self.counts['max_in_flight'] = max(self.counts['max_in_flight'],
+                                                   self.counts['in_flight'])
+
+    def page(self, path, query, cookie):
+        """(status, body) for a request."""
+        if '{}={}'.format(COOKIE['name'], COOKIE['value']) not in cookie:
+            self.count('login')
+            return 200, '<html><head><title>Touchstone Login</title></head><body>Log in</body></html>'
+        q = parse_qs(query)
+        if path == SEARCH_PATH and q.get('termId') == [self.term]:
+            self.count('listing')
+            return 200, listing_page(self.term, self.reports)
+        if path == REPORT_PATH:
+            with self.lock:
+                failed = self.rng.random() < self.error_rate
+            if failed:
+                self.count('503')
+                return 503, 'Service Unavailable'
+            try:
+                subjects, record = self.reports[int(q['surveyId'][0])]
+            except (KeyError, IndexError, ValueError):
+                return 404, 'Not Found'
+            self.count('report')
+            return 200, report_page(subjects, record)
+        return 404, 'Not Found'
+
+    def handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *a):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                site.count('in_flight')
+                try:
+                    # A little latency, so concurrent requests overlap.
+                    time.sleep(0.005)
+                    status, body = site.page(url.path, url.query, self.headers.get('Cookie', ''))
+                finally:
+                    site.count('in_flight', -1)
+                body = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def expected_records(term, reports):
+    """{subject: record} as the store should hold it after scraping the site."""
+    out = {}
+    for subjects, record in reports:
+        # Like eval_scraper.py, the subjects of one report share one record, so
+        # the numbers and name stored are those of the last title.
+        last, name = subjects[-1]
+        course, number = last.split('.', 1)
+        for subject, _ in subjects:
+            out[subject] = {'term': term, 'rating': record['rating'],
+                            'ic_hours': record['ic_hours'], 'oc_hours': record['oc_hours'],
+                            'eligible': record['eligible'], 'resp': record['resp'],
+                            'rate': record['rate'],
+                            'professors': [{'name': p['name'], 'role': p['role'],
+                                            'rating': p['rating']} for p in record['professors']],
+                            'course_number': course, 'class_number': number,
+                            'class_name': name}
+    return out
+
+
+def compare(db, expected):
+    problems = 0
+    with EvalStore(db) as store:
+        stored = dict(store.all_subjects())
+    for subject in sorted(set(expected) | set(stored)):
+        if subject not in stored:
+            print('missing from the store:', subject)
+            problems += 1
+            continue
+        if subject not in expected:
+            print('not on the site:', subject)
+            problems += 1
+            continue
+        history = stored[subject]
+        got = {k: v for k, v in history[-1].items() if k != 'url'} if len(history) == 1 else history
+        if got != expected[subject]:
+            print('{}: stored {}, expected {}'.format(subject, got, expected[subject]))
+            problems += 1
+    return problems
+
+
+def scrape(workdir, cookies, term, base_url):
+    begin = time.perf_counter()
+    r = subprocess.run([sys.executable, os.path.join(HERE, 'eval_http.py'), cookies, term,
+                        '--base-url', base_url, '--workers', '8', '--rate', '500',
+                        '--db', 'evaluations.db', '--failed', 'eval_failed'],
+                       cwd=workdir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return r, time.perf_counter() - begin
+
+
+def check(site, base_url):
+    problems = 0
+    expected = expected_records(site.term, site.reports)
+    with tempfile.TemporaryDirectory() as workdir:
+        cookies = os.path.join(workdir, 'cookies.json')
+        with open(cookies, 'w') as f:
+            json.dump([COOKIE], f)
+        no_cookies = os.path.join(workdir, 'no_cookies.json')
+        with open(no_cookies, 'w') as f:
+            json.dump([], f)
+
+        r, seconds = scrape(workdir, cookies, site.term, base_url)
+        counts = dict(site.counts)
+        print('first run: exit {}, {:.2f}s, {} reports served, {} 503s, {} requests at most in flight'
+              .format(r.returncode, seconds, counts['report'], counts['503'], counts['max_in_flight']))
+        if r.returncode != 0:
+            print(r.stdout)
+            problems += 1
+        problems += compare(os.path.join(workdir, 'evaluations.db'), expected)
+
+        r, seconds = scrape(workdir, cookies, site.term, base_url)
+        fetched = site.counts['report'] - counts['report']
+        print('second run: exit {}, {:.2f}s, {} reports fetched again'.format(
+            r.returncode, seconds, fetched))
+        if r.returncode != 0 or fetched:
+            print(r.stdout)
+            problems += 1
+        problems += compare(os.path.join(workdir, 'evaluations.db'), expected)
+
+        r, _ = scrape(workdir, no_cookies, site.term, base_url)
+        print('without cookies: exit {}: {}'.format(r.returncode, r.stdout.strip().splitlines()[-1]))
+        if r.returncode == 0 or 'cookies have probably expired' not in r.stdout:
+            problems += 1
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--serve', type=int, metavar='PORT', help='only run the stand-in site')
+    parser.add_argument('--term', default=None, help="fixture set to use; defaults to coursews.py's term")
+    parser.add_argument('--error-rate', type=float, default=ERROR_RATE)
+    args = parser.parse_args()
+
+    fixtures = args.term or bench_fixtures.default_set()
+    term = bench_fixtures.meta(fixtures)['term']
+    _, _, evaluations = bench_fixtures.load(fixtures)
+    site = Site(term, make_reports(evaluations), args.error_rate)
+    server = ThreadingHTTPServer(('127.0.0.1', args.serve or 0), site.handler())
+    server.daemon_threads = True
+    base_url = 'http://127.0.0.1:{}{}'.format(server.server_address[1], SEARCH_PATH)
+
+    if args.serve:
+        print('Serving {} reports for {} at {}'.format(len(site.reports), term, base_url))
+        print('Cookies file: [{}]'.format(json.dumps(COOKIE)))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    problems = check(site, base_url)
+    server.shutdown()
+    if problems:
+        sys.exit('{} problems'.format(problems))
+    print('{} subjects in {} reports scraped and stored correctly'.format(
+        len(expected_records(term, site.reports)), len(site.reports)))
+
+
+if __name__ == '__main__':
+    main()
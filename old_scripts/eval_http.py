@@ -0,0 +1,226 @@
+#! /usr/bin/env python3
+
+"""
+Evaluation scraper over plain HTTP.
+
+eval_scraper.py clicks through every report in one Chrome window. This reuses
+the cookies of one interactive login instead: fetch each term's search
+results once, take the report links straight from the listing, and download
+the reports concurrently (rate-limited) and parse them from the HTML. Reports
+never change once published, so downloaded pages are kept in http_cache/ and
+a rerun only fetches the ones it doesn't have.
+
+    ./eval_scraper.py --save-cookies cookies.json     # log in once (Duo push)
+    ./eval_http.py cookies.json 2019FA 2019JA
+
+Results go into the evaluation store (evalstore.py) like eval_scraper.py's.
+"""
+
+import argparse
+import json
+import os
+import sys
+from decimal import Decimal, InvalidOperation
+from http.cookiejar import MozillaCookieJar
+from urllib.parse import urljoin
+
+from lxml import html
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'new_scripts'))
+import fetch
+import httpcache
+
+from evalstore import EvalStore
+
+EVAL_URL = 'https://edu-apps.mit.edu/ose-rpt/subjectEvaluationSearch.htm'
+RATE = 5
+
+
+class ReportError(Exception):
+    pass
+
+
+def url_from_term(base, term):
+    return base + '?termId={}&search=Search'.format(term)
+
+
+def load_cookies(session, path):
+    """Cookies from a browser export (cookies.txt) or eval_scraper.py --save-cookies (JSON)."""
+    if path.endswith('.txt'):
+        jar = MozillaCookieJar(path)
+        jar.load(ignore_discard=True, ignore_expires=True)
+        session.cookies.update(jar)
+        return
+    with open(path) as f:
+        for c in json.load(f):
+            session.cookies.set(c['name'], c['value'], domain=c.get('domain'), path=c.get('path', '/'))
+
+
+def text(el):
+    """Rendered text of an element like Selenium's .text: <br> is a newline, runs of spaces collapse."""
+    parts = []
+
+    def walk(e):
+        if not isinstance(e.tag, str):
+            # Comments and processing instructions.
+            return
+        if e.tag == 'br':
+            parts.append('\n')
+        elif e.text:
+            parts.append(e.text)
+        for child in e:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(el)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def first(doc, path):
+    found = doc.xpath(path)
+    if not found:
+        raise ReportError('missing ' + path)
+    return text(found[0])
+
+
+def report_links(content, listing_url):
+    doc = html.fromstring(content)
+    if doc.findtext('.//title', '').strip() != 'Search Results':
+        raise ReportError('search results did not load; the cookies have probably expired')
+    # The first three paragraphs of the listing are not reports.
+    return [urljoin(listing_url, href)
+            for href in doc.xpath("//div[@id='rh-col']/p[position() >= 4]/a/@href")]
+
+
+# The same cells eval_scraper.py reads, without the tbody a browser inserts.
+summary = "//div[@id='contentsframe']/table[@class='header']//tr[2]/td[@class='summaryContainer']/table[@class='summary']//tr/td"
+hours = "//div[@id='contentsframe']/table[@class='indivQuestions'][3]//tr[{}]/td[@class='avg']"
+grid = "//div[@id='contentsframe']/table[@class='grid']//tr[{}]"
+
+
+def parse_report(content, url, term):
+    """{subject: record} for one report, shaped like eval_scraper.py's."""
+    doc = html.fromstring(content)
+    if 'Report for' not in doc.findtext('.//title', ''):
+        raise ReportError('not a report page')
+
+    titles = first(doc, "//div[@id='contentsframe']/table[@class='header']//tr[1]/td[@class='subjectTitle']/h1").split('\n')
+    class_numbers = [t.split(' ')[0] for t in titles]
+    class_names = [' '.join(t.split(' ')[1:]) for t in titles]
+
+    cd = {}
+    cd['term'] = term
+    cd['url'] = url
+
+    try:
+        cd['rating'] = Decimal(first(doc, summary + '[4]/p')[27:30])
+        cd['ic_hours'] = Decimal(first(doc, hours.format(4)))
+        cd['oc_hours'] = Decimal(first(doc, hours.format(5)))
+        cd['eligible'] = int(first(doc, summary + '[1]').split()[3])
+        cd['resp'] = int(first(doc, summary + '[2]').split()[4])
+        cd['rate'] = Decimal(first(doc, summary + '[3]').split()[2].rstrip('%'))
+    except (ReportError, IndexError, ValueError, InvalidOperation) as e:
+        raise ReportError('{} had a major error: {}'.format(class_numbers[0], e))
+
+    cd['professors'] = []
+    for x in range(3, 100):
+        row = doc.xpath(grid.format(x))
+        name = row and row[0].xpath('td[1]/a/strong')
+        avg = row and row[0].xpath("td[5]/span[@class='avg']")
+        if not name or not avg:
+            break
+        prof = {}
+        prof['name'] = text(name[0])
+        prof['rating'] = Decimal(text(avg[0]))
+        prof['role'] = text(row[0].xpath('td[1]')[0]).replace(prof['name'], '').rstrip('(RLECABDGMO1234567890)').strip(' ,')
+        cd['professors'].append(prof)
+
+    print('{:8} | {:48.48} | {} | {} | {}'.format(class_numbers[0], class_names[0], cd['rating'], cd['ic_hours'], cd['oc_hours']))
+
+    class_dict = {}
+    for i in range(len(titles)):
+        class_num_split = class_numbers[i].split('.')
+        cd['course_number'] = class_num_split[0]
+        cd['class_number'] = class_num_split[1]
+        cd['class_name'] = class_names[i]
+        class_dict[class_numbers[i]] = cd
+    return class_dict
+
+
+def scrape_term(session, args, cache, limit, term):
+    listing_url = url_from_term(args.base_url, term)
+    listing = fetch.fetch(session, listing_url, args.timeout, args.retries, limit=limit)
+    links = report_links(listing.content, listing_url)
+
+    class_dict = {}
+    failures = []
+
+    def add(url, r):
+        try:
+            class_dict.update(parse_report(r.content, url, term))
+        except ReportError as e:
+            # Usually a login page in place of the report; don't cache it.
+            failures.append((url, e))
+            return
+        if cache is not None and not getattr(r, 'from_cache', False):
+            cache.store(url, r)
+
+    # Reports are immutable, so anything already cached is used without asking again.
+    missing = []
+    for url in links:
+        cached = cache.response(url) if cache is not None else None
+        if cached is None:
+            missing.append(url)
+        else:
+            add(url, cached)
+    print('{}: {} reports, {} cached'.format(term, len(links), len(links) - len(missing)))
+
+    for url, r, error in fetch.fetch_all(missing, lambda url: url, args.workers, args.timeout,
+                                         args.retries, session=session, limit=limit):
+        if error is not None:
+            failures.append((url, error))
+        else:
+            add(url, r)
+    return class_dict, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scrape subject evaluations over HTTP.')
+    parser.add_argument('cookies', help='cookies.txt or eval_scraper.py --save-cookies output')
+    parser.add_argument('terms', nargs='+', help='e.g. 2019FA')
+    parser.add_argument('--base-url', default=EVAL_URL)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=RATE, help='requests per second')
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--retries', type=int, default=fetch.RETRIES)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--db', default='evaluations.db')
+    parser.add_argument('--failed', default='eval_failed')
+    args = parser.parse_args()
+
+    session = fetch.make_session(args.workers)
+    load_cookies(session, args.cookies)
+    cache = None if args.no_cache else httpcache.Cache()
+    limit = fetch.RateLimit(args.rate)
+
+    failures = []
+    with EvalStore(args.db) as store:
+        for term in args.terms:
+            try:
+                class_dict, term_failures = scrape_term(session, args, cache, limit, term)
+            except (fetch.FetchError, ReportError) as e:
+                sys.exit('{}: {}'.format(term, e))
+            if class_dict:
+                store.add_term(class_dict)
+            failures.extend(term_failures)
+            print('{}: {} subjects, {} failed'.format(term, len(class_dict), len(term_failures)))
+
+    # No cache.evict(): its age and size limits would throw away reports,
+    # which are meant to be kept so reruns only fetch the missing ones.
+    fetch.write_failures(args.failed, failures)
+
+
+if __name__ == '__main__':
+    main()
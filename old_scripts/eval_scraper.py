@@ -6,11 +6,17 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException
 
+import json
 import os
+import sys
 import time
-import pickle
 from decimal import *
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'new_scripts'))
+import journal
+
+from evalstore import EvalStore
+
 username = 'edwardf'
 with open('password', 'r') as f:
     password = f.read().strip()
@@ -48,9 +54,13 @@ def mit_duo_login():
 
     return session
 
-def scrape_class_info(session, class_element, class_dict, term):
-    # Click link and wait until report loads
+def scrape_class_info(session, class_element, progress, term):
+    # Reports already journaled by an interrupted run are skipped
     url = class_element.get_attribute('href')
+    if url in progress:
+        return
+
+    # Click link and wait until report loads
     class_element.click()
     WebDriverWait(session, 60).until(EC.title_contains('Report for'))
 
@@ -108,6 +118,7 @@ def scrape_class_info(session, class_element, class_dict, term):
     # Fits perfectly in a cmd window
     print('{:8} | {:48.48} | {} | {} | {}'.format(class_numbers[0], class_names[0], cd['rating'], cd['ic_hours'], cd['oc_hours']))
 
+    class_dict = {}
     for i in range(len(titles)):
         class_num_split = class_numbers[i].split('.')
         cd['course_number'] = class_num_split[0]
@@ -115,6 +126,8 @@ def scrape_class_info(session, class_element, class_dict, term):
         cd['class_name'] = class_names[i]
         
         class_dict[class_numbers[i]] = cd
+
+    progress.append(url, class_dict)
         
     # Error-resistant back, then wait for search page
     session.execute_script("window.history.go(-1)")
@@ -123,11 +136,21 @@ def scrape_class_info(session, class_element, class_dict, term):
 def main():
     session = mit_duo_login()
 
-    if not os.path.exists('data'):
-        os.makedirs('data')
+    # Only log in, and leave the scraping to eval_http.py.
+    if len(sys.argv) > 2 and sys.argv[1] == '--save-cookies':
+        with open(sys.argv[2], 'w') as f:
+            json.dump(session.get_cookies(), f)
+        session.quit()
+        return
+
+    store = EvalStore()
 
     for term in terms:
-        class_dict = {}
+        # Every report is journaled as soon as it's read, so a crash or an
+        # expired login only costs the report in progress on the next run.
+        progress = journal.Journal('eval_{}.journal'.format(term), default=float)
+        if len(progress):
+            print('Resuming {}: {} reports already scraped'.format(term, len(progress)))
         
         print('\n\n\n'.format(term))
         session.get(url_from_term(term))
@@ -136,13 +159,16 @@ def main():
         for i in range(4, 2000):
             try:
                 class_element = session.find_element_by_xpath("/html/body/div[@id='wrapper']/div[@id='rh-col']/p[{}]/a".format(i))
-                scrape_class_info(session, class_element, class_dict, term)
+                scrape_class_info(session, class_element, progress, term)
             except NoSuchElementException:
                 continue
 
+        class_dict = {}
+        for _, report in progress.items():
+            class_dict.update(report)
         if class_dict != {}:
-            with open('data/' + term, 'wb') as f:
-                pickle.dump(class_dict, f)
+            store.add_term(class_dict)
+        progress.done()
         
 if __name__ == '__main__':
     main()
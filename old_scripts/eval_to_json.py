@@ -1,11 +1,11 @@
 #! /usr/bin/env python3
 
 import simplejson as json
-import pickle
-import os
 import re
 from decimal import *
 
+from evalstore import EvalStore
+
 def atoi(text):
     return int(text) if text.isdigit() else text
 
@@ -15,19 +15,13 @@ def natural_keys(d):
 
 def main():
     classes = {}
-    professors = set()
-
-    # Pull all terms into a single list for each class
-    for term in os.listdir('../../firehose-priv/data/'):
-        with open('../../firehose-priv/data/' + term, 'rb') as f:
-            term_dict = pickle.load(f)
-        for k, v in term_dict.items():
-            if k not in classes:
-                classes[k] = []
-            for prof in v['professors']:
-                professors.add(prof['name'])
-            classes[k].append(v)
-            
+
+    # Each class's history across all terms, read from the evaluation store
+    with EvalStore() as store:
+        for k, history in store.all_subjects():
+            classes[k] = history
+        professors = store.professors()
+
     with open('evaluations.json', 'w') as f:
         f.write('var evals = ')
         json.dump(classes, f)
@@ -38,7 +32,7 @@ def main():
 
     with open('professors.json', 'w') as f:
         f.write('var professors = ')
-        json.dump(list(professors), f)
+        json.dump(professors, f)
         f.write(';')
 
 if __name__ == '__main__':
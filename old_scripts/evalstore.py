@@ -0,0 +1,165 @@
+#! /usr/bin/env python3
+
+"""
+Subject evaluations in a local SQLite file (evaluations.db).
+
+subject_terms holds one row per subject per term with the summary stats from
+the report; instructor_ratings holds the instructors listed on it. Both are
+indexed by subject, and instructors by name, so one subject's history or one
+instructor's ratings come straight off an index, and all_subjects() streams
+the whole store a subject at a time.
+
+eval_scraper.py writes through EvalStore.add(); eval_to_json.py reads it.
+The per-term pickles the scraper used to write can be imported with
+
+    ./evalstore.py import ../../firehose-priv/data
+"""
+
+import os
+import pickle
+import sqlite3
+import sys
+from decimal import Decimal
+
+DB = 'evaluations.db'
+
+schema = '''
+CREATE TABLE IF NOT EXISTS subject_terms (
+    subject TEXT NOT NULL,
+    term TEXT NOT NULL,
+    url TEXT,
+    rating REAL,
+    ic_hours REAL,
+    oc_hours REAL,
+    eligible INTEGER,
+    resp INTEGER,
+    rate REAL,
+    course_number TEXT,
+    class_number TEXT,
+    class_name TEXT,
+    PRIMARY KEY (subject, term)
+);
+CREATE INDEX IF NOT EXISTS subject_terms_term ON subject_terms (term);
+
+CREATE TABLE IF NOT EXISTS instructor_ratings (
+    subject TEXT NOT NULL,
+    term TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    role TEXT,
+    rating REAL,
+    PRIMARY KEY (subject, term, position)
+);
+CREATE INDEX IF NOT EXISTS instructor_ratings_name ON instructor_ratings (name);
+'''
+
+stat_columns = ['url', 'rating', 'ic_hours', 'oc_hours', 'eligible', 'resp', 'rate',
+                'course_number', 'class_number', 'class_name']
+
+
+def number(v):
+    # The scraper parses stats into Decimal, which sqlite3 can't bind.
+    return float(v) if isinstance(v, Decimal) else v
+
+
+class EvalStore:
+    def __init__(self, path=DB):
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.db.commit()
+        self.db.close()
+
+    def commit(self):
+        self.db.commit()
+
+    def add(self, subject, record):
+        """Store (or replace) one subject's report for record['term']."""
+        term = record['term']
+        self.db.execute(
+            'INSERT OR REPLACE INTO subject_terms (subject, term, {}) VALUES (?, ?, {})'.format(
+                ', '.join(stat_columns), ', '.join('?' * len(stat_columns))),
+            [subject, term] + [number(record.get(c)) for c in stat_columns])
+        self.db.execute('DELETE FROM instructor_ratings WHERE subject = ? AND term = ?',
+                        (subject, term))
+        self.db.executemany(
+            'INSERT INTO instructor_ratings (subject, term, position, name, role, rating) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            [(subject, term, i, prof['name'], prof.get('role'), number(prof.get('rating')))
+             for i, prof in enumerate(record.get('professors', []))])
+
+    def add_term(self, class_dict):
+        """Store a whole term's {subject: record}, as eval_scraper.py builds it."""
+        for subject, record in class_dict.items():
+            self.add(subject, record)
+        self.commit()
+
+    def _records(self, rows, professors):
+        for row in rows:
+            # Same key order as the scraper's dicts.
+            record = {'term': row['term']}
+            for c in stat_columns:
+                if row[c] is not None:
+                    record[c] = row[c]
+                if c == 'rate':
+                    record['professors'] = professors.get(row['term'], [])
+            yield record
+
+    def _professors(self, subject):
+        professors = {}
+        for row in self.db.execute(
+                'SELECT term, name, role, rating FROM instructor_ratings '
+                'WHERE subject = ? ORDER BY term, position', (subject,)):
+            professors.setdefault(row['term'], []).append(
+                {'name': row['name'], 'rating': row['rating'], 'role': row['role']})
+        return professors
+
+    def history(self, subject):
+        """Every term's record for one subject, in the order they were stored."""
+        rows = self.db.execute('SELECT * FROM subject_terms WHERE subject = ? ORDER BY rowid',
+                               (subject,)).fetchall()
+        return list(self._records(rows, self._professors(subject)))
+
+    def rows(self):
+        """Stream every subject/term row without loading the whole table."""
+        return self.db.execute('SELECT * FROM subject_terms ORDER BY subject, rowid')
+
+    def all_subjects(self):
+        """Yield (subject, history) for every subject, one subject in memory at a time."""
+        subjects = self.db.execute('SELECT DISTINCT subject FROM subject_terms ORDER BY subject')
+        for (subject,) in subjects.fetchall():
+            yield subject, self.history(subject)
+
+    def instructor(self, name):
+        return self.db.execute('SELECT * FROM instructor_ratings WHERE name = ? ORDER BY term',
+                               (name,)).fetchall()
+
+    def professors(self):
+        return [row['name'] for row in
+                self.db.execute('SELECT DISTINCT name FROM instructor_ratings ORDER BY name')]
+
+
+def import_pickles(directory, path=DB):
+    """One-shot import of the per-term pickles eval_scraper.py used to write."""
+    with EvalStore(path) as store:
+        for term in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, term), 'rb') as f:
+                term_dict = pickle.load(f)
+            store.add_term(term_dict)
+            print('{}: {} subjects'.format(term, len(term_dict)))
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] != 'import':
+        sys.exit('usage: evalstore.py import <pickle directory> [database]')
+    import_pickles(sys.argv[2], *sys.argv[3:4])
+
+
+if __name__ == '__main__':
+    main()
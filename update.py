@@ -1,7 +1,11 @@
 from datetime import datetime, timedelta
 import os
+import re
 import shutil
-import subprocess
+import sys
+
+sys.path.insert(0, "./new_scripts")
+import pipeline
 
 OLD_TERM = "2022SP"
 NEW_TERM = "2023FA"
@@ -131,17 +135,18 @@ with open(old_term_file, "r") as file:
 
 # in old_term_file, replace src=" to src="../../
 # exception: should not start with src="http
-# exception: should not be src="full.js",
-#            in this case, replace with "fall/spring.js"
+# exception: should not be src="full.js" or src="base.<hash>.js",
+#            in this case, replace with "fall/spring.js", the copied full data;
+#            the live base file is deleted by later publishes, and the
+#            extended/ files it needs are not archived
 # exception: should not be src="script-compiled.js"
+data_src = re.compile(r'src="(full|base(\.[0-9a-f]+)?)\.js"')
 new_lines = []
 for line in lines:
-    if not any(
-        s in line for s in ['src="http', 'src="full.js"', 'src="script-compiled.js"']
-    ):
+    if not (any(s in line for s in ['src="http', 'src="script-compiled.js"'])
+            or data_src.search(line)):
         line = line.replace('src="', 'src="../../')
-    if 'src="full.js"' in line:
-        line = line.replace("full.js", f"{old_term.sem_full}.js")
+    line = data_src.sub(f'src="{old_term.sem_full}.js"', line)
     new_lines.append(line)
 lines = new_lines[:]
 
@@ -223,8 +228,8 @@ with open(coursews_path, "w") as file:
 
 # run normal update process
 # something something some classes need special casing
-print("this might not work, if it fails run new_scripts/update_schedule.sh manually:")
-subprocess.run("./new_scripts/update_schedule.sh", shell=True)
+if not pipeline.run(pipeline.SCHEDULE):
+    print("schedule update failed, fix it and run new_scripts/update_schedule.sh manually")
 
 # in (new) index.html:
 new_term_file = "./www/index.html"
@@ -325,6 +330,6 @@ for line in lines:
 with open(script_js, "w") as file:
     file.writelines(new_lines)
 
-# recompile using new_scripts/compile.sh
-print("this might not work, if it fails run new_scripts/compile.sh manually:")
-subprocess.run("./new_scripts/compile.sh", shell=True)
+# recompile script.js (the compile stage is what new_scripts/compile.sh runs)
+if not pipeline.run(["compile"]):
+    print("compiling failed, run new_scripts/compile.sh manually")
@@ -0,0 +1,4 @@
+var last_update = "2022-09-07  1:37 PM";
+var version = "907fbfd873d3";
+var extended_version = "e764bad7cb30";
+var classes = {"1.000":{"b":[[[[123,3]],"5-233"]],"ci":false,"cl":"000","co":"1","cw":false,"f":true,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"5-233"]],"la":false,"le":"U","lm":false,"n":"Introduction to Computer Programming and Numerical Methods for Engineering Applications","no":"1.000","nx":false,"pl":false,"r":[],"ra":5.7,"re":true,"rp":false,"s":["b","l"],"si":13.3,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"1.005":{"b":[],"ci":false,"cl":"005","co":"1","cw":false,"f":false,"h":2.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Experiential Sustainability","no":"1.005","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":[],"si":19.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":true},"1.008":{"b":[[[[4,2]],"1-134"]],"ci":false,"cl":"008","co":"1","cw":false,"f":false,"h":2.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2]],"1-134"]],"la":false,"le":"U","lm":false,"n":"Engineering for a Sustainable World","no":"1.008","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["b","l"],"si":13.0,"t":["FA"],"tb":false,"u1":1,"u2":1,"u3":1,"v":false},"1.009":{"b":[],"ci":false,"cl":"009","co":"1","cw":false,"f":false,"h":2.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2]],"48-316"]],"la":false,"le":"U","lm":false,"n":"Climate Change","no":"1.009","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":27.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"1.010":{"b":[],"ci":false,"cl":"010","co":"1","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,3],[104,3]],"1-242"]],"la":false,"le":"U","lm":false,"n":"Probability and Causal Inference","no":"1.010","nx":false,"pl":false,"r":[[[[73,4]],"1-242"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":21.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"1.013":{"b":[],"ci":false,"cl":"013","co":"1","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,4]],"1-134"]],"la":false,"le":"U","lm":false,"n":"Senior Civil and Environmental Engineering Design","no":"1.013","nx":false,"pl":false,"r":[],"ra":3.7,"re":false,"rp":true,"s":["l"],"si":18.3,"t":["FA","SP"],"tb":true,"u1":1,"u2":3,"u3":2,"v":false},"1.018":{"b":[],"ci":false,"cl":"018","co":"1","cw":false,"f":true,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"1-242"]],"la":false,"le":"U","lm":false,"n":"Fundamentals of Ecology","no":"1.018","nx":false,"pl":false,"r":[[[[16,2]],"48-316"],[[[106,2]],"48-308"]],"ra":5.9,"re":true,"rp":false,"s":["r","l"],"si":19.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"1.022":{"b":[],"ci":false,"cl":"022","co":"1","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-242"]],"la":false,"le":"U","lm":false,"n":"Introduction to Network Models","no":"1.022","nx":false,"pl":false,"r":[[[[126,2]],"1-242"]],"ra":5.8,"re":false,"rp":false,"s":["l","r"],"si":4.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"1.032":{"b":[],"ci":false,"cl":"032","co":"1","cw":false,"f":false,"h":24.4,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[5,3],[65,3],[125,3]],"1-379"]],"la":false,"le":"U","lm":false,"n":"Advanced Soil Mechanics","no":"1.032","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":2.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"1.036":{"b":[],"ci":false,"cl":"036","co":"1","cw":false,"f":false,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-246"]],"la":false,"le":"U","lm":false,"n":"Structural Mechanics and Design","no":"1.036","nx":false,"pl":false,"r":[[[[96,2]],"1-277"]],"ra":6.3,"re":false,"rp":false,"s":["l","r"],"si":7.5,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"1.050":{"b":[[[[104,4]],"5-233"]],"ci":false,"cl":"050","co":"1","cw":false,"f":true,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"5-233"]],"la":false,"le":"U","lm":false,"n":"Solid Mechanics","no":"1.050","nx":false,"pl":false,"r":[],"ra":6.0,"re":true,"rp":false,"s":["l","b"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"1.053":{"b":[],"ci":false,"cl":"053","co":"1","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"10-250"]],"la":false,"le":"U","lm":false,"n":"Dynamics and Control I","no":"1.053","nx":false,"pl":false,"r":[[[[98,2]],"1-190"],[[[102,2]],"1-375"],[[[124,2]],"5-217"],[[[128,2]],"5-217"],[[[126,2]],"5-217"],[[[100,2]],"1-375"]],"ra":5.6,"re":true,"rp":false,"s":["r","l"],"si":87.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":1,"u3":7,"v":false},"1.057":{"b":[[[[132,6]],"1-050"]],"ci":false,"cl":"057","co":"1","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,2],[96,2]],"1-150"]],"la":false,"le":"U","lm":false,"n":"Heritage Science and Technology","no":"1.057","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":9.7,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":4,"v":false},"1.058":{"b":[],"ci":false,"cl":"058","co":"1","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"1-390"]],"la":false,"le":"U","lm":false,"n":"Structural Dynamics","no":"1.058","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":21.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.061":{"b":[],"ci":false,"cl":"061","co":"1","cw":false,"f":true,"h":10.1,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"48-316"]],"la":false,"le":"U","lm":false,"n":"Transport Processes in the Environment","no":"1.061","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":true,"u1":3,"u2":1,"u3":8,"v":false},"1.061A":{"b":[],"ci":false,"cl":"061A","co":"1","cw":false,"f":true,"h":11.7,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"48-316"]],"la":false,"le":"U","lm":false,"n":"Transport Processes in the Environment I","no":"1.061A","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":2.5,"t":["FA"],"tb":true,"u1":2,"u2":1,"u3":3,"v":false},"1.067":{"b":[],"ci":false,"cl":"067","co":"1","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-135"]],"la":false,"le":"U","lm":false,"n":"Energy Systems for Climate Change Mitigation","no":"1.067","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.070A":{"b":[],"ci":false,"cl":"070A","co":"1","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Introduction to Hydrology and Water Resources","no":"1.070A","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":4.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"1.070B":{"b":[],"ci":false,"cl":"070B","co":"1","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Introduction to Hydrology Modeling","no":"1.070B","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":3.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"1.071":{"b":[],"ci":false,"cl":"071","co":"1","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"48-316"]],"la":false,"le":"U","lm":false,"n":"Global Change Science","no":"1.071","nx":true,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":2.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.074":{"b":[],"ci":false,"cl":"074","co":"1","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,2]],"1-242"]],"la":false,"le":"U","lm":false,"n":"Multivariate Data Analysis","no":"1.074","nx":false,"pl":false,"r":[[[[130,2]],"1-242"]],"ra":6.8,"re":false,"rp":false,"s":["l","r"],"si":6.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"1.076":{"b":[[[[132,4]],"48-308"]],"ci":false,"cl":"076","co":"1","cw":false,"f":true,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Carbon Management","no":"1.076","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["b","l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"1.082":{"b":[],"ci":false,"cl":"082","co":"1","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,4]],"66-144"],[[[14,4]],"66-148"],[[[44,4]],"66-148"],[[[74,4]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Ethics for Engineers","no":"1.082","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":59.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"1.085":{"b":[],"ci":false,"cl":"085","co":"1","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Air Pollution and Atmospheric Chemistry","no":"1.085","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":6.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.096":{"b":[],"ci":false,"cl":"096","co":"1","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"56-114"]],"la":false,"le":"U","lm":false,"n":"Design of Sustainable Polymer Systems","no":"1.096","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.101":{"b":[[[[40,4],[100,4]],"1-050"]],"ci":false,"cl":"101","co":"1","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Introduction to Civil and Environmental Engineering Design I","no":"1.101","nx":false,"pl":true,"r":[],"ra":5.5,"re":false,"rp":false,"s":["b"],"si":12.3,"t":["FA"],"tb":false,"u1":0,"u2":4,"u3":2,"v":false},"1.103":{"b":[[[[40,2],[100,2]],"1-371"]],"ci":false,"cl":"103","co":"1","cw":false,"f":false,"h":4.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Infrastructure Design for Climate Change","no":"1.103","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b"],"si":8.0,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"1.106":{"b":[[[[70,8]],"48-109"]],"ci":false,"cl":"106","co":"1","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Environmental Fluid Transport Processes and Hydrology Laboratory","no":"1.106","nx":false,"pl":true,"r":[],"ra":6.1,"re":false,"rp":false,"s":["b"],"si":6.7,"t":["FA"],"tb":false,"u1":0,"u2":4,"u3":2,"v":false},"1.125":{"b":[],"ci":false,"cl":"125","co":"1","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"1-390"]],"la":false,"le":"G","lm":true,"n":"Architecting and Engineering Software Systems","no":"1.125","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":16.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.146":{"b":[],"ci":false,"cl":"146","co":"1","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":true,"n":"Engineering Systems Analysis for Design","no":"1.146","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":17.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.205":{"b":[],"ci":false,"cl":"205","co":"1","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"2-105"]],"la":false,"le":"G","lm":false,"n":"Advanced Demand Modeling","no":"1.205","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.231":{"b":[],"ci":false,"cl":"231","co":"1","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"33-422"]],"la":false,"le":"G","lm":false,"n":"Planning and Design of Airport Systems","no":"1.231","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":19.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.232":{"b":[],"ci":false,"cl":"232","co":"1","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"33-419"]],"la":false,"le":"G","lm":false,"n":"The Airline Industry","no":"1.232","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":30.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.260":{"b":[],"ci":false,"cl":"260","co":"1","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Logistics Systems","no":"1.260","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":62.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.27":{"b":[],"ci":false,"cl":"27","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Studies in Transportation","no":"1.27","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.286":{"b":[],"ci":false,"cl":"286","co":"1","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Urban Energy Systems and Policy","no":"1.286","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":26.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.303":{"b":[[[[40,2],[100,2]],"1-371"]],"ci":false,"cl":"303","co":"1","cw":false,"f":false,"h":4.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Infrastructure Design for Climate Change","no":"1.303","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b"],"si":8.0,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"1.361":{"b":[],"ci":false,"cl":"361","co":"1","cw":false,"f":false,"h":24.4,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[5,3],[65,3],[125,3]],"1-379"]],"la":false,"le":"G","lm":false,"n":"Advanced Soil Mechanics","no":"1.361","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":2.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"1.364":{"b":[],"ci":false,"cl":"364","co":"1","cw":false,"f":false,"h":28.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[5,3],[65,3],[125,3]],"1-379"]],"la":false,"le":"G","lm":false,"n":"Advanced Geotechnical Engineering","no":"1.364","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"1.38":{"b":[[[[33,2]],"1-371"]],"ci":false,"cl":"38","co":"1","cw":false,"f":false,"h":13.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,2],[91,2]],"1-371"]],"la":false,"le":"G","lm":false,"n":"Engineering Geology","no":"1.38","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["b","l"],"si":4.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"1.39":{"b":[],"ci":false,"cl":"39","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Geotechnical Engineering","no":"1.39","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.462":{"b":[],"ci":false,"cl":"462","co":"1","cw":false,"f":false,"h":6.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[62,4]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurship in the Built Environment","no":"1.462","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":30.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"1.545":{"b":[],"ci":false,"cl":"545","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"5-233"]],"la":false,"le":"G","lm":false,"n":"Atomistic Modeling and Simulation of Materials and Structures","no":"1.545","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.550":{"b":[[[[104,4]],"5-233"]],"ci":false,"cl":"550","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"5-233"]],"la":false,"le":"G","lm":false,"n":"Engineering Mechanics","no":"1.550","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["b","l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"1.562":{"b":[],"ci":false,"cl":"562","co":"1","cw":false,"f":true,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"1-134"]],"la":false,"le":"G","lm":false,"n":"Structural Design Project I","no":"1.562","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":13.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.564":{"b":[[[[124,2]],"3-442"]],"ci":false,"cl":"564","co":"1","cw":false,"f":true,"h":12.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Environmental Technologies in Buildings","no":"1.564","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l","b"],"si":38.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":4,"v":false},"1.573":{"b":[],"ci":false,"cl":"573","co":"1","cw":false,"f":false,"h":14.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"2-105"]],"la":false,"le":"G","lm":false,"n":"Structural Mechanics","no":"1.573","nx":false,"pl":false,"r":[[[[122,2]],"5-217"]],"ra":3.2,"re":false,"rp":false,"s":["r","l"],"si":24.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"1.575":{"b":[],"ci":false,"cl":"575","co":"1","cw":false,"f":true,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"3-133"]],"la":false,"le":"G","lm":true,"n":"Computational Structural Design and Optimization","no":"1.575","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":23.3,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"1.579":{"b":[],"ci":false,"cl":"579","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"1-379"]],"la":false,"le":"G","lm":false,"n":"Materials in Agriculture, Food Security, and Food Safety","no":"1.579","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.581":{"b":[],"ci":false,"cl":"581","co":"1","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Structural Dynamics","no":"1.581","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":21.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"1.583":{"b":[],"ci":false,"cl":"583","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-132"]],"la":false,"le":"G","lm":false,"n":"Topology Optimization of Structures","no":"1.583","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.589":{"b":[],"ci":false,"cl":"589","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Studies in Structural Design and Analysis","no":"1.589","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.61":{"b":[],"ci":false,"cl":"61","co":"1","cw":false,"f":true,"h":10.1,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"48-316"]],"la":false,"le":"G","lm":false,"n":"Transport Processes in the Environment","no":"1.61","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":true,"u1":3,"u2":1,"u3":8,"v":false},"1.65":{"b":[],"ci":false,"cl":"65","co":"1","cw":false,"f":false,"h":12.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"48-316"]],"la":false,"le":"G","lm":false,"n":"Atmospheric Boundary Layer Flows and Wind Energy","no":"1.65","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":4.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.66":{"b":[],"ci":false,"cl":"66","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Problems in Water Resources and Environmental Engineering","no":"1.66","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.670":{"b":[],"ci":false,"cl":"670","co":"1","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-135"]],"la":false,"le":"G","lm":false,"n":"Energy Systems for Climate Change Mitigation","no":"1.670","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.699":{"b":[],"ci":false,"cl":"699","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Projects in Oceanographic Engineering","no":"1.699","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.714":{"b":[],"ci":false,"cl":"714","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"48-316"]],"la":false,"le":"G","lm":false,"n":"Surface Hydrology","no":"1.714","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.723":{"b":[],"ci":false,"cl":"723","co":"1","cw":false,"f":false,"h":15.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-375"]],"la":false,"le":"G","lm":true,"n":"Computational Methods for Flow in Porous Media","no":"1.723","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.76":{"b":[],"ci":false,"cl":"76","co":"1","cw":false,"f":true,"h":13.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"54-823"]],"la":false,"le":"G","lm":false,"n":"Aquatic Chemistry","no":"1.76","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.771":{"b":[],"ci":false,"cl":"771","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"48-316"]],"la":false,"le":"G","lm":false,"n":"Global Change Science","no":"1.771","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.813":{"b":[],"ci":false,"cl":"813","co":"1","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,5]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Technology, Globalization, and Sustainable Development","no":"1.813","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":24.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.818":{"b":[],"ci":false,"cl":"818","co":"1","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"G","lm":false,"n":"Sustainable Energy","no":"1.818","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"1.83":{"b":[],"ci":false,"cl":"83","co":"1","cw":false,"f":true,"h":11.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"48-308"]],"la":false,"le":"G","lm":false,"n":"Environmental Organic Chemistry","no":"1.83","nx":false,"pl":false,"r":[[[[130,2]],"48-308"]],"ra":6.7,"re":false,"rp":false,"s":["r","l"],"si":9.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"1.831":{"b":[],"ci":false,"cl":"831","co":"1","cw":false,"f":true,"h":11.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"48-308"]],"la":false,"le":"G","lm":false,"n":"Environmental Organic Chemistry","no":"1.831","nx":false,"pl":false,"r":[[[[130,2]],"48-308"]],"ra":6.7,"re":false,"rp":false,"s":["r","l"],"si":9.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"1.837":{"b":[],"ci":false,"cl":"837","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"48-308"]],"la":false,"le":"G","lm":false,"n":"Resilience of Living Systems to Environmental Change","no":"1.837","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.84":{"b":[],"ci":false,"cl":"84","co":"1","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"48-316"]],"la":false,"le":"G","lm":false,"n":"Atmospheric Chemistry","no":"1.84","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.855":{"b":[],"ci":false,"cl":"855","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"48-308"]],"la":false,"le":"G","lm":false,"n":"Air Pollution and Atmospheric Chemistry","no":"1.855","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.86":{"b":[],"ci":false,"cl":"86","co":"1","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,6]],"4-144"]],"la":false,"le":"G","lm":false,"n":"Methods and Problems in Microbiology","no":"1.86","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"1.87":{"b":[],"ci":false,"cl":"87","co":"1","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,4],[99,4]],"66-160"]],"la":false,"le":"G","lm":false,"n":"Microbial Genetics and Evolution","no":"1.87","nx":false,"pl":false,"r":[[[[126,2]],"2-142"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":12.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"1.968":{"b":[],"ci":false,"cl":"968","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Studies in Civil and Environmental Engineering","no":"1.968","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.976":{"b":[],"ci":false,"cl":"976","co":"1","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"48-316"]],"la":false,"le":"G","lm":true,"n":"Graduate Professional Development Seminar","no":"1.976","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"1.982":{"b":[],"ci":false,"cl":"982","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Civil and Environmental Engineering","no":"1.982","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.984":{"b":[],"ci":false,"cl":"984","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching Experience in Civil and Environmental Engineering","no":"1.984","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":3,"u3":0,"v":true},"1.997":{"b":[],"ci":false,"cl":"997","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practicum Training in Civil and Environmental Engineering","no":"1.997","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.998":{"b":[],"ci":false,"cl":"998","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Practicum Training in Civil and Environmental Engineering","no":"1.998","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.999":{"b":[],"ci":false,"cl":"999","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Studies in Civil and Environmental Engineering","no":"1.999","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.EPE":{"b":[],"ci":false,"cl":"EPE","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"1.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"1.EPW":{"b":[],"ci":false,"cl":"EPW","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"1.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"1.S979":{"b":[],"ci":false,"cl":"S979","co":"1","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"48-308"]],"la":false,"le":"G","lm":false,"n":"Special Graduate Subject in Civil and Environmental Engineering","no":"1.S979","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":3.5,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"1.S980":{"b":[],"ci":false,"cl":"S980","co":"1","cw":false,"f":false,"h":21.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Graduate Subject in Civil and Environmental Engineering","no":"1.S980","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":2.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.S992":{"b":[],"ci":false,"cl":"S992","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-131"]],"la":false,"le":"U","lm":false,"n":"Special Undergraduate Subject in Civil and Environmental Engineering","no":"1.S992","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"1.S993":{"b":[],"ci":false,"cl":"S993","co":"1","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Special Undergraduate Subject in Civil and Environmental Engineering","no":"1.S993","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":1.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"1.THG":{"b":[],"ci":false,"cl":"THG","co":"1","cw":false,"f":false,"h":30.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"1.THG","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":[],"si":120.5,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.THU":{"b":[],"ci":false,"cl":"THU","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"1.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.UAR":{"b":[],"ci":false,"cl":"UAR","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2],[106,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Climate and Sustainability Undergraduate Advanced Research","no":"1.UAR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"1.UR":{"b":[],"ci":false,"cl":"UR","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Research in Civil and Environmental Engineering","no":"1.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"1.URG":{"b":[],"ci":false,"cl":"URG","co":"1","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Civil and Environmental Engineering","no":"1.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.01":{"b":[],"ci":false,"cl":"01","co":"10","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,4]],"66-148"],[[[14,4]],"66-148"],[[[82,4]],"66-144"],[[[44,4]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Ethics for Engineers","no":"10.01","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":59.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.10":{"b":[],"ci":false,"cl":"10","co":"10","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2],[72,2],[132,2]],"56-114"]],"la":false,"le":"U","lm":false,"n":"Introduction to Chemical Engineering","no":"10.10","nx":false,"pl":false,"r":[[[[38,2]],"66-168"]],"ra":5.5,"re":false,"rp":false,"s":["l","r"],"si":25.8,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"10.28":{"b":[[[[70,8],[130,8]],"66-0042"]],"ci":false,"cl":"28","co":"10","cw":false,"f":false,"h":16.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"66-160"]],"la":false,"le":"U","lm":true,"n":"Chemical-Biological Engineering Laboratory","no":"10.28","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l","b"],"si":10.0,"t":["FA"],"tb":false,"u1":2,"u2":8,"u3":5,"v":false},"10.291":{"b":[],"ci":false,"cl":"291","co":"10","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"U","lm":true,"n":"Introduction to Sustainable Energy","no":"10.291","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["r","l"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"10.302":{"b":[],"ci":false,"cl":"302","co":"10","cw":false,"f":false,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"66-110"]],"la":false,"le":"U","lm":false,"n":"Transport Processes","no":"10.302","nx":false,"pl":false,"r":[[[[126,2]],"66-160"],[[[124,2]],"66-160"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":37.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"10.321":{"b":[],"ci":false,"cl":"321","co":"10","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"24-112"]],"la":false,"le":"U","lm":false,"n":"Design Principles in Mammalian Systems and Synthetic Biology","no":"10.321","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.34":{"b":[],"ci":false,"cl":"34","co":"10","cw":false,"f":true,"h":22.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"66-110"]],"la":false,"le":"G","lm":false,"n":"Numerical Methods Applied to Chemical Engineering","no":"10.34","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":48.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.352":{"b":[],"ci":false,"cl":"352","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Modern Control Design","no":"10.352","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":true},"10.391":{"b":[],"ci":false,"cl":"391","co":"10","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"G","lm":false,"n":"Sustainable Energy","no":"10.391","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"10.40":{"b":[],"ci":false,"cl":"40","co":"10","cw":false,"f":false,"h":17.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,4],[92,4]],"66-110"]],"la":false,"le":"G","lm":false,"n":"Chemical Engineering Thermodynamics","no":"10.40","nx":false,"pl":false,"r":[],"ra":4.7,"re":false,"rp":false,"s":["l"],"si":48.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"10.421":{"b":[],"ci":false,"cl":"421","co":"10","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-135"]],"la":false,"le":"U","lm":false,"n":"Energy Systems for Climate Change Mitigation","no":"10.421","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.424":{"b":[],"ci":false,"cl":"424","co":"10","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"66-148"]],"la":false,"le":"U","lm":true,"n":"Pharmaceutical Engineering","no":"10.424","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.442":{"b":[],"ci":false,"cl":"442","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Biochemical Engineering","no":"10.442","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":true},"10.467":{"b":[[[[42,6],[100,8]],"E18-676C"]],"ci":false,"cl":"467","co":"10","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[40,2]],"E18-676C"]],"la":false,"le":"U","lm":false,"n":"Polymer Science Laboratory","no":"10.467","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l","b"],"si":7.7,"t":["FA"],"tb":false,"u1":2,"u2":7,"u3":6,"v":false},"10.490":{"b":[],"ci":false,"cl":"490","co":"10","cw":false,"f":false,"h":15.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"66-168"]],"la":false,"le":"U","lm":false,"n":"Integrated Chemical Engineering","no":"10.490","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":true,"s":["l"],"si":21.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.492A":{"b":[],"ci":false,"cl":"492A","co":"10","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"66-168"]],"la":false,"le":"U","lm":false,"n":"Integrated Chemical Engineering Topics I","no":"10.492A","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":14.5,"t":["FA"],"tb":true,"u1":2,"u2":0,"u3":4,"v":false},"10.492B":{"b":[],"ci":false,"cl":"492B","co":"10","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"66-168"]],"la":false,"le":"U","lm":false,"n":"Integrated Chemical Engineering Topics I","no":"10.492B","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":16.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.495":{"b":[],"ci":false,"cl":"495","co":"10","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"66-154"]],"la":false,"le":"U","lm":false,"n":"Molecular Design and Bioprocess Development of Immunotherapies","no":"10.495","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.496":{"b":[],"ci":false,"cl":"496","co":"10","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"56-114"]],"la":false,"le":"U","lm":false,"n":"Design of Sustainable Polymer Systems","no":"10.496","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.50":{"b":[],"ci":false,"cl":"50","co":"10","cw":false,"f":true,"h":19.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3],[130,3]],"66-110"]],"la":false,"le":"G","lm":false,"n":"Analysis of Transport Phenomena","no":"10.50","nx":false,"pl":false,"r":[[[[80,4]],"66-160"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":48.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"10.521":{"b":[],"ci":false,"cl":"521","co":"10","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"24-112"]],"la":false,"le":"G","lm":false,"n":"Design Principles in Mammalian Systems and Synthetic Biology","no":"10.521","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.524":{"b":[],"ci":false,"cl":"524","co":"10","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"66-148"]],"la":false,"le":"G","lm":true,"n":"Pharmaceutical Engineering","no":"10.524","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.536":{"b":[],"ci":false,"cl":"536","co":"10","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Thermal Hydraulics in Power Technology","no":"10.536","nx":true,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"10.538":{"b":[],"ci":false,"cl":"538","co":"10","cw":false,"f":true,"h":19.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"16-220"]],"la":false,"le":"G","lm":false,"n":"Principles of Molecular Bioengineering","no":"10.538","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":33.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.539":{"b":[],"ci":false,"cl":"539","co":"10","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-265"]],"la":false,"le":"G","lm":false,"n":"Fields, Forces, and Flows in Biological Systems","no":"10.539","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":22.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.546":{"b":[],"ci":false,"cl":"546","co":"10","cw":false,"f":true,"h":13.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-159"]],"la":false,"le":"G","lm":false,"n":"Statistical Thermodynamics","no":"10.546","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":false,"s":["l"],"si":14.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.547":{"b":[],"ci":false,"cl":"547","co":"10","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,6]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Principles and Practice of Drug Development","no":"10.547","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":32.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.548":{"b":[],"ci":false,"cl":"548","co":"10","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[18,4]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"Tumor Microenvironment and Immuno-Oncology: A Systems Biology Approach","no":"10.548","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.568":{"b":[],"ci":false,"cl":"568","co":"10","cw":false,"f":false,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"35-308"]],"la":false,"le":"G","lm":false,"n":"Physical Chemistry of Polymers","no":"10.568","nx":true,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.585":{"b":[],"ci":false,"cl":"585","co":"10","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"66-110"]],"la":false,"le":"G","lm":false,"n":"Engineering Nanotechnology","no":"10.585","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":17.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.595":{"b":[],"ci":false,"cl":"595","co":"10","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"66-154"]],"la":false,"le":"G","lm":false,"n":"Molecular Design and Bioprocess Development of Immunotherapies","no":"10.595","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"10.621":{"b":[],"ci":false,"cl":"621","co":"10","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-135"]],"la":false,"le":"G","lm":false,"n":"Energy Systems for Climate Change Mitigation","no":"10.621","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.625":{"b":[],"ci":false,"cl":"625","co":"10","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"3-333"]],"la":false,"le":"G","lm":false,"n":"Electrochemical Energy Conversion and Storage: Fundamentals, Materials and Applications","no":"10.625","nx":false,"pl":false,"r":[[[[76,2]],"5-134"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":17.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"10.7003":{"b":[[[[42,6],[100,8]],"68-074"]],"ci":false,"cl":"7003","co":"10","cw":false,"f":false,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2]],"68-181"]],"la":false,"le":"U","lm":true,"n":"Applied Molecular Biology Laboratory","no":"10.7003","nx":false,"pl":true,"r":[[[[36,3]],"68-121"]],"ra":5.3,"re":false,"rp":false,"s":["b","r","l"],"si":30.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":7,"u3":3,"v":false},"10.792":{"b":[],"ci":false,"cl":"792","co":"10","cw":false,"f":false,"h":2.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,4]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Global Operations Leadership Seminar","no":"10.792","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":true,"s":["l"],"si":48.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":0,"v":false},"10.80":{"b":[],"ci":false,"cl":"80","co":"10","cw":false,"f":false,"h":50.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"School of Chemical Engineering Practice -- Technical Accomplishment","no":"10.80","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":9.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.806":{"b":[[[[16,2]],"1-375"],[[[34,2]],"1-375"],[[[106,2]],"1-375"],[[[130,2]],"1-375"]],"ci":false,"cl":"806","co":"10","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"35-225"]],"la":false,"le":"U","lm":false,"n":"Management in Engineering","no":"10.806","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b","l"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"10.807":{"b":[[[[122,6]],"56-154"]],"ci":false,"cl":"807","co":"10","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4],[100,4]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Innovation Teams","no":"10.807","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["b","l"],"si":19.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"10.81":{"b":[],"ci":false,"cl":"81","co":"10","cw":false,"f":false,"h":50.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"School of Chemical Engineering Practice -- Communication Skills and Human Relations","no":"10.81","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":9.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.817":{"b":[],"ci":false,"cl":"817","co":"10","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"48-316"]],"la":false,"le":"G","lm":false,"n":"Atmospheric Chemistry","no":"10.817","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"10.82":{"b":[],"ci":false,"cl":"82","co":"10","cw":false,"f":false,"h":50.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"School of Chemical Engineering Practice -- Technical Accomplishment","no":"10.82","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":9.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.83":{"b":[],"ci":false,"cl":"83","co":"10","cw":false,"f":false,"h":50.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"School of Chemical Engineering Practice -- Communication Skills and Human Relations","no":"10.83","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":9.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.84":{"b":[],"ci":false,"cl":"84","co":"10","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"School of Chemical Engineering Practice -- Technical Accomplishment","no":"10.84","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.85":{"b":[],"ci":false,"cl":"85","co":"10","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"School of Chemical Engineering Practice -- Communication Skills and Human Relations","no":"10.85","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.86":{"b":[],"ci":false,"cl":"86","co":"10","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"School of Chemical Engineering Practice -- Technical Accomplishment","no":"10.86","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.87":{"b":[],"ci":false,"cl":"87","co":"10","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"School of Chemical Engineering Practice -- Communication Skills and Human Relations","no":"10.87","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"10.90":{"b":[],"ci":false,"cl":"90","co":"10","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Research Problem","no":"10.90","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.910":{"b":[],"ci":false,"cl":"910","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Research Problem","no":"10.910","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.911":{"b":[],"ci":false,"cl":"911","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Research Problem","no":"10.911","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.912":{"b":[],"ci":false,"cl":"912","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Practical Internship in Chemical Engineering","no":"10.912","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"10.951":{"b":[],"ci":false,"cl":"951","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Biological Systems","no":"10.951","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"10.952":{"b":[],"ci":false,"cl":"952","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Bioelectrochemical Engineering","no":"10.952","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"10.953":{"b":[],"ci":false,"cl":"953","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[98,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Seminar in Heterogeneous Catalysis","no":"10.953","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.954":{"b":[],"ci":false,"cl":"954","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,4]],"66-360"]],"la":false,"le":"G","lm":false,"n":"Seminar in Applied Optical Spectroscopy","no":"10.954","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.955":{"b":[],"ci":false,"cl":"955","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[64,4]],"66-148"]],"la":false,"le":"G","lm":false,"n":"Seminar in Electrochemical Engineering","no":"10.955","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.956":{"b":[],"ci":false,"cl":"956","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,4]],"66-480"]],"la":false,"le":"G","lm":false,"n":"Seminar in Atomistic Simulation","no":"10.956","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.957":{"b":[],"ci":false,"cl":"957","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[62,4]],"46-5305"]],"la":false,"le":"G","lm":false,"n":"Seminar in Bioengineering Technology","no":"10.957","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.960":{"b":[],"ci":false,"cl":"960","co":"10","cw":false,"f":false,"h":1.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[75,3]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Seminar in Polymers and Soft Matter","no":"10.960","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":37.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":0,"v":false},"10.962":{"b":[],"ci":false,"cl":"962","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"16-220"]],"la":false,"le":"G","lm":false,"n":"Seminar in Molecular Cell Engineering","no":"10.962","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.963":{"b":[],"ci":false,"cl":"963","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[66,4]],"66-360"]],"la":false,"le":"G","lm":false,"n":"Seminar in Computer-Assisted Molecular Discovery","no":"10.963","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.964":{"b":[],"ci":false,"cl":"964","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,4]],"66-360"]],"la":false,"le":"G","lm":false,"n":"Seminar on Transport Theory","no":"10.964","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.965":{"b":[],"ci":false,"cl":"965","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,4]],"76-258"]],"la":false,"le":"G","lm":false,"n":"Seminar in Biosystems Engineering","no":"10.965","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.966":{"b":[],"ci":false,"cl":"966","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[68,4]],"76-659"]],"la":false,"le":"G","lm":false,"n":"Seminar in Drug Delivery, Biomaterials, and Tissue Engineering","no":"10.966","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.967":{"b":[],"ci":false,"cl":"967","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,4]],"66-319"]],"la":false,"le":"G","lm":false,"n":"Seminar in Protein-Polymer Materials Engineering","no":"10.967","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.968":{"b":[],"ci":false,"cl":"968","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Seminar in Biomolecular Engineering","no":"10.968","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.969":{"b":[],"ci":false,"cl":"969","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Molecular Engineering Seminar","no":"10.969","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.970":{"b":[],"ci":false,"cl":"970","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[68,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Seminar in Molecular Computation","no":"10.970","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.971":{"b":[],"ci":false,"cl":"971","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Seminar in Fluid Mechanics and Transport Phenomena","no":"10.971","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.973":{"b":[],"ci":false,"cl":"973","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,4]],"66-480"]],"la":false,"le":"G","lm":false,"n":"Bioengineering","no":"10.973","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.974":{"b":[],"ci":false,"cl":"974","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,4]],"66-110"]],"la":false,"le":"G","lm":true,"n":"Seminar in Chemical Engineering Nanotechnology","no":"10.974","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.975":{"b":[],"ci":false,"cl":"975","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,4]],"76-559"]],"la":false,"le":"G","lm":false,"n":"Seminar in Polymer Science and Engineering","no":"10.975","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.976":{"b":[],"ci":false,"cl":"976","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,3]],"66-319"]],"la":false,"le":"G","lm":false,"n":"Process Design, Operations, and Control","no":"10.976","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.977":{"b":[],"ci":false,"cl":"977","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,4]],"66-480"]],"la":false,"le":"G","lm":false,"n":"Seminar in Electrocatalysis","no":"10.977","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.978":{"b":[],"ci":false,"cl":"978","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,4]],"66-480"]],"la":false,"le":"G","lm":false,"n":"Seminar in Advanced Materials for Energy Applications","no":"10.978","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.979":{"b":[],"ci":false,"cl":"979","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[80,2]],"66-480"]],"la":false,"le":"G","lm":false,"n":"Seminar in Biological Soft Matter","no":"10.979","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.981":{"b":[],"ci":false,"cl":"981","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"66-480"]],"la":false,"le":"G","lm":false,"n":"Seminar in Colloid and Interface Science","no":"10.981","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.982":{"b":[],"ci":false,"cl":"982","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,4]],"66-360"]],"la":false,"le":"G","lm":false,"n":"Seminar in Experimental Colloid and Surface Chemistry","no":"10.982","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.983":{"b":[],"ci":false,"cl":"983","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,4]],"66-360"]],"la":false,"le":"G","lm":false,"n":"Reactive Processing and Microfabricated Chemical Systems","no":"10.983","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.984":{"b":[],"ci":false,"cl":"984","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[78,3]],"76-156"]],"la":false,"le":"G","lm":false,"n":"Biomedical Applications of Chemical Engineering","no":"10.984","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.985":{"b":[],"ci":false,"cl":"985","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Advanced Manufacturing Seminar","no":"10.985","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.986":{"b":[],"ci":false,"cl":"986","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Energy Systems","no":"10.986","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"10.988":{"b":[],"ci":false,"cl":"988","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[100,3]],"NE46-1025"]],"la":false,"le":"G","lm":false,"n":"Seminar in Immune Engineering","no":"10.988","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.989":{"b":[],"ci":false,"cl":"989","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[98,4]],"66-360"]],"la":false,"le":"G","lm":false,"n":"Seminar in Biotechnology","no":"10.989","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.990":{"b":[[[[74,2]],"66-110"]],"ci":false,"cl":"990","co":"10","cw":false,"f":false,"h":3.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,2],[102,2]],"66-110"]],"la":false,"le":"G","lm":false,"n":"Introduction to Chemical Engineering Research","no":"10.990","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":42.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":0,"v":false},"10.991":{"b":[],"ci":false,"cl":"991","co":"10","cw":false,"f":false,"h":1.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[134,3]],"66-110"]],"la":false,"le":"G","lm":false,"n":"Seminar in Chemical Engineering","no":"10.991","nx":false,"pl":false,"r":[],"ra":4.7,"re":false,"rp":true,"s":["l"],"si":170.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.994":{"b":[],"ci":false,"cl":"994","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[98,3]],"76-261D"]],"la":false,"le":"G","lm":false,"n":"Molecular Bioengineering","no":"10.994","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.995":{"b":[],"ci":false,"cl":"995","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Cellular and Metabolic Engineering","no":"10.995","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.997":{"b":[],"ci":false,"cl":"997","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[129,5]],"E25-202"]],"la":false,"le":"G","lm":false,"n":"Theoretical and Computational Immunology Seminar","no":"10.997","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.998":{"b":[],"ci":false,"cl":"998","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,4]],"E17-517"]],"la":false,"le":"G","lm":false,"n":"Seminar in Crystallization Science and Technology","no":"10.998","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"10.EPE":{"b":[],"ci":false,"cl":"EPE","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"10.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"10.EPW":{"b":[],"ci":false,"cl":"EPW","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"10.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"10.S28":{"b":[],"ci":false,"cl":"S28","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Special Laboratory Subject in Chemical Engineering","no":"10.S28","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":8,"u3":5,"v":true},"10.S94":{"b":[],"ci":false,"cl":"S94","co":"10","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Problems in Chemical Engineering","no":"10.S94","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.S95":{"b":[],"ci":false,"cl":"S95","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Problems in Chemical Engineering","no":"10.S95","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.S96":{"b":[],"ci":false,"cl":"S96","co":"10","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"66-160"]],"la":false,"le":"G","lm":false,"n":"Special Problems in Chemical Engineering","no":"10.S96","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":["l"],"si":0.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"10.THG":{"b":[],"ci":false,"cl":"THG","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"10.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.THU":{"b":[],"ci":false,"cl":"THU","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"10.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.UAR":{"b":[],"ci":false,"cl":"UAR","co":"10","cw":false,"f":false,"h":4.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,2]],"66-168"]],"la":false,"le":"U","lm":true,"n":"Individual Laboratory Experience","no":"10.UAR","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":4.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":5,"v":false},"10.UR":{"b":[],"ci":false,"cl":"UR","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"10.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"10.URG":{"b":[],"ci":false,"cl":"URG","co":"10","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"10.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.001":{"b":[],"ci":false,"cl":"001","co":"11","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"2-105"]],"la":false,"le":"U","lm":false,"n":"Introduction to Urban Design and Development","no":"11.001","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":43.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.002":{"b":[],"ci":true,"cl":"002","co":"11","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[36,3],[96,3]],"4-270"]],"la":false,"le":"U","lm":false,"n":"Making Public Policy","no":"11.002","nx":false,"pl":false,"r":[[[[104,2]],"9-255"],[[[44,2]],"9-255"],[[[132,2]],"5-234"],[[[126,2]],"9-255"],[[[124,2]],"9-255"]],"ra":5.7,"re":false,"rp":false,"s":["l","r"],"si":61.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"11.011":{"b":[],"ci":false,"cl":"011","co":"11","cw":false,"f":false,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[12,3],[72,3]],"9-255"]],"la":false,"le":"U","lm":true,"n":"The Art and Science of Negotiation","no":"11.011","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":40.8,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.025":{"b":[[[[135,3]],"N51-310"]],"ci":false,"cl":"025","co":"11","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[15,3],[75,3]],"N51-310"]],"la":false,"le":"U","lm":true,"n":"D-Lab: Development","no":"11.025","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["b","l"],"si":25.3,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"11.029":{"b":[],"ci":false,"cl":"029","co":"11","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"E25-117"]],"la":false,"le":"U","lm":false,"n":"Mobility Ventures: Driving Innovation in Transportation Systems","no":"11.029","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":33.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"11.041":{"b":[],"ci":false,"cl":"041","co":"11","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[33,3],[93,3]],"9-451"]],"la":false,"le":"U","lm":false,"n":"Introduction to Housing, Community, and Economic Development","no":"11.041","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":22.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.074":{"b":[],"ci":false,"cl":"074","co":"11","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,4]],"9-450A"]],"la":false,"le":"U","lm":true,"n":"Cybersecurity Clinic","no":"11.074","nx":false,"pl":false,"r":[],"ra":3.8,"re":true,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"11.100":{"b":[],"ci":false,"cl":"100","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,2]],"10-401"]],"la":false,"le":"U","lm":false,"n":"Introduction to Computational Thinking in Cities","no":"11.100","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"11.107":{"b":[],"ci":false,"cl":"107","co":"11","cw":false,"f":false,"h":13.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[2,6]],"9-450A"]],"la":false,"le":"U","lm":false,"n":"Tools and Techniques for Inclusive Economic Development","no":"11.107","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.111":{"b":[],"ci":false,"cl":"111","co":"11","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[4,4],[64,4]],"9-255"]],"la":false,"le":"U","lm":true,"n":"Leadership in Negotiation: Advanced Applications","no":"11.111","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":23.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"11.122":{"b":[],"ci":false,"cl":"122","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[45,3],[105,3]],"E51-057"]],"la":false,"le":"U","lm":false,"n":"Law, Technology, and Public Policy","no":"11.122","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.124":{"b":[],"ci":true,"cl":"124","co":"11","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[43,3],[103,3]],"56-154"]],"la":false,"le":"U","lm":true,"n":"Introduction to Education: Looking Forward and Looking Back on Education","no":"11.124","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":24.0,"t":["FA"],"tb":true,"u1":3,"u2":6,"u3":3,"v":false},"11.129":{"b":[],"ci":false,"cl":"129","co":"11","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[46,3],[106,3]],"56-154"]],"la":false,"le":"U","lm":true,"n":"Educational Theory and Practice I","no":"11.129","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.138":{"b":[],"ci":false,"cl":"138","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[3,3],[63,3]],"9-450"]],"la":false,"le":"U","lm":false,"n":"Crowd Sourced City: Civic Tech Prototyping","no":"11.138","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.142":{"b":[],"ci":false,"cl":"142","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[12,6]],"9-450A"]],"la":false,"le":"U","lm":false,"n":"Geography of the Global Economy","no":"11.142","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.149":{"b":[],"ci":false,"cl":"149","co":"11","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"9-451"]],"la":false,"le":"U","lm":false,"n":"Decarbonizing Urban Mobility","no":"11.149","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":19.0,"t":["FA"],"tb":true,"u1":3,"u2":3,"u3":6,"v":false},"11.159":{"b":[],"ci":false,"cl":"159","co":"11","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,2]],"9-255"]],"la":false,"le":"U","lm":false,"n":"Entrepreneurial Negotiation","no":"11.159","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":22.0,"t":["FA"],"tb":false,"u1":1,"u2":3,"u3":2,"v":false},"11.165":{"b":[],"ci":false,"cl":"165","co":"11","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[36,3],[96,3]],"9-451"]],"la":false,"le":"U","lm":false,"n":"Urban Energy Systems and Policy","no":"11.165","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":26.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.173":{"b":[[[[40,2],[100,2]],"1-371"]],"ci":false,"cl":"173","co":"11","cw":false,"f":false,"h":4.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Infrastructure Design for Climate Change","no":"11.173","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b"],"si":8.0,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"11.188":{"b":[[[[130,6]],"9-554"]],"ci":false,"cl":"188","co":"11","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"9-354"]],"la":true,"le":"U","lm":false,"n":"Introduction to Spatial Analysis and GIS Laboratory","no":"11.188","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":10.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"11.189":{"b":[],"ci":false,"cl":"189","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Urban Fieldwork","no":"11.189","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.190":{"b":[],"ci":false,"cl":"190","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Urban Fieldwork","no":"11.190","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.191":{"b":[],"ci":false,"cl":"191","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"11.191","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.192":{"b":[],"ci":false,"cl":"192","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"11.192","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.193":{"b":[],"ci":false,"cl":"193","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Supervised Readings","no":"11.193","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.194":{"b":[],"ci":false,"cl":"194","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Supervised Readings","no":"11.194","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.200":{"b":[],"ci":false,"cl":"200","co":"11","cw":false,"f":false,"h":11.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"37-212"]],"la":false,"le":"G","lm":false,"n":"Gateway: Urban Studies and Planning 1","no":"11.200","nx":false,"pl":false,"r":[[[[103,2]],"9-450A"],[[[135,2]],"9-450"],[[[133,2]],"9-450"],[[[105,2]],"5-232"]],"ra":4.7,"re":false,"rp":false,"s":["r","l"],"si":42.0,"t":["FA"],"tb":false,"u1":4,"u2":1,"u3":7,"v":false},"11.205":{"b":[[[[17,4]],"9-554"],[[[107,4]],"9-554"],[[[47,4]],"9-554"]],"ci":false,"cl":"205","co":"11","cw":false,"f":false,"h":13.2,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"9-354"]],"la":false,"le":"G","lm":true,"n":"Introduction to Spatial Analysis and GIS","no":"11.205","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l","b"],"si":38.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"11.220":{"b":[],"ci":false,"cl":"220","co":"11","cw":false,"f":false,"h":11.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"9-255"]],"la":false,"le":"G","lm":false,"n":"Quantitative Reasoning and Statistical Methods for Planning I","no":"11.220","nx":false,"pl":false,"r":[[[[131,2]],"9-450"],[[[105,2]],"9-450A"],[[[107,2]],"9-450A"]],"ra":4.6,"re":false,"rp":false,"s":["r","l"],"si":32.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"11.233":{"b":[],"ci":false,"cl":"233","co":"11","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,6]],"9-450"]],"la":false,"le":"G","lm":true,"n":"Research Design for Policy Analysis and Planning","no":"11.233","nx":false,"pl":false,"r":[],"ra":4.4,"re":false,"rp":false,"s":["l"],"si":6.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.236":{"b":[],"ci":false,"cl":"236","co":"11","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[92,6]],"9-450"]],"la":false,"le":"G","lm":false,"n":"Participatory Action Research (PAR)","no":"11.236","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":19.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.250":{"b":[],"ci":false,"cl":"250","co":"11","cw":false,"f":false,"h":4.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[123,3]],"9-451"]],"la":false,"le":"G","lm":true,"n":"Transportation Research Design","no":"11.250","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":15.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"11.251":{"b":[],"ci":false,"cl":"251","co":"11","cw":false,"f":false,"h":2.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,2]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Frontier of Transportation Research","no":"11.251","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":15.5,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"11.256":{"b":[],"ci":false,"cl":"256","co":"11","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[50,4]],"9-450A"]],"la":false,"le":"G","lm":true,"n":"Encounters and Ruptures: Writing About the Modern City","no":"11.256","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"11.259":{"b":[],"ci":false,"cl":"259","co":"11","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,2]],"9-255"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurial Negotiation","no":"11.259","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":22.0,"t":["FA"],"tb":false,"u1":1,"u2":3,"u3":2,"v":false},"11.273":{"b":[[[[40,2],[100,2]],"1-371"]],"ci":false,"cl":"273","co":"11","cw":false,"f":false,"h":4.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Infrastructure Design for Climate Change","no":"11.273","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b"],"si":8.0,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"11.274":{"b":[],"ci":false,"cl":"274","co":"11","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,4]],"9-450A"]],"la":false,"le":"G","lm":true,"n":"Cybersecurity Clinic","no":"11.274","nx":false,"pl":false,"r":[],"ra":3.8,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"11.305":{"b":[],"ci":false,"cl":"305","co":"11","cw":false,"f":false,"h":3.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[73,4]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Doing Good by Doing Well: Planning and Development Case Studies that Promote both the Public Good and Real Estate Value","no":"11.305","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":33.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"11.308":{"b":[],"ci":false,"cl":"308","co":"11","cw":false,"f":false,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"10-401"]],"la":false,"le":"G","lm":true,"n":"Ecological Urbanism Seminar","no":"11.308","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":4.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.309":{"b":[],"ci":false,"cl":"309","co":"11","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"10-485"]],"la":false,"le":"G","lm":true,"n":"Sensing Place: Photography as Inquiry","no":"11.309","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.313":{"b":[],"ci":false,"cl":"313","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,6]],"10-485"]],"la":false,"le":"G","lm":false,"n":"Advanced Research Workshop in Landscape and Urbanism","no":"11.313","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.325":{"b":[],"ci":false,"cl":"325","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[64,4]],"3-133"]],"la":false,"le":"G","lm":false,"n":"Technological Change & Innovation for Real Estate and Cities","no":"11.325","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"11.328":{"b":[],"ci":false,"cl":"328","co":"11","cw":false,"f":false,"h":16.5,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[122,8]],"10-485"]],"la":false,"le":"G","lm":false,"n":"Urban Design Skills: Observing, Interpreting, and Representing the City","no":"11.328","nx":false,"pl":false,"r":[[[[78,5]],"9-554"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":19.7,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":2,"v":false},"11.329":{"b":[],"ci":false,"cl":"329","co":"11","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[122,8]],"10-485"]],"la":false,"le":"G","lm":false,"n":"Advanced Urban Design Skills: Observing, Interpreting, and Representing the City","no":"11.329","nx":false,"pl":false,"r":[[[[78,5]],"9-554"]],"ra":6.8,"re":false,"rp":false,"s":["l","r"],"si":17.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":4,"v":false},"11.338":{"b":[],"ci":false,"cl":"338","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"10-401"]],"la":false,"le":"G","lm":true,"n":"Urban Design Studio","no":"11.338","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.345":{"b":[],"ci":false,"cl":"345","co":"11","cw":false,"f":false,"h":6.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[62,4]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurship in the Built Environment","no":"11.345","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":30.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"11.351":{"b":[],"ci":false,"cl":"351","co":"11","cw":false,"f":false,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[110,6]],"9-354"]],"la":false,"le":"G","lm":true,"n":"Real Estate Ventures I: Negotiating Development-Phase Agreements","no":"11.351","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":29.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.371":{"b":[],"ci":false,"cl":"371","co":"11","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"G","lm":false,"n":"Sustainable Energy","no":"11.371","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"11.373":{"b":[],"ci":false,"cl":"373","co":"11","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,6]],"5-217"]],"la":false,"le":"G","lm":false,"n":"Science, Politics, and Environmental Policy","no":"11.373","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"11.401":{"b":[],"ci":false,"cl":"401","co":"11","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Introduction to Housing, Community, and Economic Development","no":"11.401","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":24.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.407":{"b":[],"ci":false,"cl":"407","co":"11","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,6]],"9-450A"]],"la":false,"le":"G","lm":false,"n":"Tools and Techniques for Inclusive Economic Development","no":"11.407","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.409":{"b":[],"ci":false,"cl":"409","co":"11","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,4]],"5-232"]],"la":false,"le":"G","lm":true,"n":"The Institutions of Modern Capitalism: States and Markets","no":"11.409","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"11.422":{"b":[],"ci":false,"cl":"422","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"E51-057"]],"la":false,"le":"G","lm":false,"n":"Law, Technology, and Public Policy","no":"11.422","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.430":{"b":[],"ci":false,"cl":"430","co":"11","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[62,6]],"9-357"]],"la":false,"le":"G","lm":true,"n":"Leadership in Real Estate","no":"11.430","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":16.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"11.431":{"b":[],"ci":false,"cl":"431","co":"11","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,3],[69,3]],"9-354"]],"la":false,"le":"G","lm":true,"n":"Real Estate Finance and Investment","no":"11.431","nx":false,"pl":false,"r":[[[[17,3]],"9-354"]],"ra":5.5,"re":false,"rp":false,"s":["l","r"],"si":64.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"11.433":{"b":[],"ci":false,"cl":"433","co":"11","cw":false,"f":true,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Real Estate Economics","no":"11.433","nx":false,"pl":false,"r":[[[[78,3]],"9-354"]],"ra":4.6,"re":false,"rp":false,"s":["l","r"],"si":45.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"11.439":{"b":[],"ci":false,"cl":"439","co":"11","cw":false,"f":false,"h":15.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,4],[103,4]],"9-217"]],"la":false,"le":"G","lm":true,"n":"Revitalizing Urban Main Streets","no":"11.439","nx":true,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":11,"v":false},"11.442":{"b":[],"ci":false,"cl":"442","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"9-450A"]],"la":false,"le":"G","lm":false,"n":"Geography of the Global Economy","no":"11.442","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.449":{"b":[],"ci":false,"cl":"449","co":"11","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Decarbonizing Urban Mobility","no":"11.449","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":19.0,"t":["FA"],"tb":true,"u1":3,"u2":3,"u3":6,"v":false},"11.450":{"b":[],"ci":false,"cl":"450","co":"11","cw":false,"f":false,"h":2.8,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[104,4]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Real Estate Development Building Systems","no":"11.450","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":42.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"11.458":{"b":[],"ci":false,"cl":"458","co":"11","cw":false,"f":false,"h":13.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"9-450"]],"la":false,"le":"G","lm":false,"n":"Crowd Sourced City: Civic Tech Prototyping","no":"11.458","nx":false,"pl":false,"r":[],"ra":4.2,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.466":{"b":[],"ci":false,"cl":"466","co":"11","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,5]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Technology, Globalization, and Sustainable Development","no":"11.466","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":24.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.472":{"b":[[[[135,3]],"N51-310"]],"ci":false,"cl":"472","co":"11","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"N51-310"]],"la":false,"le":"G","lm":true,"n":"D-Lab: Development","no":"11.472","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l","b"],"si":25.3,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"11.477":{"b":[],"ci":false,"cl":"477","co":"11","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Urban Energy Systems and Policy","no":"11.477","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":26.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.485":{"b":[],"ci":false,"cl":"485","co":"11","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,4]],"9-217"]],"la":false,"le":"G","lm":false,"n":"Southern Urbanisms","no":"11.485","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"11.520":{"b":[[[[47,4]],"9-554"],[[[107,4]],"9-554"],[[[17,4]],"9-554"]],"ci":false,"cl":"520","co":"11","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"9-354"]],"la":false,"le":"G","lm":true,"n":"Workshop on Geographic Information Systems (GIS)","no":"11.520","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l","b"],"si":21.5,"t":["FA","SP"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"11.529":{"b":[],"ci":false,"cl":"529","co":"11","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"Mobility Ventures: Driving Innovation in Transportation Systems","no":"11.529","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":33.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"11.540":{"b":[],"ci":false,"cl":"540","co":"11","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Urban Transportation Planning and Policy","no":"11.540","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.601":{"b":[],"ci":false,"cl":"601","co":"11","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,3],[104,3]],"9-451"]],"la":false,"le":"G","lm":false,"n":"Theory and Practice of Environmental Planning","no":"11.601","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":14.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.901":{"b":[],"ci":false,"cl":"901","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study:  Urban Studies and Planning","no":"11.901","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.902":{"b":[],"ci":false,"cl":"902","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Urban Studies and Planning","no":"11.902","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.903":{"b":[],"ci":false,"cl":"903","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Supervised Readings in Urban Studies","no":"11.903","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.904":{"b":[],"ci":false,"cl":"904","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Supervised Readings in Urban Studies","no":"11.904","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.905":{"b":[],"ci":false,"cl":"905","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Seminar in Urban Studies and Planning","no":"11.905","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.906":{"b":[],"ci":false,"cl":"906","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Seminar in Urban Studies and Planning","no":"11.906","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.907":{"b":[],"ci":false,"cl":"907","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Urban Fieldwork","no":"11.907","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.908":{"b":[],"ci":false,"cl":"908","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Urban Fieldwork","no":"11.908","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.909":{"b":[],"ci":false,"cl":"909","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Tutorial","no":"11.909","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.912":{"b":[],"ci":false,"cl":"912","co":"11","cw":false,"f":false,"h":4.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,2]],"E14-140L"]],"la":false,"le":"G","lm":false,"n":"Advanced Urbanism Colloquium","no":"11.912","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":2.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":1,"u3":1,"v":false},"11.920":{"b":[],"ci":false,"cl":"920","co":"11","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Planning in Practice","no":"11.920","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":[],"si":6.2,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.930":{"b":[],"ci":false,"cl":"930","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"9-450A"]],"la":false,"le":"G","lm":false,"n":"Advanced Seminar on Planning Theory","no":"11.930","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"11.960":{"b":[],"ci":false,"cl":"960","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Real Estate","no":"11.960","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.961":{"b":[],"ci":false,"cl":"961","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Real Estate","no":"11.961","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.962":{"b":[],"ci":false,"cl":"962","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Fieldwork: Real Estate","no":"11.962","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.963":{"b":[],"ci":false,"cl":"963","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Real Estate","no":"11.963","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.964":{"b":[],"ci":false,"cl":"964","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Real Estate","no":"11.964","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S03":{"b":[],"ci":false,"cl":"S03","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"9-217"]],"la":false,"le":"U","lm":true,"n":"Special Subject: Transportation Shaping Sustainable Urbanization: Connections with Behavior, Urban Economics and Planning","no":"11.S03","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"11.S187":{"b":[],"ci":false,"cl":"S187","co":"11","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[105,3]],"5-231"]],"la":false,"le":"U","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S187","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":["l"],"si":0.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S188":{"b":[],"ci":false,"cl":"S188","co":"11","cw":false,"f":false,"h":11.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S188","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":true,"s":[],"si":7.0,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S195":{"b":[],"ci":false,"cl":"S195","co":"11","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S195","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":[],"si":5.7,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S196":{"b":[],"ci":false,"cl":"S196","co":"11","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S196","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":6.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S197":{"b":[],"ci":false,"cl":"S197","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject:  Urban Studies and Planning","no":"11.S197","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S199":{"b":[],"ci":false,"cl":"S199","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S199","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S938":{"b":[],"ci":false,"cl":"S938","co":"11","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S938","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":true,"s":[],"si":10.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S939":{"b":[],"ci":false,"cl":"S939","co":"11","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S939","nx":false,"pl":false,"r":[],"ra":3.2,"re":false,"rp":true,"s":[],"si":9.7,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S944":{"b":[],"ci":false,"cl":"S944","co":"11","cw":false,"f":false,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S944","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":true,"s":[],"si":7.2,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S945":{"b":[],"ci":false,"cl":"S945","co":"11","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,6]],"9-217"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S945","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":11.2,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S947":{"b":[],"ci":false,"cl":"S947","co":"11","cw":false,"f":false,"h":4.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S947","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":10.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S948":{"b":[],"ci":false,"cl":"S948","co":"11","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S948","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":8.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S949":{"b":[],"ci":false,"cl":"S949","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Urban Studies and Planning","no":"11.S949","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S950":{"b":[],"ci":false,"cl":"S950","co":"11","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,2]],"9-450A"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Urban Studies and Planning","no":"11.S950","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S952":{"b":[],"ci":false,"cl":"S952","co":"11","cw":false,"f":false,"h":13.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[18,6]],"9-217"]],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S952","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":6.5,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S953":{"b":[],"ci":false,"cl":"S953","co":"11","cw":false,"f":false,"h":20.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S953","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":13.5,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S954":{"b":[],"ci":false,"cl":"S954","co":"11","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,3]],"9-450A"]],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S954","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":6.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S955":{"b":[],"ci":false,"cl":"S955","co":"11","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S955","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":[],"si":8.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S956":{"b":[],"ci":false,"cl":"S956","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S956","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S957":{"b":[],"ci":false,"cl":"S957","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S957","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S958":{"b":[],"ci":false,"cl":"S958","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S958","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S959":{"b":[],"ci":false,"cl":"S959","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Urban Studies and Planning","no":"11.S959","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.S965":{"b":[],"ci":false,"cl":"S965","co":"11","cw":false,"f":false,"h":4.7,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Real Estate","no":"11.S965","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":true,"s":["l"],"si":11.5,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S966":{"b":[],"ci":false,"cl":"S966","co":"11","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Real Estate","no":"11.S966","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":9.5,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S967":{"b":[],"ci":false,"cl":"S967","co":"11","cw":false,"f":false,"h":5.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[42,3],[102,3]],"26-142"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Real Estate","no":"11.S967","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":19.7,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S968":{"b":[],"ci":false,"cl":"S968","co":"11","cw":false,"f":false,"h":6.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Special Seminar: Real Estate","no":"11.S968","nx":false,"pl":false,"r":[[[[46,3]],"9-354"]],"ra":6.0,"re":false,"rp":true,"s":["l","r"],"si":3.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S969":{"b":[],"ci":false,"cl":"S969","co":"11","cw":false,"f":false,"h":4.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[6,3]],"5-231"]],"la":false,"le":"G","lm":false,"n":"Special Seminar: Real Estate","no":"11.S969","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.S970":{"b":[],"ci":false,"cl":"S970","co":"11","cw":false,"f":false,"h":2.3,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Special Seminar: Real Estate","no":"11.S970","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":["l"],"si":17.5,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"11.THG":{"b":[],"ci":false,"cl":"THG","co":"11","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"11.THG","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":true,"s":[],"si":91.8,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.THT":{"b":[],"ci":false,"cl":"THT","co":"11","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[69,5]],"9-217"]],"la":false,"le":"U","lm":false,"n":"Thesis Research Design Seminar","no":"11.THT","nx":false,"pl":false,"r":[],"ra":4.5,"re":false,"rp":true,"s":["l"],"si":15.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"11.THU":{"b":[],"ci":false,"cl":"THU","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"11.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.UR":{"b":[],"ci":false,"cl":"UR","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"11.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"11.URG":{"b":[],"ci":false,"cl":"URG","co":"11","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"11.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.000":{"b":[],"ci":false,"cl":"000","co":"12","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E38-470"]],"la":false,"le":"U","lm":true,"n":"Solving Complex Problems","no":"12.000","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":54.7,"t":["FA"],"tb":false,"u1":1,"u2":2,"u3":6,"v":false},"12.001":{"b":[[[[12,2],[72,2],[132,2]],"54-819"]],"ci":false,"cl":"001","co":"12","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"54-819"]],"la":false,"le":"U","lm":false,"n":"Introduction to Geology","no":"12.001","nx":false,"pl":false,"r":[],"ra":6.9,"re":true,"rp":false,"s":["l","b"],"si":11.7,"t":["FA"],"tb":false,"u1":3,"u2":4,"u3":5,"v":false},"12.003":{"b":[],"ci":false,"cl":"003","co":"12","cw":false,"f":false,"h":9.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"54-1623"]],"la":false,"le":"U","lm":false,"n":"Introduction to Atmosphere, Ocean, and Climate Dynamics","no":"12.003","nx":false,"pl":false,"r":[],"ra":5.8,"re":true,"rp":false,"s":["l"],"si":8.7,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"12.006":{"b":[],"ci":false,"cl":"006","co":"12","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E25-117"]],"la":false,"le":"U","lm":false,"n":"Nonlinear Dynamics: Chaos","no":"12.006","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.010":{"b":[],"ci":false,"cl":"010","co":"12","cw":false,"f":false,"h":15.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,4],[102,4]],"54-824"]],"la":false,"le":"U","lm":false,"n":"Computational Methods of Scientific Programming","no":"12.010","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"12.012":{"b":[],"ci":false,"cl":"012","co":"12","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-136"]],"la":false,"le":"U","lm":false,"n":"MatLab, Statistics, Regression, Signal Processing","no":"12.012","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.031":{"b":[],"ci":false,"cl":"031","co":"12","cw":false,"f":true,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"1-242"]],"la":false,"le":"U","lm":false,"n":"Fundamentals of Ecology","no":"12.031","nx":false,"pl":false,"r":[[[[106,2]],"48-308"],[[[16,2]],"48-316"]],"ra":5.9,"re":true,"rp":false,"s":["r","l"],"si":19.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"12.080":{"b":[],"ci":false,"cl":"080","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Experiential Learning in EAPS","no":"12.080","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.104":{"b":[],"ci":false,"cl":"104","co":"12","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"4-457"]],"la":false,"le":"U","lm":false,"n":"Geochemistry of Natural Waters","no":"12.104","nx":true,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":["l"],"si":0.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"12.178":{"b":[],"ci":false,"cl":"178","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"56-191"]],"la":false,"le":"U","lm":false,"n":"The Phylogenomic Planetary Record","no":"12.178","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.300":{"b":[],"ci":false,"cl":"300","co":"12","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"48-316"]],"la":false,"le":"U","lm":false,"n":"Global Change Science","no":"12.300","nx":true,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":2.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.301":{"b":[],"ci":false,"cl":"301","co":"12","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Climate Science","no":"12.301","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":[],"si":11.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":true},"12.318":{"b":[],"ci":false,"cl":"318","co":"12","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"54-1623"]],"la":false,"le":"U","lm":false,"n":"Introduction to Atmospheric Data and Large-scale Dynamics","no":"12.318","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":true,"u1":3,"u2":3,"u3":6,"v":false},"12.320A":{"b":[],"ci":false,"cl":"320A","co":"12","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Introduction to Hydrology and Water Resources","no":"12.320A","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":4.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"12.320B":{"b":[],"ci":false,"cl":"320B","co":"12","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Introduction to Hydrology Modeling","no":"12.320B","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":3.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"12.335":{"b":[],"ci":false,"cl":"335","co":"12","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"E25-605"]],"la":true,"le":"U","lm":false,"n":"Experimental Atmospheric Chemistry","no":"12.335","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":8.7,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"12.336":{"b":[],"ci":false,"cl":"336","co":"12","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"48-308"]],"la":false,"le":"U","lm":false,"n":"Air Pollution and Atmospheric Chemistry","no":"12.336","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":6.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.372":{"b":[],"ci":false,"cl":"372","co":"12","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"54-823"]],"la":false,"le":"U","lm":false,"n":"Elements of Modern Oceanography","no":"12.372","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":9.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.385":{"b":[],"ci":false,"cl":"385","co":"12","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,6]],"5-217"]],"la":false,"le":"U","lm":false,"n":"Science, Politics, and Environmental Policy","no":"12.385","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"12.387":{"b":[],"ci":false,"cl":"387","co":"12","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,6]],"66-144"]],"la":false,"le":"U","lm":false,"n":"People and the Planet:  Environmental Governance and Science","no":"12.387","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":14.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"12.390":{"b":[],"ci":false,"cl":"390","co":"12","cw":false,"f":false,"h":14.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Fluid Dynamics of the Atmosphere and Ocean","no":"12.390","nx":false,"pl":false,"r":[],"ra":4.7,"re":false,"rp":false,"s":[],"si":18.3,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":true},"12.410":{"b":[],"ci":false,"cl":"410","co":"12","cw":false,"f":false,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,2],[76,2],[136,2]],"37-212"]],"la":true,"le":"U","lm":true,"n":"Observational Techniques of Optical Astronomy","no":"12.410","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":13.3,"t":["FA"],"tb":true,"u1":3,"u2":4,"u3":8,"v":false},"12.420":{"b":[],"ci":false,"cl":"420","co":"12","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[66,3],[126,3]],"54-819"]],"la":false,"le":"U","lm":false,"n":"Essentials of Planetary Science","no":"12.420","nx":true,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.421":{"b":[],"ci":false,"cl":"421","co":"12","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"54-819"]],"la":false,"le":"U","lm":false,"n":"Physical Principles of Remote Sensing","no":"12.421","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.425":{"b":[],"ci":false,"cl":"425","co":"12","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"54-517"]],"la":false,"le":"U","lm":false,"n":"Extrasolar Planets: Physics and Detection Techniques","no":"12.425","nx":false,"pl":false,"r":[],"ra":7.0,"re":true,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.444":{"b":[],"ci":false,"cl":"444","co":"12","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-136"]],"la":false,"le":"G","lm":false,"n":"MatLab, Statistics, Regression, Signal Processing","no":"12.444","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.446":{"b":[],"ci":false,"cl":"446","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching Experience in EAPS","no":"12.446","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.478":{"b":[],"ci":false,"cl":"478","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"56-191"]],"la":false,"le":"G","lm":false,"n":"The Phylogenomic Planetary Record","no":"12.478","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.493":{"b":[],"ci":false,"cl":"493","co":"12","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,4],[99,4]],"66-160"]],"la":false,"le":"G","lm":false,"n":"Microbial Genetics and Evolution","no":"12.493","nx":false,"pl":false,"r":[[[[126,2]],"2-142"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":12.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"12.494":{"b":[],"ci":false,"cl":"494","co":"12","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"4-457"]],"la":false,"le":"G","lm":false,"n":"Geochemistry of Natural Waters","no":"12.494","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":["l"],"si":0.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"12.525":{"b":[],"ci":false,"cl":"525","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"66-156"]],"la":false,"le":"G","lm":false,"n":"Mechanisms of Faulting and Earthquakes","no":"12.525","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.601":{"b":[],"ci":false,"cl":"601","co":"12","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[66,3],[126,3]],"54-819"]],"la":false,"le":"G","lm":false,"n":"Essentials of Planetary Science","no":"12.601","nx":true,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.621":{"b":[],"ci":false,"cl":"621","co":"12","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"54-819"]],"la":false,"le":"G","lm":false,"n":"Physical Principles of Remote Sensing","no":"12.621","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.625":{"b":[],"ci":false,"cl":"625","co":"12","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"54-517"]],"la":false,"le":"G","lm":false,"n":"Extrasolar Planets: Physics and Detection Techniques","no":"12.625","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.650":{"b":[],"ci":false,"cl":"650","co":"12","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"54-824"]],"la":false,"le":"G","lm":false,"n":"Current Topics in Planetary Science","no":"12.650","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.702":{"b":[],"ci":false,"cl":"702","co":"12","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"54-824"]],"la":false,"le":"G","lm":false,"n":"Elements of Modern Oceanography","no":"12.702","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":9.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.703":{"b":[],"ci":false,"cl":"703","co":"12","cw":false,"f":false,"h":6.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3]],"54-823"]],"la":false,"le":"G","lm":false,"n":"Presenting Scientific Research","no":"12.703","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"12.708":{"b":[],"ci":false,"cl":"708","co":"12","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[103,3]],"54-827"]],"la":false,"le":"G","lm":false,"n":"Topics in Paleoceanography","no":"12.708","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":3.7,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"12.710":{"b":[],"ci":false,"cl":"710","co":"12","cw":false,"f":true,"h":8.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,3],[106,3]],"54-827"]],"la":false,"le":"G","lm":false,"n":"Geological Oceanography","no":"12.710","nx":false,"pl":false,"r":[],"ra":1.9,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.712":{"b":[],"ci":false,"cl":"712","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Advanced Marine Seismology","no":"12.712","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":true},"12.718":{"b":[],"ci":false,"cl":"718","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Kinetics and Mass Transport","no":"12.718","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":true},"12.741":{"b":[],"ci":false,"cl":"741","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Marine Bioinorganic Chemistry","no":"12.741","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":true},"12.742":{"b":[],"ci":false,"cl":"742","co":"12","cw":false,"f":false,"h":17.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"54-827"]],"la":false,"le":"G","lm":false,"n":"Marine Chemistry","no":"12.742","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.751":{"b":[],"ci":false,"cl":"751","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Oceanography at Woods Hole","no":"12.751","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.756":{"b":[],"ci":false,"cl":"756","co":"12","cw":false,"f":false,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"54-819"]],"la":false,"le":"G","lm":false,"n":"Sem: Oceanography at WHOI","no":"12.756","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":true,"s":["l"],"si":13.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"12.757":{"b":[],"ci":false,"cl":"757","co":"12","cw":false,"f":false,"h":4.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Oceanography at Woods Hole","no":"12.757","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":6.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.800":{"b":[],"ci":false,"cl":"800","co":"12","cw":false,"f":false,"h":14.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Fluid Dynamics of the Atmosphere and Ocean","no":"12.800","nx":false,"pl":false,"r":[],"ra":4.7,"re":false,"rp":false,"s":[],"si":18.3,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":true},"12.805":{"b":[],"ci":false,"cl":"805","co":"12","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,3],[106,3]],"54-823"]],"la":false,"le":"G","lm":false,"n":"Data Analysis in Physical Oceanography","no":"12.805","nx":true,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.807":{"b":[],"ci":false,"cl":"807","co":"12","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"48-316"]],"la":false,"le":"G","lm":false,"n":"Atmospheric Chemistry","no":"12.807","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.808":{"b":[],"ci":false,"cl":"808","co":"12","cw":false,"f":false,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"54-823"]],"la":false,"le":"G","lm":false,"n":"Introduction to Observational Physical Oceanography","no":"12.808","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.818":{"b":[],"ci":false,"cl":"818","co":"12","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"54-1623"]],"la":false,"le":"G","lm":false,"n":"Introduction to Atmospheric Data and Large-scale Dynamics","no":"12.818","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":true,"u1":3,"u2":3,"u3":6,"v":false},"12.835":{"b":[],"ci":false,"cl":"835","co":"12","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"E25-605"]],"la":false,"le":"G","lm":false,"n":"Experimental Atmospheric Chemistry","no":"12.835","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":8.7,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"12.842":{"b":[],"ci":false,"cl":"842","co":"12","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2],[72,2],[132,2]],"36-144"]],"la":false,"le":"G","lm":false,"n":"Climate Science","no":"12.842","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":11.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"12.843":{"b":[[[[130,3]],"56-180"]],"ci":false,"cl":"843","co":"12","cw":false,"f":false,"h":15.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"56-180"]],"la":false,"le":"G","lm":false,"n":"Large-scale Atmosphere and Ocean Dynamics","no":"12.843","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l","b"],"si":2.7,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":9,"v":false},"12.860":{"b":[],"ci":false,"cl":"860","co":"12","cw":false,"f":false,"h":14.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"54-823"]],"la":false,"le":"G","lm":false,"n":"Climate Variability and Diagnostics","no":"12.860","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.862":{"b":[],"ci":false,"cl":"862","co":"12","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"54-819"]],"la":false,"le":"G","lm":false,"n":"Coastal Physical Oceanography","no":"12.862","nx":true,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"12.885":{"b":[],"ci":false,"cl":"885","co":"12","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,6]],"5-217"]],"la":false,"le":"G","lm":false,"n":"Science, Politics, and Environmental Policy","no":"12.885","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"12.900":{"b":[],"ci":false,"cl":"900","co":"12","cw":false,"f":false,"h":2.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[136,2]],"54-1623"]],"la":false,"le":"G","lm":false,"n":"EAPS First Year Graduate Seminar","no":"12.900","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":2,"v":false},"12.950":{"b":[],"ci":false,"cl":"950","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Physical Oceanography at MIT","no":"12.950","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.970":{"b":[],"ci":false,"cl":"970","co":"12","cw":false,"f":false,"h":27.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Current Research in Earth, Atmospheric and Planetary Sciences","no":"12.970","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":21.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.971":{"b":[],"ci":false,"cl":"971","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Current Research in Earth, Atmospheric and Planetary Sciences","no":"12.971","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.980":{"b":[],"ci":false,"cl":"980","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Current Research in Joint Program at MIT","no":"12.980","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.981":{"b":[],"ci":false,"cl":"981","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Current Research in Joint Program at MIT","no":"12.981","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.982":{"b":[],"ci":false,"cl":"982","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Current Research in Joint Program at WHOI","no":"12.982","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.983":{"b":[],"ci":false,"cl":"983","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Current Research in Joint Program at WHOI","no":"12.983","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.S083":{"b":[],"ci":false,"cl":"S083","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-131"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Earth, Atmospheric and Planetary Sciences","no":"12.S083","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"12.S591":{"b":[],"ci":false,"cl":"S591","co":"12","cw":false,"f":false,"h":6.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"54-209"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Geophysics","no":"12.S591","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":4.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"12.S592":{"b":[],"ci":false,"cl":"S592","co":"12","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,4]],"35-308"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Earth, Atmospheric and Planetary Sciences","no":"12.S592","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":true,"s":["l"],"si":4.7,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"12.S680":{"b":[],"ci":false,"cl":"S680","co":"12","cw":false,"f":false,"h":20.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3]],"54-517"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Planetary Science","no":"12.S680","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"12.THG":{"b":[],"ci":false,"cl":"THG","co":"12","cw":false,"f":false,"h":45.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"12.THG","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":80.3,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.THU":{"b":[],"ci":false,"cl":"THU","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"12.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.TIP":{"b":[],"ci":false,"cl":"TIP","co":"12","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Thesis Preparation","no":"12.TIP","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":[],"si":7.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"12.UAR":{"b":[],"ci":false,"cl":"UAR","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2],[106,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Climate and Sustainability Undergraduate Advanced Research","no":"12.UAR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"12.UR":{"b":[],"ci":false,"cl":"UR","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"12.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"12.URG":{"b":[],"ci":false,"cl":"URG","co":"12","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"12.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.001":{"b":[],"ci":false,"cl":"001","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Data Economics and Development Policy Summer Internship","no":"14.001","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"14.003":{"b":[],"ci":false,"cl":"003","co":"14","cw":false,"f":true,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Microeconomic Theory and Public Policy","no":"14.003","nx":false,"pl":false,"r":[[[[124,2]],"4-370"],[[[122,2]],"4-370"]],"ra":5.9,"re":false,"rp":false,"s":["l","r"],"si":43.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.009":{"b":[],"ci":false,"cl":"009","co":"14","cw":false,"f":false,"h":2.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Economics and Society's Toughest Problems","no":"14.009","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":99.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"14.01":{"b":[],"ci":false,"cl":"01","co":"14","cw":false,"f":true,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[6,2],[66,2]],"32-123"]],"la":false,"le":"U","lm":false,"n":"Principles of Microeconomics","no":"14.01","nx":false,"pl":false,"r":[[[[126,2]],"4-163"],[[[128,2]],"4-163"],[[[130,2]],"35-225"]],"ra":5.2,"re":false,"rp":false,"s":["r","l"],"si":186.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"14.02":{"b":[],"ci":false,"cl":"02","co":"14","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[12,2],[72,2]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Principles of Macroeconomics","no":"14.02","nx":false,"pl":false,"r":[[[[130,2]],"32-123"],[[[132,2]],"6-120"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":145.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"14.03":{"b":[],"ci":false,"cl":"03","co":"14","cw":false,"f":true,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[1,3],[61,3]],"E52-164"]],"la":false,"le":"U","lm":false,"n":"Microeconomic Theory and Public Policy","no":"14.03","nx":false,"pl":false,"r":[[[[122,2]],"4-370"],[[[124,2]],"4-370"]],"ra":5.9,"re":false,"rp":false,"s":["r","l"],"si":43.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.04":{"b":[],"ci":false,"cl":"04","co":"14","cw":false,"f":true,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[43,3],[103,3]],"E51-372"]],"la":false,"le":"U","lm":false,"n":"Intermediate Microeconomic Theory","no":"14.04","nx":false,"pl":false,"r":[[[[134,2]],"E51-372"]],"ra":5.0,"re":false,"rp":false,"s":["r","l"],"si":28.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.05":{"b":[],"ci":false,"cl":"05","co":"14","cw":false,"f":false,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[10,3],[70,3]],"E51-085"]],"la":false,"le":"U","lm":false,"n":"Intermediate Macroeconomics","no":"14.05","nx":false,"pl":false,"r":[[[[124,2]],"E51-395"]],"ra":5.2,"re":false,"rp":false,"s":["l","r"],"si":30.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.08":{"b":[],"ci":false,"cl":"08","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Technical Topics in Economics","no":"14.08","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":true},"14.09":{"b":[],"ci":false,"cl":"09","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Reading Seminar in Economics","no":"14.09","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.10":{"b":[],"ci":false,"cl":"10","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Reading Seminar in Economics","no":"14.10","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.12":{"b":[],"ci":false,"cl":"12","co":"14","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[5,3],[65,3]],"4-237"]],"la":false,"le":"U","lm":false,"n":"Economic Applications of Game Theory","no":"14.12","nx":false,"pl":false,"r":[[[[124,2]],"E51-376"],[[[132,2]],"E51-361"],[[[134,2]],"E51-361"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":31.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.121":{"b":[],"ci":false,"cl":"121","co":"14","cw":false,"f":true,"h":14.1,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-151"]],"la":false,"le":"G","lm":true,"n":"Microeconomic Theory I","no":"14.121","nx":false,"pl":false,"r":[[[[130,3]],"E51-151"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":32.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"14.122":{"b":[],"ci":false,"cl":"122","co":"14","cw":false,"f":true,"h":10.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-151"]],"la":false,"le":"G","lm":true,"n":"Microeconomic Theory II","no":"14.122","nx":false,"pl":false,"r":[[[[130,3]],"E51-151"]],"ra":6.4,"re":false,"rp":false,"s":["l","r"],"si":31.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"14.130":{"b":[],"ci":false,"cl":"130","co":"14","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[69,4]],"E52-314"]],"la":false,"le":"G","lm":false,"n":"Reading Economic Theory","no":"14.130","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"14.191":{"b":[],"ci":false,"cl":"191","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Research Paper","no":"14.191","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"14.192":{"b":[],"ci":false,"cl":"192","co":"14","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[92,3]],"E52-432"]],"la":false,"le":"G","lm":true,"n":"Advanced Research and Communication","no":"14.192","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":true,"s":["l"],"si":19.7,"t":["FA","JA","SP"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"14.193":{"b":[],"ci":false,"cl":"193","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Advanced Seminar in Economics","no":"14.193","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.195":{"b":[],"ci":false,"cl":"195","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Reading Seminar in Economics","no":"14.195","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.197":{"b":[],"ci":false,"cl":"197","co":"14","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Research","no":"14.197","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":3.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.198":{"b":[],"ci":false,"cl":"198","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Introductory Economics","no":"14.198","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":2,"v":true},"14.199":{"b":[],"ci":false,"cl":"199","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Introductory Economics","no":"14.199","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":2,"v":true},"14.271":{"b":[],"ci":false,"cl":"271","co":"14","cw":false,"f":true,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,3],[62,3]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Industrial Organization I","no":"14.271","nx":false,"pl":false,"r":[[[[122,3]],"E51-361"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":19.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.281":{"b":[],"ci":false,"cl":"281","co":"14","cw":false,"f":true,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E51-361"]],"la":false,"le":"G","lm":false,"n":"Contract Economics","no":"14.281","nx":false,"pl":false,"r":[[[[125,3]],"E51-361"]],"ra":6.3,"re":false,"rp":false,"s":["r","l"],"si":8.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.282":{"b":[],"ci":false,"cl":"282","co":"14","cw":false,"f":true,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E62-550"]],"la":false,"le":"G","lm":false,"n":"Introduction to Organizational Economics","no":"14.282","nx":false,"pl":false,"r":[[[[133,3]],"E62-550"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":7.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.30":{"b":[],"ci":false,"cl":"30","co":"14","cw":false,"f":true,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"E51-145"]],"la":false,"le":"U","lm":false,"n":"Introduction to Statistical Methods in Economics","no":"14.30","nx":false,"pl":false,"r":[[[[132,2]],"4-237"]],"ra":4.7,"re":true,"rp":false,"s":["r","l"],"si":57.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.300":{"b":[],"ci":false,"cl":"300","co":"14","cw":false,"f":true,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"E51-145"]],"la":false,"le":"G","lm":false,"n":"Introduction to Statistical Methods in Economics","no":"14.300","nx":false,"pl":false,"r":[[[[132,2]],"4-237"]],"ra":4.7,"re":false,"rp":false,"s":["l","r"],"si":57.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.32":{"b":[],"ci":false,"cl":"32","co":"14","cw":false,"f":true,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"1-190"]],"la":true,"le":"U","lm":true,"n":"Econometric Data Science","no":"14.32","nx":false,"pl":false,"r":[[[[132,2]],"E51-395"]],"ra":5.8,"re":false,"rp":false,"s":["l","r"],"si":51.8,"t":["FA","SP"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"14.320":{"b":[],"ci":false,"cl":"320","co":"14","cw":false,"f":true,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"1-190"]],"la":false,"le":"G","lm":true,"n":"Econometric Data Science","no":"14.320","nx":false,"pl":false,"r":[[[[132,2]],"E51-395"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":51.8,"t":["FA","SP"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"14.33":{"b":[],"ci":false,"cl":"33","co":"14","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[32,3],[92,3]],"E51-376"]],"la":false,"le":"U","lm":true,"n":"Research and Communication in Economics: Topics, Methods, and Implementation","no":"14.33","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":22.2,"t":["FA","SP"],"tb":true,"u1":3,"u2":4,"u3":5,"v":false},"14.380":{"b":[],"ci":false,"cl":"380","co":"14","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"E51-145"]],"la":false,"le":"G","lm":true,"n":"Statistical Method in Economics","no":"14.380","nx":false,"pl":false,"r":[[[[136,3]],"E51-151"]],"ra":6.2,"re":false,"rp":false,"s":["l","r"],"si":35.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"14.381":{"b":[],"ci":false,"cl":"381","co":"14","cw":false,"f":true,"h":11.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"E51-145"]],"la":false,"le":"G","lm":false,"n":"Estimation and Inference for Linear Causal and Structural Models","no":"14.381","nx":false,"pl":false,"r":[[[[136,3]],"E51-151"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":42.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"14.385":{"b":[],"ci":false,"cl":"385","co":"14","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-361"]],"la":false,"le":"G","lm":true,"n":"Nonlinear Econometric Analysis","no":"14.385","nx":false,"pl":false,"r":[[[[135,3]],"E51-376"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":26.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.391":{"b":[],"ci":false,"cl":"391","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Workshop in Economic Research","no":"14.391","nx":false,"pl":false,"r":[[[[76,3]],"E51-151"],[[[43,3]],"E62-650"],[[[46,3]],"E52-432"],[[[106,3]],"E51-151"],[[[16,3]],"E51-151"],[[[106,4]],"E52-324"]],"ra":0,"re":false,"rp":true,"s":["r"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"14.41":{"b":[],"ci":false,"cl":"41","co":"14","cw":false,"f":true,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[13,3],[73,3]],"E51-395"]],"la":false,"le":"U","lm":false,"n":"Public Finance and Public Policy","no":"14.41","nx":false,"pl":false,"r":[[[[128,2]],"E52-164"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":72.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.416":{"b":[],"ci":false,"cl":"416","co":"14","cw":false,"f":true,"h":15.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[17,3],[77,3]],"E62-650"]],"la":false,"le":"G","lm":false,"n":"Asset Pricing","no":"14.416","nx":false,"pl":false,"r":[[[[126,2]],"E62-350"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":15.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.43":{"b":[],"ci":false,"cl":"43","co":"14","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[5,3],[65,3]],"E51-376"]],"la":false,"le":"U","lm":false,"n":"Economics of Energy, Innovation, and Sustainability","no":"14.43","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"14.442":{"b":[],"ci":false,"cl":"442","co":"14","cw":false,"f":false,"h":19.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E62-687"]],"la":false,"le":"G","lm":false,"n":"Advanced Asset Pricing","no":"14.442","nx":false,"pl":false,"r":[[[[20,3]],"E51-372"]],"ra":6.4,"re":false,"rp":false,"s":["r","l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"14.449":{"b":[],"ci":false,"cl":"449","co":"14","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2]],"E62-687"]],"la":false,"le":"G","lm":false,"n":"Current Research in Financial Economics","no":"14.449","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"14.451":{"b":[],"ci":false,"cl":"451","co":"14","cw":false,"f":false,"h":14.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-151"]],"la":false,"le":"G","lm":true,"n":"Dynamic Optimization Methods with Applications","no":"14.451","nx":false,"pl":false,"r":[[[[133,3]],"E51-151"]],"ra":5.8,"re":false,"rp":false,"s":["l","r"],"si":26.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"14.452":{"b":[],"ci":false,"cl":"452","co":"14","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-151"]],"la":false,"le":"G","lm":true,"n":"Economic Growth","no":"14.452","nx":false,"pl":false,"r":[[[[133,3]],"E51-151"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":26.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"14.461":{"b":[],"ci":false,"cl":"461","co":"14","cw":false,"f":true,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[5,3],[65,3]],"E52-432"]],"la":false,"le":"G","lm":false,"n":"Advanced Macroeconomics I","no":"14.461","nx":false,"pl":false,"r":[[[[130,3]],"E51-372"]],"ra":6.5,"re":false,"rp":false,"s":["r","l"],"si":5.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.472":{"b":[],"ci":false,"cl":"472","co":"14","cw":false,"f":true,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E51-372"]],"la":false,"le":"G","lm":false,"n":"Public Economics II","no":"14.472","nx":false,"pl":false,"r":[[[[128,2]],"E52-532"]],"ra":6.4,"re":false,"rp":false,"s":["r","l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"14.54":{"b":[],"ci":false,"cl":"54","co":"14","cw":false,"f":true,"h":8.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[5,3],[65,3]],"E51-361"]],"la":false,"le":"U","lm":false,"n":"International Trade","no":"14.54","nx":false,"pl":false,"r":[[[[126,2]],"E51-376"]],"ra":6.3,"re":false,"rp":false,"s":["l","r"],"si":8.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.540":{"b":[],"ci":false,"cl":"540","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[5,3],[65,3]],"E51-361"]],"la":false,"le":"G","lm":false,"n":"International Trade","no":"14.540","nx":false,"pl":false,"r":[[[[126,2]],"E51-376"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.581":{"b":[],"ci":false,"cl":"581","co":"14","cw":false,"f":true,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,3],[62,3]],"E51-151"]],"la":false,"le":"G","lm":false,"n":"International Economics I","no":"14.581","nx":false,"pl":false,"r":[[[[122,3]],"E51-151"]],"ra":6.9,"re":false,"rp":false,"s":["r","l"],"si":7.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.661":{"b":[],"ci":false,"cl":"661","co":"14","cw":false,"f":true,"h":11.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"E51-151"]],"la":false,"le":"G","lm":false,"n":"Labor Economics I","no":"14.661","nx":false,"pl":false,"r":[[[[126,2]],"E52-432"]],"ra":5.9,"re":false,"rp":false,"s":["r","l"],"si":12.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.661A":{"b":[],"ci":false,"cl":"661A","co":"14","cw":false,"f":true,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"E51-151"]],"la":false,"le":"G","lm":true,"n":"Labor Economics I","no":"14.661A","nx":false,"pl":false,"r":[[[[126,2]],"E52-432"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":10.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.73":{"b":[],"ci":true,"cl":"73","co":"14","cw":false,"f":true,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[10,3],[69,4]],"E51-395"]],"la":false,"le":"U","lm":false,"n":"The Challenge of World Poverty","no":"14.73","nx":false,"pl":false,"r":[[[[130,2]],"E25-117"],[[[132,2]],"E25-117"]],"ra":5.8,"re":false,"rp":false,"s":["l","r"],"si":69.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.770":{"b":[],"ci":false,"cl":"770","co":"14","cw":false,"f":true,"h":11.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E51-151"]],"la":false,"le":"G","lm":false,"n":"Introduction to Collective Choice and Political Economy","no":"14.770","nx":false,"pl":false,"r":[[[[122,3]],"E51-372"]],"ra":6.3,"re":false,"rp":false,"s":["l","r"],"si":8.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"14.771":{"b":[],"ci":false,"cl":"771","co":"14","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[5,3],[65,3]],"E51-151"]],"la":false,"le":"G","lm":false,"n":"Development Economics: Microeconomic Issues","no":"14.771","nx":false,"pl":false,"r":[[[[76,2]],"E51-361"]],"ra":6.5,"re":false,"rp":false,"s":["l","r"],"si":14.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"14.THG":{"b":[],"ci":false,"cl":"THG","co":"14","cw":false,"f":false,"h":49.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"14.THG","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":77.2,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.THU":{"b":[],"ci":false,"cl":"THU","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Thesis","no":"14.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.UR":{"b":[],"ci":false,"cl":"UR","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"14.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"14.URG":{"b":[],"ci":false,"cl":"URG","co":"14","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"14.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.000":{"b":[],"ci":false,"cl":"000","co":"15","cw":false,"f":false,"h":2.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,4]],"E51-345"]],"la":false,"le":"U","lm":false,"n":"Explorations in Management","no":"15.000","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":90.7,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"15.002":{"b":[],"ci":false,"cl":"002","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Principled Leadership for Systemic Change","no":"15.002","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"15.003":{"b":[],"ci":false,"cl":"003","co":"15","cw":false,"f":false,"h":3.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Analytics Tools","no":"15.003","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":[],"si":56.7,"t":["FA","SU","SP"],"tb":true,"u1":2,"u2":0,"u3":1,"v":true},"15.010":{"b":[],"ci":false,"cl":"010","co":"15","cw":false,"f":true,"h":6.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,3],[91,3]],"E51-325"],[[[34,3],[94,3]],"E62-262"]],"la":false,"le":"G","lm":false,"n":"Economic Analysis for Business Decisions","no":"15.010","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":424.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"15.011":{"b":[],"ci":false,"cl":"011","co":"15","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-372"]],"la":false,"le":"G","lm":false,"n":"Economic Analysis for Business Decisions","no":"15.011","nx":false,"pl":false,"r":[[[[128,2]],"E51-057"],[[[130,2]],"E51-057"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":35.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"15.0111":{"b":[],"ci":false,"cl":"0111","co":"15","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-372"]],"la":false,"le":"U","lm":false,"n":"Economic Analysis for Business Decisions","no":"15.0111","nx":false,"pl":false,"r":[[[[130,2]],"E51-057"],[[[128,2]],"E51-057"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":35.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"15.012":{"b":[],"ci":false,"cl":"012","co":"15","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"E51-372"],[[[10,3],[70,3]],"E51-372"]],"la":false,"le":"G","lm":false,"n":"Applied Macro- and International Economics","no":"15.012","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":91.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.013":{"b":[],"ci":false,"cl":"013","co":"15","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-315"],[[[4,3],[64,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Economics for Strategic Decisions","no":"15.013","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":119.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.020":{"b":[],"ci":false,"cl":"020","co":"15","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-395"]],"la":false,"le":"G","lm":false,"n":"Economics of Energy, Innovation, and Sustainability","no":"15.020","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.0201":{"b":[],"ci":false,"cl":"0201","co":"15","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[5,3],[65,3]],"E51-376"]],"la":false,"le":"U","lm":false,"n":"Economics of Energy, Innovation, and Sustainability","no":"15.0201","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.021":{"b":[],"ci":false,"cl":"021","co":"15","cw":false,"f":true,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Real Estate Economics","no":"15.021","nx":false,"pl":false,"r":[[[[78,3]],"9-354"]],"ra":4.6,"re":false,"rp":false,"s":["r","l"],"si":45.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.029":{"b":[],"ci":false,"cl":"029","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[33,3],[123,3]],"32-144"]],"la":false,"le":"G","lm":false,"n":"United States Energy Policy: Lessons Learned for the Future","no":"15.029","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.0291":{"b":[],"ci":false,"cl":"0291","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[33,3],[123,3]],"32-144"]],"la":false,"le":"U","lm":false,"n":"United States Energy Policy: Lessons Learned for the Future","no":"15.0291","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.054":{"b":[],"ci":false,"cl":"054","co":"15","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"33-419"]],"la":false,"le":"G","lm":false,"n":"The Airline Industry","no":"15.054","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":30.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.060":{"b":[],"ci":false,"cl":"060","co":"15","cw":false,"f":true,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E62-262"],[[[4,3],[64,3]],"E51-325"]],"la":false,"le":"G","lm":false,"n":"Data, Models, and Decisions","no":"15.060","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":376.0,"t":["FA","SU"],"tb":true,"u1":3,"u2":0,"u3":6,"v":false},"15.062":{"b":[],"ci":false,"cl":"062","co":"15","cw":false,"f":false,"h":15.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[16,3],[76,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Data Mining: Finding the Models and Predictions that Create Value","no":"15.062","nx":false,"pl":false,"r":[[[[46,2]],"E51-395"]],"ra":4.9,"re":false,"rp":false,"s":["r","l"],"si":54.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.0621":{"b":[],"ci":false,"cl":"0621","co":"15","cw":false,"f":false,"h":15.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[16,3],[76,3]],"E51-315"]],"la":false,"le":"U","lm":false,"n":"Data Mining: Finding the Models and Predictions that Create Value","no":"15.0621","nx":false,"pl":false,"r":[[[[46,2]],"E51-395"]],"ra":4.9,"re":false,"rp":false,"s":["l","r"],"si":54.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.069":{"b":[],"ci":false,"cl":"069","co":"15","cw":false,"f":true,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-376"]],"la":false,"le":"U","lm":false,"n":"Applied Probability and Statistics","no":"15.069","nx":false,"pl":false,"r":[],"ra":0,"re":true,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.071":{"b":[],"ci":false,"cl":"071","co":"15","cw":false,"f":false,"h":13.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"The Analytics Edge","no":"15.071","nx":false,"pl":false,"r":[[[[124,2]],"E51-345"],[[[74,2]],"E25-111"]],"ra":6.1,"re":false,"rp":false,"s":["r","l"],"si":188.2,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.072":{"b":[],"ci":false,"cl":"072","co":"15","cw":false,"f":false,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Advanced Analytics Edge","no":"15.072","nx":false,"pl":false,"r":[[[[122,2]],"E51-345"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":91.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.081":{"b":[],"ci":false,"cl":"081","co":"15","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Introduction to Mathematical Programming","no":"15.081","nx":false,"pl":false,"r":[[[[128,2]],"34-301"],[[[124,2]],"4-231"]],"ra":5.8,"re":false,"rp":false,"s":["l","r"],"si":43.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.085":{"b":[],"ci":false,"cl":"085","co":"15","cw":false,"f":false,"h":16.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"35-225"]],"la":false,"le":"G","lm":false,"n":"Fundamentals of Probability","no":"15.085","nx":false,"pl":false,"r":[[[[132,2]],"3-333"],[[[130,2]],"3-333"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":59.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.093":{"b":[],"ci":false,"cl":"093","co":"15","cw":false,"f":true,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,3],[91,3]],"E62-276"],[[[40,3],[100,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Optimization Methods","no":"15.093","nx":false,"pl":false,"r":[[[[130,2]],"E52-164"],[[[132,2]],"E52-164"]],"ra":4.9,"re":false,"rp":false,"s":["l","r"],"si":139.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.095":{"b":[],"ci":false,"cl":"095","co":"15","cw":false,"f":true,"h":14.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,3],[76,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Machine Learning Under a Modern Optimization Lens","no":"15.095","nx":false,"pl":false,"r":[[[[125,2]],"E51-335"]],"ra":5.6,"re":false,"rp":false,"s":["l","r"],"si":76.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"15.097":{"b":[],"ci":false,"cl":"097","co":"15","cw":false,"f":false,"h":6.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Statistics and Data Analysis","no":"15.097","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":13.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.128":{"b":[],"ci":false,"cl":"128","co":"15","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,4]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"Revolutionary Ventures: How to Invent and Deploy Transformative Technologies","no":"15.128","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":27.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"15.136":{"b":[],"ci":false,"cl":"136","co":"15","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,6]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Principles and Practice of Drug Development","no":"15.136","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":32.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.223":{"b":[],"ci":false,"cl":"223","co":"15","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-149"]],"la":false,"le":"G","lm":false,"n":"Global Markets, National Policies and the Competitive Advantages of Firms","no":"15.223","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":53.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.235":{"b":[],"ci":false,"cl":"235","co":"15","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-149"]],"la":false,"le":"G","lm":false,"n":"Blockchain and Money","no":"15.235","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":58.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.248":{"b":[],"ci":false,"cl":"248","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E62-250"]],"la":false,"le":"G","lm":true,"n":"Israel Lab: Startup Nation's Entrepreneurship and Innovation Ecosystem","no":"15.248","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","JA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.269":{"b":[],"ci":false,"cl":"269","co":"15","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Leadership Stories: Literature, Ethics, and Authority","no":"15.269","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":40.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.276":{"b":[],"ci":false,"cl":"276","co":"15","cw":false,"f":false,"h":6.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E62-221"],[[[13,3],[73,3]],"E62-221"]],"la":false,"le":"U","lm":true,"n":"Communicating with Data","no":"15.276","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":46.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.280":{"b":[],"ci":false,"cl":"280","co":"15","cw":false,"f":false,"h":5.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,3]],"E51-335"],[[[40,3]],"E51-325"],[[[43,3]],"E51-335"]],"la":false,"le":"G","lm":false,"n":"Communication for Leaders","no":"15.280","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":425.7,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":5,"v":false},"15.284":{"b":[],"ci":false,"cl":"284","co":"15","cw":false,"f":false,"h":6.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E62-221"],[[[10,3],[70,3]],"E62-221"]],"la":false,"le":"G","lm":false,"n":"Strategic Leadership Communication","no":"15.284","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":44.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.288":{"b":[],"ci":false,"cl":"288","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[103,3]],"E62-250"]],"la":false,"le":"G","lm":false,"n":"Tough Conversations: Science, Strategies & Skills for Communicating About & Across Difference","no":"15.288","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.301":{"b":[],"ci":false,"cl":"301","co":"15","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2]],"E25-111"]],"la":true,"le":"U","lm":false,"n":"People, Teams, and Organizations Laboratory","no":"15.301","nx":false,"pl":false,"r":[[[[126,2]],"E51-057"]],"ra":4.5,"re":false,"rp":false,"s":["r","l"],"si":16.3,"t":["FA"],"tb":true,"u1":3,"u2":3,"u3":9,"v":false},"15.305":{"b":[],"ci":false,"cl":"305","co":"15","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[120,4]],"W59-172"],[[[100,4]],"W59-073"]],"la":false,"le":"U","lm":false,"n":"Leadership and Management","no":"15.305","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":18.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.310":{"b":[],"ci":false,"cl":"310","co":"15","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2]],"E25-111"]],"la":false,"le":"G","lm":false,"n":"People, Teams, and Organizations","no":"15.310","nx":false,"pl":false,"r":[[[[126,2]],"E62-221"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":26.3,"t":["FA"],"tb":false,"u1":2,"u2":1,"u3":6,"v":false},"15.311":{"b":[],"ci":false,"cl":"311","co":"15","cw":false,"f":false,"h":5.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,3]],"E62-223"],[[[100,3]],"E62-223"],[[[103,3]],"E62-223"]],"la":false,"le":"G","lm":false,"n":"Organizational Processes","no":"15.311","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":425.7,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":4,"v":false},"15.312":{"b":[],"ci":false,"cl":"312","co":"15","cw":false,"f":false,"h":6.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"E51-376"]],"la":false,"le":"U","lm":false,"n":"Organizational Processes for Business Analytics","no":"15.312","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":42.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.318":{"b":[],"ci":false,"cl":"318","co":"15","cw":false,"f":false,"h":7.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[46,6]],"E62-250"]],"la":false,"le":"G","lm":false,"n":"Discovering Your Leadership Signature","no":"15.318","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":43.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.321":{"b":[],"ci":false,"cl":"321","co":"15","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[46,6]],"E62-233"]],"la":false,"le":"G","lm":false,"n":"Improvisational Leadership: In-the-Moment Leadership Skills","no":"15.321","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":32.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.325":{"b":[],"ci":false,"cl":"325","co":"15","cw":false,"f":false,"h":4.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[19,3]],"E62-262"],[[[79,3]],"E62-262"]],"la":false,"le":"G","lm":false,"n":"Seminar in Leadership I","no":"15.325","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":116.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"15.337":{"b":[],"ci":false,"cl":"337","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,6]],"E51-325"]],"la":false,"le":"G","lm":false,"n":"Teams Lab","no":"15.337","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.342":{"b":[],"ci":false,"cl":"342","co":"15","cw":false,"f":false,"h":14.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"E51-385"]],"la":false,"le":"G","lm":false,"n":"Organizations and Environments","no":"15.342","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.348":{"b":[],"ci":false,"cl":"348","co":"15","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,6]],"E62-350"]],"la":false,"le":"G","lm":false,"n":"Doctoral Seminar in Research Methods II","no":"15.348","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":4.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.351":{"b":[],"ci":false,"cl":"351","co":"15","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3]],"E40-160"]],"la":false,"le":"G","lm":true,"n":"Introduction to Making","no":"15.351","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":24.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.359":{"b":[],"ci":false,"cl":"359","co":"15","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"1-390"]],"la":false,"le":"U","lm":false,"n":"Engineering Innovation: Moving Ideas to Impact","no":"15.359","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":24.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"15.360":{"b":[],"ci":false,"cl":"360","co":"15","cw":false,"f":false,"h":3.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,6]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Introduction to Technological Entrepreneurship","no":"15.360","nx":false,"pl":false,"r":[],"ra":3.0,"re":false,"rp":false,"s":["l"],"si":139.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"15.365":{"b":[],"ci":false,"cl":"365","co":"15","cw":false,"f":false,"h":5.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,6]],"E62-233"]],"la":false,"le":"G","lm":false,"n":"Overcoming Obstacles to Entrepreneurial Success","no":"15.365","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":94.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.366":{"b":[],"ci":false,"cl":"366","co":"15","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[109,5]],"32-124"]],"la":false,"le":"G","lm":false,"n":"Climate & Energy Ventures","no":"15.366","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l"],"si":32.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.371":{"b":[[[[122,6]],"56-154"]],"ci":false,"cl":"371","co":"15","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4],[100,4]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Innovation Teams","no":"15.371","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["b","l"],"si":19.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"15.375":{"b":[],"ci":false,"cl":"375","co":"15","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[94,4]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"Global Ventures","no":"15.375","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":41.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.378":{"b":[],"ci":false,"cl":"378","co":"15","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[20,6]],"E40-160"]],"la":false,"le":"G","lm":false,"n":"Building an Entrepreneurial Venture: Advanced Tools and Techniques","no":"15.378","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":25.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"15.379":{"b":[],"ci":false,"cl":"379","co":"15","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"Mobility Ventures: Driving Innovation in Transportation Systems","no":"15.379","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":33.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"15.3791":{"b":[],"ci":false,"cl":"3791","co":"15","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"E25-117"]],"la":false,"le":"U","lm":false,"n":"Mobility Ventures: Driving Innovation in Transportation Systems","no":"15.3791","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":33.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"15.382":{"b":[],"ci":false,"cl":"382","co":"15","cw":false,"f":true,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"E62-221"]],"la":false,"le":"G","lm":false,"n":"Managing Innovation in Financial Institutions","no":"15.382","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":53.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.385":{"b":[],"ci":false,"cl":"385","co":"15","cw":false,"f":false,"h":6.3,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E51-151"]],"la":false,"le":"G","lm":false,"n":"Innovating for Impact","no":"15.385","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":48.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.386":{"b":[],"ci":false,"cl":"386","co":"15","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"E62-233"]],"la":false,"le":"G","lm":false,"n":"Leading in Ambiguity: Steering Through Strategic Inflection Points","no":"15.386","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":103.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.387":{"b":[],"ci":false,"cl":"387","co":"15","cw":false,"f":false,"h":6.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,3],[106,3]],"E51-325"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurial Sales","no":"15.387","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":70.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.388":{"b":[],"ci":false,"cl":"388","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[50,6]],"E51-151"]],"la":false,"le":"G","lm":false,"n":"Venture Creation Tactics","no":"15.388","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"15.389":{"b":[],"ci":false,"cl":"389","co":"15","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E62-262"]],"la":false,"le":"G","lm":false,"n":"Global Entrepreneurship Lab","no":"15.389","nx":false,"pl":false,"r":[[[[98,2]],"E62-223"]],"ra":4.6,"re":false,"rp":false,"s":["l","r"],"si":67.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"15.390":{"b":[],"ci":false,"cl":"390","co":"15","cw":false,"f":false,"h":9.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E62-233"],[[[16,3],[76,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"New Enterprises","no":"15.390","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":110.4,"t":["FA","SP"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"15.3901":{"b":[],"ci":false,"cl":"3901","co":"15","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E62-233"]],"la":false,"le":"U","lm":false,"n":"New Enterprises","no":"15.3901","nx":false,"pl":false,"r":[[[[130,2]],"E40-160"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":15.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"15.398":{"b":[],"ci":false,"cl":"398","co":"15","cw":false,"f":false,"h":3.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,2],[79,4]],"E62-221"],[[[34,2],[79,4]],"E62-221"],[[[79,4],[106,2]],"E62-223"],[[[46,2],[79,4]],"E62-221"],[[[79,4],[92,2]],"E62-223"],[[[79,4],[94,2]],"E62-223"]],"la":false,"le":"G","lm":false,"n":"Corporations at the Crossroads:  Leading an Organization Through Change & Challenge","no":"15.398","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":80.7,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.399":{"b":[],"ci":false,"cl":"399","co":"15","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[20,6]],"E51-151"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurship Lab","no":"15.399","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":24.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":9,"u3":1,"v":false},"15.401":{"b":[],"ci":false,"cl":"401","co":"15","cw":false,"f":true,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"E62-250"],[[[13,3],[73,3]],"E52-164"],[[[10,3],[70,3]],"E52-164"],[[[4,3],[64,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Managerial Finance","no":"15.401","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":232.2,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"15.402":{"b":[],"ci":false,"cl":"402","co":"15","cw":false,"f":true,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E62-262"],[[[4,3],[64,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Corporate Finance","no":"15.402","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":127.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.403":{"b":[],"ci":false,"cl":"403","co":"15","cw":false,"f":false,"h":3.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,3]],"E62-223"]],"la":false,"le":"G","lm":false,"n":"Introduction to the Practice of Finance","no":"15.403","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l"],"si":70.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"15.410":{"b":[],"ci":false,"cl":"410","co":"15","cw":false,"f":false,"h":3.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[111,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Finance Ethics & Regulation","no":"15.410","nx":false,"pl":false,"r":[],"ra":4.2,"re":false,"rp":false,"s":["l"],"si":138.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"15.414":{"b":[],"ci":false,"cl":"414","co":"15","cw":false,"f":true,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E62-262"],[[[34,3],[94,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Financial Management","no":"15.414","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":113.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.418":{"b":[[[[133,3]],"E62-221"]],"ci":false,"cl":"418","co":"15","cw":false,"f":true,"h":10.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"E62-276"],[[[10,3],[70,3]],"E62-262"]],"la":true,"le":"U","lm":false,"n":"Laboratory in Corporate Finance","no":"15.418","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l","b"],"si":15.7,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":9,"v":false},"15.425":{"b":[],"ci":false,"cl":"425","co":"15","cw":false,"f":true,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-345"],[[[4,3],[64,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Corporate Finance","no":"15.425","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":121.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.426":{"b":[],"ci":false,"cl":"426","co":"15","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,3],[69,3]],"9-354"]],"la":false,"le":"G","lm":true,"n":"Real Estate Finance and Investment","no":"15.426","nx":false,"pl":false,"r":[[[[17,3]],"9-354"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":64.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.431":{"b":[],"ci":false,"cl":"431","co":"15","cw":false,"f":true,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E51-315"],[[[40,3],[100,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurial Finance and Venture Capital","no":"15.431","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":111.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.4311":{"b":[],"ci":false,"cl":"4311","co":"15","cw":false,"f":true,"h":6.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-315"],[[[43,3],[103,3]],"E51-315"]],"la":false,"le":"U","lm":false,"n":"Entrepreneurial Finance and Venture Capital","no":"15.4311","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":false,"s":["l"],"si":16.7,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.433":{"b":[],"ci":false,"cl":"433","co":"15","cw":false,"f":true,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,3],[91,3]],"E62-233"],[[[34,3],[94,3]],"E62-233"]],"la":false,"le":"G","lm":false,"n":"Financial Markets","no":"15.433","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":false,"s":["l"],"si":133.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.4331":{"b":[],"ci":false,"cl":"4331","co":"15","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,3],[91,3]],"E62-233"],[[[34,3],[94,3]],"E62-233"]],"la":false,"le":"U","lm":false,"n":"Financial Markets","no":"15.4331","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":false,"s":["l"],"si":133.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.434":{"b":[],"ci":false,"cl":"434","co":"15","cw":false,"f":true,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-145"],[[[4,3],[64,3]],"E51-145"]],"la":false,"le":"G","lm":false,"n":"Advanced Corporate Finance","no":"15.434","nx":false,"pl":false,"r":[[[[126,3]],"E51-395"]],"ra":6.3,"re":false,"rp":false,"s":["l","r"],"si":92.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.4341":{"b":[],"ci":false,"cl":"4341","co":"15","cw":false,"f":true,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"E51-145"],[[[1,3],[61,3]],"E51-145"]],"la":false,"le":"U","lm":false,"n":"Advanced Corporate Finance","no":"15.4341","nx":false,"pl":false,"r":[[[[126,3]],"E51-395"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.436":{"b":[],"ci":false,"cl":"436","co":"15","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E51-145"]],"la":false,"le":"G","lm":false,"n":"Corporate Financial Strategy","no":"15.436","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":35.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.451":{"b":[],"ci":false,"cl":"451","co":"15","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,4]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Proseminar in Capital Markets/Investment Management","no":"15.451","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":64.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.452":{"b":[],"ci":false,"cl":"452","co":"15","cw":false,"f":false,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Proseminar in Corporate Finance/Investment Banking","no":"15.452","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":57.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.456":{"b":[],"ci":false,"cl":"456","co":"15","cw":false,"f":true,"h":13.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Financial Engineering","no":"15.456","nx":false,"pl":false,"r":[[[[126,2]],"E51-145"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":56.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"15.458":{"b":[],"ci":false,"cl":"458","co":"15","cw":false,"f":false,"h":12.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Financial Data Science and Computing","no":"15.458","nx":false,"pl":false,"r":[[[[124,2]],"E51-145"]],"ra":5.1,"re":false,"rp":false,"s":["r","l"],"si":62.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.470":{"b":[],"ci":false,"cl":"470","co":"15","cw":false,"f":true,"h":15.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[17,3],[77,3]],"E62-650"]],"la":false,"le":"G","lm":false,"n":"Asset Pricing","no":"15.470","nx":false,"pl":false,"r":[[[[126,2]],"E62-350"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":15.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"15.472":{"b":[],"ci":false,"cl":"472","co":"15","cw":false,"f":false,"h":19.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E62-687"]],"la":false,"le":"G","lm":false,"n":"Advanced Asset Pricing","no":"15.472","nx":false,"pl":false,"r":[[[[20,3]],"E51-372"]],"ra":6.4,"re":false,"rp":false,"s":["l","r"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.475":{"b":[],"ci":false,"cl":"475","co":"15","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2]],"E62-687"]],"la":false,"le":"G","lm":false,"n":"Current Research in Financial Economics","no":"15.475","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.482":{"b":[],"ci":false,"cl":"482","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,6]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Healthcare Finance","no":"15.482","nx":false,"pl":false,"r":[[[[132,2]],"E51-345"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.497":{"b":[],"ci":false,"cl":"497","co":"15","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[49,5]],"E62-223"]],"la":false,"le":"G","lm":false,"n":"FinTech Ventures","no":"15.497","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":39.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.501":{"b":[],"ci":false,"cl":"501","co":"15","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"E51-395"],[[[34,3],[94,3]],"E51-395"]],"la":false,"le":"U","lm":false,"n":"Corporate Financial Accounting","no":"15.501","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":92.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.515":{"b":[],"ci":false,"cl":"515","co":"15","cw":false,"f":true,"h":6.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"E51-335"],[[[31,3],[91,3]],"E51-335"]],"la":false,"le":"G","lm":false,"n":"Financial Accounting","no":"15.515","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":423.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"15.516":{"b":[],"ci":false,"cl":"516","co":"15","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"E51-395"],[[[37,3],[97,3]],"E51-395"]],"la":false,"le":"G","lm":false,"n":"Corporate Financial Accounting","no":"15.516","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.521":{"b":[],"ci":false,"cl":"521","co":"15","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-376"],[[[43,3],[103,3]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Accounting Information for Decision Makers","no":"15.521","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":70.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.535":{"b":[],"ci":false,"cl":"535","co":"15","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E51-335"],[[[10,3],[70,3]],"E51-335"]],"la":false,"le":"G","lm":false,"n":"Business Analysis Using Financial Statements","no":"15.535","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":127.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.539":{"b":[],"ci":false,"cl":"539","co":"15","cw":false,"f":false,"h":12.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"E62-587"]],"la":false,"le":"G","lm":false,"n":"Doctoral Seminar in Accounting","no":"15.539","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":7.2,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.540":{"b":[],"ci":false,"cl":"540","co":"15","cw":false,"f":false,"h":4.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[68,2]],"E62-687"]],"la":false,"le":"G","lm":false,"n":"Theory Studies in Accounting Research","no":"15.540","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":6.5,"t":["FA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.561":{"b":[],"ci":false,"cl":"561","co":"15","cw":false,"f":false,"h":5.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E62-233"]],"la":false,"le":"G","lm":false,"n":"Information Technology Essentials","no":"15.561","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":52.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.562":{"b":[],"ci":false,"cl":"562","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[94,3]],"E51-149"]],"la":false,"le":"G","lm":false,"n":"Web3 and Strategy: Blockchain, Metaverse, and NFT Essentials","no":"15.562","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.570":{"b":[],"ci":false,"cl":"570","co":"15","cw":false,"f":false,"h":6.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[100,3]],"E62-276"],[[[103,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Digital Marketing and Social Media Analytics","no":"15.570","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":190.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.572":{"b":[],"ci":false,"cl":"572","co":"15","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Analytics Lab: Action Learning Seminar on Analytics, Machine Learning, and the Digital Economy","no":"15.572","nx":false,"pl":false,"r":[[[[109,3]],"E62-276"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":87.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"15.615":{"b":[],"ci":false,"cl":"615","co":"15","cw":false,"f":false,"h":5.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-149"]],"la":false,"le":"G","lm":false,"n":"Essential Law for Business","no":"15.615","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":51.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.6151":{"b":[],"ci":false,"cl":"6151","co":"15","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-149"]],"la":false,"le":"U","lm":false,"n":"Essential Law for Business","no":"15.6151","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":8.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.618":{"b":[],"ci":false,"cl":"618","co":"15","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Startups and the Law","no":"15.618","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":66.8,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.6181":{"b":[],"ci":false,"cl":"6181","co":"15","cw":false,"f":false,"h":3.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,3]],"E51-345"]],"la":false,"le":"U","lm":false,"n":"Startups and the Law","no":"15.6181","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":23.8,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.621":{"b":[],"ci":false,"cl":"621","co":"15","cw":false,"f":false,"h":4.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[16,3],[76,3]],"E51-149"]],"la":false,"le":"G","lm":false,"n":"Your Career and the Law: Key Junctures, Opportunities and Risks","no":"15.621","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":61.7,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.622":{"b":[],"ci":false,"cl":"622","co":"15","cw":false,"f":false,"h":4.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[112,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"The Law of AI, Big Data & Social Media","no":"15.622","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":83.5,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.6221":{"b":[],"ci":false,"cl":"6221","co":"15","cw":false,"f":false,"h":5.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[112,3]],"E62-276"]],"la":false,"le":"U","lm":false,"n":"The Law of AI, Big Data & Social Media","no":"15.6221","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.655":{"b":[],"ci":false,"cl":"655","co":"15","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"E51-057"]],"la":false,"le":"G","lm":false,"n":"Law, Technology, and Public Policy","no":"15.655","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":9.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.657":{"b":[],"ci":false,"cl":"657","co":"15","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,5]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Technology, Globalization, and Sustainable Development","no":"15.657","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":24.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.661":{"b":[],"ci":false,"cl":"661","co":"15","cw":false,"f":false,"h":5.9,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[76,6]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Building Successful Careers and Organizations","no":"15.661","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":86.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.665":{"b":[],"ci":false,"cl":"665","co":"15","cw":false,"f":false,"h":5.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,6]],"E62-276"],[[[47,6]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Power and Negotiation","no":"15.665","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":143.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.669":{"b":[],"ci":false,"cl":"669","co":"15","cw":false,"f":false,"h":5.9,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[76,6]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Strategies for People Analytics","no":"15.669","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":67.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.671":{"b":[],"ci":false,"cl":"671","co":"15","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[109,7]],"E62-233"]],"la":false,"le":"G","lm":false,"n":"U-Lab: Transforming Self, Business and Society","no":"15.671","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":54.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.674":{"b":[],"ci":false,"cl":"674","co":"15","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"37-212"]],"la":false,"le":"G","lm":true,"n":"Leading Creative Teams","no":"15.674","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":35.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.681":{"b":[],"ci":false,"cl":"681","co":"15","cw":false,"f":false,"h":3.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[103,3]],"E62-233"]],"la":false,"le":"G","lm":false,"n":"From Analytics to Action","no":"15.681","nx":false,"pl":false,"r":[],"ra":4.2,"re":false,"rp":false,"s":["l"],"si":56.7,"t":["FA","SU"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.700":{"b":[],"ci":false,"cl":"700","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Leadership and Integrative Management","no":"15.700","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":true,"u1":3,"u2":0,"u3":6,"v":true},"15.702":{"b":[],"ci":false,"cl":"702","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Leading in a Global Context: Macroeconomics and Global Markets","no":"15.702","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":true,"u1":6,"u2":0,"u3":6,"v":true},"15.705":{"b":[],"ci":false,"cl":"705","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Organizations Lab","no":"15.705","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":true},"15.707":{"b":[],"ci":false,"cl":"707","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Global Strategy","no":"15.707","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":true,"u1":3,"u2":0,"u3":3,"v":true},"15.717":{"b":[],"ci":false,"cl":"717","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Organizational Processes","no":"15.717","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":6,"v":true},"15.722":{"b":[],"ci":false,"cl":"722","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Applied Economics for Managers","no":"15.722","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":6,"v":true},"15.724":{"b":[],"ci":false,"cl":"724","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Financial Management","no":"15.724","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":6,"v":true},"15.732":{"b":[],"ci":false,"cl":"732","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Marketing Management","no":"15.732","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":6,"v":true},"15.736":{"b":[],"ci":false,"cl":"736","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Introduction to System Dynamics","no":"15.736","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":true,"u1":3,"u2":0,"u3":6,"v":true},"15.739":{"b":[],"ci":false,"cl":"739","co":"15","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,6]],"E62-262"]],"la":false,"le":"G","lm":false,"n":"Discovering Your Leadership Signature","no":"15.739","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":50.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.761":{"b":[],"ci":false,"cl":"761","co":"15","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E62-276"]],"la":false,"le":"G","lm":false,"n":"Introduction to Operations Management","no":"15.761","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":125.6,"t":["FA","SU","SP"],"tb":true,"u1":4,"u2":0,"u3":5,"v":false},"15.768":{"b":[],"ci":false,"cl":"768","co":"15","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E62-262"],[[[16,3],[76,3]],"E62-262"]],"la":false,"le":"G","lm":false,"n":"Management of Services: Concepts, Design, and Delivery","no":"15.768","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":167.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.770":{"b":[],"ci":false,"cl":"770","co":"15","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Logistics Systems","no":"15.770","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":62.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.774":{"b":[],"ci":false,"cl":"774","co":"15","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"The Analytics of Operations Management","no":"15.774","nx":false,"pl":false,"r":[[[[128,2]],"E51-335"]],"ra":5.9,"re":false,"rp":false,"s":["r","l"],"si":57.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.775":{"b":[],"ci":false,"cl":"775","co":"15","cw":false,"f":false,"h":3.7,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[79,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Analytics Proseminar","no":"15.775","nx":false,"pl":false,"r":[],"ra":4.6,"re":false,"rp":false,"s":["l"],"si":128.3,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"15.777":{"b":[],"ci":false,"cl":"777","co":"15","cw":false,"f":false,"h":10.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Healthcare Lab: Introduction to Healthcare Delivery in the United States","no":"15.777","nx":false,"pl":false,"r":[[[[130,3]],"E51-335"]],"ra":5.7,"re":false,"rp":false,"s":["l","r"],"si":39.3,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":11,"v":false},"15.780":{"b":[],"ci":false,"cl":"780","co":"15","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"E62-223"]],"la":false,"le":"U","lm":false,"n":"Stochastic Models in Business Analytics","no":"15.780","nx":false,"pl":false,"r":[[[[132,2]],"E62-250"]],"ra":6.1,"re":false,"rp":false,"s":["r","l"],"si":30.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.792":{"b":[],"ci":false,"cl":"792","co":"15","cw":false,"f":false,"h":2.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,4]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Global Operations Leadership Seminar","no":"15.792","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":true,"s":["l"],"si":48.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":0,"v":false},"15.794":{"b":[],"ci":false,"cl":"794","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Project in Operations","no":"15.794","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"15.799":{"b":[],"ci":false,"cl":"799","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3]],"E62-550"]],"la":false,"le":"G","lm":false,"n":"Workshop in Operations Management","no":"15.799","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.814":{"b":[],"ci":false,"cl":"814","co":"15","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E62-250"],[[[13,3],[73,3]],"E62-250"]],"la":false,"le":"G","lm":false,"n":"Marketing Innovation","no":"15.814","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":47.8,"t":["FA","SP"],"tb":true,"u1":3,"u2":0,"u3":6,"v":false},"15.818":{"b":[],"ci":false,"cl":"818","co":"15","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-149"],[[[13,3],[73,3]],"E51-149"],[[[4,3],[64,3]],"E51-149"]],"la":false,"le":"G","lm":false,"n":"Pricing","no":"15.818","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":200.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.830":{"b":[],"ci":false,"cl":"830","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Enterprise Management Lab","no":"15.830","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":true},"15.833":{"b":[],"ci":false,"cl":"833","co":"15","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"E62-250"]],"la":false,"le":"G","lm":false,"n":"Business-to-Business Marketing","no":"15.833","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":48.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.838":{"b":[],"ci":false,"cl":"838","co":"15","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,6]],"E62-587"]],"la":false,"le":"G","lm":false,"n":"Research Seminar in Marketing","no":"15.838","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":["l"],"si":16.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.839":{"b":[],"ci":false,"cl":"839","co":"15","cw":false,"f":false,"h":0.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,2]],"E62-550"]],"la":false,"le":"G","lm":false,"n":"Workshop in Marketing","no":"15.839","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":7.2,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.871":{"b":[],"ci":false,"cl":"871","co":"15","cw":false,"f":false,"h":12.3,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E62-223"],[[[13,3],[73,3]],"E62-223"]],"la":false,"le":"G","lm":false,"n":"Introduction to System Dynamics","no":"15.871","nx":false,"pl":false,"r":[[[[124,3]],"E51-315"],[[[133,3]],"E51-335"]],"ra":5.2,"re":false,"rp":false,"s":["r","l"],"si":152.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.873":{"b":[],"ci":false,"cl":"873","co":"15","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E62-223"],[[[13,3],[73,3]],"E62-223"]],"la":false,"le":"G","lm":false,"n":"System Dynamics for Business and Policy","no":"15.873","nx":false,"pl":false,"r":[[[[133,3]],"E51-335"],[[[124,3]],"E51-315"]],"ra":5.6,"re":false,"rp":false,"s":["l","r"],"si":54.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.8731":{"b":[],"ci":false,"cl":"8731","co":"15","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E62-223"],[[[13,3],[73,3]],"E62-223"]],"la":false,"le":"U","lm":false,"n":"System Dynamics: Tools for Solving Complex Problems","no":"15.8731","nx":false,"pl":false,"r":[[[[124,3]],"E51-315"],[[[133,3]],"E51-335"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":6.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.874":{"b":[],"ci":false,"cl":"874","co":"15","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,6]],"66-144"]],"la":false,"le":"U","lm":false,"n":"People and the Planet:  Environmental Governance and Science","no":"15.874","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":14.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.879":{"b":[],"ci":false,"cl":"879","co":"15","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"E62-450"]],"la":false,"le":"G","lm":false,"n":"Research Seminar in System Dynamics","no":"15.879","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":6.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"15.900":{"b":[],"ci":false,"cl":"900","co":"15","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E51-325"],[[[13,3],[73,3]],"E51-325"],[[[1,3],[61,3]],"E51-335"],[[[4,3],[64,3]],"E51-335"]],"la":false,"le":"G","lm":false,"n":"Competitive Strategy","no":"15.900","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":141.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"15.903":{"b":[],"ci":false,"cl":"903","co":"15","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"E51-372"]],"la":false,"le":"G","lm":false,"n":"Managing the Modern Organization: Organizational Economics and Corporate Strategy","no":"15.903","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":35.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.911":{"b":[],"ci":false,"cl":"911","co":"15","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[10,3],[70,3],[130,3]],"E51-145"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurial Strategy","no":"15.911","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":109.0,"t":["FA","SP"],"tb":false,"u1":6,"u2":0,"u3":3,"v":false},"15.941":{"b":[],"ci":false,"cl":"941","co":"15","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[62,6]],"9-357"]],"la":false,"le":"G","lm":true,"n":"Leadership in Real Estate","no":"15.941","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":16.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"15.950":{"b":[],"ci":false,"cl":"950","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Management","no":"15.950","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.951":{"b":[],"ci":false,"cl":"951","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Management","no":"15.951","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.952":{"b":[],"ci":false,"cl":"952","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Curricular Practical Training","no":"15.952","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"15.960":{"b":[],"ci":false,"cl":"960","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Management","no":"15.960","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.961":{"b":[],"ci":false,"cl":"961","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Management","no":"15.961","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"15.999":{"b":[],"ci":false,"cl":"999","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Internship","no":"15.999","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"15.EPE":{"b":[],"ci":false,"cl":"EPE","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"15.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"15.S01":{"b":[],"ci":false,"cl":"S01","co":"15","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S01","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":9.0,"t":["FA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S03":{"b":[],"ci":false,"cl":"S03","co":"15","cw":false,"f":false,"h":5.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S03","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":true,"s":[],"si":33.3,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S08":{"b":[],"ci":false,"cl":"S08","co":"15","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,6]],"E51-145"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S08","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":36.8,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.S10":{"b":[],"ci":false,"cl":"S10","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,6]],"E62-250"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S10","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","JA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.S11":{"b":[],"ci":false,"cl":"S11","co":"15","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S11","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S12":{"b":[],"ci":false,"cl":"S12","co":"15","cw":false,"f":false,"h":6.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,6]],"E62-350"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S12","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":true,"s":["l"],"si":38.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.S16":{"b":[],"ci":false,"cl":"S16","co":"15","cw":false,"f":false,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[19,5]],"E62-221"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S16","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":14.8,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.S20":{"b":[],"ci":false,"cl":"S20","co":"15","cw":false,"f":false,"h":5.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3]],"E40-160"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S20","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":19.7,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.S22":{"b":[],"ci":false,"cl":"S22","co":"15","cw":false,"f":false,"h":3.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S22","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":true,"s":[],"si":128.0,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S23":{"b":[],"ci":false,"cl":"S23","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S23","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S24":{"b":[],"ci":false,"cl":"S24","co":"15","cw":false,"f":false,"h":35.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S24","nx":false,"pl":false,"r":[],"ra":4.7,"re":false,"rp":true,"s":[],"si":14.0,"t":["FA","JA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S43":{"b":[],"ci":false,"cl":"S43","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Seminar in Management","no":"15.S43","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S44":{"b":[],"ci":false,"cl":"S44","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Seminar in Management","no":"15.S44","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S45":{"b":[],"ci":false,"cl":"S45","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Seminar in Management","no":"15.S45","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S46":{"b":[],"ci":false,"cl":"S46","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Seminar in Management","no":"15.S46","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S47":{"b":[],"ci":false,"cl":"S47","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Seminar in Management","no":"15.S47","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S50":{"b":[],"ci":false,"cl":"S50","co":"15","cw":false,"f":false,"h":6.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S50","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":40.5,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S51":{"b":[],"ci":false,"cl":"S51","co":"15","cw":false,"f":false,"h":3.9,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S51","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":[],"si":39.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S54":{"b":[],"ci":false,"cl":"S54","co":"15","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S54","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":true,"s":[],"si":46.8,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S55":{"b":[],"ci":false,"cl":"S55","co":"15","cw":false,"f":false,"h":5.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S55","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":true,"s":[],"si":19.0,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S57":{"b":[],"ci":false,"cl":"S57","co":"15","cw":false,"f":false,"h":2.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S57","nx":false,"pl":false,"r":[],"ra":4.3,"re":false,"rp":true,"s":[],"si":19.0,"t":["FA","JA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.S64":{"b":[],"ci":false,"cl":"S64","co":"15","cw":false,"f":false,"h":12.9,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S64","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":true,"s":[],"si":43.0,"t":["FA","JA","SU"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"15.S70":{"b":[],"ci":false,"cl":"S70","co":"15","cw":false,"f":false,"h":4.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[19,5]],"E62-221"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S70","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":true,"s":["l"],"si":26.2,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.S72":{"b":[],"ci":false,"cl":"S72","co":"15","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,5]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Special Seminar in Management","no":"15.S72","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":true,"s":["l"],"si":43.7,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"15.THG":{"b":[],"ci":false,"cl":"THG","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"15.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"15.UAR":{"b":[],"ci":false,"cl":"UAR","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2],[106,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Climate and Sustainability Undergraduate Advanced Research","no":"15.UAR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"15.UR":{"b":[],"ci":false,"cl":"UR","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Management","no":"15.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"15.URG":{"b":[],"ci":false,"cl":"URG","co":"15","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Studies in Management","no":"15.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"16.001":{"b":[],"ci":false,"cl":"001","co":"16","cw":false,"f":true,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[34,2],[92,4]],"35-225"]],"la":false,"le":"U","lm":false,"n":"Unified Engineering: Materials and Structures","no":"16.001","nx":false,"pl":false,"r":[[[[62,2]],"35-225"]],"ra":6.0,"re":true,"rp":false,"s":["r","l"],"si":60.0,"t":["FA"],"tb":true,"u1":5,"u2":1,"u3":6,"v":false},"16.002":{"b":[],"ci":false,"cl":"002","co":"16","cw":false,"f":true,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[34,2],[122,4]],"35-225"]],"la":false,"le":"U","lm":false,"n":"Unified Engineering: Signals and Systems","no":"16.002","nx":false,"pl":false,"r":[[[[64,2]],"35-225"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":59.3,"t":["FA"],"tb":true,"u1":5,"u2":1,"u3":6,"v":false},"16.07":{"b":[],"ci":false,"cl":"07","co":"16","cw":false,"f":true,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"35-225"]],"la":false,"le":"U","lm":false,"n":"Dynamics","no":"16.07","nx":false,"pl":false,"r":[[[[134,2]],"35-225"]],"ra":4.1,"re":false,"rp":false,"s":["r","l"],"si":37.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"16.100":{"b":[[[[132,2]],"33-319"],[[[134,2]],"33-418"],[[[130,2]],"33-319"],[[[136,2]],"33-418"]],"ci":false,"cl":"100","co":"16","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"33-419"]],"la":false,"le":"U","lm":false,"n":"Aerodynamics","no":"16.100","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["b","l"],"si":23.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"16.110":{"b":[],"ci":false,"cl":"110","co":"16","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"33-418"]],"la":false,"le":"G","lm":false,"n":"Flight Vehicle Aerodynamics","no":"16.110","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":11.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"16.221":{"b":[],"ci":false,"cl":"221","co":"16","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Structural Dynamics","no":"16.221","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":21.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"16.30":{"b":[],"ci":false,"cl":"30","co":"16","cw":false,"f":true,"h":10.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Feedback Control Systems","no":"16.30","nx":false,"pl":false,"r":[[[[134,2]],"33-419"],[[[130,2]],"33-419"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":42.7,"t":["FA"],"tb":true,"u1":4,"u2":1,"u3":7,"v":false},"16.31":{"b":[],"ci":false,"cl":"31","co":"16","cw":false,"f":true,"h":10.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"32-144"]],"la":false,"le":"G","lm":false,"n":"Feedback Control Systems","no":"16.31","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":42.7,"t":["FA"],"tb":true,"u1":3,"u2":1,"u3":8,"v":false},"16.37":{"b":[],"ci":false,"cl":"37","co":"16","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,6]],"33-422"]],"la":false,"le":"G","lm":false,"n":"Data-Communication Networks","no":"16.37","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.391":{"b":[],"ci":false,"cl":"391","co":"16","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"66-168"]],"la":false,"le":"G","lm":false,"n":"Statistics for Engineers and Scientists","no":"16.391","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":15.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.400":{"b":[],"ci":false,"cl":"400","co":"16","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"3-370"]],"la":false,"le":"U","lm":false,"n":"Human Systems Engineering","no":"16.400","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":68.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.410":{"b":[],"ci":false,"cl":"410","co":"16","cw":false,"f":true,"h":11.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Principles of Autonomy and Decision Making","no":"16.410","nx":false,"pl":false,"r":[[[[134,2]],"33-319"],[[[124,2]],"33-319"]],"ra":5.0,"re":false,"rp":false,"s":["l","r"],"si":69.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"16.413":{"b":[],"ci":false,"cl":"413","co":"16","cw":false,"f":true,"h":11.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"Principles of Autonomy and Decision Making","no":"16.413","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":69.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.420":{"b":[],"ci":false,"cl":"420","co":"16","cw":false,"f":false,"h":14.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Planning Under Uncertainty","no":"16.420","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":[],"si":19.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"16.445":{"b":[],"ci":false,"cl":"445","co":"16","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,6]],"33-422"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurship in Aerospace and Mobility Systems","no":"16.445","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.453":{"b":[],"ci":false,"cl":"453","co":"16","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"3-370"]],"la":false,"le":"G","lm":false,"n":"Human Systems Engineering","no":"16.453","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":68.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.459":{"b":[],"ci":false,"cl":"459","co":"16","cw":false,"f":false,"h":3.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Bioengineering Journal Article Seminar","no":"16.459","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":8.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":1,"v":true},"16.511":{"b":[],"ci":false,"cl":"511","co":"16","cw":false,"f":false,"h":18.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"33-319"]],"la":false,"le":"G","lm":false,"n":"Aircraft Engines and Gas Turbines","no":"16.511","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.55":{"b":[],"ci":false,"cl":"55","co":"16","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"33-319"]],"la":false,"le":"G","lm":false,"n":"Ionized Gases","no":"16.55","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.632":{"b":[],"ci":false,"cl":"632","co":"16","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"31-120"]],"la":false,"le":"U","lm":false,"n":"Introduction to Autonomous Machines","no":"16.632","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":22.3,"t":["FA","JA"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"16.633":{"b":[],"ci":false,"cl":"633","co":"16","cw":false,"f":false,"h":1.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,2]],"35-310"]],"la":false,"le":"U","lm":true,"n":"NEET Junior Seminar: Autonomous Machines","no":"16.633","nx":false,"pl":false,"r":[],"ra":4.0,"re":false,"rp":false,"s":["l"],"si":19.0,"t":["FA"],"tb":true,"u1":1,"u2":1,"u3":1,"v":false},"16.634":{"b":[],"ci":false,"cl":"634","co":"16","cw":false,"f":false,"h":2.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,2]],"35-308"]],"la":false,"le":"U","lm":true,"n":"NEET Senior Seminar: Autonomous Machines","no":"16.634","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":1,"u2":1,"u3":1,"v":false},"16.650":{"b":[[[[130,4]],"32-124"],[[[122,4]],"32-124"],[[[134,4]],"32-124"]],"ci":false,"cl":"650","co":"16","cw":false,"f":false,"h":3.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Engineering Leadership Lab","no":"16.650","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["b"],"si":147.6,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":1,"v":false},"16.651":{"b":[],"ci":false,"cl":"651","co":"16","cw":false,"f":false,"h":3.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3]],"4-153"],[[[40,3]],"4-153"],[[[10,3]],"4-153"],[[[36,3]],"4-153"]],"la":false,"le":"U","lm":false,"n":"Engineering Leadership","no":"16.651","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":true,"s":["l"],"si":116.4,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"16.653":{"b":[[[[106,2]],"1-375"],[[[34,2]],"1-375"],[[[130,2]],"1-375"],[[[16,2]],"1-375"]],"ci":false,"cl":"653","co":"16","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"35-225"]],"la":false,"le":"U","lm":false,"n":"Management in Engineering","no":"16.653","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b","l"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"16.6621":{"b":[],"ci":false,"cl":"6621","co":"16","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":true,"n":"Introduction to Design Thinking and Innovation in Engineering","no":"16.6621","nx":false,"pl":false,"r":[[[[76,2]],"35-308"],[[[26,2]],"32-141"],[[[46,2]],"35-308"]],"ra":7.0,"re":false,"rp":false,"s":["l","r"],"si":36.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"16.662A":{"b":[],"ci":false,"cl":"662A","co":"16","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Design Thinking and Innovation Leadership for Engineers","no":"16.662A","nx":false,"pl":false,"r":[[[[82,2]],"4-231"]],"ra":0.0,"re":false,"rp":false,"s":["l","r"],"si":0.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"16.662B":{"b":[],"ci":false,"cl":"662B","co":"16","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Design Thinking and Innovation Project","no":"16.662B","nx":false,"pl":false,"r":[[[[76,2]],"35-308"],[[[46,2]],"35-308"],[[[26,2]],"32-141"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":45.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"16.667":{"b":[[[[134,4]],"32-124"],[[[122,4]],"32-124"],[[[130,4]],"32-124"]],"ci":false,"cl":"667","co":"16","cw":false,"f":false,"h":3.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Engineering Leadership Lab","no":"16.667","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["b"],"si":147.6,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"16.676":{"b":[],"ci":false,"cl":"676","co":"16","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"66-144"],[[[82,4]],"66-144"],[[[44,4]],"66-148"],[[[74,4]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Ethics for Engineers","no":"16.676","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":59.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"16.681":{"b":[],"ci":false,"cl":"681","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Topics in Aeronautics and Astronautics","no":"16.681","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"16.691":{"b":[],"ci":false,"cl":"691","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Practicum Experience","no":"16.691","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"16.71":{"b":[],"ci":false,"cl":"71","co":"16","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"33-419"]],"la":false,"le":"G","lm":false,"n":"The Airline Industry","no":"16.71","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":30.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.715":{"b":[],"ci":false,"cl":"715","co":"16","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"33-319"]],"la":false,"le":"G","lm":false,"n":"Aerospace, Energy, and the Environment","no":"16.715","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":4.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.781":{"b":[],"ci":false,"cl":"781","co":"16","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"33-422"]],"la":false,"le":"G","lm":false,"n":"Planning and Design of Airport Systems","no":"16.781","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":19.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.82":{"b":[[[[44,4],[104,4]],"33-419"]],"ci":false,"cl":"82","co":"16","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,2],[102,2]],"33-419"]],"la":false,"le":"U","lm":false,"n":"Flight Vehicle Engineering","no":"16.82","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["b","l"],"si":18.5,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"16.842":{"b":[],"ci":false,"cl":"842","co":"16","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4]],"33-218"]],"la":false,"le":"G","lm":false,"n":"Fundamentals of Systems Engineering","no":"16.842","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"16.851":{"b":[],"ci":false,"cl":"851","co":"16","cw":false,"f":false,"h":14.4,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"3-333"]],"la":false,"le":"G","lm":false,"n":"Introduction to Satellite Engineering","no":"16.851","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":32.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"16.853":{"b":[],"ci":false,"cl":"853","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"3-333"]],"la":false,"le":"G","lm":false,"n":"Advanced Satellite Engineering","no":"16.853","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"16.857":{"b":[],"ci":false,"cl":"857","co":"16","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,6]],"E14-493"]],"la":false,"le":"G","lm":true,"n":"Asking How Space Enabled Designs Advance Justice and Development","no":"16.857","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.861":{"b":[],"ci":false,"cl":"861","co":"16","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":true,"n":"Engineering Systems Analysis for Design","no":"16.861","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":17.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.863":{"b":[],"ci":false,"cl":"863","co":"16","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"4-149"]],"la":false,"le":"G","lm":true,"n":"System Safety Concepts","no":"16.863","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":32.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.886":{"b":[],"ci":false,"cl":"886","co":"16","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"33-319"]],"la":false,"le":"G","lm":false,"n":"Air Transportation Systems Architecting","no":"16.886","nx":true,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":true,"u1":3,"u2":2,"u3":7,"v":false},"16.893":{"b":[],"ci":false,"cl":"893","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,4],[62,4]],"33-319"]],"la":false,"le":"G","lm":false,"n":"Engineering the Space Shuttle","no":"16.893","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.910":{"b":[],"ci":false,"cl":"910","co":"16","cw":false,"f":false,"h":15.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"32-155"]],"la":false,"le":"G","lm":false,"n":"Introduction to Modeling and Simulation","no":"16.910","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":54.3,"t":["FA"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"16.920":{"b":[],"ci":false,"cl":"920","co":"16","cw":false,"f":false,"h":15.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"37-212"]],"la":false,"le":"G","lm":false,"n":"Numerical Methods for Partial Differential Equations","no":"16.920","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":29.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.940":{"b":[],"ci":false,"cl":"940","co":"16","cw":false,"f":false,"h":18.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"3-270"]],"la":false,"le":"G","lm":false,"n":"Numerical Methods for Stochastic Modeling and Inference","no":"16.940","nx":true,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":28.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.950":{"b":[],"ci":false,"cl":"950","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"33-418"]],"la":false,"le":"G","lm":false,"n":"Fundamentals of Turbulence","no":"16.950","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"16.971":{"b":[],"ci":false,"cl":"971","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practicum Experience","no":"16.971","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"16.985":{"b":[],"ci":false,"cl":"985","co":"16","cw":false,"f":false,"h":2.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,4]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Global Operations Leadership Seminar","no":"16.985","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":true,"s":["l"],"si":48.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":0,"v":false},"16.990":{"b":[],"ci":false,"cl":"990","co":"16","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"37-212"]],"la":false,"le":"G","lm":true,"n":"Leading Creative Teams","no":"16.990","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":35.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"16.995":{"b":[],"ci":false,"cl":"995","co":"16","cw":false,"f":false,"h":4.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,4]],"1-390"]],"la":false,"le":"G","lm":true,"n":"Doctoral Research and Communication Seminar","no":"16.995","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":15.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"16.997":{"b":[],"ci":false,"cl":"997","co":"16","cw":false,"f":false,"h":4.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,2]],"37-212"]],"la":false,"le":"G","lm":true,"n":"How To Do Excellent Research","no":"16.997","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"16.999":{"b":[],"ci":false,"cl":"999","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching in Aeronautics and Astronautics","no":"16.999","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"16.C20":{"b":[],"ci":false,"cl":"C20","co":"16","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"33-418"]],"la":false,"le":"U","lm":false,"n":"[16.0002] Introduction to Computational Science and Engineering","no":"16.C20","nx":false,"on":"16.0002","pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":32.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"16.EPE":{"b":[],"ci":false,"cl":"EPE","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"16.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"16.EPW":{"b":[],"ci":false,"cl":"EPW","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"16.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"16.S686":{"b":[],"ci":false,"cl":"S686","co":"16","cw":false,"f":false,"h":6.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-131"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Aeronautics and Astronautics","no":"16.S686","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"16.THG":{"b":[],"ci":false,"cl":"THG","co":"16","cw":false,"f":false,"h":31.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"16.THG","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":[],"si":251.2,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"16.UR":{"b":[],"ci":false,"cl":"UR","co":"16","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"16.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"17.000":{"b":[],"ci":false,"cl":"000","co":"17","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[71,4]],"E53-438"]],"la":false,"le":"G","lm":false,"n":"Political Philosophy","no":"17.000","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":15.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.035":{"b":[],"ci":false,"cl":"035","co":"17","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,3],[64,3]],"E51-385"]],"la":false,"le":"U","lm":false,"n":"Libertarianism in History","no":"17.035","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.20":{"b":[],"ci":true,"cl":"20","co":"17","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[36,2],[96,2]],"66-168"]],"la":false,"le":"U","lm":true,"n":"Introduction to the American Political Process","no":"17.20","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":22.8,"t":["FA","SP"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"17.200":{"b":[],"ci":false,"cl":"200","co":"17","cw":false,"f":false,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[92,4]],"E51-390"]],"la":false,"le":"G","lm":false,"n":"American Political Behavior I","no":"17.200","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.263":{"b":[],"ci":false,"cl":"263","co":"17","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[44,3],[104,3]],"8-205"]],"la":false,"le":"U","lm":false,"n":"Electoral Politics, Public Opinion, and Democracy","no":"17.263","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.269":{"b":[],"ci":false,"cl":"269","co":"17","cw":false,"f":false,"h":8.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[14,3],[74,3]],"5-217"]],"la":false,"le":"U","lm":false,"n":"Race, Ethnicity, and American Politics","no":"17.269","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.275":{"b":[],"ci":false,"cl":"275","co":"17","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[40,4]],"1-375"]],"la":false,"le":"U","lm":false,"n":"Public Opinion Research Design and Training Seminar","no":"17.275","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"17.276":{"b":[],"ci":false,"cl":"276","co":"17","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,4]],"E53-485"]],"la":false,"le":"G","lm":false,"n":"Public Opinion Research Training Lab","no":"17.276","nx":true,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.30":{"b":[],"ci":true,"cl":"30","co":"17","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[36,3],[96,3]],"4-270"]],"la":false,"le":"U","lm":false,"n":"Making Public Policy","no":"17.30","nx":false,"pl":false,"r":[[[[132,2]],"5-234"],[[[124,2]],"9-255"],[[[44,2]],"9-255"],[[[126,2]],"9-255"],[[[104,2]],"9-255"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":61.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"17.307":{"b":[],"ci":false,"cl":"307","co":"17","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[],"la":false,"le":"U","lm":false,"n":"American Public Policy for Washington Interns","no":"17.307","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":[],"si":16.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"17.381":{"b":[],"ci":false,"cl":"381","co":"17","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[4,4],[64,4]],"9-255"]],"la":false,"le":"U","lm":true,"n":"Leadership in Negotiation: Advanced Applications","no":"17.381","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":23.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"17.40":{"b":[],"ci":true,"cl":"40","co":"17","cw":false,"f":true,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[6,2],[66,2]],"24-121"]],"la":false,"le":"U","lm":false,"n":"American Foreign Policy: Past, Present, and Future","no":"17.40","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":37.3,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"17.407":{"b":[],"ci":false,"cl":"407","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[3,3],[63,3]],"66-154"]],"la":false,"le":"U","lm":false,"n":"Chinese Foreign Policy","no":"17.407","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.418":{"b":[],"ci":false,"cl":"418","co":"17","cw":false,"f":false,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4]],"E53-485"]],"la":false,"le":"G","lm":false,"n":"Field Seminar in International Relations Theory","no":"17.418","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":7.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.468":{"b":[],"ci":false,"cl":"468","co":"17","cw":false,"f":false,"h":12.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[104,4]],"E51-390"]],"la":false,"le":"G","lm":false,"n":"Foundations of Security Studies","no":"17.468","nx":true,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.480":{"b":[],"ci":false,"cl":"480","co":"17","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[100,4]],"E40-496"]],"la":false,"le":"G","lm":false,"n":"Understanding Modern Military Operations","no":"17.480","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.486":{"b":[],"ci":false,"cl":"486","co":"17","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"E53-438"]],"la":false,"le":"G","lm":false,"n":"Japan and East Asian Security","no":"17.486","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.490":{"b":[],"ci":false,"cl":"490","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,4]],"E53-485"]],"la":false,"le":"G","lm":false,"n":"Political Economy of International Security","no":"17.490","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.50":{"b":[],"ci":true,"cl":"50","co":"17","cw":false,"f":true,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[12,2],[72,2]],"66-160"]],"la":false,"le":"U","lm":true,"n":"Introduction to Comparative Politics","no":"17.50","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":30.0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"17.526":{"b":[],"ci":false,"cl":"526","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[92,4]],"E53-485"]],"la":false,"le":"G","lm":false,"n":"Comparative Urban Development","no":"17.526","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.571":{"b":[],"ci":false,"cl":"571","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[44,4]],"1-375"]],"la":false,"le":"U","lm":false,"n":"Engineering Democratic Development in Africa","no":"17.571","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"17.590":{"b":[],"ci":false,"cl":"590","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,4]],"E51-390"]],"la":false,"le":"G","lm":false,"n":"State Building","no":"17.590","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.800":{"b":[],"ci":false,"cl":"800","co":"17","cw":false,"f":false,"h":20.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E51-057"]],"la":false,"le":"G","lm":true,"n":"Quantitative Research Methods I: Regression","no":"17.800","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l"],"si":24.0,"t":["FA"],"tb":true,"u1":4,"u2":0,"u3":8,"v":false},"17.801":{"b":[],"ci":false,"cl":"801","co":"17","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[6,4]],"E51-393"]],"la":false,"le":"U","lm":false,"n":"Political Science Scope and Methods","no":"17.801","nx":false,"pl":false,"r":[[[[66,2]],"E51-393"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":8.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.804":{"b":[],"ci":false,"cl":"804","co":"17","cw":false,"f":false,"h":18.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"E53-438"]],"la":false,"le":"G","lm":true,"n":"Quantitative Research Methods III: Generalized Linear Models and Extensions","no":"17.804","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":14.0,"t":["FA"],"tb":true,"u1":4,"u2":0,"u3":8,"v":false},"17.850":{"b":[],"ci":false,"cl":"850","co":"17","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[75,4]],"E53-485"]],"la":false,"le":"G","lm":true,"n":"Political Science Scope and Methods","no":"17.850","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"17.902":{"b":[],"ci":false,"cl":"902","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Political Science Internship and Research","no":"17.902","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"17.959":{"b":[],"ci":false,"cl":"959","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for General Exams","no":"17.959","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"17.S918":{"b":[],"ci":false,"cl":"S918","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"1-375"]],"la":false,"le":"U","lm":false,"n":"Special Undergraduate Subject in Political Science","no":"17.S918","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"17.S950":{"b":[],"ci":false,"cl":"S950","co":"17","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,4]],"E53-438"]],"la":false,"le":"G","lm":false,"n":"Special Graduate Subject in Political Science","no":"17.S950","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":4.2,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"17.S951":{"b":[],"ci":false,"cl":"S951","co":"17","cw":false,"f":false,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"E51-385"]],"la":false,"le":"G","lm":false,"n":"Special Graduate Subject in Political Science","no":"17.S951","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":6.2,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"17.S953":{"b":[],"ci":false,"cl":"S953","co":"17","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,4]],"E53-438"]],"la":false,"le":"G","lm":false,"n":"Special Graduate Subject in Political Science","no":"17.S953","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":["l"],"si":0.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"17.THG":{"b":[],"ci":false,"cl":"THG","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Political Science Thesis","no":"17.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"17.THT":{"b":[],"ci":false,"cl":"THT","co":"17","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Thesis Research Design Seminar","no":"17.THT","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"17.THU":{"b":[],"ci":false,"cl":"THU","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Political Science Thesis","no":"17.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"17.UR":{"b":[],"ci":false,"cl":"UR","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"17.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"17.URG":{"b":[],"ci":false,"cl":"URG","co":"17","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"17.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"18.01":{"b":[],"ci":false,"cl":"01","co":"18","cw":false,"f":true,"h":5.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2],[100,2],[132,2]],"10-250"]],"la":false,"le":"U","lm":false,"n":"Calculus","no":"18.01","nx":false,"pl":false,"r":[[[[6,2],[66,2]],"2-139"],[[[10,2],[70,2]],"2-136"],[[[12,2],[72,2]],"2-139"],[[[4,2],[64,2]],"2-143"],[[[2,2],[62,2]],"2-143"],[[[8,2],[68,2]],"2-131"]],"ra":3.7,"re":false,"rp":false,"s":["r","l"],"si":111.6,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.01A":{"b":[],"ci":false,"cl":"01A","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[40,2],[100,2],[132,2]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Calculus","no":"18.01A","nx":false,"pl":false,"r":[[[[10,2],[70,2]],"2-143"],[[[2,2],[62,2]],"2-142"],[[[8,2],[68,2]],"2-143"],[[[14,2],[74,2]],"2-136"],[[[4,2],[64,2]],"2-142"],[[[6,2],[66,2]],"2-143"],[[[12,2],[72,2]],"2-136"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.02":{"b":[],"ci":false,"cl":"02","co":"18","cw":false,"f":true,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2],[100,2],[132,2]],"26-100"]],"la":false,"le":"U","lm":false,"n":"Calculus","no":"18.02","nx":false,"pl":false,"r":[[[[4,2],[64,2]],"2-135"],[[[12,2],[72,2]],"2-143"],[[[8,2],[68,2]],"2-139"],[[[10,2],[70,2]],"2-147"],[[[6,2],[66,2]],"2-147"],[[[14,2],[74,2]],"2-147"],[[[2,2],[62,2]],"2-135"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":296.0,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.022":{"b":[],"ci":false,"cl":"022","co":"18","cw":false,"f":true,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2],[100,2],[132,2]],"4-370"]],"la":false,"le":"U","lm":false,"n":"Calculus","no":"18.022","nx":false,"pl":false,"r":[[[[12,2],[72,2]],"2-146"],[[[8,2],[68,2]],"2-146"],[[[10,2],[70,2]],"2-146"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":82.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.02A":{"b":[],"ci":false,"cl":"02A","co":"18","cw":false,"f":true,"h":12.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[40,2],[100,2],[132,2]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Calculus","no":"18.02A","nx":false,"pl":false,"r":[[[[2,2],[62,2]],"2-142"],[[[4,2],[64,2]],"2-142"],[[[8,2],[68,2]],"2-143"],[[[12,2],[72,2]],"2-136"],[[[6,2],[66,2]],"2-143"],[[[14,2],[74,2]],"2-136"],[[[10,2],[70,2]],"2-143"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":170.8,"t":["FA","JA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.03":{"b":[],"ci":false,"cl":"03","co":"18","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"26-100"]],"la":false,"le":"U","lm":false,"n":"Differential Equations","no":"18.03","nx":false,"pl":false,"r":[[[[38,2],[98,2]],"2-139"],[[[42,2],[102,2]],"2-136"],[[[36,2],[96,2]],"2-139"],[[[32,2],[92,2]],"2-139"],[[[44,2],[104,2]],"2-136"],[[[40,2],[100,2]],"2-139"],[[[34,2],[94,2]],"2-142"]],"ra":5.1,"re":true,"rp":false,"s":["r","l"],"si":325.4,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.06":{"b":[],"ci":false,"cl":"06","co":"18","cw":false,"f":true,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"26-100"]],"la":false,"le":"U","lm":false,"n":"Linear Algebra","no":"18.06","nx":false,"pl":false,"r":[[[[40,2]],"2-146"],[[[36,2]],"2-146"],[[[32,2]],"2-143"],[[[38,2]],"2-361"],[[[42,2]],"2-146"],[[[34,2]],"2-146"],[[[44,2]],"2-142"]],"ra":5.1,"re":true,"rp":false,"s":["r","l"],"si":190.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"18.062":{"b":[],"ci":false,"cl":"062","co":"18","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"26-100"]],"la":false,"le":"U","lm":false,"n":"Mathematics for Computer Science","no":"18.062","nx":false,"pl":false,"r":[[[[68,2],[128,2]],"36-144"],[[[70,2],[130,2]],"26-168"],[[[72,2],[132,2]],"24-307"],[[[76,2],[136,2]],"26-168"],[[[66,2],[126,2]],"36-144"],[[[64,2],[124,2]],"36-144"],[[[74,2],[134,2]],"24-307"]],"ra":5.1,"re":true,"rp":false,"s":["r","l"],"si":268.2,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.085":{"b":[],"ci":false,"cl":"085","co":"18","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"4-237"]],"la":false,"le":"U","lm":false,"n":"Computational Science and Engineering I","no":"18.085","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":56.8,"t":["FA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.0851":{"b":[],"ci":false,"cl":"0851","co":"18","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Computational Science and Engineering I","no":"18.0851","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":56.8,"t":["FA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.098":{"b":[],"ci":false,"cl":"098","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Internship in Mathematics","no":"18.098","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"18.099":{"b":[],"ci":false,"cl":"099","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"18.099","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"18.1001":{"b":[],"ci":false,"cl":"1001","co":"18","cw":false,"f":true,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"2-190"]],"la":false,"le":"G","lm":false,"n":"Real Analysis","no":"18.1001","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":38.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.1002":{"b":[],"ci":false,"cl":"1002","co":"18","cw":false,"f":true,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-163"]],"la":false,"le":"G","lm":false,"n":"Real Analysis","no":"18.1002","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":49.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.100A":{"b":[],"ci":false,"cl":"100A","co":"18","cw":false,"f":true,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"2-190"]],"la":false,"le":"U","lm":false,"n":"Real Analysis","no":"18.100A","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":38.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.100B":{"b":[],"ci":false,"cl":"100B","co":"18","cw":false,"f":true,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-163"]],"la":false,"le":"U","lm":false,"n":"Real Analysis","no":"18.100B","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":49.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.100Q":{"b":[],"ci":false,"cl":"100Q","co":"18","cw":false,"f":true,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-132"]],"la":false,"le":"U","lm":true,"n":"Real Analysis","no":"18.100Q","nx":false,"pl":false,"r":[[[[128,2]],"2-132"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":11.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":11,"v":false},"18.101":{"b":[],"ci":false,"cl":"101","co":"18","cw":false,"f":true,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"2-132"]],"la":false,"le":"U","lm":false,"n":"Analysis and Manifolds","no":"18.101","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.1011":{"b":[],"ci":false,"cl":"1011","co":"18","cw":false,"f":true,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"2-132"]],"la":false,"le":"G","lm":false,"n":"Analysis and Manifolds","no":"18.1011","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.103":{"b":[],"ci":false,"cl":"103","co":"18","cw":false,"f":true,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"2-132"]],"la":false,"le":"U","lm":false,"n":"Fourier Analysis: Theory and Applications","no":"18.103","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":14.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.1031":{"b":[],"ci":false,"cl":"1031","co":"18","cw":false,"f":true,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"2-132"]],"la":false,"le":"G","lm":false,"n":"Fourier Analysis: Theory and Applications","no":"18.1031","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":14.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.104":{"b":[],"ci":false,"cl":"104","co":"18","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2],[72,2],[132,2]],"2-151"]],"la":false,"le":"U","lm":true,"n":"Seminar in Analysis","no":"18.104","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":14.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.112":{"b":[],"ci":false,"cl":"112","co":"18","cw":false,"f":true,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"4-237"]],"la":false,"le":"U","lm":false,"n":"Functions of a Complex Variable","no":"18.112","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":34.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.1121":{"b":[],"ci":false,"cl":"1121","co":"18","cw":false,"f":true,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Functions of a Complex Variable","no":"18.1121","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":34.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.116":{"b":[],"ci":false,"cl":"116","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-135"]],"la":false,"le":"G","lm":false,"n":"Riemann Surfaces","no":"18.116","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.155":{"b":[],"ci":false,"cl":"155","co":"18","cw":false,"f":false,"h":12.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-147"]],"la":false,"le":"G","lm":false,"n":"Differential Analysis I","no":"18.155","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":15.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.200A":{"b":[],"ci":false,"cl":"200A","co":"18","cw":false,"f":true,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"2-190"]],"la":false,"le":"U","lm":false,"n":"Principles of Discrete Applied Mathematics","no":"18.200A","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":19.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.204":{"b":[],"ci":false,"cl":"204","co":"18","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"2-151"]],"la":false,"le":"U","lm":true,"n":"Undergraduate Seminar in Discrete Mathematics","no":"18.204","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":30.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.211":{"b":[],"ci":false,"cl":"211","co":"18","cw":false,"f":false,"h":9.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"E25-111"]],"la":false,"le":"U","lm":false,"n":"Combinatorial Analysis","no":"18.211","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.217":{"b":[],"ci":false,"cl":"217","co":"18","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Combinatorial Theory","no":"18.217","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":21.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.226":{"b":[],"ci":false,"cl":"226","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"4-370"]],"la":false,"le":"G","lm":false,"n":"Probabilistic Methods in Combinatorics","no":"18.226","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.305":{"b":[],"ci":false,"cl":"305","co":"18","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2],[72,2],[132,2]],"2-132"]],"la":false,"le":"G","lm":false,"n":"Advanced Analytic Methods in Science and Engineering","no":"18.305","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":7.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.327":{"b":[],"ci":false,"cl":"327","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,3],[69,3]],"2-142"]],"la":false,"le":"G","lm":false,"n":"Topics in Applied Mathematics","no":"18.327","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.336":{"b":[],"ci":false,"cl":"336","co":"18","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"2-147"]],"la":false,"le":"G","lm":false,"n":"Fast Methods for Partial Differential and Integral Equations","no":"18.336","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.338":{"b":[],"ci":false,"cl":"338","co":"18","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"2-139"]],"la":false,"le":"G","lm":false,"n":"Eigenvalues of Random Matrices","no":"18.338","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.353":{"b":[],"ci":false,"cl":"353","co":"18","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E25-117"]],"la":false,"le":"U","lm":false,"n":"Nonlinear Dynamics: Chaos","no":"18.353","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.357":{"b":[],"ci":false,"cl":"357","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"2-135"]],"la":false,"le":"G","lm":false,"n":"Interfacial Phenomena","no":"18.357","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.384":{"b":[],"ci":false,"cl":"384","co":"18","cw":false,"f":false,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-151"]],"la":false,"le":"U","lm":true,"n":"Undergraduate Seminar in Physical Mathematics","no":"18.384","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":6.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.404":{"b":[],"ci":false,"cl":"404","co":"18","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Theory of Computation","no":"18.404","nx":false,"pl":false,"r":[[[[124,2]],"2-135"],[[[134,2]],"2-139"],[[[130,2]],"2-147"],[[[126,2]],"2-135"],[[[132,2]],"2-139"],[[[128,2]],"2-147"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":207.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"18.4041":{"b":[],"ci":false,"cl":"4041","co":"18","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"34-101"]],"la":false,"le":"G","lm":false,"n":"Theory of Computation","no":"18.4041","nx":false,"pl":false,"r":[[[[132,2]],"2-139"],[[[124,2]],"2-135"],[[[126,2]],"2-135"],[[[130,2]],"2-147"],[[[134,2]],"2-139"],[[[128,2]],"2-147"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":207.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"18.408":{"b":[],"ci":false,"cl":"408","co":"18","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"4-145"]],"la":false,"le":"G","lm":false,"n":"Topics in Theoretical Computer Science","no":"18.408","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":37.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.410":{"b":[],"ci":false,"cl":"410","co":"18","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Design and Analysis of Algorithms","no":"18.410","nx":false,"pl":false,"r":[[[[130,2]],"26-210"],[[[124,2]],"36-156"],[[[128,2]],"26-210"],[[[126,2]],"36-156"],[[[132,2]],"36-153"],[[[134,2]],"36-153"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":215.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"18.415":{"b":[],"ci":false,"cl":"415","co":"18","cw":false,"f":false,"h":19.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3],[133,3]],"32-123"]],"la":false,"le":"G","lm":false,"n":"Advanced Algorithms","no":"18.415","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":67.0,"t":["FA"],"tb":true,"u1":5,"u2":0,"u3":7,"v":false},"18.418":{"b":[],"ci":false,"cl":"418","co":"18","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"2-136"]],"la":false,"le":"G","lm":false,"n":"Topics in Computational Molecular Biology","no":"18.418","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":12.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.425":{"b":[],"ci":false,"cl":"425","co":"18","cw":false,"f":false,"h":15.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-190"]],"la":false,"le":"G","lm":false,"n":"Cryptography and Cryptanalysis","no":"18.425","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":41.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.434":{"b":[],"ci":false,"cl":"434","co":"18","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"2-151"]],"la":false,"le":"U","lm":true,"n":"Seminar in Theoretical Computer Science","no":"18.434","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.435":{"b":[],"ci":false,"cl":"435","co":"18","cw":false,"f":true,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"2-190"]],"la":false,"le":"G","lm":false,"n":"Quantum Computation","no":"18.435","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":79.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.437":{"b":[],"ci":false,"cl":"437","co":"18","cw":false,"f":false,"h":17.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"Distributed Algorithms","no":"18.437","nx":true,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":35.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.600":{"b":[],"ci":false,"cl":"600","co":"18","cw":false,"f":true,"h":9.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Probability and Random Variables","no":"18.600","nx":false,"pl":false,"r":[[[[104,2]],"4-163"],[[[94,2]],"1-190"],[[[106,2]],"4-163"],[[[98,2]],"4-153"]],"ra":6.2,"re":true,"rp":false,"s":["r","l"],"si":187.8,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"18.642":{"b":[],"ci":false,"cl":"642","co":"18","cw":false,"f":false,"h":11.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"4-261"]],"la":false,"le":"U","lm":false,"n":"Topics in Mathematics with Applications in Finance","no":"18.642","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":15.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.650":{"b":[],"ci":false,"cl":"650","co":"18","cw":false,"f":true,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-190"]],"la":false,"le":"U","lm":false,"n":"Fundamentals of Statistics","no":"18.650","nx":false,"pl":false,"r":[[[[68,2]],"4-163"],[[[66,2]],"4-163"],[[[72,2]],"4-237"]],"ra":5.1,"re":false,"rp":false,"s":["r","l"],"si":67.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"18.6501":{"b":[],"ci":false,"cl":"6501","co":"18","cw":false,"f":true,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-190"]],"la":false,"le":"G","lm":false,"n":"Fundamentals of Statistics","no":"18.6501","nx":false,"pl":false,"r":[[[[68,2]],"4-163"],[[[66,2]],"4-163"],[[[72,2]],"4-237"]],"ra":5.1,"re":false,"rp":false,"s":["r","l"],"si":67.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"18.675":{"b":[],"ci":false,"cl":"675","co":"18","cw":false,"f":false,"h":13.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"4-370"]],"la":false,"le":"G","lm":false,"n":"Theory of Probability","no":"18.675","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":23.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.700":{"b":[],"ci":false,"cl":"700","co":"18","cw":false,"f":true,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-190"]],"la":false,"le":"U","lm":false,"n":"Linear Algebra","no":"18.700","nx":false,"pl":false,"r":[],"ra":5.6,"re":true,"rp":false,"s":["l"],"si":31.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.701":{"b":[],"ci":false,"cl":"701","co":"18","cw":false,"f":false,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Algebra I","no":"18.701","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":116.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.704":{"b":[],"ci":false,"cl":"704","co":"18","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-147"]],"la":false,"le":"U","lm":true,"n":"Seminar in Algebra","no":"18.704","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.705":{"b":[],"ci":false,"cl":"705","co":"18","cw":false,"f":true,"h":10.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"2-131"]],"la":false,"le":"G","lm":false,"n":"Commutative Algebra","no":"18.705","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":26.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.725":{"b":[],"ci":false,"cl":"725","co":"18","cw":false,"f":false,"h":13.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-135"]],"la":false,"le":"G","lm":false,"n":"Algebraic Geometry I","no":"18.725","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.745":{"b":[],"ci":false,"cl":"745","co":"18","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-131"]],"la":false,"le":"G","lm":false,"n":"Lie Groups and Lie Algebras I","no":"18.745","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.785":{"b":[],"ci":false,"cl":"785","co":"18","cw":false,"f":false,"h":15.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"2-131"]],"la":false,"le":"G","lm":false,"n":"Number Theory I","no":"18.785","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":13.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.821":{"b":[],"ci":false,"cl":"821","co":"18","cw":false,"f":false,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,4],[92,4]],"2-131"]],"la":true,"le":"U","lm":true,"n":"Project Laboratory in Mathematics","no":"18.821","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":19.4,"t":["FA","SP"],"tb":true,"u1":3,"u2":6,"u3":3,"v":false},"18.901":{"b":[],"ci":false,"cl":"901","co":"18","cw":false,"f":true,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"4-237"]],"la":false,"le":"U","lm":false,"n":"Introduction to Topology","no":"18.901","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":21.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.9011":{"b":[],"ci":false,"cl":"9011","co":"18","cw":false,"f":true,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Introduction to Topology","no":"18.9011","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":21.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.905":{"b":[],"ci":false,"cl":"905","co":"18","cw":false,"f":false,"h":10.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-105"]],"la":false,"le":"G","lm":false,"n":"Algebraic Topology I","no":"18.905","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":27.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.919":{"b":[],"ci":false,"cl":"919","co":"18","cw":false,"f":false,"h":14.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"2-136"]],"la":false,"le":"G","lm":false,"n":"Graduate Topology Seminar","no":"18.919","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":8.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.950":{"b":[],"ci":false,"cl":"950","co":"18","cw":false,"f":true,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-131"]],"la":false,"le":"U","lm":false,"n":"Differential Geometry","no":"18.950","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.9501":{"b":[],"ci":false,"cl":"9501","co":"18","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Differential Geometry","no":"18.9501","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":[],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"18.965":{"b":[],"ci":false,"cl":"965","co":"18","cw":false,"f":false,"h":13.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-270"]],"la":false,"le":"G","lm":false,"n":"Geometry of Manifolds I","no":"18.965","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":15.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.994":{"b":[],"ci":false,"cl":"994","co":"18","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2],[74,2],[134,2]],"2-151"]],"la":false,"le":"U","lm":true,"n":"Seminar in Geometry","no":"18.994","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"18.999":{"b":[],"ci":false,"cl":"999","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Mathematics","no":"18.999","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"18.C06":{"b":[],"ci":false,"cl":"C06","co":"18","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"4-370"]],"la":false,"le":"U","lm":false,"n":"[18.061] Linear Algebra and Optimization","no":"18.C06","nx":false,"on":"18.061","pl":false,"r":[[[[38,2],[98,2]],"4-149"],[[[44,2],[104,2]],"2-139"],[[[40,2],[100,2]],"4-149"],[[[34,2],[94,2]],"2-135"]],"ra":5.4,"re":true,"rp":false,"s":["r","l"],"si":46.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"18.C20":{"b":[],"ci":false,"cl":"C20","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"33-418"]],"la":false,"le":"U","lm":false,"n":"Introduction to Computational Science and Engineering","no":"18.C20","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"18.S191":{"b":[],"ci":false,"cl":"S191","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-131"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Mathematics","no":"18.S191","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"18.S996":{"b":[],"ci":false,"cl":"S996","co":"18","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-143"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Mathematics","no":"18.S996","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"18.THG":{"b":[],"ci":false,"cl":"THG","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"18.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"18.THU":{"b":[],"ci":false,"cl":"THU","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Thesis","no":"18.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"18.UR":{"b":[],"ci":false,"cl":"UR","co":"18","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"18.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.00":{"b":[[[[132,6]],"3-004"],[[[102,6]],"3-004"],[[[93,6]],"3-004"]],"ci":false,"cl":"00","co":"2","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"1-390"]],"la":false,"le":"U","lm":false,"n":"Introduction to Design","no":"2.00","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["b","l"],"si":36.3,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"2.001":{"b":[],"ci":false,"cl":"001","co":"2","cw":false,"f":true,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,4],[95,4]],"10-250"]],"la":false,"le":"U","lm":false,"n":"Mechanics and Materials I","no":"2.001","nx":false,"pl":false,"r":[[[[135,3]],"1-307"],[[[126,3]],"1-307"],[[[132,3]],"1-307"],[[[101,3]],"1-307"],[[[123,3]],"1-307"],[[[112,3]],"1-307"],[[[104,3]],"1-307"],[[[129,3]],"1-307"]],"ra":5.8,"re":true,"rp":false,"s":["r","l"],"si":88.4,"t":["FA","SP"],"tb":false,"u1":4,"u2":1,"u3":7,"v":false},"2.003":{"b":[],"ci":false,"cl":"003","co":"2","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"10-250"]],"la":false,"le":"U","lm":false,"n":"Dynamics and Control I","no":"2.003","nx":false,"pl":false,"r":[[[[102,2]],"1-375"],[[[128,2]],"5-217"],[[[126,2]],"5-217"],[[[124,2]],"5-217"],[[[100,2]],"1-375"],[[[98,2]],"1-190"]],"ra":5.6,"re":true,"rp":false,"s":["r","l"],"si":87.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":1,"u3":7,"v":false},"2.004":{"b":[[[[44,4]],"3-062B"],[[[14,4]],"3-062B"],[[[10,4]],"3-062B"],[[[40,4]],"3-062B"]],"ci":false,"cl":"004","co":"2","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"3-270"]],"la":false,"le":"U","lm":true,"n":"Dynamics and Control II","no":"2.004","nx":false,"pl":false,"r":[[[[104,2]],"3-270"],[[[126,2]],"3-270"]],"ra":5.1,"re":false,"rp":false,"s":["b","r","l"],"si":51.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"2.005":{"b":[],"ci":false,"cl":"005","co":"2","cw":false,"f":true,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,4],[62,4]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Thermal-Fluids Engineering I","no":"2.005","nx":false,"pl":false,"r":[[[[126,2]],"1-246"],[[[106,2]],"1-246"],[[[102,2]],"1-246"],[[[104,2]],"1-246"],[[[124,2]],"1-246"],[[[130,2]],"1-246"]],"ra":5.2,"re":false,"rp":false,"s":["l","r"],"si":75.8,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"2.006":{"b":[],"ci":false,"cl":"006","co":"2","cw":false,"f":true,"h":13.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3],[122,2]],"3-370"]],"la":false,"le":"U","lm":false,"n":"Thermal-Fluids Engineering II","no":"2.006","nx":false,"pl":false,"r":[[[[132,2]],"1-371"],[[[130,2]],"1-371"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":33.0,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"2.008":{"b":[[[[102,6]],"35-125"],[[[12,6]],"35-125"],[[[72,6]],"35-125"],[[[92,6]],"35-125"],[[[42,6]],"35-125"],[[[62,6]],"35-125"]],"ci":false,"cl":"008","co":"2","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Design and Manufacturing II","no":"2.008","nx":false,"pl":true,"r":[],"ra":5.8,"re":false,"rp":false,"s":["b"],"si":58.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.009":{"b":[[[[72,6]],"3-037B"],[[[42,6]],"3-037D"],[[[102,6]],"3-037B"],[[[92,6]],"3-037B"],[[[82,6]],"3-037A"],[[[52,6]],"3-037B"]],"ci":false,"cl":"009","co":"2","cw":false,"f":false,"h":29.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[130,2],[36,2]],"10-250"]],"la":false,"le":"U","lm":true,"n":"The Product Engineering Process","no":"2.009","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["b","l"],"si":152.3,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":9,"v":false},"2.013":{"b":[],"ci":false,"cl":"013","co":"2","cw":false,"f":false,"h":15.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,5],[103,5]],"NE45-202A"]],"la":false,"le":"U","lm":true,"n":"Engineering Systems Design","no":"2.013","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":20.3,"t":["FA"],"tb":false,"u1":0,"u2":6,"u3":6,"v":false},"2.016":{"b":[],"ci":false,"cl":"016","co":"2","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"3-442"]],"la":false,"le":"U","lm":false,"n":"Hydrodynamics","no":"2.016","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":7.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.032":{"b":[],"ci":false,"cl":"032","co":"2","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"3-333"]],"la":false,"le":"G","lm":false,"n":"Dynamics","no":"2.032","nx":false,"pl":false,"r":[[[[46,2]],"1-371"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":21.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.050":{"b":[],"ci":false,"cl":"050","co":"2","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E25-117"]],"la":false,"le":"U","lm":false,"n":"Nonlinear Dynamics: Chaos","no":"2.050","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.060":{"b":[],"ci":false,"cl":"060","co":"2","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Structural Dynamics","no":"2.060","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":21.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"2.072":{"b":[],"ci":false,"cl":"072","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"5-134"]],"la":false,"le":"G","lm":false,"n":"Mechanics of Continuous Media","no":"2.072","nx":true,"pl":false,"r":[[[[133,2]],"5-134"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.074":{"b":[],"ci":false,"cl":"074","co":"2","cw":false,"f":true,"h":14.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"1-150"]],"la":false,"le":"G","lm":false,"n":"Solid Mechanics: Elasticity","no":"2.074","nx":false,"pl":false,"r":[[[[126,2]],"5-134"]],"ra":6.8,"re":false,"rp":false,"s":["r","l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.075":{"b":[],"ci":false,"cl":"075","co":"2","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"1-135"]],"la":false,"le":"G","lm":false,"n":"Mechanics of Soft Materials","no":"2.075","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":25.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.080":{"b":[],"ci":false,"cl":"080","co":"2","cw":false,"f":false,"h":14.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"2-105"]],"la":false,"le":"G","lm":false,"n":"Structural Mechanics","no":"2.080","nx":false,"pl":false,"r":[[[[122,2]],"5-217"]],"ra":3.2,"re":false,"rp":false,"s":["r","l"],"si":24.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.086":{"b":[[[[92,4]],"5-134"],[[[122,4]],"5-134"],[[[72,4]],"1-379"],[[[102,4]],"35-308"]],"ci":false,"cl":"086","co":"2","cw":false,"f":true,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2]],"3-270"]],"la":false,"le":"U","lm":true,"n":"Numerical Computation for Mechanical Engineers","no":"2.086","nx":false,"pl":false,"r":[],"ra":5.4,"re":true,"rp":false,"s":["l","b"],"si":81.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"2.096":{"b":[],"ci":false,"cl":"096","co":"2","cw":false,"f":false,"h":15.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"32-155"]],"la":false,"le":"G","lm":false,"n":"Introduction to Modeling and Simulation","no":"2.096","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":54.3,"t":["FA"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"2.097":{"b":[],"ci":false,"cl":"097","co":"2","cw":false,"f":false,"h":15.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"37-212"]],"la":false,"le":"G","lm":false,"n":"Numerical Methods for Partial Differential Equations","no":"2.097","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":29.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.110":{"b":[],"ci":false,"cl":"110","co":"2","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"1-273"]],"la":false,"le":"U","lm":false,"n":"Information, Entropy, and Computation","no":"2.110","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"2.111":{"b":[],"ci":false,"cl":"111","co":"2","cw":false,"f":true,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"2-190"]],"la":false,"le":"G","lm":false,"n":"Quantum Computation","no":"2.111","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":79.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.151":{"b":[],"ci":false,"cl":"151","co":"2","cw":false,"f":false,"h":16.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"3-370"]],"la":false,"le":"G","lm":false,"n":"Advanced System Dynamics and Control","no":"2.151","nx":false,"pl":false,"r":[[[[76,2]],"1-190"]],"ra":4.7,"re":false,"rp":false,"s":["r","l"],"si":22.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.154":{"b":[],"ci":false,"cl":"154","co":"2","cw":false,"f":false,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"5-234"]],"la":false,"le":"G","lm":false,"n":"Maneuvering and Control of Surface  and Underwater Vehicles","no":"2.154","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.160":{"b":[],"ci":false,"cl":"160","co":"2","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"5-134"]],"la":false,"le":"G","lm":false,"n":"Identification, Estimation, and Learning","no":"2.160","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.165":{"b":[],"ci":false,"cl":"165","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"5-234"]],"la":false,"le":"G","lm":false,"n":"Robotics","no":"2.165","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.171":{"b":[[[[42,6]],"1-004"]],"ci":false,"cl":"171","co":"2","cw":false,"f":false,"h":14.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"5-233"]],"la":false,"le":"G","lm":false,"n":"Analysis and Design of Digital Control Systems","no":"2.171","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l","b"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.20":{"b":[],"ci":false,"cl":"20","co":"2","cw":false,"f":true,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"5-134"]],"la":false,"le":"G","lm":false,"n":"Marine Hydrodynamics","no":"2.20","nx":false,"pl":false,"r":[[[[66,2]],"1-246"],[[[76,2]],"5-233"],[[[70,2]],"5-233"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":18.7,"t":["FA"],"tb":false,"u1":4,"u2":1,"u3":7,"v":false},"2.25":{"b":[],"ci":false,"cl":"25","co":"2","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"3-370"]],"la":false,"le":"G","lm":false,"n":"Fluid Mechanics","no":"2.25","nx":false,"pl":false,"r":[[[[66,3]],"1-242"],[[[105,3]],"5-217"]],"ra":6.5,"re":false,"rp":false,"s":["r","l"],"si":38.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.351":{"b":[],"ci":false,"cl":"351","co":"2","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3]],"E40-160"]],"la":false,"le":"G","lm":true,"n":"Introduction to Making","no":"2.351","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":24.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"2.42":{"b":[],"ci":false,"cl":"42","co":"2","cw":false,"f":true,"h":13.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"3-333"]],"la":false,"le":"G","lm":false,"n":"General Thermodynamics","no":"2.42","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":11.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.51":{"b":[],"ci":false,"cl":"51","co":"2","cw":false,"f":false,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-379"]],"la":false,"le":"U","lm":false,"n":"Intermediate Heat and Mass Transfer","no":"2.51","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":16.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.59":{"b":[],"ci":false,"cl":"59","co":"2","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Thermal Hydraulics in Power Technology","no":"2.59","nx":true,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"2.611":{"b":[],"ci":false,"cl":"611","co":"2","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"5-217"]],"la":false,"le":"G","lm":false,"n":"Marine Power and Propulsion","no":"2.611","nx":false,"pl":false,"r":[[[[124,2]],"1-242"]],"ra":6.6,"re":false,"rp":false,"s":["l","r"],"si":16.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.612":{"b":[],"ci":false,"cl":"612","co":"2","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"5-217"]],"la":false,"le":"U","lm":false,"n":"Marine Power and Propulsion","no":"2.612","nx":false,"pl":false,"r":[[[[124,2]],"1-242"]],"ra":6.6,"re":false,"rp":false,"s":["l","r"],"si":16.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.625":{"b":[],"ci":false,"cl":"625","co":"2","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"3-333"]],"la":false,"le":"G","lm":false,"n":"Electrochemical Energy Conversion and Storage: Fundamentals, Materials and Applications","no":"2.625","nx":false,"pl":false,"r":[[[[76,2]],"5-134"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":17.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.65":{"b":[],"ci":false,"cl":"65","co":"2","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"G","lm":false,"n":"Sustainable Energy","no":"2.65","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"2.650":{"b":[],"ci":false,"cl":"650","co":"2","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"U","lm":true,"n":"Introduction to Sustainable Energy","no":"2.650","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["r","l"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"2.652":{"b":[],"ci":false,"cl":"652","co":"2","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4],[104,4]],"N51-310"]],"la":false,"le":"U","lm":true,"n":"Applications of Energy in Global Development","no":"2.652","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"2.670":{"b":[],"ci":false,"cl":"670","co":"2","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Mechanical Engineering Tools","no":"2.670","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":[],"si":68.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":1,"u3":2,"v":true},"2.671":{"b":[[[[42,6]],"3-038"],[[[72,6]],"3-038"],[[[102,6]],"3-038"],[[[12,6]],"3-038"],[[[92,6]],"3-038"],[[[32,6]],"3-038"]],"ci":false,"cl":"671","co":"2","cw":false,"f":false,"h":14.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"3-270"]],"la":true,"le":"U","lm":true,"n":"Measurement and Instrumentation","no":"2.671","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["b","l"],"si":72.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.673":{"b":[],"ci":false,"cl":"673","co":"2","cw":false,"f":false,"h":14.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"32-144"]],"la":false,"le":"U","lm":true,"n":"Instrumentation and Measurement for Biological Systems","no":"2.673","nx":false,"pl":false,"r":[[[[128,2]],"32-144"]],"ra":6.2,"re":false,"rp":false,"s":["l","r"],"si":26.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"2.675":{"b":[[[[100,6]],"5-026"],[[[122,6]],"5-026"],[[[92,6]],"5-026"],[[[130,6]],"5-026"]],"ci":false,"cl":"675","co":"2","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,2]],"1-246"]],"la":false,"le":"G","lm":true,"n":"Micro/Nano Engineering Laboratory","no":"2.675","nx":false,"pl":false,"r":[[[[40,2]],"1-246"]],"ra":6.4,"re":false,"rp":false,"s":["b","r","l"],"si":16.3,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":7,"v":false},"2.676":{"b":[[[[130,6]],"5-026"],[[[100,6]],"5-026"],[[[122,6]],"5-026"],[[[92,6]],"5-026"]],"ci":false,"cl":"676","co":"2","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,2]],"1-246"]],"la":false,"le":"U","lm":true,"n":"Micro/Nano Engineering Laboratory","no":"2.676","nx":false,"pl":false,"r":[[[[44,2]],"1-246"]],"ra":6.4,"re":false,"rp":false,"s":["l","r","b"],"si":16.3,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":7,"v":false},"2.678":{"b":[[[[69,4]],"3-062B"],[[[74,4]],"3-062B"],[[[132,4]],"3-062B"],[[[99,4]],"3-062B"],[[[126,4]],"3-062B"],[[[104,4]],"3-062B"]],"ci":false,"cl":"678","co":"2","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2]],"3-270"]],"la":false,"le":"U","lm":true,"n":"Electronics for Mechanical Systems","no":"2.678","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":61.8,"t":["FA","SP"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"2.681":{"b":[],"ci":false,"cl":"681","co":"2","cw":false,"f":false,"h":16.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Environmental Ocean Acoustics","no":"2.681","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":[],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"2.689":{"b":[],"ci":false,"cl":"689","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Projects in Oceanographic Engineering","no":"2.689","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.70":{"b":[[[[12,6]],"35-225"]],"ci":false,"cl":"70","co":"2","cw":false,"f":false,"h":17.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"1-150"]],"la":false,"le":"U","lm":true,"n":"FUNdaMENTALS of Precision Product Design","no":"2.70","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":19.5,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.700":{"b":[[[[120,2]],"5-306"]],"ci":false,"cl":"700","co":"2","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"5-217"]],"la":false,"le":"U","lm":false,"n":"Principles of Naval Architecture","no":"2.700","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l","b"],"si":14.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"2.701":{"b":[[[[120,2]],"5-306"]],"ci":false,"cl":"701","co":"2","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"5-217"]],"la":false,"le":"G","lm":false,"n":"Principles of Naval Architecture","no":"2.701","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["b","l"],"si":14.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"2.703":{"b":[],"ci":false,"cl":"703","co":"2","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"5-217"]],"la":false,"le":"G","lm":false,"n":"Principles of Naval Ship Design","no":"2.703","nx":false,"pl":false,"r":[[[[44,2]],"5-217"]],"ra":5.2,"re":false,"rp":false,"s":["l","r"],"si":12.3,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"2.705":{"b":[],"ci":false,"cl":"705","co":"2","cw":false,"f":false,"h":18.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Projects in New Concept Naval Ship Design","no":"2.705","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":9.6,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.71":{"b":[],"ci":false,"cl":"71","co":"2","cw":false,"f":false,"h":14.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"5-134"]],"la":false,"le":"U","lm":false,"n":"Optics","no":"2.71","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l"],"si":8.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.710":{"b":[],"ci":false,"cl":"710","co":"2","cw":false,"f":false,"h":14.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"5-134"]],"la":false,"le":"G","lm":false,"n":"Optics","no":"2.710","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l"],"si":8.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.7231":{"b":[],"ci":false,"cl":"7231","co":"2","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":true,"n":"Introduction to Design Thinking and Innovation in Engineering","no":"2.7231","nx":false,"pl":false,"r":[[[[26,2]],"32-141"],[[[76,2]],"35-308"],[[[46,2]],"35-308"]],"ra":7.0,"re":false,"rp":false,"s":["l","r"],"si":36.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"2.723A":{"b":[],"ci":false,"cl":"723A","co":"2","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Design Thinking and Innovation Leadership for Engineers","no":"2.723A","nx":false,"pl":false,"r":[[[[82,2]],"4-231"]],"ra":0.0,"re":false,"rp":false,"s":["l","r"],"si":0.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"2.723B":{"b":[],"ci":false,"cl":"723B","co":"2","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Design Thinking and Innovation Project","no":"2.723B","nx":false,"pl":false,"r":[[[[46,2]],"35-308"],[[[76,2]],"35-308"],[[[26,2]],"32-141"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":45.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"2.729":{"b":[[[[100,3]],"N51-350"]],"ci":false,"cl":"729","co":"2","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"N51-350"]],"la":false,"le":"U","lm":false,"n":"D-Lab: Design for Scale","no":"2.729","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b","l"],"si":19.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"2.733":{"b":[],"ci":false,"cl":"733","co":"2","cw":false,"f":false,"h":15.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,5],[103,5]],"NE45-202A"]],"la":false,"le":"G","lm":true,"n":"Engineering Systems Design","no":"2.733","nx":true,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":20.3,"t":["FA"],"tb":false,"u1":0,"u2":6,"u3":6,"v":false},"2.74":{"b":[[[[72,6]],"3-145"],[[[102,6]],"3-145"],[[[42,6]],"3-145"],[[[12,6]],"3-145"]],"ci":false,"cl":"74","co":"2","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"3-370"]],"la":false,"le":"U","lm":true,"n":"Bio-inspired Robotics","no":"2.74","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l","b"],"si":38.5,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"2.740":{"b":[[[[12,6]],"3-145"],[[[42,6]],"3-145"],[[[72,6]],"3-145"],[[[102,6]],"3-145"]],"ci":false,"cl":"740","co":"2","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"3-370"]],"la":false,"le":"G","lm":true,"n":"Bio-inspired Robotics","no":"2.740","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l","b"],"si":38.5,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.76":{"b":[],"ci":false,"cl":"76","co":"2","cw":false,"f":false,"h":18.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"3-370"]],"la":false,"le":"G","lm":false,"n":"Global Engineering","no":"2.76","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":47.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.760":{"b":[],"ci":false,"cl":"760","co":"2","cw":false,"f":false,"h":18.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"3-370"]],"la":false,"le":"U","lm":false,"n":"Global Engineering","no":"2.760","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":47.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.77":{"b":[[[[12,6]],"35-225"]],"ci":false,"cl":"77","co":"2","cw":false,"f":false,"h":17.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"1-150"]],"la":false,"le":"G","lm":true,"n":"FUNdaMENTALS of Precision Product Design","no":"2.77","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":19.5,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.772":{"b":[],"ci":false,"cl":"772","co":"2","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Thermodynamics of Biomolecular Systems","no":"2.772","nx":false,"pl":false,"r":[[[[46,2],[106,2]],"26-168"],[[[36,2],[96,2]],"66-144"],[[[40,2],[100,2]],"56-180"],[[[12,2],[72,2]],"5-217"],[[[34,2],[94,2]],"66-144"]],"ra":5.2,"re":true,"rp":false,"s":["r","l"],"si":98.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"2.777":{"b":[],"ci":false,"cl":"777","co":"2","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"5-217"]],"la":false,"le":"U","lm":false,"n":"Large and Complex Systems Design and Concept Development","no":"2.777","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":10.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.778":{"b":[],"ci":false,"cl":"778","co":"2","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"5-217"]],"la":false,"le":"G","lm":true,"n":"Large and Complex Systems Design and Concept Development","no":"2.778","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":false,"s":["l"],"si":15.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.78":{"b":[],"ci":false,"cl":"78","co":"2","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4],[96,4]],"32-044"]],"la":false,"le":"U","lm":true,"n":"Principles and Practice of Assistive Technology","no":"2.78","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":34.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"2.787":{"b":[],"ci":false,"cl":"787","co":"2","cw":false,"f":false,"h":6.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-371"]],"la":false,"le":"G","lm":false,"n":"Tissue Engineering and Organ Regeneration","no":"2.787","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.788":{"b":[],"ci":false,"cl":"788","co":"2","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"37-212"]],"la":false,"le":"G","lm":false,"n":"Mechanical Engineering and Design of Living Systems","no":"2.788","nx":false,"pl":false,"r":[[[[68,2]],"1-135"]],"ra":6.9,"re":false,"rp":false,"s":["r","l"],"si":10.5,"t":["FA"],"tb":true,"u1":4,"u2":2,"u3":6,"v":false},"2.789":{"b":[[[[100,3]],"N51-350"]],"ci":false,"cl":"789","co":"2","cw":false,"f":false,"h":13.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"N51-350"]],"la":false,"le":"G","lm":false,"n":"D-Lab: Design for Scale","no":"2.789","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["l","b"],"si":21.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"2.79":{"b":[],"ci":false,"cl":"79","co":"2","cw":false,"f":false,"h":6.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"1-371"]],"la":false,"le":"G","lm":false,"n":"Biomaterials: Tissue Interactions","no":"2.79","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":17.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.795":{"b":[],"ci":false,"cl":"795","co":"2","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-265"]],"la":false,"le":"G","lm":false,"n":"Fields, Forces, and Flows in Biological Systems","no":"2.795","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":22.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.810":{"b":[[[[42,6]],"35-125"],[[[12,6]],"35-125"],[[[102,6]],"35-125"],[[[92,6]],"35-125"],[[[62,6]],"35-125"],[[[72,6]],"35-125"]],"ci":false,"cl":"810","co":"2","cw":false,"f":false,"h":14.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"37-212"]],"la":false,"le":"G","lm":true,"n":"Manufacturing Processes and Systems","no":"2.810","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["b","l"],"si":35.7,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.821":{"b":[],"ci":false,"cl":"821","co":"2","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"4-145"]],"la":false,"le":"G","lm":false,"n":"Structural Materials","no":"2.821","nx":false,"pl":false,"r":[[[[32,2],[92,2]],"4-145"]],"ra":6.3,"re":false,"rp":true,"s":["l","r"],"si":21.0,"t":["FA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"2.830":{"b":[],"ci":false,"cl":"830","co":"2","cw":false,"f":false,"h":14.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"24-121"]],"la":false,"le":"G","lm":false,"n":"Control of Manufacturing Processes","no":"2.830","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":19.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.853":{"b":[],"ci":false,"cl":"853","co":"2","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"3-133"]],"la":false,"le":"U","lm":false,"n":"Introduction to Manufacturing Systems","no":"2.853","nx":false,"pl":false,"r":[],"ra":4.6,"re":false,"rp":false,"s":["l"],"si":25.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.854":{"b":[],"ci":false,"cl":"854","co":"2","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"3-133"]],"la":false,"le":"G","lm":false,"n":"Introduction to Manufacturing Systems","no":"2.854","nx":false,"pl":false,"r":[],"ra":4.6,"re":false,"rp":false,"s":["l"],"si":25.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.890":{"b":[],"ci":false,"cl":"890","co":"2","cw":false,"f":false,"h":2.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,4]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Global Operations Leadership Seminar","no":"2.890","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":true,"s":["l"],"si":48.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":0,"v":false},"2.900":{"b":[],"ci":false,"cl":"900","co":"2","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"66-144"],[[[82,4]],"66-144"],[[[74,4]],"66-148"],[[[44,4]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Ethics for Engineers","no":"2.900","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":59.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"2.907":{"b":[[[[122,6]],"56-154"]],"ci":false,"cl":"907","co":"2","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4],[100,4]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Innovation Teams","no":"2.907","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["b","l"],"si":19.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"2.96":{"b":[[[[106,2]],"1-375"],[[[34,2]],"1-375"],[[[16,2]],"1-375"],[[[130,2]],"1-375"]],"ci":false,"cl":"96","co":"2","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"35-225"]],"la":false,"le":"U","lm":false,"n":"Management in Engineering","no":"2.96","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b","l"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"2.961":{"b":[[[[16,2]],"35-310"]],"ci":false,"cl":"961","co":"2","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"35-225"]],"la":false,"le":"G","lm":false,"n":"Management in Engineering","no":"2.961","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["b","l"],"si":18.7,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"2.979":{"b":[],"ci":false,"cl":"979","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Teaching","no":"2.979","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.99":{"b":[],"ci":false,"cl":"99","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Topics in Mechanical Engineering","no":"2.99","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.990":{"b":[],"ci":false,"cl":"990","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Practical Experience","no":"2.990","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"2.991":{"b":[],"ci":false,"cl":"991","co":"2","cw":false,"f":false,"h":2.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,2]],"1-390"]],"la":false,"le":"G","lm":true,"n":"Introduction to Graduate Study in Mechanical Engineering","no":"2.991","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":1,"u2":2,"u3":0,"v":false},"2.993":{"b":[],"ci":false,"cl":"993","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"2.993","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.994":{"b":[],"ci":false,"cl":"994","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"2.994","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.995":{"b":[],"ci":false,"cl":"995","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Advanced Topics in Mechanical Engineering","no":"2.995","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.996":{"b":[],"ci":false,"cl":"996","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Advanced Topics in Mechanical Engineering","no":"2.996","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.999":{"b":[],"ci":false,"cl":"999","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Engineer's Degree Thesis Proposal Preparation","no":"2.999","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.EPE":{"b":[],"ci":false,"cl":"EPE","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"2.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"2.EPW":{"b":[],"ci":false,"cl":"EPW","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"2.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"2.S793":{"b":[[[[39,6]],"35-308"]],"ci":false,"cl":"S793","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"35-308"]],"la":false,"le":"G","lm":false,"n":"Graduate Special Subject in Mechanical Engineering","no":"2.S793","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l","b"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.S794":{"b":[],"ci":false,"cl":"S794","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Special Subject in Mechanical Engineering","no":"2.S794","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.S796":{"b":[],"ci":false,"cl":"S796","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,3],[123,3]],"6-120"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Mechanical Engineering","no":"2.S796","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"2.S885":{"b":[],"ci":false,"cl":"S885","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-242"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Mechanical Engineering","no":"2.S885","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.S97":{"b":[],"ci":false,"cl":"S97","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2]],"3-442"]],"la":false,"le":"U","lm":false,"n":"Undergraduate Special Subject in Mechanical Engineering","no":"2.S97","nx":false,"pl":false,"r":[[[[126,2]],"1-134"]],"ra":0,"re":false,"rp":true,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.S971":{"b":[[[[39,6]],"35-308"]],"ci":false,"cl":"S971","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"35-308"]],"la":false,"le":"U","lm":false,"n":"Undergraduate Special Subject in Mechanical Engineering","no":"2.S971","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l","b"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.S972":{"b":[],"ci":false,"cl":"S972","co":"2","cw":false,"f":false,"h":11.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[131,6]],"3-370"]],"la":false,"le":"U","lm":false,"n":"Undergraduate Special Subject in Mechanical Engineering","no":"2.S972","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":17.7,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":2,"v":false},"2.S973":{"b":[],"ci":false,"cl":"S973","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,4]],"1-132"]],"la":false,"le":"U","lm":false,"n":"Undergraduate Special Subject in Mechanical Engineering","no":"2.S973","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"2.S977":{"b":[],"ci":false,"cl":"S977","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-135"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Mechanical Engineering","no":"2.S977","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.S984":{"b":[],"ci":false,"cl":"S984","co":"2","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"1-371"]],"la":false,"le":"G","lm":false,"n":"Graduate Special Subject in Mechanical Engineering","no":"2.S984","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.S985":{"b":[],"ci":false,"cl":"S985","co":"2","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-242"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Mechanical Engineering","no":"2.S985","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":19.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"2.S988":{"b":[],"ci":false,"cl":"S988","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"3-370"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Mechanical Engineering","no":"2.S988","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"2.S995":{"b":[],"ci":false,"cl":"S995","co":"2","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"5-231"]],"la":false,"le":"U","lm":false,"n":"Undergraduate Special Subject in Mechanical Engineering","no":"2.S995","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":0,"u2":6,"u3":0,"v":false},"2.S997":{"b":[],"ci":false,"cl":"S997","co":"2","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-135"]],"la":false,"le":"G","lm":false,"n":"Graduate Special Subject in Mechanical Engineering","no":"2.S997","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":true,"s":["l"],"si":21.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"2.S998":{"b":[],"ci":false,"cl":"S998","co":"2","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"5-231"]],"la":false,"le":"G","lm":false,"n":"Graduate Special Subject in Mechanical Engineering","no":"2.S998","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"2.THG":{"b":[],"ci":false,"cl":"THG","co":"2","cw":false,"f":false,"h":30.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"2.THG","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":424.4,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.THU":{"b":[],"ci":false,"cl":"THU","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"2.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.UR":{"b":[],"ci":false,"cl":"UR","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Mechanical Engineering","no":"2.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"2.URG":{"b":[],"ci":false,"cl":"URG","co":"2","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Mechanical Engineering","no":"2.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.001":{"b":[],"ci":false,"cl":"001","co":"20","cw":false,"f":false,"h":2.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[62,2]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Introduction to Professional Success and Leadership in Biological Engineering","no":"20.001","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":39.3,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"20.005":{"b":[],"ci":false,"cl":"005","co":"20","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,4]],"66-144"],[[[44,4]],"66-148"],[[[14,4]],"66-144"],[[[74,4]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Ethics for Engineers","no":"20.005","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":59.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"20.010":{"b":[],"ci":false,"cl":"010","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2]],"4-237"]],"la":false,"le":"U","lm":false,"n":"Introduction to Experimentation in BE","no":"20.010","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"20.051":{"b":[],"ci":false,"cl":"051","co":"20","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,2],[136,2]],"4-163"]],"la":false,"le":"U","lm":true,"n":"Introduction to NEET: Living Machines","no":"20.051","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":18.4,"t":["FA","SP"],"tb":false,"u1":2,"u2":3,"u3":1,"v":false},"20.054":{"b":[],"ci":false,"cl":"054","co":"20","cw":false,"f":false,"h":3.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,2]],"56-169"]],"la":false,"le":"U","lm":true,"n":"NEET - Living Machines Research Immersion","no":"20.054","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":7.5,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"20.101":{"b":[],"ci":false,"cl":"101","co":"20","cw":false,"f":false,"h":3.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[134,4]],"16-275"]],"la":false,"le":"U","lm":false,"n":"Metakaryotic Biology and Epidemiology","no":"20.101","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"20.102":{"b":[],"ci":false,"cl":"102","co":"20","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"16-275"]],"la":false,"le":"U","lm":false,"n":"Metakaryotic Stem Cells in Carcinogenesis: Origins and Cures","no":"20.102","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":2.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.109":{"b":[[[[70,8],[130,8]],"56-322"],[[[40,8],[100,8]],"56-322"]],"ci":false,"cl":"109","co":"20","cw":false,"f":false,"h":18.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,2],[96,2]],"16-220"]],"la":true,"le":"U","lm":true,"n":"Laboratory Fundamentals in Biological Engineering","no":"20.109","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["b","l"],"si":24.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":8,"u3":5,"v":false},"20.110":{"b":[],"ci":false,"cl":"110","co":"20","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Thermodynamics of Biomolecular Systems","no":"20.110","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"66-144"],[[[34,2],[94,2]],"66-144"],[[[46,2],[106,2]],"26-168"],[[[40,2],[100,2]],"56-180"],[[[12,2],[72,2]],"5-217"]],"ra":5.2,"re":true,"rp":false,"s":["r","l"],"si":98.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"20.200":{"b":[],"ci":false,"cl":"200","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,2]],"32-155"]],"la":false,"le":"G","lm":false,"n":"Biological Engineering Seminar","no":"20.200","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"20.201":{"b":[],"ci":false,"cl":"201","co":"20","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[11,3],[71,3]],"56-614"]],"la":false,"le":"G","lm":false,"n":"Fundamentals of Drug Development","no":"20.201","nx":false,"pl":false,"r":[[[[131,2]],"56-614"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":15.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"20.215":{"b":[],"ci":false,"cl":"215","co":"20","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"16-275"]],"la":false,"le":"G","lm":false,"n":"Macroepidemiology, Population Genetics, and Stem Cell Biology of Human Clonal Diseases","no":"20.215","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":2.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":15,"v":false},"20.309":{"b":[],"ci":false,"cl":"309","co":"20","cw":false,"f":false,"h":14.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"32-144"]],"la":false,"le":"U","lm":true,"n":"Instrumentation and Measurement for Biological Systems","no":"20.309","nx":false,"pl":false,"r":[[[[128,2]],"32-144"]],"ra":6.2,"re":false,"rp":false,"s":["l","r"],"si":26.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"20.320":{"b":[],"ci":false,"cl":"320","co":"20","cw":false,"f":false,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Analysis of Biomolecular and Cellular Systems","no":"20.320","nx":false,"pl":false,"r":[[[[14,2]],"56-114"],[[[124,2]],"4-153"]],"ra":4.6,"re":false,"rp":false,"s":["r","l"],"si":53.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"20.334":{"b":[],"ci":false,"cl":"334","co":"20","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[132,2]],"66-156"]],"la":false,"le":"U","lm":false,"n":"Biological Systems Modeling","no":"20.334","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":6.7,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":5,"v":false},"20.352":{"b":[],"ci":false,"cl":"352","co":"20","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"46-5165"]],"la":false,"le":"U","lm":false,"n":"Principles of Neuroengineering","no":"20.352","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.363":{"b":[],"ci":false,"cl":"363","co":"20","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-163"]],"la":false,"le":"U","lm":false,"n":"Biomaterials Science and Engineering","no":"20.363","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":43.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.380":{"b":[],"ci":false,"cl":"380","co":"20","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,6],[92,6]],"56-614"]],"la":false,"le":"U","lm":true,"n":"Biological Engineering Design","no":"20.380","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":24.8,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"20.409":{"b":[],"ci":false,"cl":"409","co":"20","cw":false,"f":false,"h":14.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"32-144"]],"la":false,"le":"G","lm":true,"n":"Biological Engineering II: Instrumentation and Measurement","no":"20.409","nx":false,"pl":false,"r":[[[[128,2]],"32-144"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":26.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":7,"u3":3,"v":false},"20.416":{"b":[],"ci":false,"cl":"416","co":"20","cw":false,"f":false,"h":4.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,4]],"4-253"]],"la":false,"le":"G","lm":false,"n":"Topics in Biophysics and Physical Biology","no":"20.416","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":9.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"20.420":{"b":[],"ci":false,"cl":"420","co":"20","cw":false,"f":true,"h":19.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"16-220"]],"la":false,"le":"G","lm":false,"n":"Principles of Molecular Bioengineering","no":"20.420","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":33.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.430":{"b":[],"ci":false,"cl":"430","co":"20","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-265"]],"la":false,"le":"G","lm":false,"n":"Fields, Forces, and Flows in Biological Systems","no":"20.430","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":22.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.445":{"b":[],"ci":false,"cl":"445","co":"20","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,6]],"4-144"]],"la":false,"le":"G","lm":false,"n":"Methods and Problems in Microbiology","no":"20.445","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.446":{"b":[],"ci":false,"cl":"446","co":"20","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,4],[99,4]],"66-160"]],"la":false,"le":"G","lm":false,"n":"Microbial Genetics and Evolution","no":"20.446","nx":false,"pl":false,"r":[[[[126,2]],"2-142"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":12.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"20.452":{"b":[],"ci":false,"cl":"452","co":"20","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"46-5165"]],"la":false,"le":"G","lm":false,"n":"Principles of Neuroengineering","no":"20.452","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.454":{"b":[],"ci":false,"cl":"454","co":"20","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,4]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"Revolutionary Ventures: How to Invent and Deploy Transformative Technologies","no":"20.454","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":27.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"20.463":{"b":[],"ci":false,"cl":"463","co":"20","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-163"]],"la":false,"le":"G","lm":false,"n":"Biomaterials Science and Engineering","no":"20.463","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":43.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.507":{"b":[],"ci":false,"cl":"507","co":"20","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"4-237"]],"la":false,"le":"U","lm":false,"n":"Introduction to Biological Chemistry","no":"20.507","nx":false,"pl":false,"r":[[[[42,2],[102,2]],"36-144"],[[[44,2],[104,2]],"36-144"],[[[34,2],[94,2]],"36-144"],[[[36,2],[96,2]],"36-144"]],"ra":5.2,"re":true,"rp":false,"s":["r","l"],"si":44.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"20.554":{"b":[],"ci":false,"cl":"554","co":"20","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[5,3],[65,3]],"4-261"]],"la":false,"le":"G","lm":false,"n":"Frontiers in Chemical Biology","no":"20.554","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":23.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"20.561":{"b":[],"ci":false,"cl":"561","co":"20","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,4],[70,4]],"E25-117"]],"la":false,"le":"G","lm":true,"n":"Eukaryotic Cell Biology: Principles and Practice","no":"20.561","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"20.902":{"b":[],"ci":false,"cl":"902","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Biological Engineering","no":"20.902","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.903":{"b":[],"ci":false,"cl":"903","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Biological Engineering","no":"20.903","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.920":{"b":[],"ci":false,"cl":"920","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Practical Work Experience","no":"20.920","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"20.930":{"b":[],"ci":false,"cl":"930","co":"20","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2]],"16-220"]],"la":false,"le":"G","lm":false,"n":"Research Experience in Biopharma","no":"20.930","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.3,"t":["FA"],"tb":false,"u1":2,"u2":10,"u3":0,"v":false},"20.950":{"b":[],"ci":false,"cl":"950","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Research Problems in Biological Engineering","no":"20.950","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.951":{"b":[],"ci":false,"cl":"951","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Thesis Proposal","no":"20.951","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":24,"u3":0,"v":true},"20.960":{"b":[],"ci":false,"cl":"960","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching Experience in Biological Engineering","no":"20.960","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.BME":{"b":[],"ci":false,"cl":"BME","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Biomedical Engineering","no":"20.BME","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.EPE":{"b":[],"ci":false,"cl":"EPE","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"20.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"20.EPW":{"b":[],"ci":false,"cl":"EPW","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"20.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"20.S900":{"b":[],"ci":false,"cl":"S900","co":"20","cw":false,"f":false,"h":1.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject in Biological Engineering","no":"20.S900","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":[],"si":18.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.S901":{"b":[],"ci":false,"cl":"S901","co":"20","cw":false,"f":false,"h":1.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2]],"56-614"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Biological Engineering","no":"20.S901","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":4.5,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"20.S940":{"b":[],"ci":false,"cl":"S940","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-261"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Biological Engineering","no":"20.S940","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"20.S947":{"b":[],"ci":false,"cl":"S947","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Biological Engineering","no":"20.S947","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.S948":{"b":[],"ci":false,"cl":"S948","co":"20","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Biological Engineering","no":"20.S948","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":2.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.S949":{"b":[],"ci":false,"cl":"S949","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Biological Engineering","no":"20.S949","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.S952":{"b":[],"ci":false,"cl":"S952","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,4]],"32-141"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Biological Engineering","no":"20.S952","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"20.THG":{"b":[],"ci":false,"cl":"THG","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"20.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.THU":{"b":[],"ci":false,"cl":"THU","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate BE Thesis","no":"20.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.UR":{"b":[],"ci":false,"cl":"UR","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research Opportunities","no":"20.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"20.URG":{"b":[],"ci":false,"cl":"URG","co":"20","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research Opportunities","no":"20.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21.THT":{"b":[],"ci":false,"cl":"THT","co":"21","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Humanities Pre-Thesis Tutorial","no":"21.THT","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21.THU":{"b":[],"ci":false,"cl":"THU","co":"21","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis in Humanities","no":"21.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21.UR":{"b":[],"ci":false,"cl":"UR","co":"21","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Humanities","no":"21.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21.URG":{"b":[],"ci":false,"cl":"URG","co":"21","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Humanities","no":"21.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.00":{"b":[],"ci":false,"cl":"00","co":"21A","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[40,3],[100,3]],"56-154"]],"la":false,"le":"U","lm":false,"n":"Introduction to Anthropology: Comparing Human Cultures","no":"21A.00","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":30.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.155":{"b":[],"ci":false,"cl":"155","co":"21A","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[43,3],[103,3]],"4-257"]],"la":false,"le":"U","lm":false,"n":"Food, Culture, and Politics","no":"21A.155","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.303":{"b":[],"ci":false,"cl":"303","co":"21A","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[70,6]],"1-273"]],"la":false,"le":"U","lm":false,"n":"The Anthropology of Biology","no":"21A.303","nx":true,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.312":{"b":[],"ci":false,"cl":"312","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[10,6]],"E53-354"]],"la":false,"le":"U","lm":true,"n":"Planetary Change and Human Health","no":"21A.312","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.461":{"b":[],"ci":true,"cl":"461","co":"21A","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[36,3],[96,3]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"What Is Capitalism?","no":"21A.461","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":20.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.500":{"b":[],"ci":false,"cl":"500","co":"21A","cw":false,"f":false,"h":5.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[130,4]],"66-168"]],"la":false,"le":"U","lm":true,"n":"Technology and Culture","no":"21A.500","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":47.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"21A.507":{"b":[],"ci":false,"cl":"507","co":"21A","cw":false,"f":false,"h":10.6,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"3-442"]],"la":false,"le":"U","lm":false,"n":"Resonance: Sonic Experience, Science, and Art","no":"21A.507","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.519":{"b":[],"ci":false,"cl":"519","co":"21A","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"3-442"]],"la":false,"le":"G","lm":false,"n":"Resonance: Sonic Experience, Science, and Art","no":"21A.519","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.819":{"b":[],"ci":false,"cl":"819","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[92,6]],"E53-354"]],"la":false,"le":"G","lm":false,"n":"Ethnographic Research Methods","no":"21A.819","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"21A.859":{"b":[],"ci":false,"cl":"859","co":"21A","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"E51-165"]],"la":false,"le":"G","lm":false,"n":"Social Theory and Analysis","no":"21A.859","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21A.901":{"b":[],"ci":false,"cl":"901","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Anthropology","no":"21A.901","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.902":{"b":[],"ci":false,"cl":"902","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Anthropology","no":"21A.902","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.929":{"b":[],"ci":false,"cl":"929","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Independent Study","no":"21A.929","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.939":{"b":[],"ci":false,"cl":"939","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Independent Study","no":"21A.939","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.949":{"b":[],"ci":false,"cl":"949","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Independent Study","no":"21A.949","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.950":{"b":[],"ci":false,"cl":"950","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching Anthropology","no":"21A.950","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.S01":{"b":[],"ci":false,"cl":"S01","co":"21A","cw":false,"f":false,"h":14.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"5-217"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Anthropology","no":"21A.S01","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":5.8,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"21A.THT":{"b":[],"ci":false,"cl":"THT","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Anthropology Pre-Thesis Tutorial","no":"21A.THT","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.THU":{"b":[],"ci":false,"cl":"THU","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis in Anthropology","no":"21A.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.UR":{"b":[],"ci":false,"cl":"UR","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21A.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21A.URG":{"b":[],"ci":false,"cl":"URG","co":"21A","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21A.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21G.024":{"b":[],"ci":true,"cl":"024","co":"21G","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[10,3],[70,3]],"66-144"]],"la":false,"le":"U","lm":true,"n":"The Linguistic Study of Bilingualism","no":"21G.024","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.041":{"b":[],"ci":true,"cl":"041","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[3,3],[63,3]],"1-277"]],"la":false,"le":"U","lm":false,"n":"Foundations of East Asian Literature and Culture: From Confucius to the Beats","no":"21G.041","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.044":{"b":[],"ci":false,"cl":"044","co":"21G","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"5-234"]],"la":false,"le":"U","lm":false,"n":"Classics of Chinese Literature in Translation","no":"21G.044","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.046":{"b":[],"ci":true,"cl":"046","co":"21G","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[100,6]],"16-645"]],"la":false,"le":"U","lm":true,"n":"Modern Chinese Fiction and Cinema","no":"21G.046","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.049":{"b":[],"ci":true,"cl":"049","co":"21G","cw":false,"f":false,"h":7.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E51-385"]],"la":false,"le":"U","lm":true,"n":"French Photography","no":"21G.049","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":17.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.063":{"b":[],"ci":false,"cl":"063","co":"21G","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[43,3],[103,3]],"34-303"]],"la":false,"le":"U","lm":false,"n":"Anime: Transnational Media and Culture","no":"21G.063","nx":true,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":28.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.065":{"b":[],"ci":true,"cl":"065","co":"21G","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[12,3],[72,3]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"Japanese Literature and Cinema","no":"21G.065","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":16.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.085":{"b":[],"ci":false,"cl":"085","co":"21G","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[43,3],[103,3]],"56-167"]],"la":false,"le":"U","lm":false,"n":"Imperial and Revolutionary Russia: Culture and Politics, 1700-1917","no":"21G.085","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":10.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.101":{"b":[],"ci":false,"cl":"101","co":"21G","cw":false,"f":false,"h":23.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,2],[40,2],[100,2],[130,2]],"14N-325"],[[[14,2],[44,2],[104,2],[134,2]],"16-654"],[[[4,2],[34,2],[94,2],[124,2]],"14N-325"],[[[8,2],[38,2],[98,2],[128,2]],"16-654"]],"la":false,"le":"U","lm":true,"n":"Chinese I (Regular)","no":"21G.101","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":26.2,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.103":{"b":[],"ci":false,"cl":"103","co":"21G","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,2],[40,2],[100,2],[130,2]],"14E-310"],[[[2,2],[32,2],[92,2],[122,2]],"16-668"],[[[8,2],[38,2],[98,2],[128,2]],"16-644"]],"la":false,"le":"U","lm":true,"n":"Chinese III (Regular)","no":"21G.103","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":31.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.105":{"b":[],"ci":false,"cl":"105","co":"21G","cw":false,"f":false,"h":10.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"16-668"]],"la":false,"le":"U","lm":true,"n":"Chinese V (Regular): Discovering Chinese Cultures and Societies","no":"21G.105","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.107":{"b":[],"ci":false,"cl":"107","co":"21G","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"14N-221"],[[[8,2],[68,2],[128,2]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"Chinese I (Streamlined)","no":"21G.107","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.109":{"b":[],"ci":false,"cl":"109","co":"21G","cw":false,"f":false,"h":7.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"16-654"],[[[4,2],[64,2],[124,2]],"16-654"]],"la":false,"le":"U","lm":true,"n":"Chinese III (Streamlined)","no":"21G.109","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":28.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.113":{"b":[],"ci":false,"cl":"113","co":"21G","cw":false,"f":false,"h":7.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"14N-325"]],"la":false,"le":"U","lm":true,"n":"Chinese V (Streamlined)","no":"21G.113","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.151":{"b":[],"ci":false,"cl":"151","co":"21G","cw":false,"f":false,"h":23.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[40,2],[100,2],[130,2]],"14N-325"],[[[4,2],[34,2],[94,2],[124,2]],"14N-325"],[[[8,2],[38,2],[98,2],[128,2]],"16-654"],[[[14,2],[44,2],[104,2],[134,2]],"16-654"]],"la":false,"le":"G","lm":true,"n":"Chinese I (Regular)","no":"21G.151","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":26.2,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21G.157":{"b":[],"ci":false,"cl":"157","co":"21G","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"14E-310"],[[[4,2],[64,2],[124,2]],"14N-221"]],"la":false,"le":"G","lm":true,"n":"Chinese I (Streamlined)","no":"21G.157","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"21G.192":{"b":[],"ci":true,"cl":"192","co":"21G","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[100,6]],"16-645"]],"la":false,"le":"U","lm":true,"n":"Modern Chinese Fiction and Cinema","no":"21G.192","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":10,"v":false},"21G.195":{"b":[],"ci":false,"cl":"195","co":"21G","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"5-234"]],"la":false,"le":"U","lm":false,"n":"Classics of Chinese Literature in Translation","no":"21G.195","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":10,"v":false},"21G.219":{"b":[],"ci":false,"cl":"219","co":"21G","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"14N-221"],[[[19,3],[79,3]],"4-249"]],"la":false,"le":"G","lm":true,"n":"Foundations of Academic and Professional Writing (ELS)","no":"21G.219","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.220":{"b":[],"ci":false,"cl":"220","co":"21G","cw":false,"f":false,"h":6.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[37,3],[97,3]],"14N-221"]],"la":false,"le":"U","lm":true,"n":"Foundations of Academic and Professional Writing (ELS)","no":"21G.220","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":1.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.222":{"b":[],"ci":false,"cl":"222","co":"21G","cw":true,"f":false,"h":11.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[45,3],[105,3]],"1-273"],[[[42,3],[102,3]],"4-249"]],"la":false,"le":"U","lm":true,"n":"Expository Writing for Bilingual Students","no":"21G.222","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":31.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.223":{"b":[],"ci":false,"cl":"223","co":"21G","cw":false,"f":false,"h":5.9,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[40,3],[100,3]],"1-135"]],"la":false,"le":"U","lm":true,"n":"Listening, Speaking, and Pronunciation (ELS)","no":"21G.223","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":["l"],"si":6.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.224":{"b":[],"ci":false,"cl":"224","co":"21G","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"1-135"],[[[18,6]],"14N-225"]],"la":false,"le":"G","lm":true,"n":"Listening, Speaking, and Pronunciation (ELS)","no":"21G.224","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":11.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.225":{"b":[],"ci":false,"cl":"225","co":"21G","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,3],[98,3]],"4-253"]],"la":false,"le":"G","lm":true,"n":"Advanced Workshop in Writing for Science and Engineering (ELS)","no":"21G.225","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":6.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.226":{"b":[],"ci":false,"cl":"226","co":"21G","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[38,3],[98,3]],"4-253"]],"la":false,"le":"U","lm":true,"n":"Advanced Workshop in Writing for Science and Engineering (ELS)","no":"21G.226","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":2.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.232":{"b":[],"ci":false,"cl":"232","co":"21G","cw":false,"f":false,"h":4.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"56-180"]],"la":false,"le":"G","lm":true,"n":"Advanced Speaking and Critical Listening Skills (ELS)","no":"21G.232","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":7.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21G.233":{"b":[],"ci":false,"cl":"233","co":"21G","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[15,3],[75,3]],"56-180"]],"la":false,"le":"U","lm":true,"n":"Advanced Speaking and Critical Listening Skills (ELS)","no":"21G.233","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":6.3,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21G.301":{"b":[],"ci":false,"cl":"301","co":"21G","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"14N-325"],[[[4,2],[64,2],[124,2]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"French I","no":"21G.301","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":20.6,"t":["FA","JA","SP"],"tb":true,"u1":3,"u2":1,"u3":8,"v":false},"21G.302":{"b":[],"ci":false,"cl":"302","co":"21G","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"14E-310"],[[[10,2],[70,2],[130,2]],"14N-225"]],"la":false,"le":"U","lm":true,"n":"French II","no":"21G.302","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":17.8,"t":["FA","SP"],"tb":true,"u1":3,"u2":1,"u3":8,"v":false},"21G.303":{"b":[],"ci":false,"cl":"303","co":"21G","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"14N-221"],[[[8,2],[68,2],[128,2]],"14N-221"]],"la":false,"le":"U","lm":true,"n":"French III","no":"21G.303","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA","SP"],"tb":true,"u1":3,"u2":1,"u3":8,"v":false},"21G.304":{"b":[],"ci":false,"cl":"304","co":"21G","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"1-277"],[[[8,2],[68,2],[128,2]],"1-277"]],"la":false,"le":"U","lm":true,"n":"French IV","no":"21G.304","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA","SP"],"tb":true,"u1":3,"u2":1,"u3":8,"v":false},"21G.306":{"b":[],"ci":false,"cl":"306","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"French: Communication Intensive I","no":"21G.306","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":0,"v":true},"21G.307":{"b":[],"ci":false,"cl":"307","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"French: Communication Intensive II","no":"21G.307","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":0,"v":true},"21G.308":{"b":[],"ci":false,"cl":"308","co":"21G","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[14,3],[74,3]],"14N-313"]],"la":false,"le":"U","lm":false,"n":"Writing (Like the) French","no":"21G.308","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.312":{"b":[],"ci":false,"cl":"312","co":"21G","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"16-668"]],"la":false,"le":"U","lm":false,"n":"Basic Themes in French Literature and Culture","no":"21G.312","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":13.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.344":{"b":[],"ci":false,"cl":"344","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[52,6]],"14N-313"]],"la":false,"le":"U","lm":true,"n":"French Feminist Literature: Yesterday and Today","no":"21G.344","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.348":{"b":[],"ci":false,"cl":"348","co":"21G","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[82,6]],"14E-310"]],"la":false,"le":"U","lm":false,"n":"Global Paris","no":"21G.348","nx":true,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.351":{"b":[],"ci":false,"cl":"351","co":"21G","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"14N-325"],[[[4,2],[64,2],[124,2]],"14E-310"]],"la":false,"le":"G","lm":true,"n":"French I","no":"21G.351","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":20.6,"t":["FA","JA","SP"],"tb":true,"u1":3,"u2":1,"u3":5,"v":false},"21G.352":{"b":[],"ci":false,"cl":"352","co":"21G","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"14N-225"],[[[6,2],[66,2],[126,2]],"14E-310"]],"la":false,"le":"G","lm":true,"n":"French II","no":"21G.352","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":17.8,"t":["FA","SP"],"tb":true,"u1":3,"u2":1,"u3":5,"v":false},"21G.401":{"b":[],"ci":false,"cl":"401","co":"21G","cw":false,"f":false,"h":20.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[38,2],[98,2],[128,2]],"14N-225"],[[[2,2],[32,2],[92,2],[122,2]],"16-644"]],"la":false,"le":"U","lm":true,"n":"German I","no":"21G.401","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA","JA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.402":{"b":[],"ci":false,"cl":"402","co":"21G","cw":false,"f":false,"h":16.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[2,2],[32,2],[92,2],[122,2]],"14N-225"]],"la":false,"le":"U","lm":true,"n":"German II","no":"21G.402","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":7.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.403":{"b":[],"ci":false,"cl":"403","co":"21G","cw":false,"f":false,"h":11.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[12,2],[42,2],[102,2],[132,2]],"16-654"],[[[8,2],[38,2],[98,2],[128,2]],"1-375"]],"la":false,"le":"U","lm":true,"n":"German III","no":"21G.403","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":8.8,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.404":{"b":[],"ci":false,"cl":"404","co":"21G","cw":false,"f":false,"h":11.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[38,2],[98,2],[128,2]],"1-242"]],"la":false,"le":"U","lm":true,"n":"German IV","no":"21G.404","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":7.2,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.406":{"b":[],"ci":false,"cl":"406","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"German: Communication Intensive I","no":"21G.406","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":0,"v":true},"21G.407":{"b":[],"ci":false,"cl":"407","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"German: Communication Intensive II","no":"21G.407","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":0,"v":true},"21G.409":{"b":[],"ci":false,"cl":"409","co":"21G","cw":false,"f":false,"h":6.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"14N-225"]],"la":false,"le":"U","lm":false,"n":"Advanced German: Visual Arts, Media, Creative Expression","no":"21G.409","nx":true,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.451":{"b":[],"ci":false,"cl":"451","co":"21G","cw":false,"f":false,"h":20.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[38,2],[98,2],[128,2]],"14N-225"],[[[2,2],[32,2],[92,2],[122,2]],"16-644"]],"la":false,"le":"G","lm":true,"n":"German I","no":"21G.451","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA","JA","SP"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21G.452":{"b":[],"ci":false,"cl":"452","co":"21G","cw":false,"f":false,"h":16.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[32,2],[92,2],[122,2]],"14N-225"]],"la":false,"le":"G","lm":true,"n":"German II","no":"21G.452","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":7.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21G.501":{"b":[],"ci":false,"cl":"501","co":"21G","cw":false,"f":false,"h":20.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,2],[34,2],[94,2],[124,2]],"16-644"],[[[6,2],[36,2],[96,2],[126,2]],"16-644"],[[[12,2],[42,2],[102,2],[132,2]],"16-644"],[[[10,2],[40,2],[100,2],[130,2]],"16-644"]],"la":false,"le":"U","lm":true,"n":"Japanese I","no":"21G.501","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":37.7,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.503":{"b":[],"ci":false,"cl":"503","co":"21G","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,2],[34,2],[94,2],[124,2]],"4-249"],[[[8,2],[38,2],[98,2],[128,2]],"4-249"],[[[10,2],[40,2],[100,2],[130,2]],"4-249"],[[[2,2],[32,2],[92,2],[122,2]],"4-249"]],"la":false,"le":"U","lm":true,"n":"Japanese III","no":"21G.503","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":43.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.551":{"b":[],"ci":false,"cl":"551","co":"21G","cw":false,"f":false,"h":20.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[36,2],[96,2],[126,2]],"16-644"],[[[12,2],[42,2],[102,2],[132,2]],"16-644"],[[[4,2],[34,2],[94,2],[124,2]],"16-644"],[[[10,2],[40,2],[100,2],[130,2]],"16-644"]],"la":false,"le":"G","lm":true,"n":"Japanese I","no":"21G.551","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":37.7,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21G.554":{"b":[],"ci":false,"cl":"554","co":"21G","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[40,3],[100,3]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Inventing the Samurai","no":"21G.554","nx":true,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":10,"v":false},"21G.593":{"b":[],"ci":true,"cl":"593","co":"21G","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[12,3],[72,3]],"14E-310"]],"la":false,"le":"U","lm":false,"n":"Japanese Literature and Cinema","no":"21G.593","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":16.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":10,"v":false},"21G.596":{"b":[],"ci":false,"cl":"596","co":"21G","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[43,3],[103,3]],"34-303"]],"la":false,"le":"U","lm":false,"n":"Anime: Transnational Media and Culture","no":"21G.596","nx":true,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":28.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":10,"v":false},"21G.611":{"b":[],"ci":false,"cl":"611","co":"21G","cw":false,"f":false,"h":16.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[14,2],[44,2],[104,2],[134,2]],"14N-225"],[[[6,2],[36,2],[96,2],[126,2]],"14N-225"]],"la":false,"le":"U","lm":true,"n":"Russian I (Regular)","no":"21G.611","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":12.2,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.615":{"b":[],"ci":false,"cl":"615","co":"21G","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"14N-221"]],"la":false,"le":"U","lm":true,"n":"Russian V: Russian for STEM","no":"21G.615","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.700":{"b":[],"ci":false,"cl":"700","co":"21G","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,2],[36,2],[66,2],[96,2]],"1-273"]],"la":false,"le":"U","lm":true,"n":"Introductory Spanish for Heritage Learners","no":"21G.700","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.701":{"b":[],"ci":false,"cl":"701","co":"21G","cw":false,"f":false,"h":16.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[2,2],[32,2],[62,2],[92,2]],"16-676"],[[[8,2],[38,2],[68,2],[98,2]],"1-273"],[[[4,2],[34,2],[64,2],[94,2]],"1-273"]],"la":false,"le":"U","lm":true,"n":"Spanish I","no":"21G.701","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":23.1,"t":["FA","JA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.702":{"b":[],"ci":false,"cl":"702","co":"21G","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,2],[34,2],[64,2],[94,2]],"16-676"],[[[8,2],[38,2],[68,2],[98,2]],"16-668"],[[[6,2],[36,2],[66,2],[96,2]],"16-668"]],"la":false,"le":"U","lm":true,"n":"Spanish II","no":"21G.702","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":23.2,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.703":{"b":[],"ci":false,"cl":"703","co":"21G","cw":false,"f":false,"h":11.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,2],[40,2],[70,2],[100,2]],"14N-221"],[[[12,2],[42,2],[72,2],[102,2]],"16-676"],[[[6,2],[36,2],[66,2],[96,2]],"4-249"]],"la":false,"le":"U","lm":true,"n":"Spanish III","no":"21G.703","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":23.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.704":{"b":[],"ci":false,"cl":"704","co":"21G","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,2],[36,2],[66,2],[96,2]],"16-676"],[[[10,2],[40,2],[70,2],[100,2]],"16-676"],[[[8,2],[38,2],[68,2],[98,2]],"16-676"]],"la":false,"le":"U","lm":true,"n":"Spanish IV","no":"21G.704","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":30.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.708":{"b":[],"ci":false,"cl":"708","co":"21G","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Spanish: Communication Intensive I","no":"21G.708","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":0,"v":true},"21G.709":{"b":[],"ci":false,"cl":"709","co":"21G","cw":false,"f":false,"h":3.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Spanish: Communication Intensive II","no":"21G.709","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":1.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":0,"v":true},"21G.710":{"b":[],"ci":false,"cl":"710","co":"21G","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[13,3],[73,3]],"16-668"]],"la":false,"le":"U","lm":true,"n":"Advanced Communication in Spanish: Topics in Language and Culture","no":"21G.710","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.715":{"b":[],"ci":false,"cl":"715","co":"21G","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[43,3],[103,3]],"16-668"]],"la":false,"le":"U","lm":true,"n":"Topics in Medicine and Public Health in the Hispanic World","no":"21G.715","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":14.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.717":{"b":[],"ci":false,"cl":"717","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[52,6]],"14N-325"]],"la":false,"le":"U","lm":true,"n":"Power and Culture: Utopias and Dystopias in Spain and Latin America","no":"21G.717","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.738":{"b":[],"ci":false,"cl":"738","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Literature and Social Conflict: Perspectives on the Hispanic World","no":"21G.738","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.751":{"b":[],"ci":false,"cl":"751","co":"21G","cw":false,"f":false,"h":16.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[32,2],[62,2],[92,2]],"16-676"],[[[8,2],[38,2],[68,2],[98,2]],"1-273"],[[[4,2],[34,2],[64,2],[94,2]],"1-273"]],"la":false,"le":"G","lm":true,"n":"Spanish I","no":"21G.751","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":23.1,"t":["FA","JA","SP"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21G.752":{"b":[],"ci":false,"cl":"752","co":"21G","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[36,2],[66,2],[96,2]],"16-668"],[[[8,2],[38,2],[68,2],[98,2]],"16-668"],[[[4,2],[34,2],[64,2],[94,2]],"16-676"]],"la":false,"le":"G","lm":true,"n":"Spanish II","no":"21G.752","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":23.2,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21G.821":{"b":[],"ci":false,"cl":"821","co":"21G","cw":false,"f":false,"h":6.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"14N-221"]],"la":false,"le":"U","lm":true,"n":"The Beat of Brazil: Portuguese Language and Brazilian Society Through its Music","no":"21G.821","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":1.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.901":{"b":[],"ci":false,"cl":"901","co":"21G","cw":false,"f":false,"h":19.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[14,2],[44,2],[104,2],[134,2]],"16-676"],[[[10,2],[40,2],[100,2],[130,2]],"14N-313"]],"la":false,"le":"U","lm":true,"n":"Korean I (Regular)","no":"21G.901","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":19.5,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.903":{"b":[],"ci":false,"cl":"903","co":"21G","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[38,2],[98,2],[128,2]],"14N-313"],[[[16,2],[46,2],[106,2],[136,2]],"16-676"]],"la":false,"le":"U","lm":true,"n":"Korean III (Regular)","no":"21G.903","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.905":{"b":[],"ci":false,"cl":"905","co":"21G","cw":false,"f":false,"h":5.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[45,3],[105,3]],"14N-313"]],"la":false,"le":"U","lm":true,"n":"Korean V","no":"21G.905","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.911":{"b":[],"ci":false,"cl":"911","co":"21G","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"21G.911","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21G.951":{"b":[],"ci":false,"cl":"951","co":"21G","cw":false,"f":false,"h":25.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[14,2],[44,2],[104,2],[134,2]],"16-644"]],"la":false,"le":"U","lm":true,"n":"Arabic I","no":"21G.951","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA","JA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21G.S01":{"b":[],"ci":false,"cl":"S01","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,2],[46,2],[106,2],[136,2]],"16-644"]],"la":false,"le":"U","lm":false,"n":"Special Subject: Global Studies and Languages","no":"21G.S01","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"21G.S55":{"b":[],"ci":false,"cl":"S55","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[5,3],[65,3]],"14N-313"],[[[2,3],[62,3]],"14N-313"]],"la":false,"le":"U","lm":true,"n":"Special Subject: Japanese V","no":"21G.S55","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.S63":{"b":[],"ci":false,"cl":"S63","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"1-379"]],"la":false,"le":"U","lm":true,"n":"Special Subject: Russian III","no":"21G.S63","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.S81":{"b":[],"ci":false,"cl":"S81","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"16-645"]],"la":false,"le":"U","lm":true,"n":"Special Subject: Portuguese I","no":"21G.S81","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.S83":{"b":[],"ci":false,"cl":"S83","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"16-645"]],"la":false,"le":"U","lm":true,"n":"Special Subject: Portuguese III","no":"21G.S83","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21G.S85":{"b":[],"ci":false,"cl":"S85","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Special Subject: Portuguese I","no":"21G.S85","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"21G.THT":{"b":[],"ci":false,"cl":"THT","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Pre-Thesis Tutorial: Global Studies and Languages","no":"21G.THT","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":1,"u2":0,"u3":5,"v":true},"21G.THU":{"b":[],"ci":false,"cl":"THU","co":"21G","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Global Studies and Languages Thesis","no":"21G.THU","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21G.UR":{"b":[],"ci":false,"cl":"UR","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21G.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21G.URG":{"b":[],"ci":false,"cl":"URG","co":"21G","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21G.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21H.009":{"b":[],"ci":true,"cl":"009","co":"21H","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"66-160"]],"la":false,"le":"U","lm":false,"n":"World History and Its Fault Lines Since 1800","no":"21H.009","nx":true,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.130":{"b":[],"ci":true,"cl":"130","co":"21H","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[34,2],[94,2]],"4-237"]],"la":false,"le":"U","lm":false,"n":"The Ancient World: Greece","no":"21H.130","nx":false,"pl":false,"r":[[[[124,2]],"4-261"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":22.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.141":{"b":[],"ci":true,"cl":"141","co":"21H","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[13,3],[73,3]],"E51-385"]],"la":false,"le":"U","lm":false,"n":"Renaissance to Revolution: Europe, 1300-1800","no":"21H.141","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":9.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.145":{"b":[],"ci":true,"cl":"145","co":"21H","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E51-385"]],"la":false,"le":"U","lm":true,"n":"French Photography","no":"21H.145","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.154":{"b":[],"ci":false,"cl":"154","co":"21H","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[40,3],[100,3]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Inventing the Samurai","no":"21H.154","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.160":{"b":[],"ci":false,"cl":"160","co":"21H","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[37,3],[97,3]],"66-154"]],"la":false,"le":"U","lm":false,"n":"Islam, the Middle East, and the West","no":"21H.160","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.165":{"b":[],"ci":false,"cl":"165","co":"21H","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"4-146"]],"la":false,"le":"U","lm":false,"n":"A Survey of Modern African History","no":"21H.165","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.181":{"b":[],"ci":false,"cl":"181","co":"21H","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,3],[64,3]],"E51-385"]],"la":false,"le":"U","lm":false,"n":"Libertarianism in History","no":"21H.181","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.205":{"b":[],"ci":false,"cl":"205","co":"21H","cw":false,"f":false,"h":6.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[22,6]],"E51-361"]],"la":false,"le":"U","lm":false,"n":"The Civil War and the Emergence of Modern America: 1861-1890","no":"21H.205","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":18.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.239":{"b":[],"ci":false,"cl":"239","co":"21H","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[43,3],[103,3]],"66-156"]],"la":false,"le":"U","lm":false,"n":"The City of Rome in the Age of the Caesars","no":"21H.239","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.244":{"b":[],"ci":false,"cl":"244","co":"21H","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[43,3],[103,3]],"56-167"]],"la":false,"le":"U","lm":false,"n":"Imperial and Revolutionary Russia: Culture and Politics, 1700-1917","no":"21H.244","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":10.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.261":{"b":[],"ci":false,"cl":"261","co":"21H","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[13,3],[73,3]],"4-257"]],"la":false,"le":"U","lm":false,"n":"Modern Iran: A Century of Revolution","no":"21H.261","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.283":{"b":[],"ci":false,"cl":"283","co":"21H","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,4],[68,2]],"14N-112"]],"la":false,"le":"U","lm":true,"n":"The Indigenous History of MIT","no":"21H.283","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":1.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.290":{"b":[],"ci":false,"cl":"290","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[72,6]],"56-191"]],"la":false,"le":"U","lm":false,"n":"Economic Classics: The History of Economic Ideas from Ancient Times to the Present","no":"21H.290","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.343":{"b":[],"ci":false,"cl":"343","co":"21H","cw":false,"f":false,"h":9.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"4-251"]],"la":false,"le":"U","lm":true,"n":"Making Books in the Renaissance and Today","no":"21H.343","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":11.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.381":{"b":[],"ci":false,"cl":"381","co":"21H","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[124,6]],"2-103"]],"la":false,"le":"U","lm":false,"n":"Women and War","no":"21H.381","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.388":{"b":[],"ci":false,"cl":"388","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[72,6]],"E51-390"]],"la":false,"le":"U","lm":false,"n":"Global Commodities, American Dreams","no":"21H.388","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.390":{"b":[],"ci":false,"cl":"390","co":"21H","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,6]],"E51-285"]],"la":false,"le":"U","lm":false,"n":"Theories and Methods in the Study of History","no":"21H.390","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":8.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.391":{"b":[],"ci":false,"cl":"391","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Independent Study","no":"21H.391","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21H.985":{"b":[],"ci":false,"cl":"985","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[100,6]],"E51-393"]],"la":false,"le":"G","lm":false,"n":"Money, Credit, and Financial Crisis, 1600-1850","no":"21H.985","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"21H.988":{"b":[],"ci":false,"cl":"988","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"E51-390"]],"la":false,"le":"G","lm":false,"n":"Global Commodities, American Dreams","no":"21H.988","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.991":{"b":[],"ci":false,"cl":"991","co":"21H","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,6]],"E51-285"]],"la":false,"le":"G","lm":false,"n":"Theories and Methods in the Study of History","no":"21H.991","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":8.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21H.992":{"b":[],"ci":false,"cl":"992","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Independent Study","no":"21H.992","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21H.993":{"b":[],"ci":false,"cl":"993","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Independent Study","no":"21H.993","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21H.999":{"b":[],"ci":false,"cl":"999","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching History","no":"21H.999","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21H.S04":{"b":[],"ci":false,"cl":"S04","co":"21H","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"E51-285"]],"la":false,"le":"U","lm":false,"n":"Special Subject: History","no":"21H.S04","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"21H.THT":{"b":[],"ci":false,"cl":"THT","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"History Pre-Thesis Tutorial","no":"21H.THT","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21H.THU":{"b":[],"ci":false,"cl":"THU","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"History Thesis","no":"21H.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21H.UR":{"b":[],"ci":false,"cl":"UR","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"2-103"]],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21H.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"21H.URG":{"b":[],"ci":false,"cl":"URG","co":"21H","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21H.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21L.000":{"b":[],"ci":false,"cl":"000","co":"21L","cw":true,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[14,3],[74,3]],"14N-325"]],"la":false,"le":"U","lm":true,"n":"Writing About Literature","no":"21L.000","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":13.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.001":{"b":[],"ci":true,"cl":"001","co":"21L","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[45,3],[105,3]],"14N-112"]],"la":false,"le":"U","lm":true,"n":"Foundations of Western Literature: Homer to Dante","no":"21L.001","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.002":{"b":[],"ci":true,"cl":"002","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[3,3],[63,3]],"4-253"]],"la":false,"le":"U","lm":true,"n":"Foundations of Western Literature: From Shakespeare to the Present","no":"21L.002","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.003":{"b":[],"ci":true,"cl":"003","co":"21L","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[42,3],[102,3]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"Reading Fiction","no":"21L.003","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":12.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.004":{"b":[],"ci":true,"cl":"004","co":"21L","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[22,3],[82,3]],"2-103"],[[[10,3],[70,3]],"56-167"]],"la":false,"le":"U","lm":true,"n":"Reading Poetry","no":"21L.004","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":20.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.005":{"b":[],"ci":true,"cl":"005","co":"21L","cw":false,"f":false,"h":7.1,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-103"]],"la":false,"le":"U","lm":true,"n":"Introduction to Drama","no":"21L.005","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.006":{"b":[],"ci":true,"cl":"006","co":"21L","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[40,3],[100,3]],"56-167"]],"la":false,"le":"U","lm":true,"n":"American Literature","no":"21L.006","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.010":{"b":[],"ci":false,"cl":"010","co":"21L","cw":true,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[45,3],[105,3]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"Writing with Shakespeare","no":"21L.010","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":13.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.011":{"b":[[[[22,6]],"3-270"]],"ci":true,"cl":"011","co":"21L","cw":false,"f":false,"h":9.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Introduction to Film Studies","no":"21L.011","nx":false,"pl":false,"r":[[[[106,2]],"1-277"],[[[104,2]],"1-277"]],"ra":6.1,"re":false,"rp":false,"s":["r","b","l"],"si":28.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21L.019":{"b":[],"ci":true,"cl":"019","co":"21L","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[15,3],[75,3]],"2-103"]],"la":false,"le":"U","lm":false,"n":"Introduction to European and Latin American Fiction","no":"21L.019","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":23.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.040":{"b":[],"ci":true,"cl":"040","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[3,3],[63,3]],"1-277"]],"la":false,"le":"U","lm":false,"n":"Foundations of East Asian Literature and Culture: From Confucius to the Beats","no":"21L.040","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.044":{"b":[],"ci":false,"cl":"044","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"5-234"]],"la":false,"le":"U","lm":false,"n":"Classics of Chinese Literature in Translation","no":"21L.044","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.310":{"b":[],"ci":false,"cl":"310","co":"21L","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[52,6]],"2-103"]],"la":false,"le":"U","lm":true,"n":"Bestsellers","no":"21L.310","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":5.7,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"21L.320":{"b":[],"ci":false,"cl":"320","co":"21L","cw":false,"f":false,"h":7.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-251"]],"la":false,"le":"U","lm":true,"n":"Big Books","no":"21L.320","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":9.5,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"21L.325":{"b":[],"ci":false,"cl":"325","co":"21L","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-251"]],"la":false,"le":"U","lm":false,"n":"Small Wonders","no":"21L.325","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":5.5,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"21L.432":{"b":[],"ci":false,"cl":"432","co":"21L","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[82,6]],"56-167"]],"la":false,"le":"U","lm":false,"n":"Understanding Television","no":"21L.432","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.433":{"b":[],"ci":false,"cl":"433","co":"21L","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"4-144"]],"la":false,"le":"U","lm":false,"n":"Film Styles and Genres","no":"21L.433","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":["l"],"si":8.7,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.434":{"b":[],"ci":false,"cl":"434","co":"21L","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[36,3],[96,3]],"56-167"]],"la":false,"le":"U","lm":false,"n":"Science Fiction and Fantasy","no":"21L.434","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":16.7,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.481":{"b":[],"ci":false,"cl":"481","co":"21L","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[3,3],[63,3]],"2-147"]],"la":false,"le":"U","lm":false,"n":"HIV/AIDS in American Culture","no":"21L.481","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.489":{"b":[],"ci":false,"cl":"489","co":"21L","cw":false,"f":false,"h":8.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"66-156"]],"la":false,"le":"U","lm":false,"n":"Interactive Narrative","no":"21L.489","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.500":{"b":[],"ci":false,"cl":"500","co":"21L","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"56-169"]],"la":false,"le":"U","lm":true,"n":"How We Got to Hamilton","no":"21L.500","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.512":{"b":[],"ci":false,"cl":"512","co":"21L","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"56-167"]],"la":false,"le":"U","lm":false,"n":"American Authors","no":"21L.512","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.580":{"b":[],"ci":false,"cl":"580","co":"21L","cw":false,"f":false,"h":6.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"56-167"]],"la":false,"le":"U","lm":true,"n":"Translations","no":"21L.580","nx":true,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.607":{"b":[],"ci":false,"cl":"607","co":"21L","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"1-134"]],"la":false,"le":"U","lm":true,"n":"Greek I","no":"21L.607","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":10.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"21L.608":{"b":[],"ci":false,"cl":"608","co":"21L","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"1-134"]],"la":false,"le":"U","lm":true,"n":"Greek II","no":"21L.608","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"21L.613":{"b":[],"ci":false,"cl":"613","co":"21L","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[42,2],[102,2]],"14N-112"]],"la":false,"le":"U","lm":false,"n":"Latin Readings","no":"21L.613","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"21L.614":{"b":[],"ci":false,"cl":"614","co":"21L","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[42,2],[102,2]],"14N-112"]],"la":false,"le":"U","lm":false,"n":"Advanced Latin Readings","no":"21L.614","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":2.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"21L.621":{"b":[],"ci":false,"cl":"621","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[52,6]],"14N-313"]],"la":false,"le":"U","lm":true,"n":"French Feminist Literature: Yesterday and Today","no":"21L.621","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.637":{"b":[],"ci":false,"cl":"637","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[52,6]],"14N-325"]],"la":false,"le":"U","lm":true,"n":"Power and Culture: Utopias and Dystopias in Spain and Latin America","no":"21L.637","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.638":{"b":[],"ci":false,"cl":"638","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Literature and Social Conflict: Perspectives on the Hispanic World","no":"21L.638","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.704":{"b":[],"ci":false,"cl":"704","co":"21L","cw":false,"f":false,"h":7.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[45,3],[105,3]],"4-144"]],"la":false,"le":"U","lm":true,"n":"Studies in Poetry","no":"21L.704","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":["l"],"si":9.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.705":{"b":[],"ci":false,"cl":"705","co":"21L","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[40,3],[100,3]],"2-103"]],"la":false,"le":"U","lm":true,"n":"Major Authors","no":"21L.705","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":7.3,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.706":{"b":[],"ci":false,"cl":"706","co":"21L","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[7,3],[67,3]],"56-169"]],"la":false,"le":"U","lm":true,"n":"Studies in Film","no":"21L.706","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":5.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21L.720":{"b":[],"ci":false,"cl":"720","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[3,3],[63,3]],"56-167"]],"la":false,"le":"U","lm":true,"n":"Chaucer's Canterbury Tales","no":"21L.720","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21L.UR":{"b":[],"ci":false,"cl":"UR","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21L.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21L.URG":{"b":[],"ci":false,"cl":"URG","co":"21L","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"21L.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.011":{"b":[],"ci":true,"cl":"011","co":"21M","cw":false,"f":false,"h":7.9,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[75,3]],"4-270"]],"la":false,"le":"U","lm":true,"n":"Introduction to Western Music","no":"21M.011","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"4-152"],[[[42,2],[102,2]],"4-152"],[[[14,2],[134,2]],"4-152"]],"ra":6.0,"re":false,"rp":false,"s":["r","l"],"si":49.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21M.030":{"b":[],"ci":true,"cl":"030","co":"21M","cw":false,"f":false,"h":7.1,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"4-158"],[[[3,3],[63,3]],"4-158"],[[[6,3],[66,3]],"4-158"]],"la":false,"le":"U","lm":true,"n":"Introduction to Musics of the World","no":"21M.030","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":50.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.051":{"b":[[[[130,2]],"4-270"]],"ci":false,"cl":"051","co":"21M","cw":false,"f":false,"h":7.9,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"4-162"],[[[52,3],[112,3]],"24-033F"],[[[45,3],[105,3]],"4-162"]],"la":false,"le":"U","lm":true,"n":"Fundamentals of Music","no":"21M.051","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["b","l"],"si":61.8,"t":["FA","SP"],"tb":true,"u1":3,"u2":2,"u3":7,"v":false},"21M.053":{"b":[],"ci":false,"cl":"053","co":"21M","cw":false,"f":false,"h":8.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"4-158"]],"la":false,"le":"U","lm":true,"n":"Rhythms of the World","no":"21M.053","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":10.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.065":{"b":[],"ci":false,"cl":"065","co":"21M","cw":false,"f":false,"h":6.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"4-364"]],"la":false,"le":"U","lm":true,"n":"Introduction to Musical Composition","no":"21M.065","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":14.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.080":{"b":[],"ci":false,"cl":"080","co":"21M","cw":false,"f":false,"h":7.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,3],[69,3]],"4-364"]],"la":false,"le":"U","lm":true,"n":"Introduction to Music Technology","no":"21M.080","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":19.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.128":{"b":[],"ci":false,"cl":"128","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"4-152"]],"la":false,"le":"U","lm":true,"n":"Moments in Music: History/Culture A","no":"21M.128","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"21M.129":{"b":[],"ci":false,"cl":"129","co":"21M","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"4-152"]],"la":false,"le":"U","lm":true,"n":"Moments in Music: History/Culture B","no":"21M.129","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":true,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"21M.150":{"b":[],"ci":false,"cl":"150","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-364"]],"la":false,"le":"U","lm":true,"n":"Introductory Music Theory","no":"21M.150","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":1,"u2":1,"u3":4,"v":false},"21M.226":{"b":[],"ci":false,"cl":"226","co":"21M","cw":false,"f":false,"h":7.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"24-033F"]],"la":false,"le":"U","lm":true,"n":"Jazz","no":"21M.226","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.235":{"b":[],"ci":false,"cl":"235","co":"21M","cw":false,"f":false,"h":7.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"4-158"]],"la":false,"le":"U","lm":false,"n":"Baroque and Classical Music","no":"21M.235","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.271":{"b":[],"ci":false,"cl":"271","co":"21M","cw":false,"f":false,"h":6.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,3],[102,3]],"4-364"]],"la":false,"le":"U","lm":false,"n":"Symphony and Concerto","no":"21M.271","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.273":{"b":[],"ci":false,"cl":"273","co":"21M","cw":false,"f":false,"h":6.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"4-162"]],"la":false,"le":"U","lm":false,"n":"Opera","no":"21M.273","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.283":{"b":[],"ci":false,"cl":"283","co":"21M","cw":false,"f":false,"h":7.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"4-152"]],"la":false,"le":"U","lm":false,"n":"Musicals","no":"21M.283","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.285":{"b":[],"ci":false,"cl":"285","co":"21M","cw":false,"f":false,"h":7.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,3],[99,3]],"4-364"]],"la":false,"le":"U","lm":true,"n":"The Beatles","no":"21M.285","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.292":{"b":[],"ci":false,"cl":"292","co":"21M","cw":false,"f":false,"h":7.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"N52-199"]],"la":false,"le":"U","lm":true,"n":"Music of Indonesia","no":"21M.292","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.294":{"b":[],"ci":false,"cl":"294","co":"21M","cw":false,"f":false,"h":6.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"4-364"]],"la":false,"le":"U","lm":true,"n":"Popular Musics of the World","no":"21M.294","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":28.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.299":{"b":[],"ci":false,"cl":"299","co":"21M","cw":false,"f":false,"h":7.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"4-158"]],"la":false,"le":"U","lm":false,"n":"Studies in World Music","no":"21M.299","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":9.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.301":{"b":[[[[132,2]],"4-270"]],"ci":false,"cl":"301","co":"21M","cw":false,"f":false,"h":7.9,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,3],[102,3]],"4-162"],[[[15,3],[75,3]],"4-364"],[[[3,3],[63,3]],"4-162"],[[[9,3],[69,3]],"4-152"]],"la":false,"le":"U","lm":true,"n":"Harmony and Counterpoint I","no":"21M.301","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["b","l"],"si":79.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21M.302":{"b":[[[[136,2]],"4-364"],[[[106,2]],"4-270"]],"ci":false,"cl":"302","co":"21M","cw":false,"f":false,"h":9.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-162"],[[[36,3],[96,3]],"4-162"]],"la":false,"le":"U","lm":true,"n":"Harmony and Counterpoint II","no":"21M.302","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l","b"],"si":24.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"21M.303":{"b":[[[[106,2]],"4-270"],[[[136,2]],"4-364"]],"ci":false,"cl":"303","co":"21M","cw":false,"f":false,"h":7.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"4-162"]],"la":false,"le":"U","lm":true,"n":"Writing in Tonal Forms I","no":"21M.303","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["b","l"],"si":8.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"21M.310":{"b":[],"ci":false,"cl":"310","co":"21M","cw":false,"f":false,"h":8.1,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"4-162"]],"la":false,"le":"U","lm":false,"n":"Techniques of 20th-Century Composition","no":"21M.310","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":9.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.340":{"b":[],"ci":false,"cl":"340","co":"21M","cw":false,"f":false,"h":7.1,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"24-033F"]],"la":false,"le":"U","lm":true,"n":"Jazz Harmony and Arranging","no":"21M.340","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":15.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.359":{"b":[],"ci":false,"cl":"359","co":"21M","cw":false,"f":false,"h":9.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"24-033F"]],"la":false,"le":"U","lm":true,"n":"Studies in Musical Composition, Theory and Analysis","no":"21M.359","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":7.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.361":{"b":[],"ci":false,"cl":"361","co":"21M","cw":false,"f":false,"h":8.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"24-033F"],[[[42,3],[102,3]],"24-033F"]],"la":false,"le":"U","lm":true,"n":"Electronic Music Composition I","no":"21M.361","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":33.8,"t":["FA","SP"],"tb":false,"u1":2,"u2":1,"u3":9,"v":false},"21M.380":{"b":[],"ci":false,"cl":"380","co":"21M","cw":false,"f":false,"h":7.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"4-158"]],"la":false,"le":"U","lm":true,"n":"Music and Technology","no":"21M.380","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":9.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.385":{"b":[],"ci":false,"cl":"385","co":"21M","cw":false,"f":false,"h":11.2,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"4-270"]],"la":false,"le":"U","lm":true,"n":"Interactive Music Systems","no":"21M.385","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":26.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.401":{"b":[],"ci":false,"cl":"401","co":"21M","cw":false,"f":false,"h":5.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,5],[82,5]],"26-100"]],"la":false,"le":"U","lm":false,"n":"MIT Concert Choir","no":"21M.401","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":22.8,"t":["FA","SP"],"tb":false,"u1":0,"u2":4,"u3":2,"v":false},"21M.405":{"b":[],"ci":false,"cl":"405","co":"21M","cw":false,"f":false,"h":3.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"14W-111"]],"la":false,"le":"U","lm":true,"n":"MIT Chamber Chorus","no":"21M.405","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":7.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"21M.421":{"b":[],"ci":false,"cl":"421","co":"21M","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[53,5],[113,5]],"KRESGE"]],"la":false,"le":"U","lm":false,"n":"MIT Symphony","no":"21M.421","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":41.2,"t":["FA","SP"],"tb":false,"u1":0,"u2":4,"u3":2,"v":false},"21M.423":{"b":[],"ci":false,"cl":"423","co":"21M","cw":false,"f":false,"h":5.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"4-364"]],"la":false,"le":"U","lm":false,"n":"Conducting and Score-Reading","no":"21M.423","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"21M.426":{"b":[],"ci":false,"cl":"426","co":"21M","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,5],[82,5]],"KRESGE"]],"la":false,"le":"U","lm":false,"n":"MIT Wind Ensemble","no":"21M.426","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":26.8,"t":["FA","SP"],"tb":false,"u1":0,"u2":4,"u3":2,"v":false},"21M.442":{"b":[],"ci":false,"cl":"442","co":"21M","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[48,5],[108,5]],"14W-111"]],"la":false,"le":"U","lm":false,"n":"MIT Festival Jazz Ensemble","no":"21M.442","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":4,"u3":2,"v":false},"21M.445":{"b":[],"ci":false,"cl":"445","co":"21M","cw":false,"f":false,"h":4.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[18,8],[48,8],[78,8],[108,8]],"4-364"],[[[22,4],[82,4]],"24-033F"],[[[53,5]],"14W-111"]],"la":false,"le":"U","lm":false,"n":"Chamber Music Society","no":"21M.445","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":61.4,"t":["FA","SP"],"tb":false,"u1":0,"u2":4,"u3":2,"v":false},"21M.450":{"b":[[[[45,3],[105,3]],"N52-199"]],"ci":false,"cl":"450","co":"21M","cw":false,"f":false,"h":4.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"MIT Balinese Gamelan","no":"21M.450","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["b"],"si":5.3,"t":["FA","SP"],"tb":false,"u1":0,"u2":3,"u3":3,"v":false},"21M.451":{"b":[],"ci":false,"cl":"451","co":"21M","cw":false,"f":false,"h":3.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Studio Accompanying for Pianists","no":"21M.451","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":[],"si":4.2,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.460":{"b":[],"ci":false,"cl":"460","co":"21M","cw":false,"f":false,"h":3.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,3],[52,3]],"N52-199"],[[[25,27],[112,2]],"N52-199"]],"la":false,"le":"U","lm":true,"n":"MIT Senegalese Drum Ensemble","no":"21M.460","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":32.8,"t":["FA","SP"],"tb":false,"u1":0,"u2":3,"u3":3,"v":false},"21M.470":{"b":[],"ci":false,"cl":"470","co":"21M","cw":false,"f":false,"h":5.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"W16-RRA"]],"la":false,"le":"U","lm":false,"n":"MIT Laptop Ensemble","no":"21M.470","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":7.7,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"21M.475":{"b":[],"ci":false,"cl":"475","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Music Performance","no":"21M.475","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":true,"u1":1,"u2":2,"u3":3,"v":true},"21M.480":{"b":[],"ci":false,"cl":"480","co":"21M","cw":false,"f":false,"h":9.1,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[18,4]],"14W-111"],[[[78,4]],"14W-111"]],"la":false,"le":"U","lm":false,"n":"Advanced Music Performance","no":"21M.480","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":14.4,"t":["FA","SP"],"tb":false,"u1":1,"u2":2,"u3":6,"v":false},"21M.500":{"b":[],"ci":false,"cl":"500","co":"21M","cw":false,"f":false,"h":9.2,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,3],[102,3]],"4-158"]],"la":false,"le":"U","lm":false,"n":"Advanced Seminar in Music","no":"21M.500","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":["l"],"si":8.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.511":{"b":[],"ci":false,"cl":"511","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Music Performance","no":"21M.511","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":true,"u1":1,"u2":2,"u3":3,"v":true},"21M.512":{"b":[],"ci":false,"cl":"512","co":"21M","cw":false,"f":false,"h":9.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[18,5]],"14W-111"],[[[78,5]],"14W-111"]],"la":false,"le":"G","lm":false,"n":"Advanced Music Performance","no":"21M.512","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":14.4,"t":["FA","SP"],"tb":false,"u1":1,"u2":2,"u3":6,"v":false},"21M.531":{"b":[],"ci":false,"cl":"531","co":"21M","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Music","no":"21M.531","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":17.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.533":{"b":[],"ci":false,"cl":"533","co":"21M","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Music","no":"21M.533","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":1.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.580":{"b":[],"ci":false,"cl":"580","co":"21M","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[73,5]],"E14-333"]],"la":false,"le":"G","lm":false,"n":"Musical Aesthetics and Media Technology","no":"21M.580","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21M.600":{"b":[],"ci":false,"cl":"600","co":"21M","cw":false,"f":false,"h":6.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,4],[66,4]],"W97-160"],[[[36,4],[96,4]],"W97-269"],[[[10,4],[70,4]],"W16-RRB"],[[[40,4],[100,4]],"W97-269"],[[[44,4],[104,4]],"W97-160"],[[[14,4],[74,4]],"W16-RRB"]],"la":false,"le":"U","lm":true,"n":"Introduction to Acting","no":"21M.600","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":139.4,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21M.601":{"b":[],"ci":false,"cl":"601","co":"21M","cw":false,"f":false,"h":7.9,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,6]],"W97-261"],[[[22,6]],"W97-261"],[[[112,6]],"W97-261"],[[[42,6]],"W97-261"]],"la":false,"le":"U","lm":true,"n":"Drawing for Designers","no":"21M.601","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":49.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"21M.604":{"b":[],"ci":false,"cl":"604","co":"21M","cw":false,"f":false,"h":7.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6]],"W97-267"]],"la":false,"le":"U","lm":false,"n":"Playwriting Fundamentals","no":"21M.604","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.605":{"b":[],"ci":false,"cl":"605","co":"21M","cw":false,"f":false,"h":5.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,4],[70,4]],"50-201"],[[[6,4],[66,4]],"50-201"],[[[36,4],[96,4]],"50-201"]],"la":false,"le":"U","lm":true,"n":"Voice and Speech for the Actor","no":"21M.605","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":53.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"21M.606":{"b":[],"ci":false,"cl":"606","co":"21M","cw":false,"f":false,"h":9.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4],[96,4]],"W97-275"]],"la":false,"le":"U","lm":true,"n":"Introduction to Stagecraft","no":"21M.606","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":6,"u3":2,"v":false},"21M.608":{"b":[],"ci":false,"cl":"608","co":"21M","cw":false,"f":false,"h":8.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"4-152"]],"la":false,"le":"U","lm":true,"n":"Screenwriting","no":"21M.608","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.609":{"b":[],"ci":true,"cl":"609","co":"21M","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-103"]],"la":false,"le":"U","lm":true,"n":"Introduction to Drama","no":"21M.609","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.622":{"b":[],"ci":false,"cl":"622","co":"21M","cw":false,"f":false,"h":4.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4],[104,4]],"W97-162"]],"la":false,"le":"U","lm":true,"n":"Physical Improvisation: Scores and Structures","no":"21M.622","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21M.623":{"b":[],"ci":false,"cl":"623","co":"21M","cw":false,"f":false,"h":4.9,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4],[100,4]],"W97-162"],[[[36,4],[96,4]],"W97-160"],[[[10,4],[70,4]],"W97-162"]],"la":false,"le":"U","lm":true,"n":"Physical Improvisation: Bodies in Motion","no":"21M.623","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":33.7,"t":["FA","SP"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"21M.624":{"b":[],"ci":false,"cl":"624","co":"21M","cw":false,"f":false,"h":7.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4],[74,4]],"W97-162"]],"la":false,"le":"U","lm":true,"n":"Acting with the Camera","no":"21M.624","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":14.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21M.645":{"b":[],"ci":false,"cl":"645","co":"21M","cw":false,"f":false,"h":5.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"W97-160"]],"la":false,"le":"U","lm":false,"n":"Motion Theater","no":"21M.645","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":34.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.690":{"b":[],"ci":false,"cl":"690","co":"21M","cw":false,"f":false,"h":7.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"4-253"]],"la":false,"le":"U","lm":true,"n":"Sport as Performance","no":"21M.690","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.704":{"b":[],"ci":false,"cl":"704","co":"21M","cw":false,"f":false,"h":5.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6]],"W97-162"]],"la":false,"le":"U","lm":false,"n":"Music Theater Workshop","no":"21M.704","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"21M.706":{"b":[],"ci":false,"cl":"706","co":"21M","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,6]],"4-253"]],"la":false,"le":"U","lm":true,"n":"Asian American Theater","no":"21M.706","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"21M.707":{"b":[],"ci":false,"cl":"707","co":"21M","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"4-251"]],"la":false,"le":"U","lm":false,"n":"Theater and Race","no":"21M.707","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.710":{"b":[],"ci":true,"cl":"710","co":"21M","cw":false,"f":false,"h":6.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6]],"W97-269"]],"la":false,"le":"U","lm":true,"n":"Script Analysis","no":"21M.710","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.729":{"b":[],"ci":false,"cl":"729","co":"21M","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"56-169"]],"la":false,"le":"U","lm":true,"n":"How We Got to Hamilton","no":"21M.729","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.731":{"b":[],"ci":false,"cl":"731","co":"21M","cw":false,"f":false,"h":8.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6]],"W97-275"]],"la":false,"le":"U","lm":true,"n":"Sound Design for Theater and Dance","no":"21M.731","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":4.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21M.733":{"b":[],"ci":false,"cl":"733","co":"21M","cw":false,"f":false,"h":9.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6]],"W97-261"]],"la":false,"le":"U","lm":false,"n":"Set Design","no":"21M.733","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.784":{"b":[],"ci":false,"cl":"784","co":"21M","cw":false,"f":false,"h":7.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"W97-269"]],"la":false,"le":"U","lm":true,"n":"Producing Podcasts","no":"21M.784","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.790":{"b":[],"ci":false,"cl":"790","co":"21M","cw":false,"f":false,"h":7.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,6]],"W97-162"]],"la":false,"le":"U","lm":false,"n":"Director's Craft","no":"21M.790","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.791":{"b":[],"ci":false,"cl":"791","co":"21M","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,6]],"W97-162"]],"la":false,"le":"G","lm":false,"n":"Director's Craft","no":"21M.791","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"21M.803":{"b":[],"ci":false,"cl":"803","co":"21M","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Performance and Design Workshop","no":"21M.803","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":3,"u3":0,"v":true},"21M.806":{"b":[],"ci":false,"cl":"806","co":"21M","cw":false,"f":false,"h":16.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Applied Performance and Design Production","no":"21M.806","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":[],"si":8.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"21M.809":{"b":[],"ci":false,"cl":"809","co":"21M","cw":false,"f":false,"h":14.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Performance and Design Intensive","no":"21M.809","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":[],"si":10.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":9,"u3":0,"v":true},"21M.830":{"b":[],"ci":false,"cl":"830","co":"21M","cw":false,"f":false,"h":5.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"W97-269"]],"la":false,"le":"U","lm":false,"n":"Acting: Techniques and Style","no":"21M.830","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":8.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"21M.851":{"b":[],"ci":false,"cl":"851","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Performance and Design","no":"21M.851","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.861":{"b":[],"ci":false,"cl":"861","co":"21M","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"W97-162"]],"la":false,"le":"U","lm":true,"n":"Topics in Performance Technique","no":"21M.861","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21M.864":{"b":[],"ci":false,"cl":"864","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Theater","no":"21M.864","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.865":{"b":[],"ci":false,"cl":"865","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Theater","no":"21M.865","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.THT":{"b":[],"ci":false,"cl":"THT","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Pre-Thesis Tutorial","no":"21M.THT","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":1,"u2":0,"u3":5,"v":true},"21M.THU":{"b":[],"ci":false,"cl":"THU","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Undergraduate Thesis","no":"21M.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.UR":{"b":[],"ci":false,"cl":"UR","co":"21M","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Music and Theater Arts","no":"21M.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21M.URG":{"b":[],"ci":false,"cl":"URG","co":"21M","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Music","no":"21M.URG","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.011":{"b":[],"ci":false,"cl":"011","co":"21W","cw":true,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[44,3],[104,3]],"8-119"],[[[52,3],[112,3]],"8-119"]],"la":false,"le":"U","lm":true,"n":"Writing and Rhetoric: Rhetoric and Contemporary Issues","no":"21W.011","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":18.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.012":{"b":[],"ci":false,"cl":"012","co":"21W","cw":true,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,3],[68,3]],"56-162"]],"la":false,"le":"U","lm":true,"n":"Writing and Rhetoric: Food for Thought","no":"21W.012","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":11.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.013":{"b":[],"ci":false,"cl":"013","co":"21W","cw":true,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"56-191"]],"la":false,"le":"U","lm":true,"n":"Writing and Rhetoric: Introduction to Contemporary Rhetoric","no":"21W.013","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":11.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.015":{"b":[],"ci":false,"cl":"015","co":"21W","cw":true,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[37,3],[97,3]],"E17-136"]],"la":false,"le":"U","lm":true,"n":"Writing and Rhetoric: Writing about Sports","no":"21W.015","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":15.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.016":{"b":[],"ci":false,"cl":"016","co":"21W","cw":true,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[32,4],[92,4]],"56-180"]],"la":false,"le":"U","lm":true,"n":"Writing and Rhetoric: Designing Meaning","no":"21W.016","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":11.7,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"21W.021":{"b":[],"ci":false,"cl":"021","co":"21W","cw":true,"f":false,"h":6.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"8-119"]],"la":false,"le":"U","lm":true,"n":"Writing and Experience: MIT Inside, Live","no":"21W.021","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.022":{"b":[],"ci":false,"cl":"022","co":"21W","cw":true,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[36,3],[96,3]],"35-310"],[[[42,3],[102,3]],"56-169"],[[[3,3],[63,3]],"56-162"]],"la":false,"le":"U","lm":true,"n":"Writing and Experience: Reading and Writing Autobiography","no":"21W.022","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":43.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.031":{"b":[],"ci":false,"cl":"031","co":"21W","cw":true,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[44,3],[104,3]],"56-162"],[[[34,3],[94,3]],"E17-136"],[[[36,3],[96,3]],"56-162"]],"la":false,"le":"U","lm":true,"n":"Science Writing and New Media: Explorations in Communicating about Science and Technology","no":"21W.031","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":29.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.035":{"b":[],"ci":false,"cl":"035","co":"21W","cw":true,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[36,3],[96,3]],"4-144"],[[[14,3],[74,3]],"56-167"],[[[40,3],[100,3]],"66-156"]],"la":false,"le":"U","lm":true,"n":"Science Writing and New Media: Elements of Science Writing for the Public","no":"21W.035","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":28.8,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.041":{"b":[],"ci":false,"cl":"041","co":"21W","cw":true,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[14,3],[74,3]],"14N-325"]],"la":false,"le":"U","lm":true,"n":"Writing About Literature","no":"21W.041","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":13.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.042":{"b":[],"ci":false,"cl":"042","co":"21W","cw":true,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[45,3],[105,3]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"Writing with Shakespeare","no":"21W.042","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":13.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.219":{"b":[],"ci":false,"cl":"219","co":"21W","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"14N-221"],[[[19,3],[79,3]],"4-249"]],"la":false,"le":"G","lm":true,"n":"Foundations of Academic and Professional Writing (ELS)","no":"21W.219","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":9.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.220":{"b":[],"ci":false,"cl":"220","co":"21W","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[37,3],[97,3]],"14N-221"]],"la":false,"le":"U","lm":true,"n":"Foundations of Academic and Professional Writing (ELS)","no":"21W.220","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":["l"],"si":0.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.222":{"b":[],"ci":false,"cl":"222","co":"21W","cw":true,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[45,3],[105,3]],"1-135"],[[[42,3],[102,3]],"4-249"]],"la":false,"le":"U","lm":true,"n":"Expository Writing for Bilingual Students","no":"21W.222","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":true,"s":["l"],"si":30.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.223":{"b":[],"ci":false,"cl":"223","co":"21W","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[40,3],[100,3]],"1-135"]],"la":false,"le":"U","lm":true,"n":"Listening, Speaking, and Pronunciation (ELS)","no":"21W.223","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.224":{"b":[],"ci":false,"cl":"224","co":"21W","cw":false,"f":false,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"1-135"],[[[18,6]],"14N-225"]],"la":false,"le":"G","lm":true,"n":"Listening, Speaking, and Pronunciation (ELS)","no":"21W.224","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.225":{"b":[],"ci":false,"cl":"225","co":"21W","cw":false,"f":false,"h":6.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,3],[98,3]],"4-253"]],"la":false,"le":"G","lm":true,"n":"Advanced Workshop in Writing for Science and Engineering (ELS)","no":"21W.225","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":3.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.226":{"b":[],"ci":false,"cl":"226","co":"21W","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[38,3],[98,3]],"4-253"]],"la":false,"le":"U","lm":true,"n":"Advanced Workshop in Writing for Science and Engineering (ELS)","no":"21W.226","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":4.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.232":{"b":[],"ci":false,"cl":"232","co":"21W","cw":false,"f":false,"h":2.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"56-180"]],"la":false,"le":"G","lm":true,"n":"Advanced Speaking and Critical Listening Skills (ELS)","no":"21W.232","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":4.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21W.233":{"b":[],"ci":false,"cl":"233","co":"21W","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[15,3],[75,3]],"56-180"]],"la":false,"le":"U","lm":true,"n":"Advanced Speaking and Critical Listening Skills (ELS)","no":"21W.233","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":2.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"21W.735":{"b":[],"ci":true,"cl":"735","co":"21W","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[44,3],[104,3]],"1-379"]],"la":false,"le":"U","lm":true,"n":"Writing and Reading the Essay","no":"21W.735","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.738":{"b":[],"ci":false,"cl":"738","co":"21W","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,3],[64,3]],"4-251"]],"la":false,"le":"U","lm":false,"n":"Intersectional Feminist Memoir","no":"21W.738","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.740":{"b":[],"ci":false,"cl":"740","co":"21W","cw":false,"f":false,"h":9.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"16-220"]],"la":false,"le":"U","lm":false,"n":"Writing Autobiography and Biography","no":"21W.740","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.742":{"b":[],"ci":true,"cl":"742","co":"21W","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"5-232"]],"la":false,"le":"U","lm":true,"n":"Writing about Race","no":"21W.742","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.744":{"b":[],"ci":false,"cl":"744","co":"21W","cw":false,"f":false,"h":9.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"5-234"]],"la":false,"le":"U","lm":true,"n":"The Art of Comic Book Writing","no":"21W.744","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.747":{"b":[],"ci":true,"cl":"747","co":"21W","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[44,3],[104,3]],"E17-136"]],"la":false,"le":"U","lm":true,"n":"Rhetoric","no":"21W.747","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":24.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.748":{"b":[],"ci":false,"cl":"748","co":"21W","cw":false,"f":false,"h":9.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,6]],"66-144"]],"la":false,"le":"U","lm":true,"n":"Apocalyptic Storytelling","no":"21W.748","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":11.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.754":{"b":[],"ci":false,"cl":"754","co":"21W","cw":false,"f":false,"h":7.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6]],"W97-267"]],"la":false,"le":"U","lm":false,"n":"Playwriting Fundamentals","no":"21W.754","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.755":{"b":[],"ci":false,"cl":"755","co":"21W","cw":false,"f":false,"h":7.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"66-168"],[[[14,3],[74,3]],"36-112"]],"la":false,"le":"U","lm":true,"n":"Writing and Reading Short Stories","no":"21W.755","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":27.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.757":{"b":[],"ci":false,"cl":"757","co":"21W","cw":false,"f":false,"h":9.1,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-144"]],"la":false,"le":"U","lm":false,"n":"Fiction Workshop","no":"21W.757","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.759":{"b":[],"ci":false,"cl":"759","co":"21W","cw":false,"f":false,"h":8.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,3],[104,3]],"66-168"]],"la":false,"le":"U","lm":false,"n":"Writing Science Fiction","no":"21W.759","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.762":{"b":[],"ci":false,"cl":"762","co":"21W","cw":false,"f":false,"h":5.4,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"56-167"],[[[52,6]],"56-167"]],"la":false,"le":"U","lm":false,"n":"Poetry Workshop","no":"21W.762","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":["l"],"si":23.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.764":{"b":[],"ci":false,"cl":"764","co":"21W","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"1-277"]],"la":false,"le":"U","lm":true,"n":"The Word Made Digital","no":"21W.764","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.765":{"b":[],"ci":false,"cl":"765","co":"21W","cw":false,"f":false,"h":8.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"66-156"]],"la":false,"le":"U","lm":false,"n":"Interactive Narrative","no":"21W.765","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.768":{"b":[],"ci":false,"cl":"768","co":"21W","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[82,6]],"56-180"]],"la":false,"le":"U","lm":false,"n":"Games and Culture","no":"21W.768","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.771":{"b":[],"ci":false,"cl":"771","co":"21W","cw":false,"f":false,"h":6.1,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"4-253"]],"la":false,"le":"U","lm":false,"n":"Advanced Poetry Workshop","no":"21W.771","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":8.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.776":{"b":[],"ci":false,"cl":"776","co":"21W","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"4-152"]],"la":false,"le":"U","lm":true,"n":"Screenwriting","no":"21W.776","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.778":{"b":[],"ci":true,"cl":"778","co":"21W","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"5-232"]],"la":false,"le":"U","lm":true,"n":"Science Journalism","no":"21W.778","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.790":{"b":[],"ci":false,"cl":"790","co":"21W","cw":false,"f":false,"h":9.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"2-103"]],"la":false,"le":"U","lm":true,"n":"Short Attention Span Documentary","no":"21W.790","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":15.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.791":{"b":[],"ci":false,"cl":"791","co":"21W","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[12,6]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Network Cultures","no":"21W.791","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.792":{"b":[],"ci":false,"cl":"792","co":"21W","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Science Writing Internship","no":"21W.792","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"21W.798":{"b":[],"ci":false,"cl":"798","co":"21W","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Writing","no":"21W.798","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.799":{"b":[],"ci":false,"cl":"799","co":"21W","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Writing","no":"21W.799","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.822":{"b":[],"ci":false,"cl":"822","co":"21W","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[49,3],[109,3]],"14N-112"]],"la":false,"le":"G","lm":false,"n":"Science Writing Thesis Development and Workshop","no":"21W.822","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.823":{"b":[],"ci":false,"cl":"823","co":"21W","cw":false,"f":false,"h":4.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Lab Experience for Science Writers","no":"21W.823","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":[],"si":7.8,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":2,"u3":1,"v":true},"21W.825":{"b":[],"ci":false,"cl":"825","co":"21W","cw":false,"f":false,"h":15.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,4],[64,4],[124,4]],"14N-112"]],"la":false,"le":"G","lm":false,"n":"Advanced Science Writing Seminar I","no":"21W.825","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":6,"u2":0,"u3":18,"v":false},"21W.892":{"b":[],"ci":false,"cl":"892","co":"21W","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Science Writing Internship","no":"21W.892","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":[],"si":4.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"21W.898":{"b":[],"ci":false,"cl":"898","co":"21W","cw":false,"f":false,"h":15.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Independent Study in Writing","no":"21W.898","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":true,"s":[],"si":2.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.899":{"b":[],"ci":false,"cl":"899","co":"21W","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Independent Study in Writing","no":"21W.899","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.THG":{"b":[],"ci":false,"cl":"THG","co":"21W","cw":false,"f":false,"h":11.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[49,3],[109,3]],"14N-112"]],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"21W.THG","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":true,"s":["l"],"si":8.2,"t":["FA","JA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"21W.THT":{"b":[],"ci":false,"cl":"THT","co":"21W","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Writing Pre-Thesis Tutorial","no":"21W.THT","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.THU":{"b":[],"ci":false,"cl":"THU","co":"21W","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Writing Program Thesis","no":"21W.THU","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":7.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.UR":{"b":[],"ci":false,"cl":"UR","co":"21W","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Writing","no":"21W.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"21W.URG":{"b":[],"ci":false,"cl":"URG","co":"21W","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Writing","no":"21W.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.003":{"b":[],"ci":false,"cl":"003","co":"22","cw":false,"f":false,"h":1.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,2]],"3-001"]],"la":false,"le":"U","lm":false,"n":"NEET Seminar: Renewable Energy Machines","no":"22.003","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"22.01":{"b":[[[[134,2]],"24-121"]],"ci":false,"cl":"01","co":"22","cw":false,"f":true,"h":13.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Introduction to Nuclear Engineering and Ionizing Radiation","no":"22.01","nx":false,"pl":false,"r":[[[[12,2],[72,2],[132,2]],"24-121"]],"ra":6.6,"re":true,"rp":false,"s":["r","b"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"22.014":{"b":[],"ci":false,"cl":"014","co":"22","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,4]],"66-148"],[[[44,4]],"66-148"],[[[14,4]],"66-148"],[[[82,4]],"66-144"]],"la":false,"le":"U","lm":false,"n":"Ethics for Engineers","no":"22.014","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":59.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"22.015":{"b":[],"ci":false,"cl":"015","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,3]],"N52-495"]],"la":false,"le":"U","lm":true,"n":"Radiation and Life: Applications of Radiation Sources in Medicine, Research, and Industry","no":"22.015","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":0,"v":false},"22.016":{"b":[],"ci":false,"cl":"016","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,2]],"24-121"]],"la":false,"le":"U","lm":true,"n":"Seminar in Fusion and Plasma Physics","no":"22.016","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":false},"22.017":{"b":[],"ci":false,"cl":"017","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2]],"24-307"]],"la":false,"le":"U","lm":false,"n":"Nuclear in the News","no":"22.017","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":1,"v":false},"22.03":{"b":[[[[74,4]],"NE45-202A"]],"ci":false,"cl":"03","co":"22","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"NE45-202A"]],"la":false,"le":"U","lm":true,"n":"Introduction to Design Thinking and Rapid Prototyping","no":"22.03","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":false,"s":["l","b"],"si":6.3,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"22.033":{"b":[],"ci":false,"cl":"033","co":"22","cw":false,"f":false,"h":16.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"24-115"]],"la":false,"le":"U","lm":false,"n":"Nuclear Systems Design Project","no":"22.033","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":7.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":12,"v":false},"22.039":{"b":[],"ci":false,"cl":"039","co":"22","cw":false,"f":false,"h":11.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"24-115"]],"la":false,"le":"U","lm":false,"n":"Integration of Reactor Design, Operations, and Safety","no":"22.039","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":7.3,"t":["FA"],"tb":true,"u1":3,"u2":2,"u3":7,"v":false},"22.05":{"b":[],"ci":false,"cl":"05","co":"22","cw":false,"f":true,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"24-121"]],"la":false,"le":"U","lm":false,"n":"Neutron Science and Reactor Physics","no":"22.05","nx":false,"pl":false,"r":[[[[124,2]],"24-121"]],"ra":5.9,"re":false,"rp":false,"s":["l","r"],"si":5.7,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"22.074":{"b":[],"ci":false,"cl":"074","co":"22","cw":false,"f":true,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"24-112"]],"la":false,"le":"U","lm":false,"n":"Radiation Damage and Effects in Nuclear Materials","no":"22.074","nx":true,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.078":{"b":[],"ci":false,"cl":"078","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-159"]],"la":false,"le":"U","lm":false,"n":"Nuclear Waste Management","no":"22.078","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.081":{"b":[],"ci":false,"cl":"081","co":"22","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"U","lm":true,"n":"Introduction to Sustainable Energy","no":"22.081","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"22.09":{"b":[[[[42,4],[100,6]],"NW14-1310"]],"ci":false,"cl":"09","co":"22","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2]],"NW12-222"]],"la":true,"le":"U","lm":false,"n":"Principles of Nuclear Radiation Measurement and Protection","no":"22.09","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["b","l"],"si":9.0,"t":["FA"],"tb":false,"u1":1,"u2":5,"u3":9,"v":false},"22.091":{"b":[],"ci":false,"cl":"091","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Project in Nuclear Science and Engineering","no":"22.091","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.093":{"b":[],"ci":false,"cl":"093","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Project in Nuclear Science and Engineering","no":"22.093","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.099":{"b":[],"ci":false,"cl":"099","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Topics in Nuclear Science and Engineering","no":"22.099","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.11":{"b":[],"ci":false,"cl":"11","co":"22","cw":false,"f":false,"h":15.3,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"56-154"]],"la":false,"le":"G","lm":false,"n":"Applied Nuclear Physics","no":"22.11","nx":false,"pl":false,"r":[[[[132,2]],"24-115"]],"ra":6.0,"re":false,"rp":true,"s":["l","r"],"si":19.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"22.12":{"b":[],"ci":false,"cl":"12","co":"22","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Radiation Interactions, Control, and Measurement","no":"22.12","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":true,"s":["l"],"si":20.7,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"22.13":{"b":[],"ci":false,"cl":"13","co":"22","cw":false,"f":false,"h":13.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"56-154"]],"la":false,"le":"G","lm":false,"n":"Nuclear Energy Systems","no":"22.13","nx":false,"pl":false,"r":[[[[123,2]],"24-115"]],"ra":6.3,"re":false,"rp":true,"s":["l","r"],"si":19.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"22.312":{"b":[],"ci":false,"cl":"312","co":"22","cw":false,"f":true,"h":15.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Engineering of Nuclear Reactors","no":"22.312","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.313":{"b":[],"ci":false,"cl":"313","co":"22","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Thermal Hydraulics in Power Technology","no":"22.313","nx":true,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"22.33":{"b":[],"ci":false,"cl":"33","co":"22","cw":false,"f":false,"h":16.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Nuclear Engineering Design","no":"22.33","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":7.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":15,"v":false},"22.39":{"b":[],"ci":false,"cl":"39","co":"22","cw":false,"f":false,"h":11.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Integration of Reactor Design, Operations, and Safety","no":"22.39","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":7.3,"t":["FA"],"tb":true,"u1":3,"u2":2,"u3":7,"v":false},"22.611":{"b":[],"ci":false,"cl":"611","co":"22","cw":false,"f":true,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"NW16-213"]],"la":false,"le":"G","lm":false,"n":"Introduction to Plasma Physics I","no":"22.611","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":14.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.63":{"b":[],"ci":false,"cl":"63","co":"22","cw":false,"f":false,"h":11.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"NW16-213"]],"la":false,"le":"G","lm":false,"n":"Engineering Principles for Fusion Reactors","no":"22.63","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.64":{"b":[],"ci":false,"cl":"64","co":"22","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"33-319"]],"la":false,"le":"G","lm":false,"n":"Ionized Gases","no":"22.64","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.73":{"b":[],"ci":false,"cl":"73","co":"22","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Defects in Materials","no":"22.73","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.74":{"b":[],"ci":false,"cl":"74","co":"22","cw":false,"f":true,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"24-112"]],"la":false,"le":"G","lm":false,"n":"Radiation Damage and Effects in Nuclear Materials","no":"22.74","nx":true,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.78":{"b":[],"ci":false,"cl":"78","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-159"]],"la":false,"le":"G","lm":false,"n":"Nuclear Waste Management","no":"22.78","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"22.811":{"b":[],"ci":false,"cl":"811","co":"22","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"Virtual"]],"la":false,"le":"G","lm":false,"n":"Sustainable Energy","no":"22.811","nx":false,"pl":false,"r":[[[[136,2]],"Virtual"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":51.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":true},"22.90":{"b":[[[[42,4],[100,6]],"NW14-1310"]],"ci":false,"cl":"90","co":"22","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2]],"NW12-222"]],"la":false,"le":"G","lm":false,"n":"Nuclear Science and Engineering Laboratory","no":"22.90","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["b","l"],"si":9.0,"t":["FA"],"tb":false,"u1":1,"u2":5,"u3":9,"v":false},"22.901":{"b":[],"ci":false,"cl":"901","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Project in Nuclear Science and Engineering","no":"22.901","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.911":{"b":[[[[8,3]],"24-121"],[[[76,3]],"24-121"],[[[48,3]],"NW17-218"]],"ci":false,"cl":"911","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminar in Nuclear Science and Engineering","no":"22.911","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["b"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"22.93":{"b":[],"ci":false,"cl":"93","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching and Technical Communication Experience in Nuclear Science & Engineering","no":"22.93","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.94":{"b":[],"ci":false,"cl":"94","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Nuclear Science and Engineering","no":"22.94","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.EPE":{"b":[],"ci":false,"cl":"EPE","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"22.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"22.EPW":{"b":[],"ci":false,"cl":"EPW","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"22.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"22.S093":{"b":[],"ci":false,"cl":"S093","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-131"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Nuclear Science and Engineering","no":"22.S093","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"22.THG":{"b":[],"ci":false,"cl":"THG","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"22.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.THT":{"b":[],"ci":false,"cl":"THT","co":"22","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,2]],"24-115"]],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis Tutorial","no":"22.THT","nx":false,"pl":false,"r":[],"ra":4.5,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"22.THU":{"b":[],"ci":false,"cl":"THU","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"22.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.UAR":{"b":[],"ci":false,"cl":"UAR","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2],[106,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Climate and Sustainability Undergraduate Advanced Research","no":"22.UAR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"22.UR":{"b":[],"ci":false,"cl":"UR","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research Opportunities Program","no":"22.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"22.URG":{"b":[],"ci":false,"cl":"URG","co":"22","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research Opportunities Program","no":"22.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.00":{"b":[],"ci":true,"cl":"00","co":"24","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[36,2],[96,2]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Problems of Philosophy","no":"24.00","nx":false,"pl":false,"r":[[[[124,2]],"56-180"],[[[128,2]],"66-154"],[[[126,2]],"56-180"]],"ra":5.6,"re":false,"rp":false,"s":["l","r"],"si":107.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.06":{"b":[],"ci":true,"cl":"06","co":"24","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[68,2]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Bioethics","no":"24.06","nx":true,"pl":false,"r":[[[[128,2]],"56-191"],[[[126,2]],"56-169"],[[[124,2]],"66-156"]],"ra":5.2,"re":false,"rp":false,"s":["r","l"],"si":75.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.09":{"b":[],"ci":true,"cl":"09","co":"24","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,2],[66,2]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Minds and Machines","no":"24.09","nx":false,"pl":false,"r":[[[[124,2]],"56-167"],[[[126,2]],"56-167"],[[[128,2]],"56-167"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":62.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.133":{"b":[],"ci":false,"cl":"133","co":"24","cw":false,"f":false,"h":2.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Experiential Ethics","no":"24.133","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":[],"si":30.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":true},"24.150":{"b":[],"ci":false,"cl":"150","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"32-124"]],"la":false,"le":"U","lm":false,"n":"Liberalism, Toleration, and Freedom of Speech","no":"24.150","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.201":{"b":[],"ci":false,"cl":"201","co":"24","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"26-322"]],"la":false,"le":"U","lm":false,"n":"Topics in the History of Philosophy","no":"24.201","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.211":{"b":[],"ci":false,"cl":"211","co":"24","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"32-124"]],"la":false,"le":"U","lm":false,"n":"Theory of Knowledge","no":"24.211","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.212":{"b":[],"ci":false,"cl":"212","co":"24","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[36,3],[96,3]],"56-169"]],"la":false,"le":"U","lm":false,"n":"Philosophy of Perception","no":"24.212","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":16.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.215":{"b":[],"ci":false,"cl":"215","co":"24","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"66-168"]],"la":false,"le":"U","lm":false,"n":"Topics in the Philosophy of Science","no":"24.215","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.221":{"b":[],"ci":false,"cl":"221","co":"24","cw":false,"f":false,"h":5.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[13,3],[73,3]],"66-154"]],"la":false,"le":"U","lm":false,"n":"Metaphysics","no":"24.221","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":17.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.231":{"b":[],"ci":false,"cl":"231","co":"24","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[36,2],[96,2]],"66-160"]],"la":false,"le":"U","lm":true,"n":"Ethics","no":"24.231","nx":false,"pl":false,"r":[[[[126,2]],"4-253"],[[[124,2]],"4-253"]],"ra":6.6,"re":false,"rp":false,"s":["l","r"],"si":17.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.234":{"b":[],"ci":false,"cl":"234","co":"24","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,6]],"N51-310"]],"la":false,"le":"U","lm":true,"n":"Global Justice, Gender, and Development","no":"24.234","nx":false,"pl":false,"r":[],"ra":2.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.241":{"b":[],"ci":false,"cl":"241","co":"24","cw":false,"f":true,"h":7.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[3,3],[63,3]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Logic I","no":"24.241","nx":false,"pl":false,"r":[],"ra":4.3,"re":false,"rp":false,"s":["l"],"si":30.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.260":{"b":[],"ci":false,"cl":"260","co":"24","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[43,3],[103,3]],"4-253"]],"la":false,"le":"U","lm":false,"n":"Topics in Philosophy","no":"24.260","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.292":{"b":[],"ci":false,"cl":"292","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study: Philosophy","no":"24.292","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.400":{"b":[],"ci":false,"cl":"400","co":"24","cw":false,"f":false,"h":11.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,6],[124,6]],"32-D831"]],"la":false,"le":"G","lm":false,"n":"Proseminar in Philosophy I","no":"24.400","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":6,"u2":0,"u3":18,"v":false},"24.601":{"b":[],"ci":false,"cl":"601","co":"24","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[103,4]],"32-D831"]],"la":false,"le":"G","lm":false,"n":"Topics in Moral Philosophy","no":"24.601","nx":false,"pl":false,"r":[],"ra":4.5,"re":false,"rp":false,"s":["l"],"si":5.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.611":{"b":[],"ci":false,"cl":"611","co":"24","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[71,4]],"E53-438"]],"la":false,"le":"G","lm":false,"n":"Political Philosophy","no":"24.611","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":15.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.634":{"b":[],"ci":false,"cl":"634","co":"24","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,6]],"N51-310"]],"la":false,"le":"G","lm":true,"n":"Global Justice, Gender, and Development","no":"24.634","nx":false,"pl":false,"r":[],"ra":2.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.729":{"b":[],"ci":false,"cl":"729","co":"24","cw":false,"f":false,"h":11.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"32-D831"]],"la":false,"le":"G","lm":false,"n":"Topics in Philosophy of Language","no":"24.729","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":8.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.805":{"b":[],"ci":false,"cl":"805","co":"24","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"32-D831"]],"la":false,"le":"G","lm":false,"n":"Topics in Theory of Knowledge","no":"24.805","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":["l"],"si":3.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.891":{"b":[],"ci":false,"cl":"891","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Philosophy","no":"24.891","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.892":{"b":[],"ci":false,"cl":"892","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Philosophy","no":"24.892","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.893":{"b":[],"ci":false,"cl":"893","co":"24","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Dissertation Workshop","no":"24.893","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":7.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":true},"24.894":{"b":[],"ci":false,"cl":"894","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Placement Workshop","no":"24.894","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":true,"u1":2,"u2":0,"u3":1,"v":true},"24.900":{"b":[],"ci":true,"cl":"900","co":"24","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[6,3],[66,3]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Introduction to Linguistics","no":"24.900","nx":false,"pl":false,"r":[[[[128,2]],"56-162"],[[[124,2]],"56-162"],[[[126,2]],"56-162"],[[[130,2]],"56-162"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":85.8,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"24.901":{"b":[],"ci":false,"cl":"901","co":"24","cw":false,"f":true,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[36,3],[96,3]],"26-328"]],"la":false,"le":"U","lm":false,"n":"Language and Its Structure I: Phonology","no":"24.901","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":21.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.902":{"b":[],"ci":false,"cl":"902","co":"24","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[6,3],[66,3]],"66-144"]],"la":false,"le":"U","lm":false,"n":"Language and Its Structure II: Syntax","no":"24.902","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":20.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.906":{"b":[],"ci":true,"cl":"906","co":"24","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[10,3],[70,3]],"66-144"]],"la":false,"le":"U","lm":true,"n":"The Linguistic Study of Bilingualism","no":"24.906","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.919":{"b":[],"ci":false,"cl":"919","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study: Linguistics","no":"24.919","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.921":{"b":[],"ci":false,"cl":"921","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Linguistics","no":"24.921","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.922":{"b":[],"ci":false,"cl":"922","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study: Linguistics","no":"24.922","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.93":{"b":[],"ci":false,"cl":"93","co":"24","cw":false,"f":false,"h":1.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[113,2]],"4-270"]],"la":false,"le":"U","lm":false,"n":"The Search for Meaning","no":"24.93","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":74.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":1,"v":false},"24.931":{"b":[],"ci":false,"cl":"931","co":"24","cw":false,"f":true,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"26-328"]],"la":false,"le":"G","lm":false,"n":"Language and Its Structure I: Phonology","no":"24.931","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":21.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.932":{"b":[],"ci":false,"cl":"932","co":"24","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"66-144"]],"la":false,"le":"G","lm":false,"n":"Language and Its Structure II: Syntax","no":"24.932","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":20.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.943":{"b":[],"ci":false,"cl":"943","co":"24","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[64,6]],"32-D831"]],"la":false,"le":"G","lm":false,"n":"Syntax of a Language (Family)","no":"24.943","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":2.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.951":{"b":[],"ci":false,"cl":"951","co":"24","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"36-372"]],"la":false,"le":"G","lm":false,"n":"Introduction to Syntax","no":"24.951","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":6.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.955":{"b":[],"ci":false,"cl":"955","co":"24","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,6]],"32-D461"]],"la":false,"le":"G","lm":false,"n":"More Advanced Syntax","no":"24.955","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.956":{"b":[],"ci":false,"cl":"956","co":"24","cw":false,"f":false,"h":6.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"32-D461"]],"la":false,"le":"G","lm":false,"n":"Topics in Syntax","no":"24.956","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":7.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.961":{"b":[],"ci":false,"cl":"961","co":"24","cw":false,"f":false,"h":11.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"26-328"]],"la":false,"le":"G","lm":false,"n":"Introduction to Phonology","no":"24.961","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.964":{"b":[],"ci":false,"cl":"964","co":"24","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,6]],"32-D461"]],"la":false,"le":"G","lm":false,"n":"Topics in Phonology","no":"24.964","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":4.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.970":{"b":[],"ci":false,"cl":"970","co":"24","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"26-322"]],"la":false,"le":"G","lm":false,"n":"Introduction to Semantics","no":"24.970","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":7.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.991":{"b":[],"ci":false,"cl":"991","co":"24","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"32-D461"]],"la":false,"le":"G","lm":false,"n":"Workshop in Linguistics","no":"24.991","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":true,"s":["l"],"si":7.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.993":{"b":[],"ci":false,"cl":"993","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Tutorial in Linguistics and Related Fields","no":"24.993","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.995":{"b":[],"ci":false,"cl":"995","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Linguistics Professional Perspective","no":"24.995","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"24.S00":{"b":[],"ci":false,"cl":"S00","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Philosophy","no":"24.S00","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"24.S20":{"b":[],"ci":false,"cl":"S20","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Philosophy","no":"24.S20","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"24.S40":{"b":[],"ci":false,"cl":"S40","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Philosophy","no":"24.S40","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"24.S41":{"b":[],"ci":false,"cl":"S41","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Philosophy","no":"24.S41","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"24.S90":{"b":[],"ci":false,"cl":"S90","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Linguistics","no":"24.S90","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"24.S94":{"b":[],"ci":false,"cl":"S94","co":"24","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Seminar: Linguistics","no":"24.S94","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":true},"24.S96":{"b":[],"ci":false,"cl":"S96","co":"24","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,6]],"32-D461"]],"la":false,"le":"G","lm":false,"n":"Special Seminar: Linguistics","no":"24.S96","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":["l"],"si":0.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"24.THG":{"b":[],"ci":false,"cl":"THG","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"24.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.UR":{"b":[],"ci":false,"cl":"UR","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"24.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"24.URG":{"b":[],"ci":false,"cl":"URG","co":"24","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"24.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.001":{"b":[],"ci":false,"cl":"001","co":"3","cw":false,"f":false,"h":2.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"56-154"]],"la":false,"le":"U","lm":false,"n":"Introduction to Materials Science and Engineering","no":"3.001","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":9.5,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"3.006":{"b":[],"ci":false,"cl":"006","co":"3","cw":false,"f":false,"h":1.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,2]],"3-001"]],"la":false,"le":"U","lm":false,"n":"NEET Seminar: Advanced Materials Machines","no":"3.006","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":10.2,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"3.0061":{"b":[[[[74,4]],"NE45-202A"]],"ci":false,"cl":"0061","co":"3","cw":false,"f":false,"h":6.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"NE45-202A"]],"la":false,"le":"U","lm":true,"n":"Introduction to Design Thinking and Rapid Prototyping","no":"3.0061","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["b","l"],"si":9.0,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"3.010":{"b":[[[[130,4]],"8-119"],[[[124,4]],"8-119"]],"ci":false,"cl":"010","co":"3","cw":false,"f":false,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2]],"4-231"]],"la":true,"le":"U","lm":false,"n":"Structure of Materials","no":"3.010","nx":false,"pl":false,"r":[[[[34,2]],"8-119"],[[[36,2]],"8-119"]],"ra":5.7,"re":false,"rp":false,"s":["r","b","l"],"si":31.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"3.013":{"b":[[[[124,4]],"8-119"],[[[130,4]],"8-119"]],"ci":false,"cl":"013","co":"3","cw":false,"f":false,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2]],"4-231"]],"la":false,"le":"U","lm":false,"n":"Mechanics of Materials","no":"3.013","nx":false,"pl":false,"r":[[[[96,2]],"8-119"],[[[94,2]],"8-119"]],"ra":4.4,"re":false,"rp":false,"s":["r","b","l"],"si":23.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"3.019":{"b":[],"ci":false,"cl":"019","co":"3","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,2]],"66-148"]],"la":false,"le":"U","lm":false,"n":"Introduction to Symbolic and Mathematical Computing","no":"3.019","nx":false,"pl":false,"r":[[[[102,2]],"4-265"],[[[104,2]],"4-265"]],"ra":4.5,"re":false,"rp":false,"s":["r","l"],"si":26.0,"t":["FA"],"tb":false,"u1":2,"u2":1,"u3":0,"v":false},"3.030":{"b":[[[[40,4]],"8-107"],[[[34,4]],"8-107"]],"ci":false,"cl":"030","co":"3","cw":false,"f":true,"h":13.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"4-231"]],"la":false,"le":"U","lm":false,"n":"Microstructural Evolution in Materials","no":"3.030","nx":false,"pl":false,"r":[[[[100,2]],"4-153"],[[[94,2]],"36-112"]],"ra":5.0,"re":false,"rp":false,"s":["b","r","l"],"si":20.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"3.033":{"b":[[[[34,4]],"8-107"],[[[40,4]],"8-107"]],"ci":false,"cl":"033","co":"3","cw":false,"f":true,"h":19.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"4-231"]],"la":false,"le":"U","lm":false,"n":"Electronic, Optical and Magnetic Properties of Materials","no":"3.033","nx":false,"pl":false,"r":[[[[100,2]],"8-119"],[[[94,2]],"4-144"]],"ra":3.9,"re":false,"rp":false,"s":["b","l","r"],"si":17.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":6,"v":false},"3.039":{"b":[],"ci":false,"cl":"039","co":"3","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,2],[134,2]],"4-146"]],"la":false,"le":"U","lm":false,"n":"Mathematics and Computational Thinking for Materials Scientists and Engineers II","no":"3.039","nx":false,"pl":false,"r":[[[[106,2]],"2-142"],[[[46,2]],"2-142"]],"ra":7.0,"re":false,"rp":false,"s":["r","l"],"si":3.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"3.042":{"b":[[[[42,6],[102,6]],"4-131B"]],"ci":false,"cl":"042","co":"3","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[100,2]],"4-257"]],"la":false,"le":"U","lm":true,"n":"Materials Project Laboratory","no":"3.042","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l","b"],"si":15.4,"t":["FA","SP"],"tb":false,"u1":1,"u2":6,"u3":5,"v":false},"3.055":{"b":[],"ci":false,"cl":"055","co":"3","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-163"]],"la":false,"le":"U","lm":false,"n":"Biomaterials Science and Engineering","no":"3.055","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":43.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.080":{"b":[],"ci":false,"cl":"080","co":"3","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"8-119"]],"la":false,"le":"U","lm":false,"n":"Strategic Materials Selection","no":"3.080","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":2.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.087":{"b":[],"ci":false,"cl":"087","co":"3","cw":false,"f":false,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,3],[68,3]],"16-275"]],"la":false,"le":"U","lm":false,"n":"Materials, Societal Impact, and Social Innovation","no":"3.087","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.091":{"b":[],"ci":false,"cl":"091","co":"3","cw":false,"f":true,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"10-250"]],"la":false,"le":"U","lm":false,"n":"Introduction to Solid-State Chemistry","no":"3.091","nx":false,"pl":false,"r":[[[[42,2],[102,2]],"13-3101"],[[[34,2],[94,2]],"13-4101"],[[[44,2],[104,2]],"13-4101"],[[[38,2],[98,2]],"13-4101"],[[[36,2],[96,2]],"13-1143"],[[[46,2],[106,2]],"13-5101"],[[[32,2],[92,2]],"13-5101"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":334.2,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"3.096":{"b":[[[[72,6]],"4-006"]],"ci":false,"cl":"096","co":"3","cw":false,"f":false,"h":7.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2]],"8-119"]],"la":false,"le":"U","lm":true,"n":"Architectural Ironwork","no":"3.096","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l","b"],"si":9.0,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":4,"v":false},"3.098":{"b":[],"ci":false,"cl":"098","co":"3","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[14,2],[74,2],[134,2]],"4-153"]],"la":false,"le":"U","lm":false,"n":"Ancient Engineering: Ceramic Technologies","no":"3.098","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.15":{"b":[],"ci":false,"cl":"15","co":"3","cw":false,"f":false,"h":9.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"8-205"]],"la":false,"le":"U","lm":false,"n":"Electrical, Optical, and Magnetic Materials and Devices","no":"3.15","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.16":{"b":[],"ci":false,"cl":"16","co":"3","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"1-134"]],"la":false,"le":"U","lm":false,"n":"Industrial Challenges in Metallic Materials Selection","no":"3.16","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.17":{"b":[],"ci":false,"cl":"17","co":"3","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,4]],"26-204"]],"la":false,"le":"U","lm":false,"n":"Principles of Manufacturing","no":"3.17","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":true,"u1":2,"u2":1,"u3":9,"v":false},"3.171":{"b":[],"ci":false,"cl":"171","co":"3","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"4-145"]],"la":false,"le":"U","lm":false,"n":"Structural Materials and Manufacturing","no":"3.171","nx":false,"pl":false,"r":[[[[32,2],[92,2]],"4-145"]],"ra":5.7,"re":false,"rp":true,"s":["r","l"],"si":4.0,"t":["FA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"3.173":{"b":[],"ci":false,"cl":"173","co":"3","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"4-145"]],"la":false,"le":"U","lm":true,"n":"Computing Fabrics","no":"3.173","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":14.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"3.20":{"b":[],"ci":false,"cl":"20","co":"3","cw":false,"f":true,"h":18.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3],[122,2]],"3-333"]],"la":false,"le":"G","lm":false,"n":"Materials at Equilibrium","no":"3.20","nx":false,"pl":false,"r":[[[[104,2]],"13-3101"],[[[132,2]],"13-4101"],[[[126,2]],"13-5101"]],"ra":5.0,"re":false,"rp":false,"s":["r","l"],"si":37.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":10,"v":false},"3.201":{"b":[],"ci":false,"cl":"201","co":"3","cw":false,"f":false,"h":3.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[69,3]],"56-154"]],"la":false,"le":"G","lm":true,"n":"Introduction to DMSE","no":"3.201","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"3.22":{"b":[],"ci":false,"cl":"22","co":"3","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-231"]],"la":false,"le":"G","lm":false,"n":"Structure and Mechanics of Materials","no":"3.22","nx":false,"pl":false,"r":[[[[72,2]],"13-4101"],[[[74,2]],"13-4101"]],"ra":4.8,"re":false,"rp":false,"s":["r","l"],"si":28.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"3.31":{"b":[],"ci":false,"cl":"31","co":"3","cw":false,"f":true,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"24-112"]],"la":false,"le":"G","lm":false,"n":"Radiation Damage and Effects in Nuclear Materials","no":"3.31","nx":true,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.33":{"b":[],"ci":false,"cl":"33","co":"3","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"Defects in Materials","no":"3.33","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.37":{"b":[],"ci":false,"cl":"37","co":"3","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,4]],"26-204"]],"la":false,"le":"G","lm":false,"n":"Principles of Manufacturing","no":"3.37","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":true,"u1":2,"u2":1,"u3":9,"v":false},"3.371":{"b":[],"ci":false,"cl":"371","co":"3","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"4-145"]],"la":false,"le":"G","lm":false,"n":"Structural Materials","no":"3.371","nx":false,"pl":false,"r":[[[[32,2],[92,2]],"4-145"]],"ra":6.3,"re":false,"rp":true,"s":["r","l"],"si":21.0,"t":["FA","SU","SP"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"3.373":{"b":[],"ci":false,"cl":"373","co":"3","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"4-145"]],"la":false,"le":"G","lm":true,"n":"Computing Fabrics","no":"3.373","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"3.39":{"b":[],"ci":false,"cl":"39","co":"3","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"1-134"]],"la":false,"le":"G","lm":false,"n":"Industrial Challenges in Metallic Materials Selection","no":"3.39","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.41":{"b":[],"ci":false,"cl":"41","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-146"]],"la":false,"le":"G","lm":false,"n":"Colloids, Surfaces, Absorption, Capillarity, and Wetting Phenomena","no":"3.41","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.43":{"b":[],"ci":false,"cl":"43","co":"3","cw":false,"f":true,"h":15.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[94,2],[124,2]],"36-153"]],"la":false,"le":"G","lm":false,"n":"Integrated Microelectronic Devices","no":"3.43","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"3.44":{"b":[],"ci":false,"cl":"44","co":"3","cw":false,"f":true,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"8-205"]],"la":false,"le":"G","lm":false,"n":"Materials Processing for Micro- and Nano-Systems","no":"3.44","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":10.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.48":{"b":[],"ci":false,"cl":"48","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-134"]],"la":false,"le":"G","lm":false,"n":"Measurement Science for Materials Research","no":"3.48","nx":false,"pl":false,"r":[[[[130,2]],"4-145"]],"ra":0,"re":false,"rp":false,"s":["l","r"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"3.69":{"b":[],"ci":false,"cl":"69","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,4]],"4-251"]],"la":false,"le":"G","lm":false,"n":"Teaching Fellows Seminar","no":"3.69","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"3.691":{"b":[],"ci":false,"cl":"691","co":"3","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Teaching Materials Science and Engineering","no":"3.691","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"3.692":{"b":[],"ci":false,"cl":"692","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Teaching Materials Science and Engineering","no":"3.692","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.693":{"b":[],"ci":false,"cl":"693","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Materials Science and Engineering","no":"3.693","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.903":{"b":[],"ci":false,"cl":"903","co":"3","cw":false,"f":false,"h":1.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[75,3]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Seminar in Polymers and Soft Matter","no":"3.903","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":37.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":0,"v":false},"3.930":{"b":[],"ci":false,"cl":"930","co":"3","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Internship Program","no":"3.930","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"3.931":{"b":[],"ci":false,"cl":"931","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Internship Program","no":"3.931","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":6,"u3":0,"v":true},"3.942":{"b":[],"ci":false,"cl":"942","co":"3","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"35-308"]],"la":false,"le":"G","lm":false,"n":"Polymer Physics","no":"3.942","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":29.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"3.963":{"b":[],"ci":false,"cl":"963","co":"3","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-163"]],"la":false,"le":"G","lm":false,"n":"Biomaterials Science and Engineering","no":"3.963","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":43.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.983":{"b":[],"ci":false,"cl":"983","co":"3","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[52,3],[112,3]],"8-205"]],"la":false,"le":"U","lm":true,"n":"Ancient Mesoamerican Civilization","no":"3.983","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"3.984":{"b":[],"ci":false,"cl":"984","co":"3","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Materials in Ancient Societies: Ceramics","no":"3.984","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":1.0,"t":["FA"],"tb":false,"u1":3,"u2":6,"u3":3,"v":true},"3.986":{"b":[],"ci":true,"cl":"986","co":"3","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[44,2],[104,2]],"4-231"]],"la":false,"le":"U","lm":false,"n":"The Human Past: Introduction to Archaeology","no":"3.986","nx":false,"pl":false,"r":[[[[46,2]],"4-261"],[[[106,2]],"4-261"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":30.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.990":{"b":[],"ci":false,"cl":"990","co":"3","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Seminar in Archaeological Method and Theory","no":"3.990","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":[],"si":0.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":true},"3.991":{"b":[],"ci":false,"cl":"991","co":"3","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2],[74,2],[134,2]],"4-153"]],"la":false,"le":"G","lm":false,"n":"Ancient Engineering: Ceramic Technologies","no":"3.991","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"3.997":{"b":[],"ci":false,"cl":"997","co":"3","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Fieldwork in Materials Science and Engineering","no":"3.997","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.998":{"b":[],"ci":false,"cl":"998","co":"3","cw":false,"f":false,"h":20.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Doctoral Thesis Update Meeting","no":"3.998","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":[],"si":29.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"3.EPE":{"b":[],"ci":false,"cl":"EPE","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"3.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"3.EPW":{"b":[],"ci":false,"cl":"EPW","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"3.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"3.S01":{"b":[],"ci":false,"cl":"S01","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject in Materials Science and Engineering","no":"3.S01","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.THG":{"b":[],"ci":false,"cl":"THG","co":"3","cw":false,"f":false,"h":45.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"3.THG","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":[],"si":142.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.THU":{"b":[],"ci":false,"cl":"THU","co":"3","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"3.THU","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.UAR":{"b":[],"ci":false,"cl":"UAR","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2],[106,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Climate and Sustainability Undergraduate Advanced Research","no":"3.UAR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"3.UR":{"b":[],"ci":false,"cl":"UR","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"3.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"3.URG":{"b":[],"ci":false,"cl":"URG","co":"3","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"3.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.021":{"b":[],"ci":false,"cl":"021","co":"4","cw":false,"f":true,"h":11.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6],[72,6]],"N52-342C"]],"la":false,"le":"U","lm":true,"n":"Design Studio: How to Design","no":"4.021","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":22.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.022":{"b":[],"ci":false,"cl":"022","co":"4","cw":false,"f":true,"h":16.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6],[72,6]],"7-434"]],"la":false,"le":"U","lm":true,"n":"Design Studio: Introduction to Design Techniques and Technologies","no":"4.022","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":15.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.023":{"b":[],"ci":false,"cl":"023","co":"4","cw":false,"f":true,"h":28.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,8],[100,8],[130,8]],"7-434"]],"la":false,"le":"U","lm":false,"n":"Architecture Design Studio I","no":"4.023","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":9.3,"t":["FA"],"tb":false,"u1":0,"u2":12,"u3":12,"v":false},"4.031":{"b":[],"ci":false,"cl":"031","co":"4","cw":false,"f":false,"h":14.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,6]],"N52-342C"]],"la":false,"le":"U","lm":true,"n":"Design Studio: Objects and Interaction","no":"4.031","nx":false,"pl":false,"r":[[[[52,4]],"N52-337"]],"ra":6.1,"re":false,"rp":false,"s":["r","l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.053":{"b":[],"ci":true,"cl":"053","co":"4","cw":false,"f":false,"h":13.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,6]],"N52-337"]],"la":false,"le":"U","lm":true,"n":"Visual Communication Fundamentals","no":"4.053","nx":false,"pl":false,"r":[[[[112,6]],"N52-337"]],"ra":6.3,"re":false,"rp":false,"s":["r","l"],"si":6.7,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.091":{"b":[],"ci":false,"cl":"091","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Design","no":"4.091","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.092":{"b":[],"ci":false,"cl":"092","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Design","no":"4.092","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.093":{"b":[],"ci":false,"cl":"093","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Design","no":"4.093","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.094":{"b":[],"ci":false,"cl":"094","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Design","no":"4.094","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.105":{"b":[],"ci":false,"cl":"105","co":"4","cw":false,"f":true,"h":14.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[94,6]],"1-246"]],"la":false,"le":"G","lm":false,"n":"Geometric Disciplines and Architecture Skills","no":"4.105","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":29.0,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":5,"v":false},"4.140":{"b":[],"ci":false,"cl":"140","co":"4","cw":false,"f":true,"h":21.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"How to Make (Almost) Anything","no":"4.140","nx":false,"pl":false,"r":[[[[108,4]],"E14-633"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":62.3,"t":["FA"],"tb":false,"u1":3,"u2":9,"u3":6,"v":false},"4.151":{"b":[],"ci":false,"cl":"151","co":"4","cw":false,"f":false,"h":38.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,8],[100,8],[130,8]],"7-434"]],"la":false,"le":"G","lm":true,"n":"Architecture Design Core Studio I","no":"4.151","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":28.7,"t":["FA"],"tb":false,"u1":0,"u2":12,"u3":9,"v":false},"4.153":{"b":[],"ci":false,"cl":"153","co":"4","cw":false,"f":false,"h":53.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,8],[100,8],[130,8]],"3-415"]],"la":false,"le":"G","lm":true,"n":"Architecture Design Core Studio III","no":"4.153","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l"],"si":26.3,"t":["FA"],"tb":false,"u1":0,"u2":12,"u3":9,"v":false},"4.154":{"b":[],"ci":false,"cl":"154","co":"4","cw":false,"f":false,"h":29.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,8],[100,8],[130,8]],"3-415"]],"la":false,"le":"G","lm":false,"n":"Architecture Design Option Studio","no":"4.154","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":36.8,"t":["FA","SP"],"tb":false,"u1":0,"u2":10,"u3":11,"v":false},"4.181":{"b":[],"ci":false,"cl":"181","co":"4","cw":false,"f":false,"h":24.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,6]],"3-329"]],"la":false,"le":"G","lm":false,"n":"Architectural Design Workshop","no":"4.181","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":6.7,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.182":{"b":[],"ci":false,"cl":"182","co":"4","cw":false,"f":false,"h":16.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Architectural Design Workshop","no":"4.182","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":true,"s":[],"si":7.7,"t":["FA"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"4.183":{"b":[],"ci":false,"cl":"183","co":"4","cw":false,"f":false,"h":30.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[92,6]],"3-329"]],"la":false,"le":"G","lm":false,"n":"Architectural Design Workshop","no":"4.183","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":10.2,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.184":{"b":[],"ci":false,"cl":"184","co":"4","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,4]],"N52-399"]],"la":false,"le":"G","lm":false,"n":"Architectural Design Workshop","no":"4.184","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":7.3,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.189":{"b":[],"ci":false,"cl":"189","co":"4","cw":false,"f":false,"h":11.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for MArch Thesis","no":"4.189","nx":false,"pl":false,"r":[],"ra":4.5,"re":false,"rp":true,"s":[],"si":28.0,"t":["FA","SU","SP"],"tb":false,"u1":3,"u2":1,"u3":5,"v":true},"4.191":{"b":[],"ci":false,"cl":"191","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Architecture Design","no":"4.191","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.192":{"b":[],"ci":false,"cl":"192","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Architecture Design","no":"4.192","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.193":{"b":[],"ci":false,"cl":"193","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Architecture Design","no":"4.193","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.194":{"b":[],"ci":false,"cl":"194","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Architecture Design","no":"4.194","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.210":{"b":[],"ci":false,"cl":"210","co":"4","cw":false,"f":true,"h":10.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"10-401"]],"la":false,"le":"G","lm":false,"n":"Positions: Cultivating Critical Practice","no":"4.210","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":28.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"4.213":{"b":[],"ci":false,"cl":"213","co":"4","cw":false,"f":false,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"10-401"]],"la":false,"le":"G","lm":true,"n":"Ecological Urbanism Seminar","no":"4.213","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":4.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.215":{"b":[],"ci":false,"cl":"215","co":"4","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"10-485"]],"la":false,"le":"G","lm":true,"n":"Sensing Place: Photography as Inquiry","no":"4.215","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.221":{"b":[],"ci":false,"cl":"221","co":"4","cw":false,"f":false,"h":3.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[62,4]],"7-429"]],"la":false,"le":"G","lm":true,"n":"Architecture Studies Colloquium","no":"4.221","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":26.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"4.222":{"b":[],"ci":false,"cl":"222","co":"4","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"1-135"]],"la":false,"le":"G","lm":false,"n":"Professional Practice","no":"4.222","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":false,"s":["l"],"si":25.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"4.228":{"b":[],"ci":false,"cl":"228","co":"4","cw":false,"f":false,"h":16.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"1-150"]],"la":false,"le":"G","lm":true,"n":"Contemporary Urbanism Proseminar: Theory and Representation","no":"4.228","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.240":{"b":[],"ci":false,"cl":"240","co":"4","cw":false,"f":false,"h":16.5,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[122,8]],"10-485"]],"la":false,"le":"G","lm":false,"n":"Urban Design Skills: Observing, Interpreting, and Representing the City","no":"4.240","nx":false,"pl":false,"r":[[[[78,5]],"9-554"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":19.7,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":2,"v":false},"4.248":{"b":[],"ci":false,"cl":"248","co":"4","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[122,8]],"10-485"]],"la":false,"le":"G","lm":false,"n":"Advanced Urban Design Skills: Observing, Interpreting, and Representing the City","no":"4.248","nx":false,"pl":false,"r":[[[[78,5]],"9-554"]],"ra":6.8,"re":false,"rp":false,"s":["l","r"],"si":17.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":4,"v":false},"4.250":{"b":[],"ci":false,"cl":"250","co":"4","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"2-105"]],"la":false,"le":"U","lm":false,"n":"Introduction to Urban Design and Development","no":"4.250","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":43.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.256":{"b":[],"ci":false,"cl":"256","co":"4","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[50,4]],"9-450A"]],"la":false,"le":"G","lm":true,"n":"Encounters and Ruptures: Writing About the Modern City","no":"4.256","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"4.275":{"b":[],"ci":false,"cl":"275","co":"4","cw":false,"f":false,"h":4.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,2]],"E14-140L"]],"la":false,"le":"G","lm":false,"n":"Advanced Urbanism Colloquium","no":"4.275","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":2.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":1,"u3":1,"v":false},"4.288":{"b":[],"ci":false,"cl":"288","co":"4","cw":false,"f":false,"h":12.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,6]],"5-232"],[[[32,6]],"10-401"]],"la":false,"le":"G","lm":false,"n":"Preparation for SMArchS Thesis","no":"4.288","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":17.2,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.291":{"b":[],"ci":false,"cl":"291","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Architecture Studies","no":"4.291","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.292":{"b":[],"ci":false,"cl":"292","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Architecture Studies","no":"4.292","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.293":{"b":[],"ci":false,"cl":"293","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Architecture Studies","no":"4.293","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.294":{"b":[],"ci":false,"cl":"294","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Architecture Studies","no":"4.294","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.301":{"b":[],"ci":false,"cl":"301","co":"4","cw":false,"f":false,"h":10.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,6],[93,6]],"E15-207"]],"la":false,"le":"U","lm":true,"n":"Introduction to Artistic Experimentation","no":"4.301","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":7.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.314":{"b":[],"ci":false,"cl":"314","co":"4","cw":false,"f":false,"h":10.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6],[112,6]],"E15-001"]],"la":false,"le":"U","lm":true,"n":"Advanced Workshop in Artistic Practice and Transdisciplinary Research","no":"4.314","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.315":{"b":[],"ci":false,"cl":"315","co":"4","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,6],[112,6]],"E15-001"]],"la":false,"le":"G","lm":true,"n":"Advanced Workshop in Artistic Practice and Transdisciplinary Research","no":"4.315","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.341":{"b":[],"ci":false,"cl":"341","co":"4","cw":false,"f":false,"h":12.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6],[72,6]],"E15-283A"],[[[3,6],[63,6]],"E15-054"]],"la":false,"le":"U","lm":true,"n":"Introduction to Photography and Related Media","no":"4.341","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":13.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.342":{"b":[],"ci":false,"cl":"342","co":"4","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6],[72,6]],"E15-283A"],[[[3,6],[63,6]],"E15-054"]],"la":false,"le":"G","lm":true,"n":"Introduction to Photography and Related Media","no":"4.342","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":13.8,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.344":{"b":[],"ci":false,"cl":"344","co":"4","cw":false,"f":false,"h":7.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"E15-054"]],"la":false,"le":"U","lm":true,"n":"Advanced Photography and Related Media","no":"4.344","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.345":{"b":[],"ci":false,"cl":"345","co":"4","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"E15-054"]],"la":false,"le":"G","lm":true,"n":"Advanced Photography and Related Media","no":"4.345","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":true,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.356":{"b":[],"ci":false,"cl":"356","co":"4","cw":false,"f":false,"h":12.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,6]],"E15-001"]],"la":false,"le":"U","lm":true,"n":"Cinematic Migrations","no":"4.356","nx":false,"pl":false,"r":[[[[52,6]],"E15-070"]],"ra":7.0,"re":false,"rp":false,"s":["l","r"],"si":3.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.357":{"b":[],"ci":false,"cl":"357","co":"4","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,6]],"E15-001"]],"la":false,"le":"G","lm":true,"n":"Cinematic Migrations","no":"4.357","nx":false,"pl":false,"r":[[[[52,6]],"E15-070"]],"ra":7.0,"re":false,"rp":true,"s":["r","l"],"si":3.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.373":{"b":[],"ci":false,"cl":"373","co":"4","cw":false,"f":false,"h":9.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,6],[93,6]],"E15-001"]],"la":false,"le":"U","lm":true,"n":"Advanced Projects in Art, Culture, and Technology","no":"4.373","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"4.374":{"b":[],"ci":false,"cl":"374","co":"4","cw":false,"f":false,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,6],[93,6]],"E15-001"]],"la":false,"le":"G","lm":true,"n":"Advanced Projects in Art, Culture, and Technology","no":"4.374","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.387":{"b":[],"ci":false,"cl":"387","co":"4","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,2]],"E15-207"]],"la":false,"le":"G","lm":true,"n":"Thesis I: Art, Culture, and Technology Theory and Criticism Colloquium","no":"4.387","nx":false,"pl":false,"r":[],"ra":2.8,"re":false,"rp":true,"s":["l"],"si":7.0,"t":["FA","JA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"4.389":{"b":[],"ci":false,"cl":"389","co":"4","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[126,4]],"E15-207"]],"la":false,"le":"G","lm":false,"n":"Thesis III: SMACT Thesis Tutorial","no":"4.389","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":true,"s":["l"],"si":4.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"4.390":{"b":[],"ci":false,"cl":"390","co":"4","cw":false,"f":true,"h":13.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6],[132,6]],"E15-001"]],"la":false,"le":"G","lm":false,"n":"Art, Culture, and Technology Studio","no":"4.390","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":true,"s":["l"],"si":11.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":12,"v":false},"4.391":{"b":[],"ci":false,"cl":"391","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Art, Culture, and Technology","no":"4.391","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.392":{"b":[],"ci":false,"cl":"392","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Art, Culture, and Technology","no":"4.392","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.393":{"b":[],"ci":false,"cl":"393","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Art, Culture, and Technology","no":"4.393","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.394":{"b":[],"ci":false,"cl":"394","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Art, Culture, and Technology","no":"4.394","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.401":{"b":[[[[126,2]],"3-442"]],"ci":false,"cl":"401","co":"4","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"9-354"]],"la":false,"le":"U","lm":false,"n":"Environmental Technologies in Buildings","no":"4.401","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l","b"],"si":47.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"4.411":{"b":[[[[12,6]],"N51-350"]],"ci":false,"cl":"411","co":"4","cw":false,"f":true,"h":13.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,3]],"1-132"]],"la":true,"le":"U","lm":true,"n":"D-Lab Schools: Building Technology Laboratory","no":"4.411","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["b","l"],"si":9.3,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":7,"v":false},"4.412":{"b":[[[[12,6]],"N51-350"]],"ci":false,"cl":"412","co":"4","cw":false,"f":true,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,3]],"1-132"]],"la":false,"le":"G","lm":true,"n":"D-Lab Schools: Building Technology Laboratory","no":"4.412","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":12.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.450":{"b":[],"ci":false,"cl":"450","co":"4","cw":false,"f":true,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"3-133"]],"la":false,"le":"G","lm":true,"n":"Computational Structural Design and Optimization","no":"4.450","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":23.3,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.451":{"b":[],"ci":false,"cl":"451","co":"4","cw":false,"f":true,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"3-133"]],"la":false,"le":"U","lm":true,"n":"Computational Structural Design and Optimization","no":"4.451","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":23.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.463":{"b":[[[[124,4]],"3-133"]],"ci":false,"cl":"463","co":"4","cw":false,"f":true,"h":11.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"3-442"]],"la":false,"le":"G","lm":false,"n":"Building Technology Systems: Structures and Envelopes","no":"4.463","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["b","l"],"si":26.7,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":4,"v":false},"4.464":{"b":[[[[124,2]],"3-442"]],"ci":false,"cl":"464","co":"4","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Environmental Technologies in Buildings","no":"4.464","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l","b"],"si":47.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":4,"v":false},"4.481":{"b":[],"ci":false,"cl":"481","co":"4","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[104,4]],"5-415"]],"la":false,"le":"G","lm":false,"n":"Building Technology Seminar","no":"4.481","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":6.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"4.488":{"b":[],"ci":false,"cl":"488","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for S.M.B.T. Thesis","no":"4.488","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"4.489":{"b":[],"ci":false,"cl":"489","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for Building Technology Ph.D. Thesis","no":"4.489","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"4.491":{"b":[],"ci":false,"cl":"491","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Building Technology","no":"4.491","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.492":{"b":[],"ci":false,"cl":"492","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Building Technology","no":"4.492","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.493":{"b":[],"ci":false,"cl":"493","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Building Technology","no":"4.493","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.494":{"b":[],"ci":false,"cl":"494","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Building Technology","no":"4.494","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.500":{"b":[],"ci":false,"cl":"500","co":"4","cw":false,"f":false,"h":13.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"1-150"]],"la":false,"le":"U","lm":false,"n":"Design Computation: Art, Objects and Space","no":"4.500","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":20.7,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"4.502":{"b":[],"ci":false,"cl":"502","co":"4","cw":false,"f":true,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,5]],"1-150"]],"la":false,"le":"U","lm":false,"n":"Advanced Visualization: Architecture in Motion Graphics","no":"4.502","nx":false,"pl":false,"r":[[[[22,3]],"1-379"]],"ra":6.5,"re":false,"rp":false,"s":["l","r"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"4.505":{"b":[],"ci":false,"cl":"505","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"1-150"]],"la":false,"le":"G","lm":false,"n":"Design Computation: Art, Objects, and Space","no":"4.505","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"4.540":{"b":[],"ci":false,"cl":"540","co":"4","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,6]],"1-132"]],"la":false,"le":"G","lm":false,"n":"Introduction to Shape Grammars I","no":"4.540","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":18.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"4.562":{"b":[],"ci":false,"cl":"562","co":"4","cw":false,"f":true,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,5]],"1-150"]],"la":false,"le":"G","lm":false,"n":"Advanced Visualization: Architecture in Motion Graphics","no":"4.562","nx":false,"pl":false,"r":[[[[22,3]],"1-379"]],"ra":6.5,"re":false,"rp":false,"s":["l","r"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"4.566":{"b":[],"ci":false,"cl":"566","co":"4","cw":false,"f":false,"h":12.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[78,4]],"7-304"]],"la":false,"le":"G","lm":true,"n":"Advanced Projects in Digital Media","no":"4.566","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":4.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.580":{"b":[],"ci":false,"cl":"580","co":"4","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,6]],"5-231"]],"la":false,"le":"G","lm":false,"n":"Inquiry into Computation and Design","no":"4.580","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.581":{"b":[],"ci":false,"cl":"581","co":"4","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,6]],"1-246"]],"la":false,"le":"G","lm":false,"n":"Proseminar in Computation","no":"4.581","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":["l"],"si":4.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.582":{"b":[],"ci":false,"cl":"582","co":"4","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Seminar in Computation","no":"4.582","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":2.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.583":{"b":[],"ci":false,"cl":"583","co":"4","cw":false,"f":false,"h":2.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[21,3]],"5-216"]],"la":false,"le":"G","lm":false,"n":"Forum in Computation","no":"4.583","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["l"],"si":14.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":0,"v":false},"4.589":{"b":[],"ci":false,"cl":"589","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for Design and Computation PhD Thesis","no":"4.589","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"4.591":{"b":[],"ci":false,"cl":"591","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Architectural Computation","no":"4.591","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.592":{"b":[],"ci":false,"cl":"592","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Architectural Computation","no":"4.592","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.593":{"b":[],"ci":false,"cl":"593","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Architectural Computation","no":"4.593","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.594":{"b":[],"ci":false,"cl":"594","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Architectural Computation","no":"4.594","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.601":{"b":[],"ci":false,"cl":"601","co":"4","cw":false,"f":false,"h":7.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,3],[102,3]],"3-133"]],"la":false,"le":"U","lm":false,"n":"Introduction to Art History","no":"4.601","nx":true,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"4.603":{"b":[],"ci":false,"cl":"603","co":"4","cw":false,"f":false,"h":7.8,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"5-134"]],"la":false,"le":"U","lm":false,"n":"Understanding Modern Architecture","no":"4.603","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":22.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.604":{"b":[],"ci":false,"cl":"604","co":"4","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"5-134"]],"la":false,"le":"G","lm":false,"n":"Understanding Modern Architecture","no":"4.604","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":22.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.607":{"b":[],"ci":false,"cl":"607","co":"4","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"5-216"]],"la":false,"le":"G","lm":false,"n":"Thinking About Architecture: In History and At Present","no":"4.607","nx":true,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":25.3,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.614":{"b":[],"ci":false,"cl":"614","co":"4","cw":false,"f":false,"h":7.9,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"5-216"]],"la":false,"le":"U","lm":true,"n":"Building Islam","no":"4.614","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":11.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.619":{"b":[],"ci":false,"cl":"619","co":"4","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"5-216"]],"la":false,"le":"G","lm":false,"n":"Historiography of Islamic Art and Architecture","no":"4.619","nx":true,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.626":{"b":[],"ci":false,"cl":"626","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[52,4]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Documenting MIT Communities","no":"4.626","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"4.647":{"b":[],"ci":false,"cl":"647","co":"4","cw":false,"f":false,"h":13.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"5-216"]],"la":false,"le":"G","lm":true,"n":"Technopolitics, Culture, Intervention","no":"4.647","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.648":{"b":[],"ci":false,"cl":"648","co":"4","cw":false,"f":false,"h":10.6,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"3-442"]],"la":false,"le":"U","lm":false,"n":"Resonance: Sonic Experience, Science, and Art","no":"4.648","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.649":{"b":[],"ci":false,"cl":"649","co":"4","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"3-442"]],"la":false,"le":"G","lm":false,"n":"Resonance: Sonic Experience, Science, and Art","no":"4.649","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.661":{"b":[],"ci":false,"cl":"661","co":"4","cw":false,"f":false,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,6]],"5-216"]],"la":false,"le":"G","lm":false,"n":"Theory and Method in the Study of Architecture and Art","no":"4.661","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":true,"s":["l"],"si":13.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.674":{"b":[],"ci":true,"cl":"674","co":"4","cw":false,"f":false,"h":7.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E51-385"]],"la":false,"le":"U","lm":true,"n":"French Photography","no":"4.674","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":17.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.677":{"b":[],"ci":false,"cl":"677","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"5-216"]],"la":false,"le":"G","lm":true,"n":"Advanced Study in the History of Art","no":"4.677","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.684":{"b":[],"ci":false,"cl":"684","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for HTC Major Exam","no":"4.684","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":26,"v":true},"4.685":{"b":[],"ci":false,"cl":"685","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for HTC Minor Exam","no":"4.685","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":14,"v":true},"4.689":{"b":[],"ci":false,"cl":"689","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for History, Theory, and Criticism - Ph.D. Thesis","no":"4.689","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"4.691":{"b":[],"ci":false,"cl":"691","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in the History, Theory, and Criticism of Architecture and Art","no":"4.691","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.692":{"b":[],"ci":false,"cl":"692","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in the History, Theory, and Criticism of Architecture and Art","no":"4.692","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.693":{"b":[],"ci":false,"cl":"693","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in the History, Theory, and Criticism of Architecture and Art","no":"4.693","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.694":{"b":[],"ci":false,"cl":"694","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in the History, Theory, and Criticism of Architecture and Art","no":"4.694","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.S13":{"b":[],"ci":false,"cl":"S13","co":"4","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Architecture Design","no":"4.S13","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":[],"si":5.7,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.S14":{"b":[],"ci":false,"cl":"S14","co":"4","cw":false,"f":false,"h":13.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"3-329"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Architecture Design","no":"4.S14","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":8.8,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.S15":{"b":[],"ci":false,"cl":"S15","co":"4","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Design","no":"4.S15","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":3.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.S24":{"b":[],"ci":false,"cl":"S24","co":"4","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,8]],"10-401"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Architecture Studies","no":"4.S24","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":8.5,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.S28":{"b":[],"ci":false,"cl":"S28","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4]],"5-232"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Architecture Studies","no":"4.S28","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.S32":{"b":[],"ci":false,"cl":"S32","co":"4","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"E15-207"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Art, Culture, and Technology","no":"4.S32","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":11.3,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.S44":{"b":[],"ci":false,"cl":"S44","co":"4","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Building Technology","no":"4.S44","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.S52":{"b":[],"ci":false,"cl":"S52","co":"4","cw":false,"f":false,"h":18.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"9-450"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Architectural Computation","no":"4.S52","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.S62":{"b":[],"ci":false,"cl":"S62","co":"4","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[64,6]],"5-216"]],"la":false,"le":"G","lm":false,"n":"Special Subject: History, Theory and Criticism of Architecture and Art","no":"4.S62","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":["l"],"si":6.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"4.THG":{"b":[],"ci":false,"cl":"THG","co":"4","cw":false,"f":false,"h":39.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"4.THG","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":[],"si":59.8,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.THT":{"b":[],"ci":false,"cl":"THT","co":"4","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[69,5]],"9-217"]],"la":false,"le":"U","lm":false,"n":"Thesis Research Design Seminar","no":"4.THT","nx":false,"pl":false,"r":[],"ra":4.5,"re":false,"rp":true,"s":["l"],"si":15.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"4.THU":{"b":[],"ci":false,"cl":"THU","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"4.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.UR":{"b":[],"ci":false,"cl":"UR","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Design","no":"4.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"4.URG":{"b":[],"ci":false,"cl":"URG","co":"4","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Design","no":"4.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.04":{"b":[],"ci":false,"cl":"04","co":"5","cw":false,"f":true,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"2-105"]],"la":false,"le":"U","lm":false,"n":"Principles of Inorganic Chemistry II","no":"5.04","nx":false,"pl":false,"r":[[[[132,2]],"4-257"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":22.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"5.05":{"b":[],"ci":false,"cl":"05","co":"5","cw":false,"f":true,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"4-153"]],"la":false,"le":"G","lm":false,"n":"Principles of Inorganic Chemistry III","no":"5.05","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.062":{"b":[],"ci":false,"cl":"062","co":"5","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"2-105"]],"la":false,"le":"G","lm":false,"n":"Principles of Bioinorganic Chemistry","no":"5.062","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":11.7,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.067":{"b":[[[[100,6]],"26-322"]],"ci":false,"cl":"067","co":"5","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,4]],"26-322"]],"la":false,"le":"G","lm":false,"n":"Crystal Structure Refinement","no":"5.067","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l","b"],"si":7.0,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":1,"v":false},"5.07":{"b":[],"ci":false,"cl":"07","co":"5","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"4-237"]],"la":false,"le":"U","lm":false,"n":"Introduction to Biological Chemistry","no":"5.07","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"36-144"],[[[44,2],[104,2]],"36-144"],[[[34,2],[94,2]],"36-144"],[[[42,2],[102,2]],"36-144"]],"ra":5.2,"re":true,"rp":false,"s":["r","l"],"si":44.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"5.111":{"b":[],"ci":false,"cl":"111","co":"5","cw":false,"f":true,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"10-250"]],"la":false,"le":"U","lm":false,"n":"Principles of Chemical Science","no":"5.111","nx":false,"pl":false,"r":[[[[42,2],[102,2]],"56-180"],[[[38,2],[98,2]],"1-132"],[[[40,2],[100,2]],"56-191"],[[[36,2],[96,2]],"24-307"]],"ra":5.0,"re":false,"rp":false,"s":["r","l"],"si":166.0,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"5.112":{"b":[],"ci":false,"cl":"112","co":"5","cw":false,"f":true,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"32-155"]],"la":false,"le":"U","lm":false,"n":"Principles of Chemical Science","no":"5.112","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"1-375"],[[[38,2],[98,2]],"38-166"],[[[42,2],[102,2]],"36-153"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":64.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"5.12":{"b":[],"ci":false,"cl":"12","co":"5","cw":false,"f":true,"h":12.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2],[128,2]],"32-123"]],"la":false,"le":"U","lm":false,"n":"Organic Chemistry I","no":"5.12","nx":false,"pl":false,"r":[[[[32,2],[92,2]],"56-169"],[[[38,2],[98,2]],"36-144"],[[[40,2],[100,2]],"36-144"],[[[34,2],[94,2]],"4-253"],[[[36,2],[96,2]],"36-112"]],"ra":4.8,"re":true,"rp":false,"s":["r","l"],"si":98.4,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"5.13":{"b":[],"ci":false,"cl":"13","co":"5","cw":false,"f":true,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"4-370"]],"la":false,"le":"U","lm":false,"n":"Organic Chemistry II","no":"5.13","nx":false,"pl":false,"r":[[[[32,2],[92,2]],"36-155"],[[[38,2],[98,2]],"4-159"],[[[12,2],[72,2]],"36-153"],[[[42,2],[102,2]],"38-166"],[[[40,2],[100,2]],"38-166"],[[[14,2],[74,2]],"36-153"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":61.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"5.310":{"b":[[[[40,8],[100,8]],"12-5170B"],[[[10,8],[70,8]],"12-5170B"]],"ci":false,"cl":"310","co":"5","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"4-370"]],"la":true,"le":"U","lm":true,"n":"Laboratory Chemistry","no":"5.310","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["b","l"],"si":33.8,"t":["FA","SP"],"tb":false,"u1":2,"u2":7,"u3":3,"v":false},"5.351":{"b":[[[[10,8],[70,8]],"12-5170B"],[[[40,8],[100,8]],"12-5170B"]],"ci":false,"cl":"351","co":"5","cw":false,"f":false,"h":13.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"4-231"]],"la":false,"le":"U","lm":false,"n":"Fundamentals of Spectroscopy","no":"5.351","nx":false,"pl":true,"r":[],"ra":5.3,"re":false,"rp":false,"s":["b","l"],"si":18.8,"t":["FA","SP"],"tb":false,"u1":1,"u2":2,"u3":1,"v":false},"5.352":{"b":[[[[40,8],[100,8]],"12-5170B"],[[[10,8],[70,8]],"12-5170B"]],"ci":false,"cl":"352","co":"5","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"4-231"]],"la":false,"le":"U","lm":false,"n":"Synthesis of Coordination Compounds and Kinetics","no":"5.352","nx":false,"pl":true,"r":[],"ra":6.1,"re":false,"rp":false,"s":["b","l"],"si":18.6,"t":["FA","SP"],"tb":false,"u1":1,"u2":2,"u3":2,"v":false},"5.353":{"b":[[[[40,8],[100,8]],"12-5170B"],[[[10,8],[70,8]],"12-5170B"]],"ci":false,"cl":"353","co":"5","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"4-231"]],"la":false,"le":"U","lm":false,"n":"Macromolecular Prodrugs","no":"5.353","nx":false,"pl":true,"r":[],"ra":6.0,"re":false,"rp":false,"s":["b","l"],"si":16.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":2,"u3":1,"v":false},"5.363":{"b":[[[[40,8],[100,8]],"12-5170B"],[[[10,8],[70,8]],"12-5170B"]],"ci":false,"cl":"363","co":"5","cw":false,"f":false,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"2-105"]],"la":false,"le":"U","lm":false,"n":"Organic Structure Determination","no":"5.363","nx":false,"pl":true,"r":[],"ra":5.8,"re":false,"rp":false,"s":["b","l"],"si":12.7,"t":["FA"],"tb":false,"u1":1,"u2":2,"u3":1,"v":false},"5.372":{"b":[[[[10,8],[70,8]],"12-5170B"],[[[40,8],[100,8]],"12-5170B"]],"ci":false,"cl":"372","co":"5","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"2-105"]],"la":false,"le":"U","lm":false,"n":"Chemistry of Renewable Energy","no":"5.372","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l","b"],"si":6.3,"t":["FA"],"tb":false,"u1":1,"u2":2,"u3":1,"v":false},"5.373":{"b":[[[[10,8],[70,8]],"12-5170B"],[[[40,8],[100,8]],"12-5170B"]],"ci":false,"cl":"373","co":"5","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[38,2],[98,2]],"2-105"]],"la":false,"le":"U","lm":false,"n":"Dinitrogen Cleavage","no":"5.373","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["b","l"],"si":6.3,"t":["FA"],"tb":false,"u1":1,"u2":2,"u3":1,"v":false},"5.43":{"b":[],"ci":false,"cl":"43","co":"5","cw":false,"f":true,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"4-149"]],"la":false,"le":"U","lm":false,"n":"Advanced Organic Chemistry","no":"5.43","nx":false,"pl":false,"r":[[[[130,2]],"4-257"],[[[126,2]],"4-257"]],"ra":6.5,"re":false,"rp":false,"s":["r","l"],"si":15.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"5.47":{"b":[],"ci":false,"cl":"47","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,4],[62,4],[122,4]],"4-257"]],"la":false,"le":"G","lm":false,"n":"Tutorial in Organic Chemistry","no":"5.47","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.511":{"b":[],"ci":false,"cl":"511","co":"5","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"4-257"]],"la":false,"le":"G","lm":false,"n":"Synthetic Organic Chemistry I","no":"5.511","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":15.7,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.52":{"b":[],"ci":false,"cl":"52","co":"5","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,4],[72,4]],"2-142"]],"la":false,"le":"G","lm":false,"n":"Tutorial in Chemical Biology","no":"5.52","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"5.53":{"b":[],"ci":false,"cl":"53","co":"5","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[132,6]],"4-145"]],"la":false,"le":"G","lm":false,"n":"Molecular Structure and Reactivity","no":"5.53","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":17.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"5.54":{"b":[],"ci":false,"cl":"54","co":"5","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[5,3],[65,3]],"4-261"]],"la":false,"le":"G","lm":false,"n":"Frontiers in Chemical Biology","no":"5.54","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":23.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"5.601":{"b":[],"ci":false,"cl":"601","co":"5","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"4-270"]],"la":false,"le":"U","lm":false,"n":"Thermodynamics I","no":"5.601","nx":false,"pl":false,"r":[[[[38,2],[98,2]],"36-153"],[[[40,2],[100,2]],"36-156"],[[[36,2],[96,2]],"36-153"],[[[42,2],[102,2]],"36-156"],[[[8,2],[68,2]],"36-112"]],"ra":4.4,"re":false,"rp":false,"s":["r","l"],"si":36.7,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.602":{"b":[],"ci":false,"cl":"602","co":"5","cw":false,"f":true,"h":9.8,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"4-270"]],"la":false,"le":"U","lm":false,"n":"Thermodynamics II and Kinetics","no":"5.602","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"36-156"],[[[42,2],[102,2]],"36-156"],[[[8,2],[68,2]],"36-112"],[[[40,2],[100,2]],"36-156"],[[[38,2],[98,2]],"36-156"]],"ra":5.2,"re":false,"rp":false,"s":["r","l"],"si":16.7,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.611":{"b":[],"ci":false,"cl":"611","co":"5","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Introduction to Spectroscopy","no":"5.611","nx":false,"pl":false,"r":[[[[8,2],[68,2]],"4-261"],[[[36,2],[96,2]],"4-159"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":10.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.612":{"b":[],"ci":false,"cl":"612","co":"5","cw":false,"f":true,"h":12.2,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Electronic Structure of Molecules","no":"5.612","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"4-159"],[[[8,2],[68,2]],"4-261"]],"ra":5.2,"re":false,"rp":false,"s":["l","r"],"si":4.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.70":{"b":[],"ci":false,"cl":"70","co":"5","cw":false,"f":true,"h":13.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"4-159"]],"la":false,"le":"G","lm":false,"n":"Statistical Thermodynamics","no":"5.70","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":false,"s":["l"],"si":14.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"5.73":{"b":[],"ci":false,"cl":"73","co":"5","cw":false,"f":false,"h":21.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[62,2],[122,2]],"4-261"]],"la":false,"le":"G","lm":false,"n":"Introductory Quantum Mechanics I","no":"5.73","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":12.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"5.80":{"b":[],"ci":false,"cl":"80","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Advanced Topics of Current Special Interest","no":"5.80","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.81":{"b":[],"ci":false,"cl":"81","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[33,3],[123,3]],"32-144"]],"la":false,"le":"G","lm":false,"n":"United States Energy Policy: Lessons Learned for the Future","no":"5.81","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.811":{"b":[],"ci":false,"cl":"811","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[33,3],[123,3]],"32-144"]],"la":false,"le":"U","lm":false,"n":"United States Energy Policy: Lessons Learned for the Future","no":"5.811","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.891":{"b":[],"ci":false,"cl":"891","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Chemistry for Undergraduates","no":"5.891","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.892":{"b":[],"ci":false,"cl":"892","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Chemistry for Undergraduates","no":"5.892","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.90":{"b":[],"ci":false,"cl":"90","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Problems in Chemistry","no":"5.90","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.913":{"b":[],"ci":false,"cl":"913","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,4]],"6-120"]],"la":false,"le":"G","lm":false,"n":"Seminar in Organic Chemistry","no":"5.913","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"5.921":{"b":[],"ci":false,"cl":"921","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,4]],"4-270"]],"la":false,"le":"G","lm":false,"n":"Seminar in Chemical Biology","no":"5.921","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"5.931":{"b":[],"ci":false,"cl":"931","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,4]],"6-120"]],"la":false,"le":"G","lm":false,"n":"Seminar in Physical Chemistry","no":"5.931","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"5.941":{"b":[],"ci":false,"cl":"941","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,4]],"4-370"]],"la":false,"le":"G","lm":false,"n":"Seminar in Inorganic Chemistry","no":"5.941","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"5.S95":{"b":[],"ci":false,"cl":"S95","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2]],"E19-611"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Chemistry","no":"5.S95","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":1,"v":false},"5.THG":{"b":[],"ci":false,"cl":"THG","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"5.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.THU":{"b":[],"ci":false,"cl":"THU","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"5.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.UAR":{"b":[],"ci":false,"cl":"UAR","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2],[106,2]],"32-144"]],"la":false,"le":"U","lm":false,"n":"Climate and Sustainability Undergraduate Advanced Research","no":"5.UAR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"5.UR":{"b":[],"ci":false,"cl":"UR","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"5.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"5.URG":{"b":[],"ci":false,"cl":"URG","co":"5","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"5.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.100A":{"b":[],"ci":false,"cl":"100A","co":"6","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"26-100"]],"la":false,"le":"U","lm":false,"n":"[6.0001] Introduction to Computer Science Programming in Python","no":"6.100A","nx":false,"on":"6.0001","pl":false,"r":[[[[126,2]],"37-212"],[[[124,2]],"37-212"],[[[132,2]],"37-212"],[[[130,2]],"37-212"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":329.6,"t":["FA","SP"],"tb":true,"u1":3,"u2":0,"u3":3,"v":false},"6.100B":{"b":[],"ci":false,"cl":"100B","co":"6","cw":false,"f":true,"h":10.7,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"26-100"]],"la":false,"le":"U","lm":false,"n":"[6.0002] Introduction to Computational Thinking and Data Science","no":"6.100B","nx":false,"on":"6.0002","pl":false,"r":[[[[126,2]],"37-212"],[[[132,2]],"37-212"],[[[130,2]],"37-212"],[[[124,2]],"37-212"]],"ra":5.1,"re":false,"rp":false,"s":["r","l"],"si":273.2,"t":["FA","SP"],"tb":true,"u1":3,"u2":0,"u3":3,"v":false},"6.100L":{"b":[],"ci":false,"cl":"100L","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"2-190"]],"la":false,"le":"U","lm":false,"n":"Introduction to Computer Science and Programming","no":"6.100L","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"6.1010":{"b":[[[[124,6]],"34-501"],[[[132,6]],"1-190"]],"ci":false,"cl":"1010","co":"6","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2]],"3-270"],[[[4,2],[64,2]],"66-144"],[[[6,2],[66,2]],"36-155"],[[[2,2],[62,2]],"66-144"],[[[12,2],[72,2]],"36-112"],[[[14,2],[74,2]],"36-156"]],"la":true,"le":"U","lm":true,"n":"[6.009] Fundamentals of Programming","no":"6.1010","nx":false,"on":"6.009","pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["b","l"],"si":381.4,"t":["FA","SP"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"6.1040":{"b":[],"ci":false,"cl":"1040","co":"6","cw":false,"f":false,"h":17.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"1-190"]],"la":false,"le":"U","lm":false,"n":"[6.170] Software Studio","no":"6.1040","nx":false,"on":"6.170","pl":false,"r":[[[[96,2]],"34-301"],[[[94,2]],"38-166"],[[[100,2]],"36-372"],[[[102,2]],"34-301"],[[[104,2]],"36-112"],[[[98,2]],"34-303"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":88.3,"t":["FA"],"tb":false,"u1":4,"u2":9,"u3":2,"v":false},"6.1060":{"b":[[[[130,4]],"34-301"],[[[134,4]],"34-301"],[[[124,4]],"26-322"]],"ci":false,"cl":"1060","co":"6","cw":false,"f":false,"h":23.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-190"]],"la":false,"le":"U","lm":false,"n":"[6.172] Software Performance Engineering","no":"6.1060","nx":false,"on":"6.172","pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l","b"],"si":113.3,"t":["FA"],"tb":false,"u1":3,"u2":12,"u3":3,"v":false},"6.1120":{"b":[],"ci":false,"cl":"1120","co":"6","cw":false,"f":false,"h":15.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[40,2],[70,2],[100,2],[130,2]],"36-153"]],"la":false,"le":"U","lm":false,"n":"[6.818] Dynamic Computer Language Engineering","no":"6.1120","nx":false,"on":"6.818","pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":14.0,"t":["FA"],"tb":true,"u1":4,"u2":4,"u3":4,"v":false},"6.1200":{"b":[],"ci":false,"cl":"1200","co":"6","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"26-100"]],"la":false,"le":"U","lm":false,"n":"[6.042] Mathematics for Computer Science","no":"6.1200","nx":false,"on":"6.042","pl":false,"r":[[[[66,2],[126,2]],"13-3101"],[[[74,2],[134,2]],"26-168"],[[[72,2],[132,2]],"26-168"],[[[68,2],[128,2]],"36-144"],[[[64,2],[124,2]],"26-168"],[[[76,2],[136,2]],"26-168"],[[[70,2],[130,2]],"24-112"]],"ra":5.1,"re":true,"rp":false,"s":["l","r"],"si":268.2,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"6.1210":{"b":[],"ci":false,"cl":"1210","co":"6","cw":false,"f":true,"h":11.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"26-100"]],"la":false,"le":"U","lm":true,"n":"[6.006] Introduction to Algorithms","no":"6.1210","nx":false,"on":"6.006","pl":false,"r":[[[[66,2],[126,2]],"35-310"],[[[68,2],[128,2]],"34-304"],[[[76,2],[136,2]],"36-155"],[[[64,2],[124,2]],"34-303"],[[[72,2],[132,2]],"35-310"],[[[70,2],[130,2]],"35-310"],[[[74,2],[134,2]],"36-155"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":303.0,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"6.1220":{"b":[],"ci":false,"cl":"1220","co":"6","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"34-101"]],"la":false,"le":"U","lm":false,"n":"[6.046] Design and Analysis of Algorithms","no":"6.1220","nx":false,"on":"6.046","pl":false,"r":[[[[130,2]],"36-156"],[[[126,2]],"36-156"],[[[124,2]],"36-155"],[[[134,2]],"36-153"],[[[128,2]],"26-210"],[[[132,2]],"36-153"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":215.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.1420":{"b":[],"ci":false,"cl":"1420","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"5-134"]],"la":false,"le":"U","lm":false,"n":"[6.054] Fixed Parameter and Fine-grained Computation","no":"6.1420","nx":true,"on":"6.054","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.1600":{"b":[],"ci":false,"cl":"1600","co":"6","cw":false,"f":true,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"32-124"]],"la":false,"le":"U","lm":false,"n":"[6.053] Foundations of Computer Security","no":"6.1600","nx":false,"on":"6.053","pl":false,"r":[[[[126,2]],"35-308"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.1810":{"b":[],"ci":false,"cl":"1810","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"E25-111"]],"la":false,"le":"U","lm":false,"n":"[6.039] Operating System Engineering","no":"6.1810","nx":false,"on":"6.039","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.1850":{"b":[],"ci":false,"cl":"1850","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"34-304"]],"la":false,"le":"U","lm":true,"n":"[6.052] Computer Systems and Society","no":"6.1850","nx":false,"on":"6.052","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.1900":{"b":[[[[73,5]],"38-530"],[[[68,5]],"38-530"],[[[82,5]],"38-530"],[[[63,5]],"38-530"]],"ci":false,"cl":"1900","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[9,3]],"34-101"]],"la":false,"le":"U","lm":false,"n":"[6.0004] Introduction to Low-level Programming in C and Assembly","no":"6.1900","nx":false,"on":"6.0004","pl":false,"r":[[[[43,3]],"24-115"],[[[40,3]],"34-304"],[[[33,3]],"36-153"],[[[36,3]],"34-303"]],"ra":0,"re":false,"rp":false,"s":["l","r","b"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":2,"u3":2,"v":false},"6.1910":{"b":[],"ci":false,"cl":"1910","co":"6","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2],[100,2]],"32-123"]],"la":false,"le":"U","lm":false,"n":"[6.004] Computation Structures","no":"6.1910","nx":false,"on":"6.004","pl":false,"r":[[[[64,2],[124,2]],"34-301"],[[[70,2],[130,2]],"35-308"],[[[74,2],[134,2]],"13-5101"],[[[72,2],[132,2]],"34-303"],[[[68,2],[128,2]],"36-155"],[[[66,2],[126,2]],"34-301"]],"ra":5.0,"re":true,"rp":false,"s":["r","l"],"si":220.8,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.2000":{"b":[[[[134,4]],"38-530"],[[[126,4]],"38-530"],[[[130,4]],"38-530"],[[[122,4]],"38-530"]],"ci":false,"cl":"2000","co":"6","cw":false,"f":true,"h":11.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,2],[96,2]],"32-155"]],"la":false,"le":"U","lm":false,"n":"[6.002] Electrical Circuits: Modeling and Design of Physical Systems","no":"6.2000","nx":false,"on":"6.002","pl":false,"r":[[[[68,2]],"24-307"],[[[66,2]],"24-307"],[[[70,2]],"24-307"]],"ra":5.9,"re":true,"rp":false,"s":["b","r","l"],"si":84.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"6.2020":{"b":[],"ci":false,"cl":"2020","co":"6","cw":false,"f":false,"h":4.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"4-409"]],"la":false,"le":"U","lm":true,"n":"[6.070] Electronics Project Laboratory","no":"6.2020","nx":false,"on":"6.070","pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":15.4,"t":["FA","SP"],"tb":false,"u1":1,"u2":2,"u3":3,"v":false},"6.2050":{"b":[],"ci":false,"cl":"2050","co":"6","cw":false,"f":false,"h":15.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"32-141"]],"la":true,"le":"U","lm":false,"n":"[6.111] Digital Systems Laboratory","no":"6.2050","nx":false,"on":"6.111","pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":62.0,"t":["FA"],"tb":true,"u1":3,"u2":7,"u3":2,"v":false},"6.2090":{"b":[],"ci":false,"cl":"2090","co":"6","cw":false,"f":true,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"24-115"]],"la":false,"le":"U","lm":false,"n":"[6.301] Solid-State Circuits","no":"6.2090","nx":false,"on":"6.301","pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":16.7,"t":["FA"],"tb":true,"u1":3,"u2":2,"u3":7,"v":false},"6.2092":{"b":[],"ci":false,"cl":"2092","co":"6","cw":false,"f":true,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"24-115"]],"la":false,"le":"G","lm":false,"n":"[6.321] Solid-State Circuits","no":"6.2092","nx":false,"on":"6.321","pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":22.5,"t":["FA"],"tb":true,"u1":3,"u2":2,"u3":7,"v":false},"6.2210":{"b":[],"ci":false,"cl":"2210","co":"6","cw":false,"f":true,"h":12.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"36-156"]],"la":false,"le":"U","lm":false,"n":"[6.014] Electromagnetic Fields, Forces and Motion","no":"6.2210","nx":false,"on":"6.014","pl":false,"r":[[[[130,2]],"36-112"],[[[128,2]],"36-112"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.2220":{"b":[],"ci":false,"cl":"2220","co":"6","cw":false,"f":false,"h":24.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2],[100,2]],"32-155"]],"la":true,"le":"U","lm":false,"n":"[6.131] Power Electronics Laboratory","no":"6.2220","nx":false,"on":"6.131","pl":false,"r":[[[[74,2]],"34-101"]],"ra":6.6,"re":false,"rp":false,"s":["l","r"],"si":19.0,"t":["FA"],"tb":true,"u1":3,"u2":6,"u3":3,"v":false},"6.2221":{"b":[],"ci":false,"cl":"2221","co":"6","cw":false,"f":false,"h":24.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2],[100,2]],"32-155"]],"la":false,"le":"U","lm":false,"n":"[6.1311] Power Electronics Laboratory - Independent Inquiry","no":"6.2221","nx":false,"on":"6.1311","pl":false,"r":[[[[74,2]],"34-101"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":19.0,"t":["FA"],"tb":true,"u1":3,"u2":9,"u3":3,"v":false},"6.2222":{"b":[],"ci":false,"cl":"2222","co":"6","cw":false,"f":false,"h":24.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2],[100,2]],"32-155"]],"la":false,"le":"G","lm":false,"n":"[6.330] Power Electronics Laboratory","no":"6.2222","nx":false,"on":"6.330","pl":false,"r":[[[[74,2]],"34-101"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":21.0,"t":["FA"],"tb":true,"u1":3,"u2":9,"u3":3,"v":false},"6.2400":{"b":[],"ci":false,"cl":"2400","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"4-265"]],"la":false,"le":"U","lm":false,"n":"Introduction to Quantum Systems Engineering","no":"6.2400","nx":false,"pl":false,"r":[[[[96,2]],"4-153"]],"ra":0,"re":false,"rp":false,"s":["l","r"],"si":0,"t":["FA"],"tb":true,"u1":4,"u2":2,"u3":6,"v":false},"6.2540":{"b":[[[[132,6]],"36-156"],[[[128,6]],"4-265"],[[[122,6]],"36-372"]],"ci":false,"cl":"2540","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,2],[94,2]],"32-155"]],"la":false,"le":"U","lm":false,"n":"Nanotechnology: From Atoms to Systems","no":"6.2540","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["b","l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":7,"v":false},"6.3000":{"b":[[[[46,2],[106,2]],"36-156"]],"ci":false,"cl":"3000","co":"6","cw":false,"f":true,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,2],[102,2]],"3-270"]],"la":false,"le":"U","lm":false,"n":"[6.003] Signal Processing","no":"6.3000","nx":false,"on":"6.003","pl":false,"r":[[[[44,2],[104,2]],"4-149"]],"ra":5.3,"re":true,"rp":false,"s":["r","b","l"],"si":64.8,"t":["FA","SP"],"tb":false,"u1":6,"u2":0,"u3":6,"v":false},"6.3100":{"b":[[[[132,6]],"38-545"],[[[124,6]],"38-545"]],"ci":false,"cl":"3100","co":"6","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2],[74,2]],"4-231"]],"la":true,"le":"U","lm":false,"n":"[6.302] Dynamical System Modeling and Control Design","no":"6.3100","nx":false,"on":"6.302","pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["b","l"],"si":71.0,"t":["FA"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"6.3102":{"b":[[[[132,6]],"38-545"],[[[124,6]],"38-545"]],"ci":false,"cl":"3102","co":"6","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2],[74,2]],"4-231"]],"la":false,"le":"G","lm":false,"n":"[6.320] Dynamical System Modeling and Control Design","no":"6.3102","nx":false,"on":"6.320","pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["b","l"],"si":71.0,"t":["FA"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"6.3700":{"b":[],"ci":false,"cl":"3700","co":"6","cw":false,"f":true,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"32-141"]],"la":false,"le":"U","lm":false,"n":"[6.041] Introduction to Probability","no":"6.3700","nx":false,"on":"6.041","pl":false,"r":[[[[102,2]],"24-121"],[[[100,2]],"24-121"]],"ra":5.3,"re":true,"rp":false,"s":["r","l"],"si":56.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.3702":{"b":[],"ci":false,"cl":"3702","co":"6","cw":false,"f":true,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"[6.431] Introduction to Probability","no":"6.3702","nx":false,"on":"6.431","pl":false,"r":[[[[100,2]],"24-121"],[[[102,2]],"24-121"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":56.0,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.3800":{"b":[],"ci":false,"cl":"3800","co":"6","cw":false,"f":true,"h":11.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2]],"32-155"]],"la":true,"le":"U","lm":false,"n":"[6.008] Introduction to Inference","no":"6.3800","nx":false,"on":"6.008","pl":false,"r":[[[[40,2],[100,2]],"34-302"],[[[42,2],[102,2]],"34-302"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":55.0,"t":["FA"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"6.3900":{"b":[],"ci":false,"cl":"3900","co":"6","cw":false,"f":true,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"34-501"],[[[10,3],[70,3]],"34-501"],[[[6,3],[66,3]],"34-501"],[[[13,3],[73,3]],"32-044"]],"la":false,"le":"U","lm":true,"n":"[6.036] Introduction to Machine Learning","no":"6.3900","nx":false,"on":"6.036","pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":390.2,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.3950":{"b":[],"ci":false,"cl":"3950","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"32-141"]],"la":false,"le":"U","lm":false,"n":"[6.404] AI, Decision Making, and Society","no":"6.3950","nx":false,"on":"6.404","pl":false,"r":[[[[106,2]],"26-314"],[[[130,2]],"36-144"],[[[104,2]],"26-314"],[[[132,2]],"4-149"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.3952":{"b":[],"ci":false,"cl":"3952","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"AI, Decision Making, and Society","no":"6.3952","nx":false,"pl":false,"r":[[[[130,2]],"4-149"],[[[106,2]],"26-314"],[[[104,2]],"34-304"],[[[132,2]],"4-149"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.4100":{"b":[],"ci":false,"cl":"4100","co":"6","cw":false,"f":true,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"26-100"]],"la":false,"le":"U","lm":false,"n":"[6.034] Artificial Intelligence","no":"6.4100","nx":false,"on":"6.034","pl":false,"r":[[[[126,2]],"4-159"],[[[128,2]],"26-322"],[[[130,2]],"24-121"],[[[132,2]],"34-304"],[[[136,2]],"36-372"],[[[134,2]],"34-303"]],"ra":6.3,"re":false,"rp":false,"s":["r","l"],"si":296.3,"t":["FA"],"tb":false,"u1":4,"u2":3,"u3":5,"v":false},"6.4102":{"b":[[[[126,2]],"32-141"]],"ci":false,"cl":"4102","co":"6","cw":false,"f":true,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"26-100"]],"la":false,"le":"G","lm":false,"n":"[6.844] Artificial Intelligence","no":"6.4102","nx":false,"on":"6.844","pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["b","l"],"si":282.5,"t":["FA"],"tb":false,"u1":4,"u2":3,"u3":5,"v":false},"6.4110":{"b":[],"ci":false,"cl":"4110","co":"6","cw":false,"f":true,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"4-163"]],"la":false,"le":"U","lm":false,"n":"[6.038] Representation, Inference, and Reasoning in AI","no":"6.4110","nx":false,"on":"6.038","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.4120":{"b":[],"ci":false,"cl":"4120","co":"6","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"46-3002"]],"la":false,"le":"U","lm":false,"n":"[6.804] Computational Cognitive Science","no":"6.4120","nx":false,"on":"6.804","pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":148.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.4130":{"b":[],"ci":false,"cl":"4130","co":"6","cw":false,"f":true,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"32-141"]],"la":false,"le":"U","lm":false,"n":"[6.817] Principles of Autonomy and Decision Making","no":"6.4130","nx":false,"on":"6.817","pl":false,"r":[[[[134,2]],"33-319"],[[[124,2]],"33-319"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":74.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.4132":{"b":[],"ci":false,"cl":"4132","co":"6","cw":false,"f":true,"h":11.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"[6.877] Principles of Autonomy and Decision Making","no":"6.4132","nx":false,"on":"6.877","pl":false,"r":[],"ra":4.8,"re":false,"rp":false,"s":["l"],"si":74.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.4210":{"b":[[[[132,2]],"4-159"],[[[130,2]],"4-159"]],"ci":false,"cl":"4210","co":"6","cw":false,"f":false,"h":12.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"32-155"]],"la":false,"le":"U","lm":false,"n":"[6.800] Robotic Manipulation","no":"6.4210","nx":false,"on":"6.800","pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["b","l"],"si":90.0,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":9,"v":false},"6.4212":{"b":[[[[130,2]],"4-159"],[[[132,2]],"4-159"]],"ci":false,"cl":"4212","co":"6","cw":false,"f":false,"h":12.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"32-155"]],"la":false,"le":"G","lm":false,"n":"[6.843] Robotic Manipulation","no":"6.4212","nx":false,"on":"6.843","pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["b","l"],"si":90.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.4400":{"b":[],"ci":false,"cl":"4400","co":"6","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"4-370"]],"la":false,"le":"U","lm":false,"n":"[6.837] Computer Graphics","no":"6.4400","nx":false,"on":"6.837","pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":55.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.4420":{"b":[],"ci":false,"cl":"4420","co":"6","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"32-144"]],"la":false,"le":"U","lm":false,"n":"[6.807] Computational Design and Fabrication","no":"6.4420","nx":false,"on":"6.807","pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":3.5,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"6.4530":{"b":[],"ci":false,"cl":"4530","co":"6","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4],[96,4]],"32-044"]],"la":false,"le":"U","lm":true,"n":"[6.811] Principles and Practice of Assistive Technology","no":"6.4530","nx":false,"on":"6.811","pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":34.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"6.4550":{"b":[],"ci":false,"cl":"4550","co":"6","cw":false,"f":false,"h":11.7,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"4-270"]],"la":false,"le":"U","lm":true,"n":"[6.185] Interactive Music Systems","no":"6.4550","nx":false,"on":"6.185","pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":32.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.4570":{"b":[],"ci":false,"cl":"4570","co":"6","cw":false,"f":false,"h":11.2,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6],[102,6]],"1-150"]],"la":false,"le":"U","lm":true,"n":"[6.073] Creating Video Games","no":"6.4570","nx":false,"on":"6.073","pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":36.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"6.4590":{"b":[],"ci":false,"cl":"4590","co":"6","cw":false,"f":false,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[100,4]],"37-212"]],"la":false,"le":"U","lm":true,"n":"[6.805] Foundations of Information Policy","no":"6.4590","nx":false,"on":"6.805","pl":false,"r":[[[[104,2]],"37-212"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":32.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.4832":{"b":[],"ci":false,"cl":"4832","co":"6","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-265"]],"la":false,"le":"G","lm":false,"n":"[6.561] Fields, Forces, and Flows in Biological Systems","no":"6.4832","nx":false,"on":"6.561","pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":22.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.5210":{"b":[],"ci":false,"cl":"5210","co":"6","cw":false,"f":false,"h":19.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3],[133,3]],"32-123"]],"la":false,"le":"G","lm":false,"n":"[6.854] Advanced Algorithms","no":"6.5210","nx":false,"on":"6.854","pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":67.0,"t":["FA"],"tb":true,"u1":5,"u2":0,"u3":7,"v":false},"6.5240":{"b":[],"ci":false,"cl":"5240","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"34-302"]],"la":false,"le":"G","lm":false,"n":"[6.855] Sublinear Time Algorithms","no":"6.5240","nx":true,"on":"6.855","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.5250":{"b":[],"ci":false,"cl":"5250","co":"6","cw":false,"f":false,"h":17.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"[6.852] Distributed Algorithms","no":"6.5250","nx":true,"on":"6.852","pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":35.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.5400":{"b":[],"ci":false,"cl":"5400","co":"6","cw":false,"f":true,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"34-101"]],"la":false,"le":"G","lm":false,"n":"[6.840] Theory of Computation","no":"6.5400","nx":false,"on":"6.840","pl":false,"r":[[[[132,2]],"2-139"],[[[124,2]],"2-135"],[[[128,2]],"2-147"],[[[134,2]],"2-139"],[[[126,2]],"2-135"],[[[130,2]],"2-147"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":207.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.5620":{"b":[],"ci":false,"cl":"5620","co":"6","cw":false,"f":false,"h":15.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"1-190"]],"la":false,"le":"G","lm":false,"n":"[6.875] Cryptography and Cryptanalysis","no":"6.5620","nx":false,"on":"6.875","pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":41.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.5810":{"b":[],"ci":false,"cl":"5810","co":"6","cw":false,"f":false,"h":14.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"32-123"]],"la":false,"le":"G","lm":false,"n":"[6.828] Operating System Engineering","no":"6.5810","nx":false,"on":"6.828","pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":59.0,"t":["FA"],"tb":true,"u1":3,"u2":6,"u3":3,"v":false},"6.5820":{"b":[],"ci":false,"cl":"5820","co":"6","cw":false,"f":false,"h":13.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"32-124"]],"la":false,"le":"G","lm":false,"n":"[6.829] Computer Networks","no":"6.5820","nx":false,"on":"6.829","pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":35.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.5830":{"b":[],"ci":false,"cl":"5830","co":"6","cw":false,"f":false,"h":13.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"32-155"]],"la":false,"le":"G","lm":true,"n":"[6.830] Database Systems","no":"6.5830","nx":false,"on":"6.830","pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":48.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.5831":{"b":[],"ci":false,"cl":"5831","co":"6","cw":false,"f":false,"h":13.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"32-155"]],"la":false,"le":"U","lm":true,"n":"[6.814] Database Systems","no":"6.5831","nx":false,"on":"6.814","pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":48.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.5900":{"b":[],"ci":false,"cl":"5900","co":"6","cw":false,"f":false,"h":12.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"32-141"]],"la":false,"le":"G","lm":false,"n":"[6.823] Computer System Architecture","no":"6.5900","nx":false,"on":"6.823","pl":false,"r":[[[[130,3]],"32-141"]],"ra":5.9,"re":false,"rp":false,"s":["r","l"],"si":31.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.6010":{"b":[],"ci":false,"cl":"6010","co":"6","cw":false,"f":false,"h":20.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"34-302"]],"la":false,"le":"G","lm":false,"n":"[6.374] Analysis and Design of Digital Integrated Circuits","no":"6.6010","nx":false,"on":"6.374","pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"6.6210":{"b":[],"ci":false,"cl":"6210","co":"6","cw":false,"f":true,"h":12.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"36-156"]],"la":false,"le":"G","lm":false,"n":"[6.640] Electromagnetic Fields, Forces and Motion","no":"6.6210","nx":false,"on":"6.640","pl":false,"r":[[[[128,2]],"36-112"],[[[130,2]],"36-112"]],"ra":5.5,"re":false,"rp":false,"s":["l","r"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.6300":{"b":[],"ci":false,"cl":"6300","co":"6","cw":false,"f":false,"h":14.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,3],[130,3]],"32-144"]],"la":false,"le":"G","lm":false,"n":"[6.630] Electromagnetics","no":"6.6300","nx":false,"on":"6.630","pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":20.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.6310":{"b":[],"ci":false,"cl":"6310","co":"6","cw":false,"f":true,"h":33.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"36-372"]],"la":false,"le":"G","lm":false,"n":"[6.631] Optics and Photonics","no":"6.6310","nx":false,"on":"6.631","pl":false,"r":[],"ra":4.7,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.6400":{"b":[],"ci":false,"cl":"6400","co":"6","cw":false,"f":true,"h":17.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[66,3],[126,3]],"4-153"]],"la":false,"le":"G","lm":false,"n":"[6.728] Applied Quantum and Statistical Physics","no":"6.6400","nx":false,"on":"6.728","pl":false,"r":[[[[6,2]],"4-159"]],"ra":6.3,"re":false,"rp":false,"s":["l","r"],"si":23.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.6410":{"b":[],"ci":false,"cl":"6410","co":"6","cw":false,"f":true,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"2-190"]],"la":false,"le":"G","lm":false,"n":"[6.445] Quantum Computation","no":"6.6410","nx":false,"on":"6.445","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.6500":{"b":[],"ci":false,"cl":"6500","co":"6","cw":false,"f":true,"h":15.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[94,2],[124,2]],"36-153"]],"la":false,"le":"G","lm":false,"n":"[6.720] Integrated Microelectronic Devices","no":"6.6500","nx":false,"on":"6.720","pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.6630":{"b":[],"ci":false,"cl":"6630","co":"6","cw":false,"f":false,"h":14.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"24-121"]],"la":false,"le":"G","lm":false,"n":"[6.780] Control of Manufacturing Processes","no":"6.6630","nx":false,"on":"6.780","pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":19.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7000":{"b":[],"ci":false,"cl":"7000","co":"6","cw":false,"f":true,"h":13.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"32-124"]],"la":false,"le":"G","lm":false,"n":"[6.341] Discrete-Time Signal Processing","no":"6.7000","nx":false,"on":"6.341","pl":false,"r":[[[[132,2]],"36-372"],[[[130,2]],"36-372"]],"ra":6.5,"re":false,"rp":false,"s":["l","r"],"si":20.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.7200":{"b":[],"ci":false,"cl":"7200","co":"6","cw":false,"f":true,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,3],[91,3]],"E62-276"],[[[40,3],[100,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"[6.255] Optimization Methods","no":"6.7200","nx":false,"on":"6.255","pl":false,"r":[[[[132,2]],"E52-164"],[[[130,2]],"E52-164"]],"ra":4.9,"re":false,"rp":false,"s":["l","r"],"si":139.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.7201":{"b":[],"ci":false,"cl":"7201","co":"6","cw":false,"f":true,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E51-345"]],"la":false,"le":"U","lm":false,"n":"[6.215] Optimization Methods","no":"6.7201","nx":false,"on":"6.215","pl":false,"r":[[[[124,2]],"32-141"],[[[130,2]],"32-155"]],"ra":4.9,"re":false,"rp":false,"s":["r","l"],"si":139.7,"t":["FA"],"tb":true,"u1":4,"u2":0,"u3":8,"v":false},"6.7210":{"b":[],"ci":false,"cl":"7210","co":"6","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"[6.251] Introduction to Mathematical Programming","no":"6.7210","nx":false,"on":"6.251","pl":false,"r":[[[[128,2]],"34-301"],[[[124,2]],"4-231"]],"ra":5.8,"re":false,"rp":false,"s":["l","r"],"si":43.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.7300":{"b":[],"ci":false,"cl":"7300","co":"6","cw":false,"f":false,"h":15.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"32-155"]],"la":false,"le":"G","lm":false,"n":"[6.336] Introduction to Modeling and Simulation","no":"6.7300","nx":false,"on":"6.336","pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":54.3,"t":["FA"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"6.7330":{"b":[],"ci":false,"cl":"7330","co":"6","cw":false,"f":false,"h":15.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"37-212"]],"la":false,"le":"G","lm":false,"n":"[6.339] Numerical Methods for Partial Differential Equations","no":"6.7330","nx":false,"on":"6.339","pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":29.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7340":{"b":[],"ci":false,"cl":"7340","co":"6","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"2-147"]],"la":false,"le":"G","lm":false,"n":"[6.335] Fast Methods for Partial Differential and Integral Equations","no":"6.7340","nx":false,"on":"6.335","pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7410":{"b":[],"ci":false,"cl":"7410","co":"6","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-105"]],"la":false,"le":"G","lm":false,"n":"[6.450] Principles of Digital Communication","no":"6.7410","nx":false,"on":"6.450","pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":7.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7411":{"b":[],"ci":false,"cl":"7411","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-105"]],"la":false,"le":"U","lm":false,"n":"Principles of Digital Communication","no":"6.7411","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7420":{"b":[],"ci":false,"cl":"7420","co":"6","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"34-302"]],"la":false,"le":"G","lm":false,"n":"[6.267] Heterogeneous Networks: Architecture, Transport, Proctocols, and Management","no":"6.7420","nx":true,"on":"6.267","pl":false,"r":[[[[123,3]],"34-302"]],"ra":0.0,"re":false,"rp":false,"s":["l","r"],"si":0.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.7450":{"b":[],"ci":false,"cl":"7450","co":"6","cw":false,"f":false,"h":6.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,6]],"33-422"]],"la":false,"le":"G","lm":false,"n":"[6.263] Data-Communication Networks","no":"6.7450","nx":false,"on":"6.263","pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7700":{"b":[],"ci":false,"cl":"7700","co":"6","cw":false,"f":false,"h":16.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"35-225"]],"la":false,"le":"G","lm":false,"n":"[6.436] Fundamentals of Probability","no":"6.7700","nx":false,"on":"6.436","pl":false,"r":[[[[132,2]],"3-333"],[[[130,2]],"3-333"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":59.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.7810":{"b":[],"ci":false,"cl":"7810","co":"6","cw":false,"f":true,"h":15.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"32-123"]],"la":false,"le":"G","lm":false,"n":"[6.438] Algorithms for Inference","no":"6.7810","nx":false,"on":"6.438","pl":false,"r":[[[[124,2]],"1-190"],[[[126,2]],"1-190"]],"ra":5.8,"re":false,"rp":false,"s":["r","l"],"si":89.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.7900":{"b":[],"ci":false,"cl":"7900","co":"6","cw":false,"f":true,"h":17.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"32-123"]],"la":false,"le":"G","lm":true,"n":"[6.867] Machine Learning","no":"6.7900","nx":false,"on":"6.867","pl":false,"r":[[[[132,2]],"3-270"],[[[126,2]],"4-237"],[[[124,2]],"4-237"],[[[130,2]],"3-270"]],"ra":4.4,"re":false,"rp":false,"s":["r","l"],"si":171.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7910":{"b":[],"ci":false,"cl":"7910","co":"6","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"46-3002"]],"la":false,"le":"G","lm":false,"n":"[6.860] Statistical Learning Theory and Applications","no":"6.7910","nx":false,"on":"6.860","pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":95.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.7950":{"b":[],"ci":false,"cl":"7950","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"4-237"]],"la":false,"le":"G","lm":false,"n":"[6.246] Advanced Topics in Control","no":"6.7950","nx":false,"on":"6.246","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.8370":{"b":[],"ci":false,"cl":"8370","co":"6","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-270"]],"la":false,"le":"G","lm":false,"n":"[6.865] Advanced Computational Photography","no":"6.8370","nx":false,"on":"6.865","pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":99.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.8371":{"b":[],"ci":false,"cl":"8371","co":"6","cw":false,"f":false,"h":9.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-270"]],"la":false,"le":"U","lm":false,"n":"[6.815] Digital and Computational Photography","no":"6.8371","nx":false,"on":"6.815","pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":99.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.8420":{"b":[],"ci":false,"cl":"8420","co":"6","cw":false,"f":false,"h":17.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"32-144"]],"la":false,"le":"G","lm":false,"n":"[6.839] Computational Design and Fabrication","no":"6.8420","nx":false,"on":"6.839","pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":14.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.8610":{"b":[],"ci":false,"cl":"8610","co":"6","cw":false,"f":false,"h":12.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"32-123"]],"la":false,"le":"G","lm":false,"n":"[6.864] Quantitative Methods for Natural Language Processing","no":"6.8610","nx":false,"on":"6.864","pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":168.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.8611":{"b":[],"ci":false,"cl":"8611","co":"6","cw":false,"f":false,"h":12.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"32-123"]],"la":false,"le":"U","lm":false,"n":"[6.806] Quantitative Methods for Natural Language Processing","no":"6.8611","nx":false,"on":"6.806","pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":168.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":11,"v":false},"6.8700":{"b":[],"ci":false,"cl":"8700","co":"6","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-237"]],"la":false,"le":"G","lm":false,"n":"[6.878] Advanced Computational Biology: Genomes, Networks, Evolution","no":"6.8700","nx":false,"on":"6.878","pl":false,"r":[[[[134,2]],"4-149"]],"ra":4.8,"re":false,"rp":false,"s":["l","r"],"si":47.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"6.8701":{"b":[],"ci":false,"cl":"8701","co":"6","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"32-144"]],"la":false,"le":"U","lm":false,"n":"[6.047] Computational Biology: Genomes, Networks, Evolution","no":"6.8701","nx":false,"on":"6.047","pl":false,"r":[[[[134,2]],"32-144"]],"ra":4.8,"re":false,"rp":false,"s":["r","l"],"si":47.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.9020":{"b":[],"ci":false,"cl":"9020","co":"6","cw":false,"f":true,"h":21.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"[6.943] How to Make (Almost) Anything","no":"6.9020","nx":false,"on":"6.943","pl":false,"r":[[[[108,4]],"E14-633"]],"ra":6.2,"re":false,"rp":false,"s":["l","r"],"si":62.3,"t":["FA"],"tb":false,"u1":3,"u2":9,"u3":6,"v":false},"6.9030":{"b":[],"ci":false,"cl":"9030","co":"6","cw":false,"f":false,"h":10.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2]],"1-134"]],"la":true,"le":"U","lm":true,"n":"[6.163] Strobe Project Laboratory","no":"6.9030","nx":false,"on":"6.163","pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA","SP"],"tb":true,"u1":2,"u2":8,"u3":2,"v":false},"6.9101":{"b":[],"ci":false,"cl":"9101","co":"6","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":true,"n":"[6.9021] Introduction to Design Thinking and Innovation in Engineering","no":"6.9101","nx":false,"on":"6.9021","pl":false,"r":[[[[76,2]],"35-308"],[[[46,2]],"35-308"],[[[26,2]],"32-141"]],"ra":7.0,"re":false,"rp":false,"s":["r","l"],"si":36.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"6.910A":{"b":[],"ci":false,"cl":"910A","co":"6","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":false,"n":"[6.902A] Design Thinking and Innovation Leadership for Engineers","no":"6.910A","nx":false,"on":"6.902A","pl":false,"r":[[[[82,2]],"4-231"]],"ra":0.0,"re":false,"rp":false,"s":["r","l"],"si":0.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"6.910B":{"b":[],"ci":false,"cl":"910B","co":"6","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[22,4]],"32-141"]],"la":false,"le":"U","lm":false,"n":"[6.902B] Design Thinking and Innovation Project","no":"6.910B","nx":false,"on":"6.902B","pl":false,"r":[[[[46,2]],"35-308"],[[[26,2]],"32-141"],[[[76,2]],"35-308"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":45.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"6.9110":{"b":[[[[130,4]],"32-124"],[[[122,4]],"32-124"],[[[134,4]],"32-124"]],"ci":false,"cl":"9110","co":"6","cw":false,"f":false,"h":3.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"[6.911] Engineering Leadership Lab","no":"6.9110","nx":false,"on":"6.911","pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["b"],"si":147.6,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":1,"v":false},"6.9120":{"b":[],"ci":false,"cl":"9120","co":"6","cw":false,"f":false,"h":3.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3]],"4-153"],[[[40,3]],"4-153"],[[[10,3]],"4-153"],[[[36,3]],"4-153"]],"la":false,"le":"U","lm":false,"n":"[6.912] Engineering Leadership","no":"6.9120","nx":false,"on":"6.912","pl":false,"r":[],"ra":5.7,"re":false,"rp":true,"s":["l"],"si":116.4,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"6.9130":{"b":[[[[134,4]],"32-124"],[[[130,4]],"32-124"],[[[122,4]],"32-124"]],"ci":false,"cl":"9130","co":"6","cw":false,"f":false,"h":3.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"[6.913] Engineering Leadership Lab","no":"6.9130","nx":false,"on":"6.913","pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":["b"],"si":147.6,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"6.9160":{"b":[],"ci":false,"cl":"9160","co":"6","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"1-390"]],"la":false,"le":"U","lm":false,"n":"[6.901] Engineering Innovation: Moving Ideas to Impact","no":"6.9160","nx":false,"on":"6.901","pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":24.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"6.9270":{"b":[],"ci":false,"cl":"9270","co":"6","cw":false,"f":false,"h":12.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,4]],"32-124"]],"la":false,"le":"G","lm":false,"n":"[6.927] Negotiation and Influence Skills for Technical Leaders","no":"6.9270","nx":false,"on":"6.927","pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":30.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"6.9280":{"b":[],"ci":false,"cl":"9280","co":"6","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"37-212"]],"la":false,"le":"G","lm":true,"n":"[6.928] Leading Creative Teams","no":"6.9280","nx":false,"on":"6.928","pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":35.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"6.9320":{"b":[],"ci":false,"cl":"9320","co":"6","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"66-144"],[[[44,4]],"66-148"],[[[82,4]],"66-144"],[[[74,4]],"66-148"]],"la":false,"le":"U","lm":false,"n":"[6.904] Ethics for Engineers","no":"6.9320","nx":false,"on":"6.904","pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":59.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"6.9360":{"b":[[[[16,2]],"1-375"],[[[130,2]],"1-375"],[[[34,2]],"1-375"],[[[106,2]],"1-375"]],"ci":false,"cl":"9360","co":"6","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"35-225"]],"la":false,"le":"U","lm":false,"n":"[6.930] Management in Engineering","no":"6.9360","nx":false,"on":"6.930","pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["l","b"],"si":27.0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"6.9800":{"b":[],"ci":false,"cl":"9800","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"[6.910] Independent Study in Electrical Engineering and Computer Science","no":"6.9800","nx":false,"on":"6.910","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.9820":{"b":[],"ci":false,"cl":"9820","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"[6.920] Practical Internship Experience","no":"6.9820","nx":false,"on":"6.920","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"6.9830":{"b":[],"ci":false,"cl":"9830","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.997] Professional Perspective Internship","no":"6.9830","nx":false,"on":"6.997","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"6.9840":{"b":[],"ci":false,"cl":"9840","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.998] Practical Experience in EECS","no":"6.9840","nx":false,"on":"6.998","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"6.9850":{"b":[],"ci":false,"cl":"9850","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"[6.921] 6-A Internship","no":"6.9850","nx":false,"on":"6.921","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"6.9860":{"b":[],"ci":false,"cl":"9860","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"[6.922] Advanced 6-A Internship","no":"6.9860","nx":false,"on":"6.922","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"6.9870":{"b":[],"ci":false,"cl":"9870","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"[6.951] Graduate 6-A Internship","no":"6.9870","nx":false,"on":"6.951","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"6.9880":{"b":[],"ci":false,"cl":"9880","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"[6.952] Graduate 6-A Internship","no":"6.9880","nx":false,"on":"6.952","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"6.9900":{"b":[],"ci":false,"cl":"9900","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.981] Teaching Electrical Engineering and Computer Science","no":"6.9900","nx":false,"on":"6.981","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.9910":{"b":[],"ci":false,"cl":"9910","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.991] Research in Electrical Engineering and Computer Science","no":"6.9910","nx":false,"on":"6.991","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.9920":{"b":[],"ci":false,"cl":"9920","co":"6","cw":false,"f":false,"h":26.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.960] Introductory Research in Electrical Engineering and Computer Science","no":"6.9920","nx":false,"on":"6.960","pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":[],"si":124.2,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.9930":{"b":[],"ci":false,"cl":"9930","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.963] Networking Seminars in EECS","no":"6.9930","nx":false,"on":"6.963","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.9932":{"b":[],"ci":false,"cl":"9932","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,4]],"32-124"]],"la":false,"le":"G","lm":true,"n":"[6.961] Introduction to Research in Electrical Engineering and Computer Science","no":"6.9932","nx":false,"on":"6.961","pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":3,"u2":0,"u3":0,"v":false},"6.9940":{"b":[],"ci":false,"cl":"9940","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.994] Professional Perspective I","no":"6.9940","nx":false,"on":"6.994","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"6.9950":{"b":[],"ci":false,"cl":"9950","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.995] Professional Perspective II","no":"6.9950","nx":false,"on":"6.995","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"6.9970":{"b":[],"ci":false,"cl":"9970","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[47,4]],"4-231"]],"la":false,"le":"G","lm":false,"n":"Academic Job Search","no":"6.9970","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"6.9990":{"b":[],"ci":false,"cl":"9990","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"[6.962] Independent Study in Electrical Engineering and Computer Science","no":"6.9990","nx":false,"on":"6.962","pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.EPE":{"b":[],"ci":false,"cl":"EPE","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"6.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"6.EPW":{"b":[],"ci":false,"cl":"EPW","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"UPOP Engineering Practice Workshop","no":"6.EPW","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"6.S040":{"b":[],"ci":false,"cl":"S040","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[99,4]],"24-307"],[[[103,4]],"24-307"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S040","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S045":{"b":[],"ci":false,"cl":"S045","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2]],"36-156"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S045","nx":false,"pl":false,"r":[[[[126,2]],"34-302"]],"ra":0,"re":false,"rp":true,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.S046":{"b":[],"ci":false,"cl":"S046","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"26-328"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S046","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":0,"v":false},"6.S047":{"b":[],"ci":false,"cl":"S047","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S047","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":true},"6.S077":{"b":[[[[63,5]],"38-530"],[[[82,5]],"38-530"],[[[73,5]],"38-530"],[[[68,5]],"38-530"]],"ci":false,"cl":"S077","co":"6","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[9,3]],"34-101"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S077","nx":false,"pl":false,"r":[[[[36,3]],"34-303"],[[[33,3]],"36-153"],[[[43,3]],"24-121"],[[[40,3]],"34-304"]],"ra":5.8,"re":false,"rp":true,"s":["b","r","l"],"si":11.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S082":{"b":[],"ci":false,"cl":"S082","co":"6","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"34-302"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S082","nx":false,"pl":false,"r":[[[[130,2]],"26-314"]],"ra":6.0,"re":false,"rp":true,"s":["r","l"],"si":3.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S083":{"b":[],"ci":false,"cl":"S083","co":"6","cw":false,"f":false,"h":10.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-131"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S083","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S084":{"b":[],"ci":false,"cl":"S084","co":"6","cw":false,"f":true,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"4-370"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S084","nx":false,"pl":false,"r":[[[[38,2],[98,2]],"4-149"],[[[44,2],[104,2]],"2-139"],[[[40,2],[100,2]],"4-149"],[[[34,2],[94,2]],"2-135"]],"ra":4.5,"re":false,"rp":true,"s":["l","r"],"si":2.5,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S897":{"b":[],"ci":false,"cl":"S897","co":"6","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4]],"4-257"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Computer Science","no":"6.S897","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":32.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S898":{"b":[],"ci":false,"cl":"S898","co":"6","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-231"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Computer Science","no":"6.S898","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":19.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S965":{"b":[],"ci":false,"cl":"S965","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"36-153"]],"la":false,"le":"G","lm":false,"n":"Special Studies: EECS","no":"6.S965","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S967":{"b":[],"ci":false,"cl":"S967","co":"6","cw":false,"f":false,"h":14.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"34-302"]],"la":false,"le":"G","lm":false,"n":"Special Studies: EECS","no":"6.S967","nx":false,"pl":false,"r":[[[[130,2]],"26-314"]],"ra":4.5,"re":false,"rp":true,"s":["l","r"],"si":35.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S974":{"b":[],"ci":false,"cl":"S974","co":"6","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"5-134"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S974","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"6.S975":{"b":[],"ci":false,"cl":"S975","co":"6","cw":false,"f":false,"h":3.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S975","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":2.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.S976":{"b":[],"ci":false,"cl":"S976","co":"6","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"26-328"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S976","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":22.0,"t":["FA"],"tb":true,"u1":0,"u2":0,"u3":0,"v":false},"6.S977":{"b":[],"ci":false,"cl":"S977","co":"6","cw":false,"f":false,"h":5.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[123,6]],"1-150"]],"la":false,"le":"G","lm":false,"n":"The Sum of Squares Methods","no":"6.S977","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.S979":{"b":[],"ci":false,"cl":"S979","co":"6","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S979","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":23.5,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.S980":{"b":[],"ci":false,"cl":"S980","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"32-124"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S980","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.S981":{"b":[],"ci":false,"cl":"S981","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"26-328"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S981","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.S982":{"b":[],"ci":false,"cl":"S982","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[123,6]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Electrical Engineering and Computer Science","no":"6.S982","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"6.THG":{"b":[],"ci":false,"cl":"THG","co":"6","cw":false,"f":false,"h":42.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"6.THG","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":[],"si":600.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.THM":{"b":[],"ci":false,"cl":"THM","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Master of Engineering Program Thesis","no":"6.THM","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"6.UAR":{"b":[],"ci":false,"cl":"UAR","co":"6","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,2]],"32-123"]],"la":false,"le":"U","lm":false,"n":"Seminar in Undergraduate Advanced Research","no":"6.UAR","nx":false,"pl":false,"r":[],"ra":4.4,"re":false,"rp":true,"s":["l"],"si":106.6,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"6.UAT":{"b":[],"ci":false,"cl":"UAT","co":"6","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2]],"32-123"]],"la":false,"le":"U","lm":true,"n":"Oral Communication","no":"6.UAT","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":198.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"6.UR":{"b":[],"ci":false,"cl":"UR","co":"6","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Electrical Engineering and Computer Science","no":"6.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.002":{"b":[[[[130,7]],"68-074"],[[[70,7]],"68-074"]],"ci":false,"cl":"002","co":"7","cw":false,"f":false,"h":5.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[11,3]],"68-181"]],"la":false,"le":"U","lm":true,"n":"Fundamentals of Experimental Molecular Biology","no":"7.002","nx":false,"pl":true,"r":[],"ra":6.5,"re":false,"rp":false,"s":["b","l"],"si":39.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":4,"u3":1,"v":false},"7.003":{"b":[[[[42,6],[100,8]],"68-074"]],"ci":false,"cl":"003","co":"7","cw":false,"f":false,"h":13.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,2]],"68-181"]],"la":false,"le":"U","lm":true,"n":"Applied Molecular Biology Laboratory","no":"7.003","nx":false,"pl":true,"r":[[[[36,3]],"68-121"]],"ra":5.7,"re":false,"rp":false,"s":["l","r","b"],"si":22.7,"t":["FA","SP"],"tb":false,"u1":2,"u2":7,"u3":3,"v":false},"7.012":{"b":[],"ci":false,"cl":"012","co":"7","cw":false,"f":true,"h":8.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"10-250"]],"la":false,"le":"U","lm":true,"n":"Introductory Biology","no":"7.012","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"26-210"],[[[42,2],[102,2]],"26-210"],[[[52,2],[112,2]],"26-210"],[[[34,2],[94,2]],"35-308"],[[[40,2],[100,2]],"26-210"],[[[38,2],[98,2]],"26-204"],[[[32,2],[92,2]],"26-210"],[[[44,2],[104,2]],"26-204"]],"ra":5.4,"re":false,"rp":false,"s":["r","l"],"si":360.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"7.015":{"b":[],"ci":false,"cl":"015","co":"7","cw":false,"f":true,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"2-190"]],"la":false,"le":"U","lm":true,"n":"Introductory Biology","no":"7.015","nx":false,"pl":false,"r":[[[[68,2],[128,2]],"26-142"],[[[66,2],[126,2]],"36-112"],[[[64,2],[124,2]],"36-112"],[[[70,2],[130,2]],"26-142"],[[[72,2],[132,2]],"26-142"]],"ra":5.9,"re":false,"rp":false,"s":["r","l"],"si":42.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"7.03":{"b":[],"ci":false,"cl":"03","co":"7","cw":false,"f":true,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2],[126,2]],"4-370"]],"la":false,"le":"U","lm":false,"n":"Genetics","no":"7.03","nx":false,"pl":false,"r":[[[[12,2]],"26-204"],[[[34,2]],"38-166"],[[[40,2]],"26-322"],[[[36,2]],"26-314"],[[[68,2]],"4-251"],[[[14,2]],"26-204"],[[[70,2]],"4-251"],[[[38,2]],"26-314"],[[[42,2]],"26-322"]],"ra":5.3,"re":true,"rp":false,"s":["l","r"],"si":76.4,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.06":{"b":[],"ci":false,"cl":"06","co":"7","cw":false,"f":true,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-270"]],"la":false,"le":"U","lm":false,"n":"Cell Biology","no":"7.06","nx":false,"pl":false,"r":[[[[124,2]],"26-204"],[[[126,2]],"26-204"],[[[130,2]],"26-204"],[[[128,2]],"26-204"],[[[132,2]],"26-204"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":69.4,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.11":{"b":[],"ci":false,"cl":"11","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Biology Teaching","no":"7.11","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.19":{"b":[],"ci":false,"cl":"19","co":"7","cw":false,"f":false,"h":15.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,4],[102,4]],"68-121"]],"la":false,"le":"U","lm":false,"n":"Communication in Experimental Biology","no":"7.19","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":10.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":4,"u3":4,"v":false},"7.20":{"b":[],"ci":false,"cl":"20","co":"7","cw":false,"f":true,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,4],[92,4]],"E25-111"]],"la":false,"le":"U","lm":false,"n":"Human Physiology","no":"7.20","nx":false,"pl":false,"r":[[[[66,2]],"4-159"],[[[53,2]],"66-154"]],"ra":6.4,"re":false,"rp":false,"s":["r","l"],"si":25.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"7.21":{"b":[],"ci":false,"cl":"21","co":"7","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,4],[66,4]],"56-114"]],"la":false,"le":"U","lm":false,"n":"Microbial Physiology","no":"7.21","nx":false,"pl":false,"r":[[[[126,2]],"56-114"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":14.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.30":{"b":[],"ci":false,"cl":"30","co":"7","cw":false,"f":true,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"1-242"]],"la":false,"le":"U","lm":false,"n":"Fundamentals of Ecology","no":"7.30","nx":false,"pl":false,"r":[[[[16,2]],"48-316"],[[[106,2]],"48-308"]],"ra":5.9,"re":true,"rp":false,"s":["r","l"],"si":19.5,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.32":{"b":[],"ci":false,"cl":"32","co":"7","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-159"]],"la":false,"le":"U","lm":false,"n":"Systems Biology","no":"7.32","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":35.7,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"7.340":{"b":[],"ci":false,"cl":"340","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.340","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.341":{"b":[],"ci":false,"cl":"341","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4]],"68-150"]],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.341","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"7.342":{"b":[],"ci":false,"cl":"342","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,4]],"68-150"]],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.342","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"7.343":{"b":[],"ci":false,"cl":"343","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.343","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.344":{"b":[],"ci":false,"cl":"344","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.344","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.345":{"b":[],"ci":false,"cl":"345","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.345","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.346":{"b":[],"ci":false,"cl":"346","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.346","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.347":{"b":[],"ci":false,"cl":"347","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.347","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.348":{"b":[],"ci":false,"cl":"348","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.348","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.349":{"b":[],"ci":false,"cl":"349","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Advanced Undergraduate Seminar","no":"7.349","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.371":{"b":[],"ci":false,"cl":"371","co":"7","cw":false,"f":false,"h":9.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4],[74,4]],"WI-7TH"]],"la":false,"le":"U","lm":false,"n":"Biological and Engineering Principles Underlying Novel Biotherapeutics","no":"7.371","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.390":{"b":[],"ci":false,"cl":"390","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Practical Internship Experience in Biology","no":"7.390","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"7.391":{"b":[],"ci":false,"cl":"391","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Biology","no":"7.391","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.392":{"b":[],"ci":false,"cl":"392","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Biology","no":"7.392","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.393":{"b":[],"ci":false,"cl":"393","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Genetics","no":"7.393","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.394":{"b":[],"ci":false,"cl":"394","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Biochemistry","no":"7.394","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.395":{"b":[],"ci":false,"cl":"395","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Cell and Molecular Biology","no":"7.395","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.396":{"b":[],"ci":false,"cl":"396","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Experimental Biology","no":"7.396","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.411":{"b":[],"ci":false,"cl":"411","co":"7","cw":false,"f":false,"h":6.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Seminars in Biological Oceanography","no":"7.411","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":5.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.421":{"b":[],"ci":false,"cl":"421","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Problems in Biological Oceanography","no":"7.421","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.431":{"b":[],"ci":false,"cl":"431","co":"7","cw":false,"f":false,"h":5.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Topics in Marine Ecology","no":"7.431","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":[],"si":5.3,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.433":{"b":[],"ci":false,"cl":"433","co":"7","cw":false,"f":false,"h":7.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Topics in Biological Oceanography","no":"7.433","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":[],"si":7.5,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.434":{"b":[],"ci":false,"cl":"434","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Topics in Zooplankton Biology","no":"7.434","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.435":{"b":[],"ci":false,"cl":"435","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Topics in Benthic Biology","no":"7.435","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.436":{"b":[],"ci":false,"cl":"436","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Topics in Phytoplankton Biology","no":"7.436","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.437":{"b":[],"ci":false,"cl":"437","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Topics in Molecular Biological Oceanography","no":"7.437","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.438":{"b":[],"ci":false,"cl":"438","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Topics in the Behavior of Marine Animals","no":"7.438","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":4,"v":true},"7.45":{"b":[],"ci":false,"cl":"45","co":"7","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-163"]],"la":false,"le":"U","lm":false,"n":"The Hallmarks of Cancer","no":"7.45","nx":false,"pl":false,"r":[[[[128,2]],"26-314"],[[[112,2]],"56-114"],[[[126,2]],"26-314"]],"ra":6.5,"re":false,"rp":false,"s":["r","l"],"si":58.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.46":{"b":[],"ci":false,"cl":"46","co":"7","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"26-328"]],"la":false,"le":"U","lm":false,"n":"Building with Cells","no":"7.46","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":18.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.491":{"b":[],"ci":false,"cl":"491","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Biological Oceanography","no":"7.491","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.492":{"b":[],"ci":false,"cl":"492","co":"7","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,6]],"4-144"]],"la":false,"le":"G","lm":false,"n":"Methods and Problems in Microbiology","no":"7.492","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"7.493":{"b":[],"ci":false,"cl":"493","co":"7","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[39,4],[99,4]],"66-160"]],"la":false,"le":"G","lm":false,"n":"Microbial Genetics and Evolution","no":"7.493","nx":false,"pl":false,"r":[[[[126,2]],"2-142"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":12.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.494":{"b":[],"ci":false,"cl":"494","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Problems in Microbiology","no":"7.494","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.498":{"b":[],"ci":false,"cl":"498","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Experience in Microbiology","no":"7.498","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.499":{"b":[],"ci":false,"cl":"499","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Research Rotations in Microbiology","no":"7.499","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.50":{"b":[],"ci":false,"cl":"50","co":"7","cw":false,"f":false,"h":12.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Method and Logic in Molecular Biology","no":"7.50","nx":false,"pl":false,"r":[[[[14,6],[103,6]],"WI-6TH"]],"ra":6.3,"re":false,"rp":false,"s":["r"],"si":36.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.51":{"b":[],"ci":false,"cl":"51","co":"7","cw":false,"f":false,"h":13.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,3],[62,3],[122,3]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Principles of Biochemical Analysis","no":"7.51","nx":false,"pl":false,"r":[[[[43,2],[130,2]],"4-163"]],"ra":5.6,"re":false,"rp":false,"s":["l","r"],"si":44.3,"t":["FA"],"tb":false,"u1":6,"u2":0,"u3":6,"v":false},"7.52":{"b":[],"ci":false,"cl":"52","co":"7","cw":false,"f":false,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,4],[93,4]],"56-154"]],"la":false,"le":"G","lm":false,"n":"Genetics for Graduate Students","no":"7.52","nx":false,"pl":false,"r":[[[[75,2],[132,2]],"66-144"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":38.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.540":{"b":[],"ci":false,"cl":"540","co":"7","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[5,3],[65,3]],"4-261"]],"la":false,"le":"G","lm":false,"n":"Frontiers in Chemical Biology","no":"7.540","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":23.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"7.61":{"b":[],"ci":false,"cl":"61","co":"7","cw":false,"f":true,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,4],[70,4]],"E25-117"]],"la":false,"le":"G","lm":true,"n":"Eukaryotic Cell Biology: Principles and Practice","no":"7.61","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":18.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.62":{"b":[],"ci":false,"cl":"62","co":"7","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,4],[66,4]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Microbial Physiology","no":"7.62","nx":false,"pl":false,"r":[[[[126,2]],"56-114"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":14.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.65":{"b":[],"ci":false,"cl":"65","co":"7","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"46-4062"]],"la":false,"le":"G","lm":false,"n":"Molecular and Cellular Neuroscience Core I","no":"7.65","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"7.74":{"b":[],"ci":false,"cl":"74","co":"7","cw":false,"f":false,"h":4.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,4]],"4-253"]],"la":false,"le":"G","lm":false,"n":"Topics in Biophysics and Physical Biology","no":"7.74","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":9.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"7.81":{"b":[],"ci":false,"cl":"81","co":"7","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-159"]],"la":false,"le":"G","lm":false,"n":"Systems Biology","no":"7.81","nx":false,"pl":false,"r":[[[[77,3]],"2-147"]],"ra":6.2,"re":false,"rp":false,"s":["l","r"],"si":35.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"7.85":{"b":[],"ci":false,"cl":"85","co":"7","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-163"]],"la":false,"le":"G","lm":false,"n":"The Hallmarks of Cancer","no":"7.85","nx":false,"pl":false,"r":[[[[128,2]],"26-314"],[[[112,2]],"56-114"],[[[126,2]],"26-314"]],"ra":6.5,"re":false,"rp":false,"s":["l","r"],"si":58.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.86":{"b":[],"ci":false,"cl":"86","co":"7","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"26-328"]],"la":false,"le":"G","lm":false,"n":"Building with Cells","no":"7.86","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":18.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"7.89":{"b":[],"ci":false,"cl":"89","co":"7","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[126,4]],"66-148"]],"la":false,"le":"G","lm":false,"n":"Topics in Computational and Systems Biology","no":"7.89","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"7.930":{"b":[],"ci":false,"cl":"930","co":"7","cw":false,"f":false,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2]],"16-220"]],"la":false,"le":"G","lm":false,"n":"Research Experience in Biopharma","no":"7.930","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.3,"t":["FA"],"tb":false,"u1":2,"u2":10,"u3":0,"v":false},"7.931":{"b":[],"ci":false,"cl":"931","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Biology","no":"7.931","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.932":{"b":[],"ci":false,"cl":"932","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Biology","no":"7.932","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.933":{"b":[],"ci":false,"cl":"933","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Research Rotations in Biology","no":"7.933","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.934":{"b":[],"ci":false,"cl":"934","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Experience in Biology","no":"7.934","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.935":{"b":[],"ci":false,"cl":"935","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Responsible Conduct in Biology","no":"7.935","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.936":{"b":[],"ci":false,"cl":"936","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Professional Development in Biology","no":"7.936","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":0,"v":true},"7.941":{"b":[],"ci":false,"cl":"941","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Problems","no":"7.941","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.MTHG":{"b":[],"ci":false,"cl":"MTHG","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Microbiology Graduate Thesis","no":"7.MTHG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.S391":{"b":[],"ci":false,"cl":"S391","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject in Biology","no":"7.S391","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.S930":{"b":[],"ci":false,"cl":"S930","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Biology","no":"7.S930","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.S931":{"b":[],"ci":false,"cl":"S931","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Biology","no":"7.S931","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.THG":{"b":[],"ci":false,"cl":"THG","co":"7","cw":false,"f":false,"h":48.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Biology Thesis","no":"7.THG","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":141.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.THU":{"b":[],"ci":false,"cl":"THU","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Thesis","no":"7.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.UR":{"b":[],"ci":false,"cl":"UR","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"7.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"7.URG":{"b":[],"ci":false,"cl":"URG","co":"7","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"7.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.01":{"b":[],"ci":false,"cl":"01","co":"8","cw":false,"f":true,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3],[130,2]],"26-152"],[[[44,3],[104,3],[136,2]],"26-152"],[[[36,3],[96,3],[128,2]],"26-152"],[[[5,3],[65,3],[126,2]],"26-152"],[[[32,3],[92,3],[124,2]],"26-152"],[[[2,3],[62,3],[122,2]],"26-152"],[[[14,3],[74,3],[134,2]],"26-152"]],"la":false,"le":"U","lm":false,"n":"Physics I","no":"8.01","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":332.5,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"8.012":{"b":[],"ci":false,"cl":"012","co":"8","cw":false,"f":true,"h":11.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,3],[92,3]],"6-120"]],"la":false,"le":"U","lm":false,"n":"Physics I","no":"8.012","nx":false,"pl":false,"r":[[[[10,2],[70,2]],"26-314"],[[[6,2],[66,2]],"26-204"],[[[12,2],[72,2]],"26-314"],[[[4,2],[64,2]],"26-204"]],"ra":5.1,"re":false,"rp":false,"s":["l","r"],"si":54.7,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"8.01L":{"b":[],"ci":false,"cl":"01L","co":"8","cw":false,"f":false,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3],[134,3]],"32-082"],[[[36,3],[96,3],[134,3]],"32-082"]],"la":false,"le":"U","lm":false,"n":"Physics I","no":"8.01L","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":66.0,"t":["FA","JA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"8.02":{"b":[],"ci":false,"cl":"02","co":"8","cw":false,"f":true,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3],[126,2]],"32-082"],[[[2,3],[62,3],[122,2]],"32-082"],[[[10,3],[70,3],[130,2]],"32-082"]],"la":false,"le":"U","lm":false,"n":"Physics II","no":"8.02","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":395.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"8.021":{"b":[[[[126,2]],"26-210"]],"ci":false,"cl":"021","co":"8","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"35-310"]],"la":false,"le":"U","lm":true,"n":"Physics II","no":"8.021","nx":false,"pl":false,"r":[[[[70,2]],"26-204"]],"ra":5.1,"re":false,"rp":false,"s":["l","r","b"],"si":15.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"8.022":{"b":[],"ci":false,"cl":"022","co":"8","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,3],[102,3]],"6-120"]],"la":false,"le":"U","lm":false,"n":"Physics II","no":"8.022","nx":false,"pl":false,"r":[[[[12,2],[72,2]],"26-210"],[[[10,2],[70,2]],"26-210"],[[[4,2],[64,2]],"26-210"],[[[6,2],[66,2]],"26-210"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":42.6,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"8.03":{"b":[],"ci":false,"cl":"03","co":"8","cw":false,"f":true,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"6-120"]],"la":false,"le":"U","lm":false,"n":"Physics III","no":"8.03","nx":false,"pl":false,"r":[[[[12,2],[72,2]],"26-328"],[[[4,2],[64,2]],"26-314"],[[[10,2],[70,2]],"26-328"],[[[6,2],[66,2]],"26-314"]],"ra":5.5,"re":true,"rp":false,"s":["r","l"],"si":56.0,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"8.033":{"b":[],"ci":false,"cl":"033","co":"8","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"6-120"]],"la":false,"le":"U","lm":false,"n":"Relativity","no":"8.033","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"2-143"],[[[34,2],[94,2]],"2-143"],[[[42,2],[102,2]],"26-168"],[[[40,2],[100,2]],"26-168"]],"ra":6.0,"re":true,"rp":false,"s":["r","l"],"si":61.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"8.041":{"b":[],"ci":false,"cl":"041","co":"8","cw":false,"f":true,"h":12.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Quantum Physics I","no":"8.041","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"4-231"]],"ra":4.8,"re":true,"rp":false,"s":["r"],"si":21.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"8.05":{"b":[],"ci":false,"cl":"05","co":"8","cw":false,"f":true,"h":13.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,3],[69,3]],"6-120"]],"la":false,"le":"U","lm":false,"n":"Quantum Physics II","no":"8.05","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"4-265"],[[[40,2],[100,2]],"26-314"],[[[34,2],[94,2]],"4-265"],[[[42,2],[102,2]],"26-314"]],"ra":5.7,"re":false,"rp":false,"s":["r","l"],"si":56.7,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"8.07":{"b":[],"ci":false,"cl":"07","co":"8","cw":false,"f":true,"h":11.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"6-120"]],"la":false,"le":"U","lm":false,"n":"Electromagnetism II","no":"8.07","nx":false,"pl":false,"r":[[[[100,2]],"4-265"],[[[98,2]],"4-265"]],"ra":5.9,"re":false,"rp":false,"s":["l","r"],"si":21.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"8.09":{"b":[],"ci":false,"cl":"09","co":"8","cw":false,"f":true,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"56-114"]],"la":false,"le":"U","lm":false,"n":"Classical Mechanics III","no":"8.09","nx":false,"pl":false,"r":[[[[132,2]],"26-328"],[[[130,2]],"26-328"]],"ra":6.3,"re":false,"rp":false,"s":["r","l"],"si":14.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"8.10":{"b":[],"ci":false,"cl":"10","co":"8","cw":false,"f":false,"h":4.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"4-270"]],"la":false,"le":"U","lm":false,"n":"Exploring and Communicating Physics (and other) Frontiers","no":"8.10","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":0,"v":false},"8.13":{"b":[[[[2,6],[62,6]],"4-361"],[[[12,6],[72,6]],"4-361"],[[[32,6],[92,6]],"4-361"],[[[42,6],[102,6]],"4-361"]],"ci":false,"cl":"13","co":"8","cw":false,"f":false,"h":18.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":true,"le":"U","lm":true,"n":"Experimental Physics I","no":"8.13","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["b"],"si":35.2,"t":["FA","SP"],"tb":false,"u1":0,"u2":6,"u3":12,"v":false},"8.18":{"b":[],"ci":false,"cl":"18","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research Problems in Undergraduate Physics","no":"8.18","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":0,"u3":0,"v":true},"8.19":{"b":[],"ci":false,"cl":"19","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Readings in Physics","no":"8.19","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.231":{"b":[],"ci":false,"cl":"231","co":"8","cw":false,"f":true,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-261"]],"la":false,"le":"U","lm":false,"n":"Physics of Solids I","no":"8.231","nx":false,"pl":false,"r":[[[[130,2]],"2-135"]],"ra":5.6,"re":false,"rp":false,"s":["r","l"],"si":9.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"8.286":{"b":[],"ci":false,"cl":"286","co":"8","cw":false,"f":false,"h":9.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"4-265"]],"la":false,"le":"U","lm":false,"n":"The Early Universe","no":"8.286","nx":true,"pl":false,"r":[],"ra":6.7,"re":true,"rp":false,"s":["l"],"si":39.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.287":{"b":[],"ci":false,"cl":"287","co":"8","cw":false,"f":false,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,2],[76,2],[136,2]],"37-212"]],"la":true,"le":"U","lm":true,"n":"Observational Techniques of Optical Astronomy","no":"8.287","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":13.3,"t":["FA"],"tb":true,"u1":3,"u2":4,"u3":8,"v":false},"8.290":{"b":[],"ci":false,"cl":"290","co":"8","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"54-517"]],"la":false,"le":"U","lm":false,"n":"Extrasolar Planets: Physics and Detection Techniques","no":"8.290","nx":false,"pl":false,"r":[],"ra":7.0,"re":true,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.295":{"b":[],"ci":false,"cl":"295","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Practical Experience in Physics","no":"8.295","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"8.298":{"b":[],"ci":false,"cl":"298","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Selected Topics in Physics","no":"8.298","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.299":{"b":[],"ci":false,"cl":"299","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Physics Teaching","no":"8.299","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.309":{"b":[],"ci":false,"cl":"309","co":"8","cw":false,"f":true,"h":12.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"56-114"]],"la":false,"le":"G","lm":false,"n":"Classical Mechanics III","no":"8.309","nx":false,"pl":false,"r":[[[[130,2]],"26-328"],[[[132,2]],"26-328"]],"ra":6.3,"re":false,"rp":false,"s":["l","r"],"si":14.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"8.321":{"b":[],"ci":false,"cl":"321","co":"8","cw":false,"f":true,"h":16.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[16,3],[76,3]],"2-105"]],"la":false,"le":"G","lm":false,"n":"Quantum Theory I","no":"8.321","nx":false,"pl":false,"r":[[[[124,2]],"4-159"],[[[44,2]],"26-322"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":30.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"8.324":{"b":[],"ci":false,"cl":"324","co":"8","cw":false,"f":false,"h":16.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"56-154"]],"la":false,"le":"G","lm":false,"n":"Relativistic Quantum Field Theory II","no":"8.324","nx":false,"pl":false,"r":[[[[124,2]],"26-328"]],"ra":6.6,"re":false,"rp":false,"s":["l","r"],"si":15.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"8.333":{"b":[],"ci":false,"cl":"333","co":"8","cw":false,"f":true,"h":21.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[13,3],[73,3]],"4-163"]],"la":false,"le":"G","lm":false,"n":"Statistical Mechanics I","no":"8.333","nx":false,"pl":false,"r":[[[[133,3]],"4-163"]],"ra":5.3,"re":false,"rp":false,"s":["r","l"],"si":44.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"8.370":{"b":[],"ci":false,"cl":"370","co":"8","cw":false,"f":true,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[70,2],[130,2]],"2-190"]],"la":false,"le":"G","lm":false,"n":"Quantum Computation","no":"8.370","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":79.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.372":{"b":[],"ci":false,"cl":"372","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"2-143"]],"la":false,"le":"G","lm":false,"n":"Quantum Information Science III","no":"8.372","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.391":{"b":[],"ci":false,"cl":"391","co":"8","cw":false,"f":false,"h":30.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Pre-Thesis Research","no":"8.391","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":[],"si":120.7,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.398":{"b":[],"ci":false,"cl":"398","co":"8","cw":false,"f":false,"h":2.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[68,2]],"26-414"]],"la":false,"le":"G","lm":false,"n":"Selected Topics in Graduate Physics","no":"8.398","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":true,"s":["l"],"si":65.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"8.399":{"b":[],"ci":false,"cl":"399","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Physics Teaching","no":"8.399","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.511":{"b":[],"ci":false,"cl":"511","co":"8","cw":false,"f":true,"h":13.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"2-105"]],"la":false,"le":"G","lm":false,"n":"Theory of Solids I","no":"8.511","nx":false,"pl":false,"r":[],"ra":4.9,"re":false,"rp":false,"s":["l"],"si":26.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.590":{"b":[],"ci":false,"cl":"590","co":"8","cw":false,"f":false,"h":4.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,4]],"4-253"]],"la":false,"le":"G","lm":false,"n":"Topics in Biophysics and Physical Biology","no":"8.590","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":9.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"8.591":{"b":[],"ci":false,"cl":"591","co":"8","cw":false,"f":true,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-159"]],"la":false,"le":"G","lm":false,"n":"Systems Biology","no":"8.591","nx":false,"pl":false,"r":[[[[77,3]],"2-147"]],"ra":6.2,"re":false,"rp":false,"s":["l","r"],"si":35.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.613":{"b":[],"ci":false,"cl":"613","co":"8","cw":false,"f":true,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"NW16-213"]],"la":false,"le":"G","lm":false,"n":"Introduction to Plasma Physics I","no":"8.613","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":14.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.701":{"b":[],"ci":false,"cl":"701","co":"8","cw":false,"f":true,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[41,3],[101,3]],"8-205"]],"la":false,"le":"G","lm":false,"n":"Introduction to Nuclear and Particle Physics","no":"8.701","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":14.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.790":{"b":[],"ci":false,"cl":"790","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Selected Topics in Accelerator Physics","no":"8.790","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.811":{"b":[],"ci":false,"cl":"811","co":"8","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"8-205"]],"la":false,"le":"G","lm":false,"n":"Particle Physics","no":"8.811","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":7.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.821":{"b":[],"ci":false,"cl":"821","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[17,3],[77,3]],"4-265"]],"la":false,"le":"G","lm":false,"n":"String Theory","no":"8.821","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.871":{"b":[],"ci":false,"cl":"871","co":"8","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"2-135"]],"la":false,"le":"G","lm":false,"n":"Selected Topics in Theoretical Particle Physics","no":"8.871","nx":true,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":23.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.902":{"b":[],"ci":false,"cl":"902","co":"8","cw":false,"f":true,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"4-261"]],"la":false,"le":"G","lm":false,"n":"Astrophysics II","no":"8.902","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.942":{"b":[],"ci":false,"cl":"942","co":"8","cw":false,"f":false,"h":11.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"34-301"]],"la":false,"le":"G","lm":false,"n":"Cosmology","no":"8.942","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"8.995":{"b":[],"ci":false,"cl":"995","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practical Experience in Physics","no":"8.995","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.EPE":{"b":[],"ci":false,"cl":"EPE","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"UPOP Engineering Practice Experience","no":"8.EPE","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":1,"v":true},"8.S30":{"b":[],"ci":false,"cl":"S30","co":"8","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,3],[102,3]],"5-231"]],"la":false,"le":"U","lm":false,"n":"Special Subject:  Physics","no":"8.S30","nx":true,"pl":false,"r":[[[[126,2]],"5-231"]],"ra":0.0,"re":false,"rp":false,"s":["l","r"],"si":0.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"8.S998":{"b":[[[[100,2]],"4-145"],[[[132,2]],"8-205"],[[[112,2]],"26-328"]],"ci":false,"cl":"S998","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[64,2]],"26-328"],[[[6,2]],"8-205"],[[[40,2]],"4-145"]],"la":false,"le":"U","lm":false,"n":"Special Subject:  Physics","no":"8.S998","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l","b"],"si":0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"8.THG":{"b":[],"ci":false,"cl":"THG","co":"8","cw":false,"f":false,"h":49.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Physics Thesis","no":"8.THG","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":[],"si":148.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.THU":{"b":[],"ci":false,"cl":"THU","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Physics Thesis","no":"8.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"8.UR":{"b":[],"ci":false,"cl":"UR","co":"8","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"8.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.000":{"b":[],"ci":false,"cl":"000","co":"9","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[68,2]],"46-2033"]],"la":false,"le":"G","lm":false,"n":"Constructive Criticism of Research in the Brain & Cognitive Sciences","no":"9.000","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":14.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"9.01":{"b":[],"ci":false,"cl":"01","co":"9","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"46-3002"]],"la":false,"le":"U","lm":false,"n":"Introduction to Neuroscience","no":"9.01","nx":false,"pl":false,"r":[[[[98,2]],"46-3037"],[[[130,2]],"46-3037"],[[[126,2]],"46-3037"],[[[112,2]],"46-3037"],[[[124,2]],"32-123"]],"ra":5.5,"re":true,"rp":false,"s":["r","l"],"si":114.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"9.011":{"b":[],"ci":false,"cl":"011","co":"9","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,4],[72,4],[132,4]],"46-5313"]],"la":false,"le":"G","lm":false,"n":"Systems Neuroscience Core I","no":"9.011","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":12.7,"t":["FA"],"tb":false,"u1":6,"u2":0,"u3":12,"v":false},"9.014":{"b":[[[[124,4]],"46-5313"]],"ci":false,"cl":"014","co":"9","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[66,2]],"46-1015"]],"la":false,"le":"G","lm":true,"n":"Quantitative Methods and Computational Models in Neurosciences","no":"9.014","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["b","l"],"si":17.3,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":8,"v":false},"9.015":{"b":[],"ci":false,"cl":"015","co":"9","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"46-4062"]],"la":false,"le":"G","lm":false,"n":"Molecular and Cellular Neuroscience Core I","no":"9.015","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.016":{"b":[],"ci":false,"cl":"016","co":"9","cw":false,"f":false,"h":14.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,3],[104,3]],"46-5056"]],"la":false,"le":"G","lm":false,"n":"Introduction to Sound, Speech, and Hearing","no":"9.016","nx":false,"pl":false,"r":[[[[66,2]],"46-5056"]],"ra":5.5,"re":false,"rp":false,"s":["l","r"],"si":7.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"9.07":{"b":[],"ci":false,"cl":"07","co":"9","cw":false,"f":true,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[3,3],[63,3]],"46-3310"]],"la":false,"le":"U","lm":false,"n":"Statistics for Brain and Cognitive Science","no":"9.07","nx":false,"pl":false,"r":[[[[124,2]],"46-3310"]],"ra":5.5,"re":false,"rp":false,"s":["l","r"],"si":32.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"9.17":{"b":[[[[130,8]],"46-1024"]],"ci":false,"cl":"17","co":"9","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2]],"46-3310"]],"la":true,"le":"U","lm":true,"n":"Systems Neuroscience Laboratory","no":"9.17","nx":false,"pl":false,"r":[[[[34,2]],"46-1015"]],"ra":6.1,"re":false,"rp":false,"s":["r","l","b"],"si":12.7,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"9.175":{"b":[],"ci":false,"cl":"175","co":"9","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"5-234"]],"la":false,"le":"G","lm":false,"n":"Robotics","no":"9.175","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.36":{"b":[],"ci":false,"cl":"36","co":"9","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"46-3189"]],"la":false,"le":"U","lm":false,"n":"Neurobiology of Self","no":"9.36","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.401":{"b":[],"ci":false,"cl":"401","co":"9","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,6]],"46-3189"]],"la":false,"le":"G","lm":false,"n":"Tools for Robust Science","no":"9.401","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.41":{"b":[],"ci":false,"cl":"41","co":"9","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[9,4]],"46-5056"]],"la":false,"le":"U","lm":true,"n":"Research and Communication in Neuroscience and Cognitive Science","no":"9.41","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":2.0,"t":["FA"],"tb":true,"u1":2,"u2":12,"u3":4,"v":false},"9.422":{"b":[],"ci":false,"cl":"422","co":"9","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"46-5165"]],"la":false,"le":"G","lm":false,"n":"Principles of Neuroengineering","no":"9.422","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.455":{"b":[],"ci":false,"cl":"455","co":"9","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,4]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"Revolutionary Ventures: How to Invent and Deploy Transformative Technologies","no":"9.455","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":27.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"9.49":{"b":[],"ci":false,"cl":"49","co":"9","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"46-3310"]],"la":false,"le":"U","lm":false,"n":"Neural Circuits for Cognition","no":"9.49","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.490":{"b":[],"ci":false,"cl":"490","co":"9","cw":false,"f":false,"h":11.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"46-3310"]],"la":false,"le":"G","lm":false,"n":"Neural Circuits for Cognition","no":"9.490","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.50":{"b":[],"ci":false,"cl":"50","co":"9","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Brain and Cognitive Sciences","no":"9.50","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"9.520":{"b":[],"ci":false,"cl":"520","co":"9","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"46-3002"]],"la":false,"le":"G","lm":false,"n":"Statistical Learning Theory and Applications","no":"9.520","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":95.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.58":{"b":[],"ci":false,"cl":"58","co":"9","cw":false,"f":false,"h":9.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[71,4]],"46-3189"]],"la":false,"le":"U","lm":true,"n":"Projects in the Science of Intelligence","no":"9.58","nx":false,"pl":false,"r":[[[[12,2]],"46-4062"]],"ra":6.0,"re":false,"rp":false,"s":["l","r"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.583":{"b":[[[[9,3]],"56-154"]],"ci":false,"cl":"583","co":"9","cw":false,"f":true,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2],[74,2]],"56-154"]],"la":false,"le":"G","lm":false,"n":"Functional Magnetic Resonance Imaging: Data Acquisition and Analysis","no":"9.583","nx":true,"pl":false,"r":[[[[72,2]],"56-154"]],"ra":0.0,"re":false,"rp":false,"s":["b","l","r"],"si":0.0,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":7,"v":false},"9.66":{"b":[],"ci":false,"cl":"66","co":"9","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"46-3002"]],"la":false,"le":"U","lm":false,"n":"Computational Cognitive Science","no":"9.66","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":148.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.660":{"b":[],"ci":false,"cl":"660","co":"9","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"46-3002"]],"la":false,"le":"G","lm":false,"n":"Computational Cognitive Science","no":"9.660","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":148.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.72":{"b":[[[[104,4]],"10-150"]],"ci":false,"cl":"72","co":"9","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"10-150"]],"la":false,"le":"U","lm":false,"n":"Vision in Art and Neuroscience","no":"9.72","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["b","l"],"si":17.0,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"9.720":{"b":[[[[104,4]],"10-150"]],"ci":false,"cl":"720","co":"9","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"10-150"]],"la":false,"le":"G","lm":false,"n":"Vision in Art and Neuroscience","no":"9.720","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l","b"],"si":17.0,"t":["FA"],"tb":false,"u1":2,"u2":2,"u3":8,"v":false},"9.85":{"b":[],"ci":false,"cl":"85","co":"9","cw":false,"f":false,"h":7.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[40,3],[100,3]],"46-3189"]],"la":false,"le":"U","lm":false,"n":"Infant and Early Childhood Cognition","no":"9.85","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":39.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"9.89":{"b":[],"ci":false,"cl":"89","co":"9","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Off-Campus Undergraduate Research in Brain and Cognitive Sciences","no":"9.89","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":2.5,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.91":{"b":[],"ci":false,"cl":"91","co":"9","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Brain and Cognitive Sciences","no":"9.91","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.919":{"b":[],"ci":false,"cl":"919","co":"9","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Brain and Cognitive Sciences","no":"9.919","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.921":{"b":[],"ci":false,"cl":"921","co":"9","cw":false,"f":false,"h":15.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Brain and Cognitive Sciences","no":"9.921","nx":false,"pl":false,"r":[],"ra":3.5,"re":false,"rp":true,"s":[],"si":86.5,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.941":{"b":[],"ci":false,"cl":"941","co":"9","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis Proposal","no":"9.941","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.S911":{"b":[],"ci":false,"cl":"S911","co":"9","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[48,4]],"46-3189"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Brain and Cognitive Sciences","no":"9.S911","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"9.S914":{"b":[],"ci":false,"cl":"S914","co":"9","cw":false,"f":false,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject in Brain and Cognitive Sciences","no":"9.S914","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":[],"si":25.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.S915":{"b":[],"ci":false,"cl":"S915","co":"9","cw":false,"f":false,"h":7.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3]],"46-3002"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Brain and Cognitive Sciences","no":"9.S915","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":4.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"9.THG":{"b":[],"ci":false,"cl":"THG","co":"9","cw":false,"f":false,"h":90.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"9.THG","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":43.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.UR":{"b":[],"ci":false,"cl":"UR","co":"9","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"9.UR","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"9.URG":{"b":[],"ci":false,"cl":"URG","co":"9","cw":false,"f":false,"h":10.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"9.URG","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":24.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"AS.101":{"b":[],"ci":false,"cl":"101","co":"AS","cw":false,"f":false,"h":2.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[92,2]],"W59-073"]],"la":false,"le":"U","lm":false,"n":"Heritage and Values of the United States Air Force","no":"AS.101","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":29.3,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":1,"v":false},"AS.111":{"b":[],"ci":false,"cl":"111","co":"AS","cw":false,"f":false,"h":3.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Leadership Laboratory","no":"AS.111","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":28.7,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":2,"v":false},"AS.201":{"b":[],"ci":false,"cl":"201","co":"AS","cw":false,"f":false,"h":2.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2],[62,2]],"W59-147"]],"la":false,"le":"U","lm":false,"n":"Team and Leadership Fundamentals","no":"AS.201","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":20.3,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":1,"v":false},"AS.211":{"b":[],"ci":false,"cl":"211","co":"AS","cw":false,"f":false,"h":3.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Leadership Laboratory","no":"AS.211","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":19.7,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":2,"v":false},"AS.301":{"b":[[[[44,4]],"1-190"]],"ci":false,"cl":"301","co":"AS","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[110,-18]],"W59-073"]],"la":false,"le":"U","lm":false,"n":"Leading People and Effective Communication","no":"AS.301","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l","b"],"si":6.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"AS.311":{"b":[],"ci":false,"cl":"311","co":"AS","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Leadership Laboratory","no":"AS.311","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":15.3,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"AS.401":{"b":[],"ci":false,"cl":"401","co":"AS","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[90,4]],"W59-073"]],"la":false,"le":"U","lm":false,"n":"National Security Affairs/Preparation for Active Duty","no":"AS.401","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"AS.411":{"b":[],"ci":false,"cl":"411","co":"AS","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Leadership Laboratory","no":"AS.411","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":10.3,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"AS.811":{"b":[],"ci":false,"cl":"811","co":"AS","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"1-190"]],"la":false,"le":"U","lm":false,"n":"Leadership Laboratory","no":"AS.811","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":3.5,"t":["FA"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"CC.010":{"b":[],"ci":false,"cl":"010","co":"CC","cw":false,"f":false,"h":3.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,4]],"16-128"]],"la":false,"le":"U","lm":true,"n":"Seminar I","no":"CC.010","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":true,"s":["l"],"si":46.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"CC.012":{"b":[],"ci":false,"cl":"012","co":"CC","cw":false,"f":false,"h":3.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[134,4]],"16-128"]],"la":false,"le":"U","lm":false,"n":"Continuing Conversations","no":"CC.012","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":11.0,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"CC.110":{"b":[],"ci":true,"cl":"110","co":"CC","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"16-160"]],"la":false,"le":"U","lm":true,"n":"Becoming Human: Ancient Greek Perspectives on the Good Life","no":"CC.110","nx":false,"pl":false,"r":[],"ra":4.6,"re":false,"rp":false,"s":["l"],"si":36.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CC.115":{"b":[],"ci":false,"cl":"115","co":"CC","cw":true,"f":false,"h":11.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"4-251"]],"la":false,"le":"U","lm":false,"n":"Writing About Big Questions: Defending Poetry","no":"CC.115","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CC.120":{"b":[],"ci":false,"cl":"120","co":"CC","cw":false,"f":false,"h":9.0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"4-146"]],"la":false,"le":"U","lm":true,"n":"Making Books in the Renaissance and Today","no":"CC.120","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":11.2,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CC.1801":{"b":[],"ci":false,"cl":"1801","co":"CC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Calculus","no":"CC.1801","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":true},"CC.200":{"b":[],"ci":false,"cl":"200","co":"CC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Concourse Program Undergraduate Teaching","no":"CC.200","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CC.210":{"b":[],"ci":false,"cl":"210","co":"CC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Independent Study","no":"CC.210","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CC.220":{"b":[],"ci":false,"cl":"220","co":"CC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Independent Study","no":"CC.220","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CC.5111":{"b":[],"ci":false,"cl":"5111","co":"CC","cw":false,"f":true,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[64,2],[124,2]],"16-160"]],"la":false,"le":"U","lm":true,"n":"Principles of Chemical Science","no":"CC.5111","nx":false,"pl":false,"r":[[[[36,2],[96,2]],"16-160"]],"ra":6.6,"re":false,"rp":false,"s":["r","l"],"si":32.0,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"CC.801":{"b":[],"ci":false,"cl":"801","co":"CC","cw":false,"f":true,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"16-160"]],"la":false,"le":"U","lm":true,"n":"Physics I","no":"CC.801","nx":false,"pl":false,"r":[[[[42,2],[102,2]],"16-160"]],"ra":4.4,"re":false,"rp":false,"s":["r","l"],"si":22.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"CC.8012":{"b":[],"ci":false,"cl":"8012","co":"CC","cw":false,"f":true,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,2],[104,2]],"16-160"]],"la":false,"le":"U","lm":true,"n":"Physics I","no":"CC.8012","nx":false,"pl":false,"r":[],"ra":4.6,"re":false,"rp":false,"s":["l"],"si":22.0,"t":["FA"],"tb":true,"u1":5,"u2":0,"u3":7,"v":false},"CC.S20":{"b":[],"ci":false,"cl":"S20","co":"CC","cw":false,"f":false,"h":2.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Concourse","no":"CC.S20","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":6.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CC.S21":{"b":[],"ci":false,"cl":"S21","co":"CC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Concourse","no":"CC.S21","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CC.UR":{"b":[],"ci":false,"cl":"UR","co":"CC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Undergraduate Research","no":"CC.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CDO.THG":{"b":[],"ci":false,"cl":"THG","co":"CDO","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"CDO.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.100":{"b":[],"ci":true,"cl":"100","co":"CMS","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"4-257"],[[[38,3],[98,3]],"1-277"]],"la":false,"le":"U","lm":true,"n":"Introduction to Media Studies","no":"CMS.100","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":42.4,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"CMS.300":{"b":[],"ci":false,"cl":"300","co":"CMS","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[36,3],[96,3]],"E15-335"]],"la":false,"le":"U","lm":true,"n":"Game Studies","no":"CMS.300","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":17.7,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"CMS.307":{"b":[[[[112,6]],"4-149"]],"ci":false,"cl":"307","co":"CMS","cw":false,"f":false,"h":11.2,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"4-149"]],"la":false,"le":"U","lm":true,"n":"Critical Worldbuilding","no":"CMS.307","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l","b"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"CMS.335":{"b":[],"ci":false,"cl":"335","co":"CMS","cw":false,"f":false,"h":9.5,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"2-103"]],"la":false,"le":"U","lm":true,"n":"Short Attention Span Documentary","no":"CMS.335","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":15.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.340":{"b":[],"ci":false,"cl":"340","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[130,6]],"2-103"]],"la":false,"le":"U","lm":true,"n":"Immersive Media Studies","no":"CMS.340","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.354":{"b":[],"ci":true,"cl":"354","co":"CMS","cw":false,"f":false,"h":8.7,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[12,3],[72,3]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"Japanese Literature and Cinema","no":"CMS.354","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.361":{"b":[],"ci":false,"cl":"361","co":"CMS","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[72,6]],"56-162"]],"la":false,"le":"U","lm":true,"n":"Networked Social Movements: Media and Mobilization","no":"CMS.361","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.375":{"b":[],"ci":false,"cl":"375","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[22,6]],"E25-117"]],"la":false,"le":"U","lm":true,"n":"Reading Climate Through Media","no":"CMS.375","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.376":{"b":[],"ci":true,"cl":"376","co":"CMS","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[82,6]],"E25-117"]],"la":false,"le":"U","lm":true,"n":"History of Media and Technology","no":"CMS.376","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.405":{"b":[],"ci":false,"cl":"405","co":"CMS","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"4-144"]],"la":false,"le":"U","lm":true,"n":"Visual Design","no":"CMS.405","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.586":{"b":[],"ci":true,"cl":"586","co":"CMS","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[43,3],[103,3]],"56-154"]],"la":false,"le":"U","lm":true,"n":"Introduction to Education: Looking Forward and Looking Back on Education","no":"CMS.586","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":24.0,"t":["FA"],"tb":true,"u1":3,"u2":6,"u3":3,"v":false},"CMS.591":{"b":[],"ci":false,"cl":"591","co":"CMS","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[46,3],[106,3]],"56-154"]],"la":false,"le":"U","lm":true,"n":"Educational Theory and Practice I","no":"CMS.591","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":7.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.594":{"b":[],"ci":false,"cl":"594","co":"CMS","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[94,6]],"E15-318"]],"la":false,"le":"U","lm":false,"n":"Education Technology Studio","no":"CMS.594","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.603":{"b":[],"ci":false,"cl":"603","co":"CMS","cw":false,"f":false,"h":17.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"CMS.603","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":[],"si":1.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.604":{"b":[],"ci":false,"cl":"604","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"CMS.604","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.605":{"b":[],"ci":false,"cl":"605","co":"CMS","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Media Internship","no":"CMS.605","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.606":{"b":[],"ci":false,"cl":"606","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Media Internship","no":"CMS.606","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.609":{"b":[],"ci":false,"cl":"609","co":"CMS","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"1-277"]],"la":false,"le":"U","lm":true,"n":"The Word Made Digital","no":"CMS.609","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.611":{"b":[],"ci":false,"cl":"611","co":"CMS","cw":false,"f":false,"h":11.2,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6],[102,6]],"1-150"]],"la":false,"le":"U","lm":true,"n":"Creating Video Games","no":"CMS.611","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":36.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"CMS.614":{"b":[],"ci":false,"cl":"614","co":"CMS","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[12,6]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Network Cultures","no":"CMS.614","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.616":{"b":[],"ci":false,"cl":"616","co":"CMS","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[82,6]],"56-180"]],"la":false,"le":"U","lm":false,"n":"Games and Culture","no":"CMS.616","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.618":{"b":[],"ci":false,"cl":"618","co":"CMS","cw":false,"f":false,"h":8.3,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"66-156"]],"la":false,"le":"U","lm":false,"n":"Interactive Narrative","no":"CMS.618","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.619":{"b":[],"ci":false,"cl":"619","co":"CMS","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[22,6]],"14N-325"]],"la":false,"le":"U","lm":false,"n":"Gender and Media Studies","no":"CMS.619","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.628":{"b":[],"ci":false,"cl":"628","co":"CMS","cw":false,"f":false,"h":0,"ha":true,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"E15-335"]],"la":false,"le":"U","lm":false,"n":"Advanced Identity Representation","no":"CMS.628","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.633":{"b":[],"ci":false,"cl":"633","co":"CMS","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[15,3],[75,3]],"1-277"]],"la":false,"le":"U","lm":false,"n":"Digital Humanities: Topics, Techniques, and Technologies","no":"CMS.633","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.701":{"b":[],"ci":false,"cl":"701","co":"CMS","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,3],[64,3]],"1-135"]],"la":false,"le":"U","lm":false,"n":"Current Debates in Media","no":"CMS.701","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":8.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.807":{"b":[[[[112,6]],"4-149"]],"ci":false,"cl":"807","co":"CMS","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"4-149"]],"la":false,"le":"G","lm":true,"n":"Critical Worldbuilding","no":"CMS.807","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l","b"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"CMS.828":{"b":[],"ci":false,"cl":"828","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[42,6]],"E39-335"]],"la":false,"le":"G","lm":false,"n":"Advanced Identity Representation","no":"CMS.828","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.833":{"b":[],"ci":false,"cl":"833","co":"CMS","cw":false,"f":false,"h":8.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"1-277"]],"la":false,"le":"G","lm":false,"n":"Digital Humanities: Topics, Techniques, and Technologies","no":"CMS.833","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.841":{"b":[],"ci":false,"cl":"841","co":"CMS","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"E15-335"]],"la":false,"le":"G","lm":true,"n":"Game Studies","no":"CMS.841","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":17.7,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"CMS.845":{"b":[],"ci":false,"cl":"845","co":"CMS","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"66-156"]],"la":false,"le":"G","lm":false,"n":"Interactive Narrative","no":"CMS.845","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.848":{"b":[],"ci":false,"cl":"848","co":"CMS","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,6]],"66-144"]],"la":false,"le":"G","lm":true,"n":"Apocalyptic Storytelling","no":"CMS.848","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":11.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.861":{"b":[],"ci":false,"cl":"861","co":"CMS","cw":false,"f":false,"h":7.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[72,6]],"56-162"]],"la":false,"le":"G","lm":true,"n":"Networked Social Movements: Media and Mobilization","no":"CMS.861","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.865":{"b":[],"ci":false,"cl":"865","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[130,6]],"2-103"]],"la":false,"le":"G","lm":true,"n":"Immersive Media Studies","no":"CMS.865","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.867":{"b":[],"ci":false,"cl":"867","co":"CMS","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,6]],"56-162"]],"la":false,"le":"G","lm":false,"n":"Network Cultures","no":"CMS.867","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.868":{"b":[],"ci":false,"cl":"868","co":"CMS","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,6]],"56-180"]],"la":false,"le":"G","lm":false,"n":"Games and Culture","no":"CMS.868","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.875":{"b":[],"ci":false,"cl":"875","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"E25-117"]],"la":false,"le":"G","lm":true,"n":"Reading Climate Through Media","no":"CMS.875","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.876":{"b":[],"ci":false,"cl":"876","co":"CMS","cw":false,"f":false,"h":7.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[82,6]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"History of Media and Technology","no":"CMS.876","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.894":{"b":[],"ci":false,"cl":"894","co":"CMS","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[94,6]],"E15-318"]],"la":false,"le":"G","lm":false,"n":"Education Technology Studio","no":"CMS.894","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":7.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.901":{"b":[],"ci":false,"cl":"901","co":"CMS","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,3],[64,3]],"56-180"]],"la":false,"le":"G","lm":false,"n":"Current Debates in Media","no":"CMS.901","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":8.8,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"CMS.915":{"b":[],"ci":false,"cl":"915","co":"CMS","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Understanding Television","no":"CMS.915","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":true,"s":[],"si":12.0,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":true},"CMS.992":{"b":[],"ci":false,"cl":"992","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Portfolio in Comparative Media","no":"CMS.992","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.993":{"b":[],"ci":false,"cl":"993","co":"CMS","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching in Comparative Media","no":"CMS.993","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.994":{"b":[],"ci":false,"cl":"994","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study","no":"CMS.994","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.995":{"b":[],"ci":false,"cl":"995","co":"CMS","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study","no":"CMS.995","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":2.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.S61":{"b":[],"ci":false,"cl":"S61","co":"CMS","cw":false,"f":false,"h":5.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[131,6]],"3-370"]],"la":false,"le":"U","lm":false,"n":"Special Subject: Comparative Media Studies","no":"CMS.S61","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":5.0,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"CMS.S97":{"b":[],"ci":false,"cl":"S97","co":"CMS","cw":false,"f":false,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[131,6]],"3-370"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Comparative Media Studies","no":"CMS.S97","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":4.7,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"CMS.S98":{"b":[],"ci":false,"cl":"S98","co":"CMS","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Comparative Media Studies","no":"CMS.S98","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.S99":{"b":[],"ci":false,"cl":"S99","co":"CMS","cw":false,"f":false,"h":11.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Comparative Media Studies","no":"CMS.S99","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":1.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.THG":{"b":[],"ci":false,"cl":"THG","co":"CMS","cw":false,"f":false,"h":15.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Master's Thesis","no":"CMS.THG","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":true,"s":[],"si":6.7,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.THT":{"b":[],"ci":false,"cl":"THT","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Comparative Media Studies Pre-Thesis Tutorial","no":"CMS.THT","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":1,"u2":0,"u3":5,"v":true},"CMS.THU":{"b":[],"ci":false,"cl":"THU","co":"CMS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis in Comparative Media Studies","no":"CMS.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.UR":{"b":[],"ci":false,"cl":"UR","co":"CMS","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Comparative Media Studies","no":"CMS.UR","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":3.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CMS.URG":{"b":[],"ci":false,"cl":"URG","co":"CMS","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Research in Comparative Media Studies","no":"CMS.URG","nx":false,"pl":false,"r":[],"ra":3.5,"re":false,"rp":true,"s":[],"si":2.5,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CSB.100":{"b":[],"ci":false,"cl":"100","co":"CSB","cw":false,"f":false,"h":6.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[126,4]],"66-148"]],"la":false,"le":"G","lm":false,"n":"Topics in Computational and Systems Biology","no":"CSB.100","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"CSB.110":{"b":[],"ci":false,"cl":"110","co":"CSB","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Rotations in Computational and Systems Biology","no":"CSB.110","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"CSB.190":{"b":[],"ci":false,"cl":"190","co":"CSB","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research Problems in Computational and Systems Biology","no":"CSB.190","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CSB.199":{"b":[],"ci":false,"cl":"199","co":"CSB","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Experience in Computational Systems Biology","no":"CSB.199","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CSB.THG":{"b":[],"ci":false,"cl":"THG","co":"CSB","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"CSB.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CSE.C20":{"b":[],"ci":false,"cl":"C20","co":"CSE","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"33-418"]],"la":false,"le":"U","lm":false,"n":"Introduction to Computational Science and Engineering","no":"CSE.C20","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"CSE.IND":{"b":[],"ci":false,"cl":"IND","co":"CSE","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study","no":"CSE.IND","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"CSE.THG":{"b":[],"ci":false,"cl":"THG","co":"CSE","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"CSE.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.050":{"b":[[[[104,4]],"4-402"]],"ci":false,"cl":"050","co":"EC","cw":false,"f":false,"h":19.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"4-402"]],"la":false,"le":"U","lm":false,"n":"Re-create Experiments from History: Inform the Future from the Past","no":"EC.050","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l","b"],"si":2.7,"t":["FA","JA","SP"],"tb":false,"u1":1,"u2":3,"u3":2,"v":false},"EC.074":{"b":[],"ci":false,"cl":"074","co":"EC","cw":false,"f":false,"h":4.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[52,4]],"4-402"]],"la":false,"le":"U","lm":false,"n":"The Start-up Experience at MIT","no":"EC.074","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"EC.090":{"b":[[[[104,4]],"4-402"]],"ci":false,"cl":"090","co":"EC","cw":false,"f":false,"h":19.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"4-402"]],"la":false,"le":"G","lm":false,"n":"Re-create Experiments from History: Inform the Future from the Past","no":"EC.090","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l","b"],"si":2.7,"t":["FA","JA","SP"],"tb":false,"u1":1,"u2":3,"u3":2,"v":false},"EC.120":{"b":[],"ci":false,"cl":"120","co":"EC","cw":false,"f":false,"h":4.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"4-409"]],"la":false,"le":"U","lm":true,"n":"Electronics Project Laboratory","no":"EC.120","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":15.4,"t":["FA","SP"],"tb":false,"u1":1,"u2":2,"u3":3,"v":false},"EC.701":{"b":[[[[135,3]],"N51-310"]],"ci":false,"cl":"701","co":"EC","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[15,3],[75,3]],"N51-310"]],"la":false,"le":"U","lm":true,"n":"D-Lab: Development","no":"EC.701","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["b","l"],"si":25.3,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"EC.712":{"b":[],"ci":false,"cl":"712","co":"EC","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4],[104,4]],"N51-310"]],"la":false,"le":"U","lm":true,"n":"Applications of Energy in Global Development","no":"EC.712","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"EC.713":{"b":[[[[12,6]],"N51-350"]],"ci":false,"cl":"713","co":"EC","cw":false,"f":true,"h":13.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,3]],"1-132"]],"la":true,"le":"U","lm":true,"n":"D-Lab Schools: Building Technology Laboratory","no":"EC.713","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l","b"],"si":9.3,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":7,"v":false},"EC.718":{"b":[],"ci":false,"cl":"718","co":"EC","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,6]],"N51-310"]],"la":false,"le":"U","lm":true,"n":"D-Lab: Gender and Development","no":"EC.718","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":9.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"EC.729":{"b":[[[[100,3]],"N51-350"]],"ci":false,"cl":"729","co":"EC","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"N51-350"]],"la":false,"le":"U","lm":false,"n":"D-Lab: Design for Scale","no":"EC.729","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b","l"],"si":19.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"EC.731":{"b":[],"ci":false,"cl":"731","co":"EC","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[94,4]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"Global Ventures","no":"EC.731","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":41.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"EC.770":{"b":[],"ci":false,"cl":"770","co":"EC","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"D-Lab: Independent Project","no":"EC.770","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":2.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.780":{"b":[],"ci":false,"cl":"780","co":"EC","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"D-Lab: Independent Project","no":"EC.780","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.781":{"b":[[[[135,3]],"N51-310"]],"ci":false,"cl":"781","co":"EC","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[15,3],[75,3]],"N51-310"]],"la":false,"le":"G","lm":true,"n":"D-Lab: Development","no":"EC.781","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["b","l"],"si":25.3,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"EC.782":{"b":[],"ci":false,"cl":"782","co":"EC","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4],[104,4]],"N51-310"]],"la":false,"le":"G","lm":true,"n":"Applications of Energy in Global Development","no":"EC.782","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":10.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"EC.797":{"b":[[[[100,3]],"N51-350"]],"ci":false,"cl":"797","co":"EC","cw":false,"f":false,"h":13.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[37,3],[97,3]],"N51-350"]],"la":false,"le":"G","lm":false,"n":"D-Lab: Design for Scale","no":"EC.797","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["b","l"],"si":21.0,"t":["FA"],"tb":false,"u1":3,"u2":2,"u3":7,"v":false},"EC.798":{"b":[],"ci":false,"cl":"798","co":"EC","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,6]],"N51-310"]],"la":false,"le":"G","lm":true,"n":"D-Lab: Gender and Development","no":"EC.798","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":9.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"EC.900":{"b":[],"ci":false,"cl":"900","co":"EC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study","no":"EC.900","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.901":{"b":[],"ci":false,"cl":"901","co":"EC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Edgerton Center Independent Study","no":"EC.901","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.910":{"b":[],"ci":false,"cl":"910","co":"EC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Edgerton Center Undergraduate Teaching","no":"EC.910","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.980":{"b":[],"ci":false,"cl":"980","co":"EC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Edgerton Center Independent Study - Graduate","no":"EC.980","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.990":{"b":[],"ci":false,"cl":"990","co":"EC","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Edgerton Center Graduate Teaching","no":"EC.990","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.S00":{"b":[[[[131,4]],"4-409"]],"ci":false,"cl":"S00","co":"EC","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject at the Edgerton Center","no":"EC.S00","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":["b"],"si":0.0,"t":["FA","JA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"EC.S13":{"b":[],"ci":false,"cl":"S13","co":"EC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,3],[68,3]],"16-275"]],"la":false,"le":"G","lm":false,"n":"Special Subject at the Edgerton Center","no":"EC.S13","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"EC.UR":{"b":[],"ci":false,"cl":"UR","co":"EC","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"EC.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EC.URG":{"b":[],"ci":false,"cl":"URG","co":"EC","cw":false,"f":false,"h":18.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"EC.URG","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":9.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EM.411":{"b":[],"ci":false,"cl":"411","co":"EM","cw":false,"f":false,"h":19.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,4],[66,4]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Foundations of System Design and Management","no":"EM.411","nx":false,"pl":false,"r":[[[[38,2],[98,2]],"1-390"],[[[40,2],[100,2]],"1-390"]],"ra":5.5,"re":false,"rp":false,"s":["r","l"],"si":99.3,"t":["FA"],"tb":false,"u1":4,"u2":2,"u3":9,"v":false},"EM.422":{"b":[],"ci":false,"cl":"422","co":"EM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":true,"n":"Engineering Systems Analysis for Design","no":"EM.422","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"EM.423":{"b":[],"ci":false,"cl":"423","co":"EM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Risk and Decision Analysis","no":"EM.423","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"EM.424":{"b":[],"ci":false,"cl":"424","co":"EM","cw":false,"f":false,"h":12.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Real Options for Product and Systems Design","no":"EM.424","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":14.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"EM.425":{"b":[],"ci":false,"cl":"425","co":"EM","cw":false,"f":false,"h":6.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,3]],"E51-372"]],"la":false,"le":"G","lm":false,"n":"Research Seminar on Engineering Projects and Teamwork","no":"EM.425","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":15.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"EM.443":{"b":[],"ci":false,"cl":"443","co":"EM","cw":false,"f":false,"h":3.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[68,2]],"4-013"]],"la":false,"le":"G","lm":false,"n":"Integrated Design Seminar I","no":"EM.443","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":true,"s":["l"],"si":28.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"EM.451":{"b":[],"ci":false,"cl":"451","co":"EM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Internship Experience","no":"EM.451","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"EM.S20":{"b":[[[[15,3],[75,3]],"4-013"]],"ci":false,"cl":"S20","co":"EM","cw":false,"f":false,"h":5.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"4-013"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Engineering Management","no":"EM.S20","nx":false,"pl":false,"r":[],"ra":5.0,"re":false,"rp":false,"s":["b","l"],"si":4.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"EM.S21":{"b":[[[[43,3],[103,3]],"4-013"]],"ci":false,"cl":"S21","co":"EM","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-013"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Engineering Management","no":"EM.S21","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["b","l"],"si":10.0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"EM.S22":{"b":[[[[15,3],[75,3]],"4-013"]],"ci":false,"cl":"S22","co":"EM","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3]],"4-013"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Engineering Management","no":"EM.S22","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":["b","l"],"si":0.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"EM.THG":{"b":[],"ci":false,"cl":"THG","co":"EM","cw":false,"f":false,"h":13.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"EM Graduate Thesis","no":"EM.THG","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":[],"si":61.2,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"ES.1801":{"b":[],"ci":false,"cl":"1801","co":"ES","cw":false,"f":false,"h":11.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[36,2],[66,2],[96,2]],"24-619"]],"la":false,"le":"U","lm":true,"n":"Calculus","no":"ES.1801","nx":false,"pl":false,"r":[[[[106,2]],"24-618"],[[[124,2]],"24-618"],[[[128,2]],"24-611A"],[[[126,2]],"24-618"],[[[132,2]],"24-618"]],"ra":6.3,"re":false,"rp":false,"s":["r","l"],"si":8.7,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"ES.1802":{"b":[],"ci":false,"cl":"1802","co":"ES","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[34,2],[64,2],[94,2]],"24-618"],[[[10,2],[40,2],[70,2],[100,2]],"24-618"],[[[6,2],[36,2],[66,2],[96,2]],"24-618"]],"la":false,"le":"U","lm":true,"n":"Calculus","no":"ES.1802","nx":false,"pl":false,"r":[[[[124,2]],"24-619"],[[[126,2]],"24-619"],[[[132,2]],"24-611A"],[[[122,2]],"24-618"],[[[106,2]],"24-619"],[[[128,2]],"24-618"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":18.6,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"ES.1803":{"b":[],"ci":false,"cl":"1803","co":"ES","cw":false,"f":true,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[8,2],[38,2],[68,2],[98,2],[128,2]],"24-112"]],"la":false,"le":"U","lm":true,"n":"Differential Equations","no":"ES.1803","nx":false,"pl":false,"r":[],"ra":6.6,"re":true,"rp":false,"s":["l"],"si":17.0,"t":["FA","SP"],"tb":true,"u1":5,"u2":0,"u3":7,"v":false},"ES.181A":{"b":[],"ci":false,"cl":"181A","co":"ES","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[10,2],[40,2],[70,2],[100,2]],"24-619"]],"la":false,"le":"U","lm":true,"n":"Calculus","no":"ES.181A","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":13.7,"t":["FA"],"tb":true,"u1":5,"u2":0,"u3":7,"v":false},"ES.182A":{"b":[],"ci":false,"cl":"182A","co":"ES","cw":false,"f":true,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[10,2],[40,2],[70,2],[100,2]],"24-619"]],"la":false,"le":"U","lm":true,"n":"Calculus","no":"ES.182A","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA","JA"],"tb":true,"u1":5,"u2":0,"u3":7,"v":false},"ES.200":{"b":[],"ci":false,"cl":"200","co":"ES","cw":false,"f":false,"h":3.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[46,2]],"24-619"],[[[136,2]],"24-619"]],"la":false,"le":"U","lm":true,"n":"ESG Undergraduate Teaching","no":"ES.200","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":true,"s":["l"],"si":35.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"ES.201":{"b":[],"ci":false,"cl":"201","co":"ES","cw":false,"f":false,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"ESG Undergraduate Teaching","no":"ES.201","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":true,"s":[],"si":0.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":2,"v":true},"ES.210":{"b":[],"ci":false,"cl":"210","co":"ES","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"ESG Independent Study","no":"ES.210","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"ES.5111":{"b":[],"ci":false,"cl":"5111","co":"ES","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2],[42,2],[72,2],[102,2],[132,2]],"24-619"],[[[14,2],[44,2],[74,2],[104,2],[134,2]],"24-619"]],"la":false,"le":"U","lm":true,"n":"Principles of Chemical Science","no":"ES.5111","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":16.6,"t":["FA","SP"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"ES.7012":{"b":[],"ci":false,"cl":"7012","co":"ES","cw":false,"f":true,"h":8.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,2],[32,2],[62,2],[92,2],[122,2]],"24-619"]],"la":false,"le":"U","lm":true,"n":"Introductory Biology","no":"ES.7012","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":13.7,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"ES.801":{"b":[],"ci":false,"cl":"801","co":"ES","cw":false,"f":false,"h":12.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,2],[34,2],[64,2],[94,2],[124,2]],"26-142"],[[[6,2],[36,2],[66,2],[96,2],[126,2]],"24-112"]],"la":false,"le":"U","lm":true,"n":"Physics I","no":"ES.801","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":["l"],"si":31.7,"t":["FA"],"tb":false,"u1":5,"u2":1,"u3":6,"v":false},"ES.8012":{"b":[],"ci":false,"cl":"8012","co":"ES","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,2],[36,2],[66,2],[96,2],[126,2]],"26-142"]],"la":false,"le":"U","lm":true,"n":"Physics I","no":"ES.8012","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":5,"u2":1,"u3":6,"v":false},"ES.9114":{"b":[],"ci":true,"cl":"9114","co":"ES","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[12,3],[72,3],[132,3]],"24-621"]],"la":false,"le":"U","lm":true,"n":"Non-violence as a Way of Life - MIT Prison Initiative","no":"ES.9114","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":10.2,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"ES.92":{"b":[],"ci":false,"cl":"92","co":"ES","cw":false,"f":false,"h":5.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[34,3],[94,3]],"24-621"]],"la":false,"le":"U","lm":true,"n":"Authenticity - MIT Prison Initiative","no":"ES.92","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":6.0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"ES.S601":{"b":[[[[128,2]],"24-307"]],"ci":false,"cl":"S601","co":"ES","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,3],[74,3]],"2-190"]],"la":false,"le":"U","lm":true,"n":"Special Topics in Computer Science","no":"ES.S601","nx":false,"pl":false,"r":[],"ra":4.7,"re":false,"rp":false,"s":["b","l"],"si":20.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"ES.S70":{"b":[],"ci":false,"cl":"S70","co":"ES","cw":false,"f":false,"h":4.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Seminar in Interdisciplinary Studies","no":"ES.S70","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":[],"si":7.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"ES.S71":{"b":[],"ci":false,"cl":"S71","co":"ES","cw":false,"f":false,"h":4.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"24-618"]],"la":false,"le":"U","lm":false,"n":"Special Seminar in Interdisciplinary Studies","no":"ES.S71","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":true,"s":["l"],"si":5.3,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"ES.UR":{"b":[],"ci":false,"cl":"UR","co":"ES","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":true,"n":"Undergraduate Research in ESG","no":"ES.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"ESD.THG":{"b":[],"ci":false,"cl":"THG","co":"ESD","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"ESD Graduate Thesis","no":"ESD.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"HST.010":{"b":[],"ci":false,"cl":"010","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[11,9],[71,9],[131,9]],"MEC-227"]],"la":false,"le":"G","lm":false,"n":"Human Functional Anatomy","no":"HST.010","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":11,"u3":10,"v":false},"HST.011":{"b":[],"ci":false,"cl":"011","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[11,9],[71,9],[131,9]],"MEC-227"]],"la":false,"le":"G","lm":false,"n":"Human Functional Anatomy","no":"HST.011","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":11,"u3":10,"v":false},"HST.030":{"b":[],"ci":false,"cl":"030","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[30,8],[90,8]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Human Pathology","no":"HST.030","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":3,"u3":8,"v":false},"HST.031":{"b":[],"ci":false,"cl":"031","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[30,8],[90,8]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Human Pathology","no":"HST.031","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":3,"u3":8,"v":false},"HST.040":{"b":[],"ci":false,"cl":"040","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,7],[91,7]],"MEC-227"]],"la":false,"le":"G","lm":true,"n":"Microbial Pathogenesis","no":"HST.040","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":true,"u1":4,"u2":2,"u3":6,"v":false},"HST.041":{"b":[],"ci":false,"cl":"041","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,7],[91,7]],"MEC-227"]],"la":false,"le":"G","lm":true,"n":"Mechanisms of Microbial Pathogenesis","no":"HST.041","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":true,"u1":4,"u2":2,"u3":6,"v":false},"HST.070":{"b":[],"ci":false,"cl":"070","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[11,7],[71,7]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Human Reproductive Biology","no":"HST.070","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":2,"v":false},"HST.071":{"b":[],"ci":false,"cl":"071","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[11,7],[71,7]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Human Reproductive Biology","no":"HST.071","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":2,"v":false},"HST.120":{"b":[],"ci":false,"cl":"120","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[10,8],[70,8]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Gastroenterology","no":"HST.120","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":2,"v":false},"HST.121":{"b":[],"ci":false,"cl":"121","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[10,8],[70,8]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Gastroenterology","no":"HST.121","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":1,"u3":2,"v":false},"HST.130":{"b":[],"ci":false,"cl":"130","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,7],[61,7]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Neuroscience","no":"HST.130","nx":false,"pl":false,"r":[[[[121,3]],"MEC-209"]],"ra":0,"re":false,"rp":false,"s":["l","r"],"si":0,"t":["FA"],"tb":false,"u1":6,"u2":3,"u3":6,"v":false},"HST.131":{"b":[],"ci":false,"cl":"131","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,7],[61,7]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Neuroscience","no":"HST.131","nx":false,"pl":false,"r":[[[[121,3]],"MEC-209"]],"ra":0,"re":false,"rp":false,"s":["l","r"],"si":0,"t":["FA"],"tb":false,"u1":6,"u2":3,"u3":6,"v":false},"HST.140":{"b":[],"ci":false,"cl":"140","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4]],"MEC-250"]],"la":false,"le":"G","lm":false,"n":"Molecular Medicine","no":"HST.140","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"HST.141":{"b":[],"ci":false,"cl":"141","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4]],"MEC-250"]],"la":false,"le":"G","lm":false,"n":"Molecular Medicine","no":"HST.141","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"HST.146":{"b":[],"ci":false,"cl":"146","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,6]],"MEC-250"]],"la":false,"le":"G","lm":true,"n":"Biochemistry and Metabolism","no":"HST.146","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"HST.147":{"b":[],"ci":false,"cl":"147","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,6]],"MEC-250"]],"la":false,"le":"G","lm":true,"n":"Biochemistry and Metabolism","no":"HST.147","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":5,"v":false},"HST.160":{"b":[],"ci":false,"cl":"160","co":"HST","cw":false,"f":true,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[42,6]],"MEC-209"]],"la":false,"le":"G","lm":false,"n":"Genetics in Modern Medicine","no":"HST.160","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"HST.161":{"b":[],"ci":false,"cl":"161","co":"HST","cw":false,"f":true,"h":0,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[42,6]],"MEC-209"]],"la":false,"le":"G","lm":false,"n":"Genetics in Modern Medicine","no":"HST.161","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"HST.162":{"b":[],"ci":false,"cl":"162","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[42,6]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Molecular Diagnostics and Bioinformatics","no":"HST.162","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"HST.163":{"b":[],"ci":false,"cl":"163","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[42,6]],"MEC-209"]],"la":false,"le":"G","lm":true,"n":"Molecular Diagnostics and Bioinformatics","no":"HST.163","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"HST.175":{"b":[],"ci":false,"cl":"175","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[62,6],[122,6]],"RAGON"]],"la":false,"le":"G","lm":true,"n":"Cellular and Molecular Immunology","no":"HST.175","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":6,"u2":0,"u3":6,"v":false},"HST.176":{"b":[],"ci":false,"cl":"176","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[62,6],[122,6]],"RAGON"]],"la":false,"le":"G","lm":true,"n":"Cellular and Molecular Immunology","no":"HST.176","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":6,"u2":0,"u3":6,"v":false},"HST.196":{"b":[],"ci":false,"cl":"196","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching Health Sciences and Technology","no":"HST.196","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"HST.198":{"b":[],"ci":false,"cl":"198","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Health Sciences and Technology","no":"HST.198","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"HST.199":{"b":[],"ci":false,"cl":"199","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Health Sciences and Technology","no":"HST.199","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":true,"u1":0,"u2":10,"u3":0,"v":true},"HST.202":{"b":[[[[2,8],[32,8],[62,8],[92,8],[122,8],[10,8],[40,8],[70,8],[100,8],[130,8]],"HOSPIT"]],"ci":false,"cl":"202","co":"HST","cw":false,"f":false,"h":25.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Introduction to Clinical Medicine and Medical Engineering II","no":"HST.202","nx":false,"pl":false,"r":[],"ra":3.5,"re":false,"rp":false,"s":["b"],"si":6.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":20,"u3":0,"v":false},"HST.240":{"b":[],"ci":false,"cl":"240","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Translational Medicine Preceptorship","no":"HST.240","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":true,"u1":0,"u2":12,"u3":0,"v":true},"HST.420":{"b":[],"ci":false,"cl":"420","co":"HST","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,4],[96,4]],"32-044"]],"la":false,"le":"U","lm":true,"n":"Principles and Practice of Assistive Technology","no":"HST.420","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":34.0,"t":["FA"],"tb":false,"u1":2,"u2":4,"u3":6,"v":false},"HST.504":{"b":[],"ci":false,"cl":"504","co":"HST","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[7,3],[67,3]],"2-136"]],"la":false,"le":"G","lm":false,"n":"Topics in Computational Molecular Biology","no":"HST.504","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":true,"s":["l"],"si":12.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"HST.507":{"b":[],"ci":false,"cl":"507","co":"HST","cw":false,"f":false,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Advanced Computational Biology: Genomes, Networks, Evolution","no":"HST.507","nx":false,"pl":false,"r":[[[[134,2]],"4-149"]],"ra":4.8,"re":false,"rp":false,"s":["r","l"],"si":47.3,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"HST.508":{"b":[],"ci":false,"cl":"508","co":"HST","cw":false,"f":false,"h":10.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[6,3],[66,3],[126,3]],"4-145"]],"la":false,"le":"G","lm":false,"n":"Evolutionary and Quantitative Genomics","no":"HST.508","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"HST.518":{"b":[],"ci":false,"cl":"518","co":"HST","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[33,3],[93,3]],"3-370"]],"la":false,"le":"G","lm":false,"n":"Human Systems Engineering","no":"HST.518","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":68.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"HST.522":{"b":[],"ci":false,"cl":"522","co":"HST","cw":false,"f":false,"h":6.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"1-371"]],"la":false,"le":"G","lm":false,"n":"Biomaterials: Tissue Interactions","no":"HST.522","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":17.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"HST.525":{"b":[],"ci":false,"cl":"525","co":"HST","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[18,4]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"Tumor Microenvironment and Immuno-Oncology: A Systems Biology Approach","no":"HST.525","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"HST.535":{"b":[],"ci":false,"cl":"535","co":"HST","cw":false,"f":false,"h":6.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-371"]],"la":false,"le":"G","lm":false,"n":"Tissue Engineering and Organ Regeneration","no":"HST.535","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"HST.540":{"b":[],"ci":false,"cl":"540","co":"HST","cw":false,"f":true,"h":9.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,4],[92,4]],"E25-111"]],"la":false,"le":"U","lm":false,"n":"Human Physiology","no":"HST.540","nx":false,"pl":false,"r":[[[[66,2]],"4-159"],[[[53,2]],"66-154"]],"ra":6.4,"re":false,"rp":false,"s":["l","r"],"si":25.3,"t":["FA"],"tb":false,"u1":5,"u2":0,"u3":7,"v":false},"HST.565":{"b":[],"ci":false,"cl":"565","co":"HST","cw":false,"f":true,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[47,3],[107,3]],"56-162"]],"la":false,"le":"G","lm":false,"n":"Medical Imaging Sciences and Applications","no":"HST.565","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":3.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"HST.583":{"b":[[[[9,3]],"56-154"]],"ci":false,"cl":"583","co":"HST","cw":false,"f":true,"h":0.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,2],[74,2]],"56-154"]],"la":false,"le":"G","lm":false,"n":"Functional Magnetic Resonance Imaging: Data Acquisition and Analysis","no":"HST.583","nx":true,"pl":false,"r":[[[[72,2]],"56-154"]],"ra":0.0,"re":false,"rp":false,"s":["l","r","b"],"si":0.0,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":7,"v":false},"HST.590":{"b":[],"ci":false,"cl":"590","co":"HST","cw":false,"f":false,"h":2.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[107,4]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"Biomedical Engineering Seminar Series","no":"HST.590","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":true,"s":["l"],"si":48.2,"t":["FA","SP"],"tb":false,"u1":1,"u2":0,"u3":0,"v":false},"HST.599":{"b":[],"ci":false,"cl":"599","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Health Sciences and Technology","no":"HST.599","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"HST.714":{"b":[],"ci":false,"cl":"714","co":"HST","cw":false,"f":false,"h":14.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,3],[104,3]],"46-5056"]],"la":false,"le":"G","lm":false,"n":"Introduction to Sound, Speech, and Hearing","no":"HST.714","nx":false,"pl":false,"r":[[[[66,2]],"46-5056"]],"ra":5.5,"re":false,"rp":false,"s":["l","r"],"si":7.0,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"HST.920":{"b":[],"ci":false,"cl":"920","co":"HST","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,6]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Principles and Practice of Drug Development","no":"HST.920","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":32.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"HST.953":{"b":[],"ci":false,"cl":"953","co":"HST","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[123,6]],"E25-117"]],"la":false,"le":"G","lm":false,"n":"Clinical Data Learning, Visualization, and Deployments","no":"HST.953","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":31.3,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":false},"HST.974":{"b":[],"ci":false,"cl":"974","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[4,6]],"E25-406"]],"la":false,"le":"G","lm":false,"n":"Innovating for Mission Impact in Medicine and Healthcare","no":"HST.974","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"HST.999":{"b":[],"ci":false,"cl":"999","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practical Experience in Health Sciences and Technology","no":"HST.999","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"HST.THG":{"b":[],"ci":false,"cl":"THG","co":"HST","cw":false,"f":false,"h":38.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"HST.THG","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":[],"si":86.0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"HST.UR":{"b":[],"ci":false,"cl":"UR","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Health Sciences and Technology","no":"HST.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"HST.URG":{"b":[],"ci":false,"cl":"URG","co":"HST","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Health Sciences and Technology","no":"HST.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.014":{"b":[],"ci":false,"cl":"014","co":"IDS","cw":false,"f":true,"h":10.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"2-190"]],"la":false,"le":"U","lm":false,"n":"Fundamentals of Statistics","no":"IDS.014","nx":false,"pl":false,"r":[[[[68,2]],"4-163"],[[[72,2]],"4-237"],[[[66,2]],"4-163"]],"ra":5.1,"re":false,"rp":false,"s":["r","l"],"si":67.6,"t":["FA","SP"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"IDS.063":{"b":[],"ci":false,"cl":"063","co":"IDS","cw":false,"f":false,"h":6.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[124,6]],"66-144"]],"la":false,"le":"U","lm":false,"n":"People and the Planet:  Environmental Governance and Science","no":"IDS.063","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":14.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"IDS.065":{"b":[],"ci":false,"cl":"065","co":"IDS","cw":false,"f":false,"h":9.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-135"]],"la":false,"le":"U","lm":false,"n":"Energy Systems for Climate Change Mitigation","no":"IDS.065","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.066":{"b":[],"ci":false,"cl":"066","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[45,3],[105,3]],"E51-057"]],"la":false,"le":"U","lm":false,"n":"Law, Technology, and Public Policy","no":"IDS.066","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.145":{"b":[],"ci":false,"cl":"145","co":"IDS","cw":false,"f":false,"h":15.5,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[16,3],[76,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Data Mining: Finding the Models and Predictions that Create Value","no":"IDS.145","nx":false,"pl":false,"r":[[[[46,2]],"E51-395"]],"ra":4.9,"re":false,"rp":false,"s":["r","l"],"si":54.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":4,"v":false},"IDS.190":{"b":[],"ci":false,"cl":"190","co":"IDS","cw":false,"f":false,"h":4.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[126,2]],"E18-304"]],"la":false,"le":"G","lm":false,"n":"Doctoral Seminar in Statistics and Data Science","no":"IDS.190","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":21.5,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"IDS.200":{"b":[],"ci":false,"cl":"200","co":"IDS","cw":false,"f":true,"h":14.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[31,3],[91,3]],"E62-276"],[[[40,3],[100,3]],"E51-345"]],"la":false,"le":"G","lm":false,"n":"Optimization Methods","no":"IDS.200","nx":false,"pl":false,"r":[[[[132,2]],"E52-164"],[[[130,2]],"E52-164"]],"ra":4.9,"re":false,"rp":false,"s":["r","l"],"si":139.7,"t":["FA"],"tb":false,"u1":4,"u2":0,"u3":8,"v":false},"IDS.330":{"b":[],"ci":false,"cl":"330","co":"IDS","cw":false,"f":false,"h":10.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Real Options for Product and Systems Design","no":"IDS.330","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":13.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"IDS.332":{"b":[],"ci":false,"cl":"332","co":"IDS","cw":false,"f":false,"h":10.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":true,"n":"Engineering Systems Analysis for Design","no":"IDS.332","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":17.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.333":{"b":[],"ci":false,"cl":"333","co":"IDS","cw":false,"f":false,"h":8.6,"ha":false,"he":false,"hf":1,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"1-390"]],"la":false,"le":"G","lm":false,"n":"Risk and Decision Analysis","no":"IDS.333","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":41.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"IDS.340":{"b":[],"ci":false,"cl":"340","co":"IDS","cw":false,"f":false,"h":10.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"4-149"]],"la":false,"le":"G","lm":true,"n":"System Safety Concepts","no":"IDS.340","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":32.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.411":{"b":[],"ci":false,"cl":"411","co":"IDS","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"9-354"]],"la":false,"le":"G","lm":false,"n":"Concepts and Research in Technology and Policy","no":"IDS.411","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["l"],"si":31.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"IDS.435":{"b":[],"ci":false,"cl":"435","co":"IDS","cw":false,"f":false,"h":8.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[45,3],[105,3]],"E51-057"]],"la":false,"le":"G","lm":false,"n":"Law, Technology, and Public Policy","no":"IDS.435","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":9.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.437":{"b":[],"ci":false,"cl":"437","co":"IDS","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,5]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Technology, Globalization, and Sustainable Development","no":"IDS.437","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":24.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.449":{"b":[],"ci":false,"cl":"449","co":"IDS","cw":false,"f":false,"h":2.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[128,4]],"E25-111"]],"la":false,"le":"G","lm":false,"n":"Technology Policy Internship and Professional Perspectives Seminar","no":"IDS.449","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":true,"s":["l"],"si":13.0,"t":["FA","SP"],"tb":false,"u1":1,"u2":1,"u3":1,"v":false},"IDS.521":{"b":[],"ci":false,"cl":"521","co":"IDS","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[36,3],[96,3]],"1-135"]],"la":false,"le":"G","lm":false,"n":"Energy Systems for Climate Change Mitigation","no":"IDS.521","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.620":{"b":[],"ci":false,"cl":"620","co":"IDS","cw":false,"f":false,"h":7.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,6]],"4-237"]],"la":false,"le":"G","lm":false,"n":"Principles and Practice of Drug Development","no":"IDS.620","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":32.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"IDS.670":{"b":[],"ci":false,"cl":"670","co":"IDS","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"33-422"]],"la":false,"le":"G","lm":false,"n":"Planning and Design of Airport Systems","no":"IDS.670","nx":true,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":19.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.730":{"b":[],"ci":false,"cl":"730","co":"IDS","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Logistics Systems","no":"IDS.730","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":62.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"IDS.900":{"b":[],"ci":false,"cl":"900","co":"IDS","cw":false,"f":false,"h":4.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[123,3]],"E18-304"]],"la":false,"le":"G","lm":false,"n":"Doctoral Seminar in Social and Engineering Systems","no":"IDS.900","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":5.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"IDS.950":{"b":[],"ci":false,"cl":"950","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Data, Systems, and Society","no":"IDS.950","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.951":{"b":[],"ci":false,"cl":"951","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Technology and Policy","no":"IDS.951","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.955":{"b":[],"ci":false,"cl":"955","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practical Experience in Data, Systems, and Society","no":"IDS.955","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.956":{"b":[],"ci":false,"cl":"956","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practical Experience in Technology and Policy","no":"IDS.956","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.960":{"b":[],"ci":false,"cl":"960","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching in Data, Systems, and Society","no":"IDS.960","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.961":{"b":[],"ci":false,"cl":"961","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Teaching in Technology and Policy","no":"IDS.961","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.970":{"b":[],"ci":false,"cl":"970","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Data, Systems, and Society","no":"IDS.970","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.971":{"b":[],"ci":false,"cl":"971","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Technology and Policy","no":"IDS.971","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.S24":{"b":[],"ci":false,"cl":"S24","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,3],[100,3]],"35-225"]],"la":false,"le":"G","lm":false,"n":"Special Graduate Subject in Data, Systems, and Society","no":"IDS.S24","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"IDS.THG":{"b":[],"ci":false,"cl":"THG","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"IDS.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.UR":{"b":[],"ci":false,"cl":"UR","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"IDS.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"IDS.URG":{"b":[],"ci":false,"cl":"URG","co":"IDS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"IDS.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.490":{"b":[],"ci":false,"cl":"490","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Media Arts and Sciences","no":"MAS.490","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.491":{"b":[],"ci":false,"cl":"491","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Media Arts and Sciences","no":"MAS.491","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.630":{"b":[],"ci":false,"cl":"630","co":"MAS","cw":false,"f":false,"h":11.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[64,4]],"E15-341"]],"la":false,"le":"G","lm":true,"n":"Advanced Seminar: Affective Computing and Ethics","no":"MAS.630","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":14.5,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":10,"v":false},"MAS.665":{"b":[],"ci":false,"cl":"665","co":"MAS","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[94,4]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"Global Ventures","no":"MAS.665","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":41.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"MAS.690":{"b":[],"ci":false,"cl":"690","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Media Arts and Sciences","no":"MAS.690","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.790":{"b":[],"ci":false,"cl":"790","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Media Arts and Sciences","no":"MAS.790","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.825":{"b":[],"ci":false,"cl":"825","co":"MAS","cw":false,"f":false,"h":12.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[73,5]],"E14-333"]],"la":false,"le":"G","lm":false,"n":"Musical Aesthetics and Media Technology","no":"MAS.825","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":20.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"MAS.834":{"b":[],"ci":false,"cl":"834","co":"MAS","cw":false,"f":false,"h":12.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,6]],"E15-341"]],"la":false,"le":"G","lm":false,"n":"Tangible Interfaces","no":"MAS.834","nx":false,"pl":false,"r":[],"ra":5.6,"re":false,"rp":false,"s":["l"],"si":34.0,"t":["FA"],"tb":false,"u1":3,"u2":3,"u3":6,"v":false},"MAS.858":{"b":[],"ci":false,"cl":"858","co":"MAS","cw":false,"f":false,"h":13.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[2,6]],"E14-493"]],"la":false,"le":"G","lm":true,"n":"Asking How Space Enabled Designs Advance Justice and Development","no":"MAS.858","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"MAS.863":{"b":[],"ci":false,"cl":"863","co":"MAS","cw":false,"f":true,"h":21.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"How to Make (Almost) Anything","no":"MAS.863","nx":false,"pl":false,"r":[[[[108,4]],"E14-633"]],"ra":6.2,"re":false,"rp":false,"s":["l","r"],"si":62.3,"t":["FA"],"tb":false,"u1":3,"u2":9,"u3":6,"v":false},"MAS.881":{"b":[],"ci":false,"cl":"881","co":"MAS","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[35,3],[95,3]],"46-5165"]],"la":false,"le":"G","lm":false,"n":"Principles of Neuroengineering","no":"MAS.881","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":12.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"MAS.883":{"b":[],"ci":false,"cl":"883","co":"MAS","cw":false,"f":false,"h":5.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,4]],"E14-633"]],"la":false,"le":"G","lm":false,"n":"Revolutionary Ventures: How to Invent and Deploy Transformative Technologies","no":"MAS.883","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":false,"s":["l"],"si":27.3,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"MAS.890":{"b":[],"ci":false,"cl":"890","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Media Arts and Sciences","no":"MAS.890","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.910":{"b":[],"ci":false,"cl":"910","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Research in Media Technology","no":"MAS.910","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.912":{"b":[],"ci":false,"cl":"912","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching in Media Arts and Sciences","no":"MAS.912","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.914":{"b":[],"ci":false,"cl":"914","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practical Experience in Media Arts and Sciences","no":"MAS.914","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"MAS.915":{"b":[],"ci":false,"cl":"915","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practical Experience in Media Arts and Sciences","no":"MAS.915","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"MAS.921":{"b":[],"ci":false,"cl":"921","co":"MAS","cw":false,"f":false,"h":3.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Proseminar in Media Arts and Sciences","no":"MAS.921","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":[],"si":23.3,"t":["FA"],"tb":true,"u1":3,"u2":0,"u3":9,"v":true},"MAS.941":{"b":[],"ci":false,"cl":"941","co":"MAS","cw":false,"f":false,"h":3.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[76,3]],"E15-341"]],"la":false,"le":"G","lm":false,"n":"Preparation for SM Thesis II","no":"MAS.941","nx":false,"pl":false,"r":[],"ra":0.0,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"MAS.945":{"b":[],"ci":false,"cl":"945","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Media Arts and Sciences General Exam","no":"MAS.945","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":12,"u3":0,"v":true},"MAS.950":{"b":[],"ci":false,"cl":"950","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Preparation for Ph.D. Thesis","no":"MAS.950","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.S60":{"b":[],"ci":false,"cl":"S60","co":"MAS","cw":false,"f":true,"h":8.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[14,4]],"E15-341"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S60","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":9.5,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S61":{"b":[],"ci":false,"cl":"S61","co":"MAS","cw":false,"f":true,"h":8.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[98,4]],"E15-341"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S61","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":true,"s":["l"],"si":7.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S62":{"b":[],"ci":false,"cl":"S62","co":"MAS","cw":false,"f":true,"h":9.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,4]],"E15-359"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S62","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":true,"s":["l"],"si":6.2,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S63":{"b":[],"ci":false,"cl":"S63","co":"MAS","cw":false,"f":true,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,4]],"E15-466"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S63","nx":false,"pl":false,"r":[],"ra":5.9,"re":false,"rp":true,"s":["l"],"si":15.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S64":{"b":[],"ci":false,"cl":"S64","co":"MAS","cw":false,"f":true,"h":10.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,4]],"E15-359"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S64","nx":false,"pl":false,"r":[],"ra":6.4,"re":false,"rp":true,"s":["l"],"si":9.0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S65":{"b":[],"ci":false,"cl":"S65","co":"MAS","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[92,4]],"E15-466"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S65","nx":false,"pl":false,"r":[],"ra":6.7,"re":false,"rp":true,"s":["l"],"si":10.3,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S66":{"b":[],"ci":false,"cl":"S66","co":"MAS","cw":false,"f":false,"h":13.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,4]],"E15-359"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S66","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":true,"s":["l"],"si":9.8,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S67":{"b":[],"ci":false,"cl":"S67","co":"MAS","cw":false,"f":false,"h":10.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[40,6]],"E14-493"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S67","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":true,"s":["l"],"si":9.7,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S68":{"b":[],"ci":false,"cl":"S68","co":"MAS","cw":false,"f":false,"h":5.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,3],[72,3],[132,3]],"E14-493"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Technology","no":"MAS.S68","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":true,"s":["l"],"si":16.5,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.S90":{"b":[],"ci":false,"cl":"S90","co":"MAS","cw":false,"f":false,"h":4.6,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[106,4]],"E15-341"]],"la":false,"le":"G","lm":false,"n":"Special Subject in Media Arts and Sciences","no":"MAS.S90","nx":false,"pl":false,"r":[],"ra":4.0,"re":false,"rp":true,"s":["l"],"si":32.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"MAS.THG":{"b":[],"ci":false,"cl":"THG","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"MAS.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.UR":{"b":[],"ci":false,"cl":"UR","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Media Arts and Sciences","no":"MAS.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MAS.URG":{"b":[],"ci":false,"cl":"URG","co":"MAS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Media Arts and Sciences","no":"MAS.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"MS.101":{"b":[[[[74,4]],"W59-073"]],"ci":false,"cl":"101","co":"MS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Introduction to the Army and Critical Thinking","no":"MS.101","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["b"],"si":0,"t":["FA","SP"],"tb":false,"u1":1,"u2":3,"u3":2,"v":false},"MS.102":{"b":[],"ci":false,"cl":"102","co":"MS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[74,4]],"W59-073"]],"la":false,"le":"U","lm":false,"n":"Introduction to the Profession of Arms","no":"MS.102","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":1,"u2":3,"u3":2,"v":false},"MS.201":{"b":[[[[74,4]],"W59-149"]],"ci":false,"cl":"201","co":"MS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Leadership and Decision Making","no":"MS.201","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["b"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":3,"u3":1,"v":false},"MS.301":{"b":[],"ci":false,"cl":"301","co":"MS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Applied Team Leadership","no":"MS.301","nx":false,"pl":false,"r":[[[[72,6]],"W59-147"]],"ra":0,"re":false,"rp":false,"s":["r"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"MS.401":{"b":[],"ci":false,"cl":"401","co":"MS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[51,-18]],"W59-159"]],"la":false,"le":"U","lm":false,"n":"Officership: Mission Command and the Army Officer","no":"MS.401","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":6,"u3":3,"v":false},"NS.100":{"b":[],"ci":false,"cl":"100","co":"NS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[81,-20]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Naval Science Leadership Seminar","no":"NS.100","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":2,"v":false},"NS.11":{"b":[],"ci":false,"cl":"11","co":"NS","cw":false,"f":false,"h":5.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[53,-21],[113,-21]],"W59-172"]],"la":false,"le":"U","lm":false,"n":"Introduction to Naval Science","no":"NS.11","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":9.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"NS.200":{"b":[],"ci":false,"cl":"200","co":"NS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[81,-20]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Naval Science Leadership Seminar","no":"NS.200","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":2,"v":false},"NS.21":{"b":[],"ci":false,"cl":"21","co":"NS","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[120,6]],"W59-172"]],"la":false,"le":"U","lm":false,"n":"Leadership and Management","no":"NS.21","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"NS.300":{"b":[],"ci":false,"cl":"300","co":"NS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[81,-20]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Naval Science Leadership Seminar","no":"NS.300","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"NS.31":{"b":[],"ci":false,"cl":"31","co":"NS","cw":false,"f":false,"h":4.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[53,-21],[113,-21]],"W59-149"]],"la":false,"le":"U","lm":false,"n":"Naval Ships Systems I: Engineering","no":"NS.31","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"NS.400":{"b":[],"ci":false,"cl":"400","co":"NS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[81,-20]],"3-270"]],"la":false,"le":"U","lm":false,"n":"Naval Science Leadership Seminar","no":"NS.400","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":2,"u3":4,"v":false},"NS.41":{"b":[],"ci":false,"cl":"41","co":"NS","cw":false,"f":false,"h":4.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[53,-21],[113,-21]],"W59-051"]],"la":false,"le":"U","lm":false,"n":"Navigation and Naval Operations","no":"NS.41","nx":false,"pl":false,"r":[],"ra":5.5,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"OR.THG":{"b":[],"ci":false,"cl":"THG","co":"OR","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"OR.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"OR.THP":{"b":[],"ci":false,"cl":"THP","co":"OR","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Pre-thesis Research","no":"OR.THP","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"RED.THG":{"b":[],"ci":false,"cl":"THG","co":"RED","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"RED.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"SCM.250":{"b":[],"ci":false,"cl":"250","co":"SCM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Analytical Methods for Supply Chain Management","no":"SCM.250","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":true},"SCM.251":{"b":[],"ci":false,"cl":"251","co":"SCM","cw":false,"f":false,"h":9.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[43,3],[103,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Supply Chain Financial Analysis","no":"SCM.251","nx":false,"pl":false,"r":[[[[124,3]],"E52-164"]],"ra":5.4,"re":false,"rp":false,"s":["l","r"],"si":21.7,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":6,"v":false},"SCM.258":{"b":[],"ci":false,"cl":"258","co":"SCM","cw":false,"f":false,"h":10.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Written Communication Topics for Supply Chain Management","no":"SCM.258","nx":false,"pl":false,"r":[],"ra":5.4,"re":false,"rp":false,"s":[],"si":39.0,"t":["FA","JA"],"tb":false,"u1":1,"u2":0,"u3":0,"v":true},"SCM.259":{"b":[],"ci":false,"cl":"259","co":"SCM","cw":false,"f":false,"h":4.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[64,3]],"E51-057"],[[[31,3]],"E52-164"]],"la":false,"le":"G","lm":false,"n":"Written Communication for Supply Chain Management","no":"SCM.259","nx":false,"pl":false,"r":[],"ra":4.0,"re":false,"rp":false,"s":["l"],"si":42.7,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"SCM.260":{"b":[],"ci":false,"cl":"260","co":"SCM","cw":false,"f":false,"h":8.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Logistics Systems","no":"SCM.260","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":62.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"SCM.264":{"b":[[[[79,3]],"E52-164"]],"ci":false,"cl":"264","co":"SCM","cw":false,"f":false,"h":10.8,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[46,3],[106,3]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Databases and Data Analysis for Supply Chain Management","no":"SCM.264","nx":false,"pl":false,"r":[],"ra":5.2,"re":false,"rp":false,"s":["b","l"],"si":47.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":3,"v":false},"SCM.271":{"b":[],"ci":false,"cl":"271","co":"SCM","cw":false,"f":false,"h":8.9,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[1,3],[61,3]],"E51-315"]],"la":false,"le":"G","lm":false,"n":"Logistics Systems Topics","no":"SCM.271","nx":false,"pl":false,"r":[],"ra":5.7,"re":false,"rp":false,"s":["l"],"si":70.5,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"SCM.274":{"b":[[[[79,3]],"E52-164"]],"ci":false,"cl":"274","co":"SCM","cw":false,"f":false,"h":10.4,"ha":false,"he":false,"hf":2,"hh":false,"hs":false,"l":[[[[46,3],[106,3]],"E51-376"]],"la":false,"le":"G","lm":false,"n":"Databases and Data Analysis Topics for Supply Chain Management","no":"SCM.274","nx":false,"pl":false,"r":[],"ra":5.1,"re":false,"rp":false,"s":["b","l"],"si":50.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"SCM.800":{"b":[],"ci":false,"cl":"800","co":"SCM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Capstone Project in Supply Chain Management","no":"SCM.800","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"SCM.THG":{"b":[],"ci":false,"cl":"THG","co":"SCM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"SCM.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"SCM.UR":{"b":[],"ci":false,"cl":"UR","co":"SCM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"SCM.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"SCM.URG":{"b":[],"ci":false,"cl":"URG","co":"SCM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"SCM.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"SDM.THG":{"b":[],"ci":false,"cl":"THG","co":"SDM","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"SDM.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"SP.248":{"b":[],"ci":false,"cl":"248","co":"SP","cw":false,"f":false,"h":2.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[12,2]],"56-154"]],"la":false,"le":"U","lm":false,"n":"NEET Ways of Thinking","no":"SP.248","nx":false,"pl":false,"r":[],"ra":4.6,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":1,"u2":0,"u3":2,"v":false},"SP.252":{"b":[],"ci":false,"cl":"252","co":"SP","cw":false,"f":false,"h":3.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[102,3]],"2-132"]],"la":false,"le":"U","lm":true,"n":"Careers in Medicine","no":"SP.252","nx":false,"pl":false,"r":[],"ra":5.8,"re":false,"rp":false,"s":["l"],"si":15.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"SP.257":{"b":[],"ci":false,"cl":"257","co":"SP","cw":false,"f":false,"h":2.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[64,4]],"1-134"]],"la":false,"le":"U","lm":false,"n":"MISTI Career Connections: Energy","no":"SP.257","nx":false,"pl":false,"r":[],"ra":5.3,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":1,"v":false},"SP.35UR":{"b":[],"ci":false,"cl":"35UR","co":"SP","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Terrascope","no":"SP.35UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"SP.3S50":{"b":[],"ci":false,"cl":"3S50","co":"SP","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Special Subject: Terrascope","no":"SP.3S50","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.002":{"b":[],"ci":true,"cl":"002","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[14,2],[74,2]],"3-333"]],"la":false,"le":"U","lm":true,"n":"Finance and Society","no":"STS.002","nx":true,"pl":false,"r":[[[[134,2]],"3-333"],[[[76,2]],"3-333"]],"ra":0,"re":false,"rp":false,"s":["r","l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.006":{"b":[],"ci":true,"cl":"006","co":"STS","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[8,2],[68,2]],"32-141"]],"la":false,"le":"U","lm":false,"n":"Bioethics","no":"STS.006","nx":true,"pl":false,"r":[[[[126,2]],"56-169"],[[[128,2]],"56-191"],[[[124,2]],"66-156"]],"ra":5.2,"re":false,"rp":false,"s":["r","l"],"si":75.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.014":{"b":[],"ci":false,"cl":"014","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[36,3],[96,3]],"5-234"]],"la":false,"le":"U","lm":true,"n":"Embodied Education: Past, Present, Future","no":"STS.014","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.021":{"b":[],"ci":false,"cl":"021","co":"STS","cw":false,"f":false,"h":8.1,"ha":false,"he":true,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-145"]],"la":false,"le":"U","lm":false,"n":"Science Activism: Gender, Race, and Power","no":"STS.021","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.023":{"b":[],"ci":false,"cl":"023","co":"STS","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Science, Gender and Social Inequality in the Developing World","no":"STS.023","nx":true,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.027":{"b":[],"ci":false,"cl":"027","co":"STS","cw":false,"f":false,"h":6.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[22,6]],"E51-361"]],"la":false,"le":"U","lm":false,"n":"The Civil War and the Emergence of Modern America: 1861-1890","no":"STS.027","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":18.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.036":{"b":[],"ci":false,"cl":"036","co":"STS","cw":false,"f":false,"h":6.6,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[10,3],[70,3]],"E28-330"]],"la":false,"le":"U","lm":false,"n":"Science in American Life: 1920-2020","no":"STS.036","nx":true,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.051":{"b":[],"ci":false,"cl":"051","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[52,4]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Documenting MIT Communities","no":"STS.051","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"STS.053":{"b":[],"ci":false,"cl":"053","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":true,"hf":false,"hh":false,"hs":false,"l":[[[[122,6]],"E51-390"]],"la":false,"le":"U","lm":false,"n":"Multidisciplinary Interactive Learning Through Problem-Solving","no":"STS.053","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.060":{"b":[],"ci":false,"cl":"060","co":"STS","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[70,6]],"1-273"]],"la":false,"le":"U","lm":false,"n":"The Anthropology of Biology","no":"STS.060","nx":true,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":18.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.075":{"b":[],"ci":false,"cl":"075","co":"STS","cw":false,"f":false,"h":5.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[130,4]],"66-168"]],"la":false,"le":"U","lm":true,"n":"Technology and Culture","no":"STS.075","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":47.2,"t":["FA","SP"],"tb":false,"u1":2,"u2":0,"u3":7,"v":false},"STS.085":{"b":[],"ci":false,"cl":"085","co":"STS","cw":false,"f":false,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[100,4]],"37-212"]],"la":false,"le":"U","lm":true,"n":"Foundations of Information Policy","no":"STS.085","nx":false,"pl":false,"r":[[[[104,2]],"38-166"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":32.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.095":{"b":[],"ci":false,"cl":"095","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Science, Technology, and Society","no":"STS.095","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.096":{"b":[],"ci":false,"cl":"096","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Independent Study in Science, Technology, and Society","no":"STS.096","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.250":{"b":[],"ci":false,"cl":"250","co":"STS","cw":false,"f":false,"h":13.8,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[70,6]],"E51-165"]],"la":false,"le":"G","lm":false,"n":"Social Theory and Analysis","no":"STS.250","nx":false,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.421":{"b":[],"ci":false,"cl":"421","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[94,6]],"E51-393"]],"la":false,"le":"G","lm":false,"n":"Graduate Super-Seminar on Global South Cosmologies and Epistemologies","no":"STS.421","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.427":{"b":[],"ci":false,"cl":"427","co":"STS","cw":false,"f":false,"h":6.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"E51-361"]],"la":false,"le":"G","lm":false,"n":"The Civil War and the Emergence of Modern America: 1861-1890","no":"STS.427","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":18.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.468":{"b":[],"ci":false,"cl":"468","co":"STS","cw":false,"f":false,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[32,6]],"33-422"]],"la":false,"le":"G","lm":false,"n":"Entrepreneurship in Aerospace and Mobility Systems","no":"STS.468","nx":true,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.487":{"b":[],"ci":false,"cl":"487","co":"STS","cw":false,"f":false,"h":11.4,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[100,4]],"37-212"]],"la":false,"le":"G","lm":true,"n":"Foundations of Information Policy","no":"STS.487","nx":false,"pl":false,"r":[[[[104,2]],"36-372"]],"ra":6.2,"re":false,"rp":false,"s":["r","l"],"si":32.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"STS.800":{"b":[],"ci":false,"cl":"800","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"Teaching Science, Technology and Society","no":"STS.800","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.840":{"b":[],"ci":false,"cl":"840","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":true,"n":"HASTS Professional Perspective","no":"STS.840","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":1,"u3":0,"v":true},"STS.850":{"b":[],"ci":false,"cl":"850","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Practical Experience in HASTS Fields","no":"STS.850","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.880":{"b":[],"ci":false,"cl":"880","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Proposal Writing in HASTS","no":"STS.880","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.901":{"b":[],"ci":false,"cl":"901","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Science, Technology, and Society","no":"STS.901","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.902":{"b":[],"ci":false,"cl":"902","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Science, Technology, and Society","no":"STS.902","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.903":{"b":[],"ci":false,"cl":"903","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Science, Technology, and Society","no":"STS.903","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.904":{"b":[],"ci":false,"cl":"904","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Independent Study in Science, Technology, and Society","no":"STS.904","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.S91":{"b":[],"ci":false,"cl":"S91","co":"STS","cw":false,"f":false,"h":9.2,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[66,4]],"E51-390"]],"la":false,"le":"G","lm":false,"n":"Special Subject: Science, Technology and Society","no":"STS.S91","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":5.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":false},"STS.S92":{"b":[],"ci":false,"cl":"S92","co":"STS","cw":false,"f":false,"h":36.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Special Subject: Science, Technology and Society","no":"STS.S92","nx":true,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":[],"si":7.0,"t":["FA"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.THG":{"b":[],"ci":false,"cl":"THG","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"G","lm":false,"n":"Graduate Thesis","no":"STS.THG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.THT":{"b":[],"ci":false,"cl":"THT","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis Tutorial","no":"STS.THT","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.THU":{"b":[],"ci":false,"cl":"THU","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Thesis","no":"STS.THU","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.UR":{"b":[],"ci":false,"cl":"UR","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"STS.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"STS.URG":{"b":[],"ci":false,"cl":"URG","co":"STS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research","no":"STS.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"WGS.101":{"b":[],"ci":true,"cl":"101","co":"WGS","cw":false,"f":false,"h":7.9,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[14,3],[74,3]],"1-246"]],"la":false,"le":"U","lm":false,"n":"Introduction to Women's and Gender Studies","no":"WGS.101","nx":false,"pl":false,"r":[],"ra":6.2,"re":false,"rp":false,"s":["l"],"si":20.6,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.111":{"b":[],"ci":false,"cl":"111","co":"WGS","cw":false,"f":false,"h":8.2,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[22,6]],"14N-325"]],"la":false,"le":"U","lm":false,"n":"Gender and Media Studies","no":"WGS.111","nx":false,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.125":{"b":[],"ci":false,"cl":"125","co":"WGS","cw":false,"f":false,"h":9.7,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[82,6]],"56-180"]],"la":false,"le":"U","lm":false,"n":"Games and Culture","no":"WGS.125","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":25.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.160":{"b":[],"ci":false,"cl":"160","co":"WGS","cw":false,"f":false,"h":8.1,"ha":false,"he":true,"hf":false,"hh":false,"hs":false,"l":[[[[10,3],[70,3]],"4-145"]],"la":false,"le":"U","lm":false,"n":"Science Activism: Gender, Race, and Power","no":"WGS.160","nx":false,"pl":false,"r":[],"ra":6.8,"re":false,"rp":false,"s":["l"],"si":12.5,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.183":{"b":[],"ci":false,"cl":"183","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[52,6]],"4-257"]],"la":false,"le":"U","lm":false,"n":"Feminist Data Ethics","no":"WGS.183","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.222":{"b":[],"ci":false,"cl":"222","co":"WGS","cw":false,"f":false,"h":7.1,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[124,6]],"2-103"]],"la":false,"le":"U","lm":false,"n":"Women and War","no":"WGS.222","nx":false,"pl":false,"r":[],"ra":6.9,"re":false,"rp":false,"s":["l"],"si":10.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.226":{"b":[],"ci":false,"cl":"226","co":"WGS","cw":false,"f":false,"h":7.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"56-162"]],"la":false,"le":"U","lm":false,"n":"Science, Gender and Social Inequality in the Developing World","no":"WGS.226","nx":true,"pl":false,"r":[],"ra":6.0,"re":false,"rp":false,"s":["l"],"si":8.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.228":{"b":[],"ci":false,"cl":"228","co":"WGS","cw":false,"f":true,"h":7.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":true,"l":[[[[112,6]],"14E-310"]],"la":false,"le":"U","lm":true,"n":"Psychology of Sex and Gender","no":"WGS.228","nx":false,"pl":false,"r":[],"ra":6.1,"re":false,"rp":false,"s":["l"],"si":14.3,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.231":{"b":[],"ci":true,"cl":"231","co":"WGS","cw":false,"f":false,"h":8.3,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[33,3],[93,3]],"5-232"]],"la":false,"le":"U","lm":true,"n":"Writing about Race","no":"WGS.231","nx":false,"pl":false,"r":[],"ra":6.5,"re":false,"rp":false,"s":["l"],"si":12.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.235":{"b":[],"ci":false,"cl":"235","co":"WGS","cw":false,"f":false,"h":8.5,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[6,3],[66,3]],"5-234"]],"la":false,"le":"U","lm":false,"n":"Classics of Chinese Literature in Translation","no":"WGS.235","nx":true,"pl":false,"r":[],"ra":6.3,"re":false,"rp":false,"s":["l"],"si":16.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.238":{"b":[],"ci":false,"cl":"238","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[4,3],[64,3]],"4-251"]],"la":false,"le":"U","lm":false,"n":"Intersectional Feminist Memoir","no":"WGS.238","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.250":{"b":[],"ci":false,"cl":"250","co":"WGS","cw":false,"f":false,"h":7.4,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[3,3],[63,3]],"2-147"]],"la":false,"le":"U","lm":false,"n":"HIV/AIDS in American Culture","no":"WGS.250","nx":false,"pl":false,"r":[],"ra":6.6,"re":false,"rp":false,"s":["l"],"si":13.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.277":{"b":[],"ci":false,"cl":"277","co":"WGS","cw":false,"f":false,"h":8.0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[63,6]],"N51-310"]],"la":false,"le":"U","lm":true,"n":"D-Lab: Gender and Development","no":"WGS.277","nx":false,"pl":false,"r":[],"ra":4.8,"re":false,"rp":false,"s":["l"],"si":11.0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.321":{"b":[],"ci":false,"cl":"321","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":true,"hs":false,"l":[[[[52,6]],"14N-313"]],"la":false,"le":"U","lm":true,"n":"French Feminist Literature: Yesterday and Today","no":"WGS.321","nx":true,"pl":false,"r":[],"ra":0,"re":false,"rp":false,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.400":{"b":[],"ci":false,"cl":"400","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"WGS Undergraduate Independent Study","no":"WGS.400","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"WGS.610":{"b":[],"ci":false,"cl":"610","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[44,6]],"5-233"]],"la":false,"le":"G","lm":true,"n":"Seminar in Feminist Issues","no":"WGS.610","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA","SU"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.700":{"b":[],"ci":false,"cl":"700","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[100,6]],"1-134"]],"la":false,"le":"G","lm":false,"n":"Interdisciplinary Area Studies in Feminist Theories","no":"WGS.700","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":["l"],"si":0,"t":["FA"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.S10":{"b":[],"ci":false,"cl":"S10","co":"WGS","cw":false,"f":false,"h":6.3,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[[[[22,6]],"4-257"]],"la":false,"le":"U","lm":false,"n":"Special Subject in Women's and Gender Studies","no":"WGS.S10","nx":false,"pl":false,"r":[],"ra":7.0,"re":false,"rp":true,"s":["l"],"si":8.5,"t":["FA","SP"],"tb":false,"u1":3,"u2":0,"u3":9,"v":false},"WGS.UR":{"b":[],"ci":false,"cl":"UR","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Women's and Gender Studies","no":"WGS.UR","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true},"WGS.URG":{"b":[],"ci":false,"cl":"URG","co":"WGS","cw":false,"f":false,"h":0,"ha":false,"he":false,"hf":false,"hh":false,"hs":false,"l":[],"la":false,"le":"U","lm":false,"n":"Undergraduate Research in Women's and Gender Studies","no":"WGS.URG","nx":false,"pl":false,"r":[],"ra":0,"re":false,"rp":true,"s":[],"si":0,"t":["FA","JA","SU","SP"],"tb":false,"u1":0,"u2":0,"u3":0,"v":true}};
\ No newline at end of file
@@ -0,0 +1,75 @@
+// Rebuild the classes object from the column-wise encoding written by
+// new_scripts/compact.py (see there for the format).
+function decode_compact(data) {
+	if (data.v != 1) {
+		throw new Error('unknown compact encoding version ' + data.v);
+	}
+
+	var keys = data.keys || data.columns['no'];
+	var sections = {'l': true, 'r': true, 'b': true};
+
+	// How to rebuild each field, worked out once rather than per class.
+	var kinds = data.fields.map(function (k) {
+		if (data.masks.indexOf(k) != -1) {
+			return [k, 'mask', k[0]];
+		} else if (data.flags.indexOf(k) != -1) {
+			return [k, 'flag', data.flags.indexOf(k)];
+		} else if (data.interned.indexOf(k) != -1) {
+			return [k, 'interned', data.columns[k]];
+		} else if (k in sections) {
+			return [k, 'sections', data.columns[k]];
+		}
+		return [k, 'raw', data.columns[k]];
+	});
+
+	var classes = {};
+	for (var row = 0; row < keys.length; row++) {
+		var cl = {};
+		for (var f = 0; f < kinds.length; f++) {
+			var k = kinds[f][0];
+			var kind = kinds[f][1];
+			var arg = kinds[f][2];
+			if (kind == 'mask') {
+				if (arg in cl) {
+					cl[k] = cl[arg].map(function (section) {
+						return occupancy(section[0]);
+					});
+				}
+			} else if (kind == 'flag') {
+				cl[k] = (data.bits[row] >> arg & 1) == 1;
+			} else {
+				var v = arg[row];
+				if (v === null) {
+					continue;
+				}
+				if (kind == 'interned') {
+					v = data.strings[v];
+				} else if (kind == 'sections') {
+					v = v.map(function (s) {
+						var slots = [];
+						for (var j = 1; j < s.length; j += 2) {
+							slots.push([s[j], s[j + 1]]);
+						}
+						return [slots, data.strings[s[0]]];
+					});
+				}
+				cl[k] = v;
+			}
+		}
+		classes[keys[row]] = cl;
+	}
+	return classes;
+}
+
+// Five 30-bit words, one per day, as in new_scripts/timeslots.py.
+function occupancy(slots) {
+	var words = [0, 0, 0, 0, 0];
+	for (var s = 0; s < slots.length; s++) {
+		for (var i = slots[s][0]; i < slots[s][0] + slots[s][1]; i++) {
+			if (i >= 0 && i < 150) {
+				words[Math.floor(i / 30)] |= 1 << (i % 30);
+			}
+		}
+	}
+	return words;
+}
@@ -26,14 +26,15 @@ var d=[];for(var e=0;e<b.length;e++)d.push.apply(d,classes[all_sections[e][0]][a
 function fill_table(){table.clear();conflicts_flag=!1;for(var a in classes)is_selected(a)&&table.rows.add([[classes[a].no,classes[a].ra.format(1),classes[a].h.format(1),classes[a].n]]);table.draw()}
 function link_classes(a,b){var c=a.split(" "),d;for(d in c){var e=c[d];a="";-1!=e.indexOf(",")&&(a+=",",e=e.replace(",",""));-1!=e.indexOf(";")&&(a+=";",e=e.replace(";",""));if(e in classes){var f=id_sanitize(e);$("#class-"+b).append('<span class="link-span" id="'+b+"-"+f+'">'+e+"</span>"+a+" ");(function(){var a=e;$("#"+b+"-"+f).click(function(){class_desc(a)})})()}else $("#class-"+b).append(e+a+" ")}}
 function set_class_number(a,b){if(b.startsWith("[")){b=$jscomp.makeIterator(b.split(" "));var c=b.next().value;rest=$jscomp.arrayFromIterator(b);b=rest.join(" ");$("#class-name").html(a+"<sub>"+c+"</sub>: "+b)}else $("#class-name").text(a+": "+b)}
-function class_desc(a){set_class_number(classes[a].no,classes[a].n);$(".type-span").hide();classes[a].nx&&$("#nonext-span").show();"U"==classes[a].le?$("#under-span").show():"G"==classes[a].le&&$("#grad-span").show();var b=[0,0];-1!=classes[a].t.indexOf("FA")&&($("#fall-span").show(),b[0]=1);-1!=classes[a].t.indexOf("JA")&&($("#iap-span").show(),b[1]=1);-1!=classes[a].t.indexOf("SP")&&($("#spring-span").show(),b[0]=1);-1!=classes[a].t.indexOf("SU")&&($("#summer-span").show(),b[1]=1);(b=b[0]&&b[1])?
+function load_extended(a,b){$.getJSON("extended/"+extended_version+"/"+classes[a].co+".json",function(a){for(var c in a)c in classes&&$.extend(classes[c],a[c]);b()}).fail(function(){set_class_number(classes[a].no,classes[a].n);$("#class-desc").html("Could not load the details of this class. Reload the page to try again.")})}
+function class_desc(a){if(!("d"in classes[a]))load_extended(a,function(){class_desc(a)});else{set_class_number(classes[a].no,classes[a].n);$(".type-span").hide();classes[a].nx&&$("#nonext-span").show();"U"==classes[a].le?$("#under-span").show():"G"==classes[a].le&&$("#grad-span").show();var b=[0,0];-1!=classes[a].t.indexOf("FA")&&($("#fall-span").show(),b[0]=1);-1!=classes[a].t.indexOf("JA")&&($("#iap-span").show(),b[1]=1);-1!=classes[a].t.indexOf("SP")&&($("#spring-span").show(),b[0]=1);-1!=classes[a].t.indexOf("SU")&&($("#summer-span").show(),b[1]=1);(b=b[0]&&b[1])?
 $("#class-hours-disclaimer").show():$("#class-hours-disclaimer").hide();$("#end-paren-span").show();classes[a].rp&&$("#repeat-span").show();classes[a].re&&$("#rest-span").show();classes[a].la&&$("#Lab-span").show();classes[a].pl&&$("#PartLab-span").show();classes[a].hh&&$("#hassH-span").show();classes[a].ha&&$("#hassA-span").show();classes[a].hs&&$("#hassS-span").show();classes[a].he&&$("#hassE-span").show();classes[a].ci&&$("#cih1-span").show();classes[a].cw&&$("#cihw-span").show();var c=classes[a].u1,
 d=classes[a].u2,e=classes[a].u3;classes[a].f&&$("#final-span").show();1==classes[a].half?$("#first-half-span").show():2==classes[a].half&&$("#second-half-span").show();$("#class-prereq").html("Prereq: ");link_classes(classes[a].pr,"prereq");try{$("#class-same").html("<br>Same class as "),""!=classes[a].sa?(link_classes(classes[a].sa,"same"),$("#class-same").show()):$("#class-same").hide(),$("#class-meets").html("<br>Meets with "),""!=classes[a].mw?(link_classes(classes[a].mw,"meets"),$("#class-meets").show()):
 $("#class-meets").hide()}catch(f){$("#class-same").hide(),$("#class-meets").hide()}$("#class-units").text(c+d+e+" units: "+c+"-"+d+"-"+e);0!=classes[a].ra?($("#class-rating").text(classes[a].ra.format(1)),c=classes[a].h.format(1),b&&(c+="*"),$("#class-hours").text(c),$("#class-people").text(classes[a].si.format(1)),$("#out-of-rating").show()):($("#class-rating").text("N/A"),$("#class-hours").text("N/A"),$("#class-hours-disclaimer").hide(),$("#class-people").text("N/A"),$("#out-of-rating").hide());
 $("#class-eval").show();$("#class-desc").html(classes[a].d+"<br><br>");""!=classes[a].u&&$("#class-desc").append('<a href="'+classes[a].u+'" target="_blank">More info</a> | ');""!=classes[a].i&&$("#class-desc").append("<em>In-charge: "+classes[a].i+"</em><br><br>");$("#class-desc").append('<a href="http://student.mit.edu/catalog/search.cgi?search='+a+'" target="_blank">Course Catalog</a> | <a href="https://sisapp.mit.edu/ose-rpt/subjectEvaluationSearch.htm?search=Search&subjectCode='+a+'" target="_blank">Class Evaluations</a>');
 "6"===classes[a].co&&$("#class-desc").append(' | <a href="https://underground-guide.mit.edu/search?q='+a+'" target="_blank">HKN Underground Guide</a>');"18"===classes[a].co&&$("#class-desc").append(' | <a href="http://course18.guide/'+a+'-spring-2021.html" target="_blank">Course 18 Underground Guide</a>');cur_class=a;n_number=id_sanitize(a);-1==cur_classes.indexOf(a)?($("#class-buttons-div").html('<button type="button" class="btn btn-primary" id='+n_number+"-add-button>Add class</button>"),$("#"+
 n_number+"-add-button").click(function(){add_class(a)}),$("#manual-button").hide()):($("#class-buttons-div").html('<button type="button" class="btn btn-primary" id='+n_number+"-remove-button>Remove class</button>"),$("#"+n_number+"-remove-button").click(function(){remove_class(a)}),1==classes[a].s.length&&"a"==classes[a].s[0]&&($("#class-buttons-div").append('<button type="button" class="btn btn-primary" id='+n_number+"-edit-button>Edit activity</button>"),$("#"+n_number+"-edit-button").click(function(){old_activity_number=
-a;activity_times=classes[a].at;activity_times_raw=classes[a].atr;activity_timeslot_close();$("#activity-input").val(classes[a].no);$("#activity-hours-input").val(classes[a].h);$("#activity-modal").modal("show")})),$("#manual-button").text("+ Manually set sections"),$("#manual-button").show());$("#manual-div").hide();-1!=classes[a].s.indexOf("a")?($("#flags-div").hide(),$("#class-name").text(classes[a].no)):$("#flags-div").show()}
+a;activity_times=classes[a].at;activity_times_raw=classes[a].atr;activity_timeslot_close();$("#activity-input").val(classes[a].no);$("#activity-hours-input").val(classes[a].h);$("#activity-modal").modal("show")})),$("#manual-button").text("+ Manually set sections"),$("#manual-button").show());$("#manual-div").hide();-1!=classes[a].s.indexOf("a")?($("#flags-div").hide(),$("#class-name").text(classes[a].no)):$("#flags-div").show()}}
 function add_class(a){var b=id_sanitize(a);$("#selected-div").append('<button type="button" class="btn btn-primary" id='+b+"-button>"+a+"</button>");sortable(".sortable");sortable_listener();$("#"+b+"-button").click(function(){class_desc(a)});$("#"+b+"-button").dblclick(function(){remove_class(a)});cur_classes.push(a);try{class_desc(a)}catch(c){}select_slots();$("#units-div").show()}
 function remove_class(a){var b=id_sanitize(a);$("#"+b+"-button").remove();cur_classes.splice(cur_classes.indexOf(a),1);class_desc(a);0==cur_classes.length?(options=[[]],cur_option=0,$("#cal-options-1").text("1"),$("#cal-options-2").text("1"),$("#calendar").fullCalendar("removeEvents"),$("#units-div").hide(),$("#warning-div").hide(),$("#warning2-div").hide(),localStorage.setObj("fall22_cur_classes",cur_classes),localStorage.setObj("fall22_cur_option",cur_option)):select_slots()}
 function activity_timeslot_close(){$("#activity-times").html("");for(var a in activity_times_raw){var b="remove-activity-"+a;$("#activity-times").append('<button type="button" id="'+b+'" class="close" aria-label="Close"><span aria-hidden="true">&times;</span></button>'+activity_times_raw[a]+"<br>");$("#"+b).click(function(){activity_times.splice(a,1);activity_times_raw.splice(a,1);activity_timeslot_close()})}}
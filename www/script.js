@@ -683,7 +683,32 @@ function set_class_number(number, name) {
 	}
 }
 
+// With base.js, descriptions and raw section strings are left out of classes
+// and fetched per course from extended/<extended_version>/<course>.json on
+// first use; base.js sets extended_version.
+function load_extended(number, callback) {
+	$.getJSON('extended/' + extended_version + '/' + classes[number]['co'] + '.json', function (data) {
+		for (var c in data) {
+			if (c in classes) {
+				$.extend(classes[c], data[c]);
+			}
+		}
+		callback();
+	}).fail(function () {
+		// Say so rather than leaving the click without any effect.
+		set_class_number(classes[number]['no'], classes[number]['n']);
+		$('#class-desc').html('Could not load the details of this class. Reload the page to try again.');
+	});
+}
+
 function class_desc(number) {
+	if (!('d' in classes[number])) {
+		load_extended(number, function () {
+			class_desc(number);
+		});
+		return;
+	}
+
 	set_class_number(classes[number]['no'], classes[number]['n']);
 	$('.type-span').hide();
 